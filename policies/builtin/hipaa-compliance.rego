@@ -3,6 +3,9 @@ package jmo.policy.hipaa
 import future.keywords.if
 import future.keywords.in
 
+# Finding fields this policy reads (jmo trims OPA input to these)
+# jmo:input-fields: id severity ruleId message remediation risk.cwe
+
 metadata := {
 	"name": "HIPAA Security Rule Compliance",
 	"version": "1.0.0",
@@ -3,6 +3,9 @@ package jmo.policy.owasp
 import future.keywords.if
 import future.keywords.in
 
+# Finding fields this policy reads (jmo trims OPA input to these)
+# jmo:input-fields: id severity ruleId message remediation location.path compliance.owaspTop10_2021
+
 # Metadata
 metadata := {
 	"name": "OWASP Top 10 2021 Enforcer",
@@ -3,6 +3,9 @@ package jmo.policy.pci
 import future.keywords.if
 import future.keywords.in
 
+# Finding fields this policy reads (jmo trims OPA input to these)
+# jmo:input-fields: id severity ruleId message compliance.pciDss4_0
+
 metadata := {
 	"name": "PCI DSS 4.0 Compliance",
 	"version": "1.0.0",
@@ -3,6 +3,9 @@ package jmo.policy.production
 import future.keywords.if
 import future.keywords.in
 
+# Finding fields this policy reads (jmo trims OPA input to these)
+# jmo:input-fields: id severity ruleId message tool.name location.path
+
 metadata := {
 	"name": "Production Hardening Policy",
 	"version": "1.0.0",
@@ -3,6 +3,9 @@ package jmo.policy.secrets
 import future.keywords.if
 import future.keywords.in
 
+# Finding fields this policy reads (jmo trims OPA input to these)
+# jmo:input-fields: id severity message tool.name location.path location.startLine raw.verified
+
 metadata := {
 	"name": "Zero Secrets Policy",
 	"version": "1.0.0",
@@ -0,0 +1,243 @@
+"""
+Adaptive scan concurrency driven by live system load.
+
+``auto_detect_threads`` picks one worker count before the scan starts. On a
+shared CI runner that number is wrong in both directions: too high while
+neighbours saturate the box, too low once they go quiet. This module keeps
+re-deciding during the scan.
+
+A ``ConcurrencyLimiter`` gates how many targets may be in flight; the
+ThreadPoolExecutor is sized to the upper bound and each submitted scan
+acquires a slot first. An ``AdaptiveConcurrencyController`` thread samples
+load average, available memory and (on Linux) PSI from ``/proc/pressure`` and
+moves the limit one step at a time between ``min_workers`` and
+``max_workers``. Every adjustment is logged with the readings behind it.
+
+Shrinking never interrupts a running scan; it only delays the next one.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from scripts.cli.cpu_utils import get_cpu_count
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INTERVAL = 5.0
+
+# Thresholds. Load is normalised per CPU; PSI values are the "some avg10"
+# percentage of time at least one task was stalled on the resource.
+OVERLOAD_LOAD_PER_CPU = 1.5
+IDLE_LOAD_PER_CPU = 0.7
+LOW_MEMORY_FRACTION = 0.10
+COMFORTABLE_MEMORY_FRACTION = 0.25
+PSI_HIGH = {"cpu": 40.0, "memory": 10.0, "io": 40.0}
+PSI_LOW = {"cpu": 10.0, "memory": 1.0, "io": 10.0}
+
+_PROC = Path("/proc")
+
+
+@dataclass(frozen=True)
+class LoadSample:
+    """One reading of system load. Fields are None where the OS can't say."""
+
+    load_per_cpu: float | None = None
+    memory_available: float | None = None  # Fraction of MemTotal
+    psi: dict[str, float] | None = None  # resource -> some avg10 (%)
+
+    def describe(self) -> str:
+        parts = []
+        if self.load_per_cpu is not None:
+            parts.append(f"load/cpu={self.load_per_cpu:.2f}")
+        if self.memory_available is not None:
+            parts.append(f"mem_avail={self.memory_available:.0%}")
+        for resource, value in sorted((self.psi or {}).items()):
+            parts.append(f"psi_{resource}={value:.1f}%")
+        return ", ".join(parts) or "no load data"
+
+
+def _read_memory_available(proc: Path) -> float | None:
+    try:
+        fields = {}
+        for line in (proc / "meminfo").read_text(encoding="utf-8").splitlines():
+            key, _, rest = line.partition(":")
+            if key in ("MemTotal", "MemAvailable"):
+                fields[key] = int(rest.split()[0])
+        return fields["MemAvailable"] / fields["MemTotal"]
+    except (OSError, KeyError, ValueError, IndexError, ZeroDivisionError):
+        return None
+
+
+def _read_psi(proc: Path) -> dict[str, float] | None:
+    psi = {}
+    for resource in PSI_HIGH:
+        try:
+            text = (proc / "pressure" / resource).read_text(encoding="utf-8")
+        except OSError:
+            continue
+        for line in text.splitlines():
+            if line.startswith("some "):
+                for token in line.split()[1:]:
+                    name, _, value = token.partition("=")
+                    if name == "avg10":
+                        try:
+                            psi[resource] = float(value)
+                        except ValueError:
+                            pass
+    return psi or None
+
+
+def read_load_sample(proc: Path = _PROC) -> LoadSample:
+    """Sample current system load. Never raises; missing sources read as None."""
+    try:
+        load_per_cpu: float | None = os.getloadavg()[0] / get_cpu_count()
+    except (OSError, AttributeError):  # AttributeError: no getloadavg on Windows
+        load_per_cpu = None
+    return LoadSample(
+        load_per_cpu=load_per_cpu,
+        memory_available=_read_memory_available(proc),
+        psi=_read_psi(proc),
+    )
+
+
+def decide(sample: LoadSample, limit: int, in_flight: int) -> tuple[int, str]:
+    """Return the step to apply to ``limit`` (-1, 0 or +1) and why.
+
+    Any single sign of overload shrinks. Growth needs every available signal
+    to be calm *and* the current limit to be fully used - adding a slot
+    nobody is waiting for proves nothing and would only let the next burst
+    overshoot.
+    """
+    psi = sample.psi or {}
+    overloaded = []
+    if sample.load_per_cpu is not None and sample.load_per_cpu > OVERLOAD_LOAD_PER_CPU:
+        overloaded.append("load")
+    if (
+        sample.memory_available is not None
+        and sample.memory_available < LOW_MEMORY_FRACTION
+    ):
+        overloaded.append("memory")
+    overloaded += [f"{r} pressure" for r, v in sorted(psi.items()) if v > PSI_HIGH[r]]
+    if overloaded:
+        return -1, ", ".join(overloaded)
+
+    if in_flight < limit:
+        return 0, "limit not saturated"
+    calm = (
+        (sample.load_per_cpu is None or sample.load_per_cpu < IDLE_LOAD_PER_CPU)
+        and (
+            sample.memory_available is None
+            or sample.memory_available > COMFORTABLE_MEMORY_FRACTION
+        )
+        and all(v < PSI_LOW[r] for r, v in psi.items())
+    )
+    if calm and (sample.load_per_cpu is not None or psi):
+        return 1, "idle capacity"
+    return 0, "steady"
+
+
+class ConcurrencyLimiter:
+    """A semaphore whose capacity can change while threads wait on it."""
+
+    def __init__(self, limit: int):
+        self._limit = max(1, limit)
+        self._in_flight = 0
+        self._cond = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def set_limit(self, limit: int) -> None:
+        with self._cond:
+            self._limit = max(1, limit)
+            self._cond.notify_all()
+
+    def acquire(self) -> None:
+        with self._cond:
+            while self._in_flight >= self._limit:
+                self._cond.wait()
+            self._in_flight += 1
+
+    def release(self) -> None:
+        with self._cond:
+            self._in_flight -= 1
+            self._cond.notify()
+
+    def run(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Call ``fn`` while holding a slot."""
+        self.acquire()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            self.release()
+
+
+class AdaptiveConcurrencyController(threading.Thread):
+    """Background thread that resizes a ConcurrencyLimiter from live load."""
+
+    def __init__(
+        self,
+        limiter: ConcurrencyLimiter,
+        min_workers: int,
+        max_workers: int,
+        interval: float = DEFAULT_INTERVAL,
+        sampler: Callable[[], LoadSample] = read_load_sample,
+    ):
+        """
+        Args:
+            limiter: Limiter gating the scan's in-flight targets
+            min_workers: Lower bound for the limit (>= 1)
+            max_workers: Upper bound for the limit (the executor's size)
+            interval: Seconds between samples
+            sampler: Load source (injectable for tests)
+        """
+        super().__init__(name="jmo-adaptive-concurrency", daemon=True)
+        self.limiter = limiter
+        self.min_workers = max(1, min_workers)
+        self.max_workers = max(self.min_workers, max_workers)
+        self.interval = interval
+        self.sampler = sampler
+        self._stop_event = threading.Event()
+
+    def step(self) -> int:
+        """Take one sample and apply at most one adjustment. Returns the limit."""
+        current = self.limiter.limit
+        sample = self.sampler()
+        delta, reason = decide(sample, current, self.limiter.in_flight)
+        target = min(self.max_workers, max(self.min_workers, current + delta))
+        if target != current:
+            self.limiter.set_limit(target)
+            logger.info(
+                f"Adaptive concurrency: {current} -> {target} in-flight targets "
+                f"({reason}; {sample.describe()})"
+            )
+        return target
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.step()
+            except Exception as e:  # Acceptable: never let sampling kill the scan
+                logger.debug(f"Adaptive concurrency sample failed: {e}")
+
+    def stop(self) -> None:
+        self._stop_event.set()
+
+    def __enter__(self) -> AdaptiveConcurrencyController:
+        self.start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
@@ -13,8 +13,6 @@ import subprocess
 import sys
 from pathlib import Path
 
-from scripts.core.tool_utils import tool_exists
-
 # Variant configuration: maps variant name to Dockerfile
 VARIANTS = {
     "fast": "Dockerfile.fast",
@@ -41,6 +39,8 @@ def _detect_arch() -> str:
 
 def _check_docker() -> bool:
     """Check if Docker is available and running."""
+    from scripts.core.tool_utils import tool_exists
+
     if not tool_exists("docker", warn=False):
         print("Error: Docker not found in PATH", file=sys.stderr)
         return False
@@ -10,23 +10,18 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
-from scripts.cli.build_commands import add_build_args, cmd_build
-from scripts.cli.ci_orchestrator import cmd_ci as _cmd_ci_impl
+# Command modules (scan, report, history, trends, ...) and their dependencies
+# are imported inside the handler that runs them, not here: jmo is spawned
+# from hooks and schedulers, and every start paid for Rich, the history DB,
+# reporters and compliance tables it never used. Only what parse_args() and
+# _log() need is imported at startup (guarded by
+# tests/performance/test_cli_import_time.py).
+from scripts.cli.build_commands import add_build_args
 from scripts.cli.cpu_utils import auto_detect_threads as _auto_detect_threads_shared
-from scripts.cli.diff_commands import cmd_diff
-from scripts.cli.history_commands import cmd_history
-from scripts.cli.policy_commands import cmd_policy
-from scripts.cli.report_orchestrator import cmd_report as _cmd_report_impl
-
-# PHASE 1 REFACTORING: Import refactored modules
-from scripts.cli.scan_orchestrator import ScanConfig, ScanOrchestrator
-from scripts.cli.schedule_commands import cmd_schedule
-from scripts.cli.trend_commands import cmd_trends
 from scripts.core.config import load_config
 from scripts.core.exceptions import (
     ConfigurationException,
 )
-from scripts.core.tool_registry import PROFILE_TOOLS
 from scripts.core.unicode_utils import (
     UNICODE_FALLBACKS as _UNICODE_FALLBACKS,
 )
@@ -59,6 +54,8 @@ def _effective_scan_settings(args) -> dict[str, Any]:
     Note: Tool lists come from PROFILE_TOOLS in tool_registry.py (single source of truth).
     jmo.yml profiles only configure threads, timeout, per_tool settings - not tool lists.
     """
+    from scripts.core.tool_registry import PROFILE_TOOLS
+
     cfg = load_config(getattr(args, "config", None))
     profile_name = getattr(args, "profile_name", None) or cfg.default_profile
     profile = {}
@@ -203,11 +200,50 @@ def _add_scan_config_args(parser: argparse.ArgumentParser) -> None:
         default=None,
         help="Concurrent repos to scan (default: auto)",
     )
+    parser.add_argument(
+        "--adaptive-threads",
+        action="store_true",
+        help=(
+            "Start at --threads concurrent targets, then grow or shrink with "
+            "load average, free memory and PSI during the scan"
+        ),
+    )
     parser.add_argument(
         "--allow-missing-tools",
         action="store_true",
         help="If a tool is missing, create empty JSON instead of failing",
     )
+    parser.add_argument(
+        "--warm-tools",
+        action="store_true",
+        help=(
+            "Start trivy/OPA once as local servers and route invocations to them "
+            "instead of cold-starting per target (env: JMO_WARM_TOOLS=1)"
+        ),
+    )
+    parser.add_argument(
+        "--distributed",
+        action="store_true",
+        help=(
+            "Coordinate the scan through a work queue in the results directory; "
+            "workers on other hosts sharing it join with 'jmo worker'"
+        ),
+    )
+    parser.add_argument(
+        "--local-workers",
+        type=int,
+        default=1,
+        help="Worker processes to start on this host with --distributed (default: 1)",
+    )
+    parser.add_argument(
+        "--lease-seconds",
+        type=float,
+        default=120.0,
+        help=(
+            "Seconds without a worker heartbeat before its target is retried "
+            "elsewhere (default: 120)"
+        ),
+    )
     parser.add_argument(
         "--profile-name",
         default=None,
@@ -282,6 +318,32 @@ def _add_scan_args(subparsers: argparse._SubParsersAction) -> Any:
     return sp
 
 
+def _add_worker_args(subparsers: argparse._SubParsersAction) -> Any:
+    """Add 'worker' subcommand arguments for distributed scans."""
+    wp = subparsers.add_parser(
+        "worker",
+        help="Serve a distributed scan's work queue (see 'jmo scan --distributed')",
+    )
+    wp.add_argument(
+        "--queue-dir",
+        required=True,
+        help="Work queue directory, normally <results-dir>/.queue on a shared volume",
+    )
+    wp.add_argument(
+        "--threads",
+        type=int,
+        default=1,
+        help="Targets to scan concurrently in this worker (default: 1)",
+    )
+    wp.add_argument(
+        "--worker-id",
+        default=None,
+        help="Identity recorded on leases (default: hostname:pid)",
+    )
+    _add_logging_args(wp)
+    return wp
+
+
 def _add_report_args(subparsers: argparse._SubParsersAction) -> Any:
     """Add 'report' subcommand arguments."""
     rp = subparsers.add_parser("report", help="Aggregate findings and emit reports")
@@ -326,6 +388,33 @@ def _add_report_args(subparsers: argparse._SubParsersAction) -> Any:
         dest="policies",
         help="Policy to evaluate (can be specified multiple times, e.g., --policy owasp-top-10 --policy zero-secrets)",
     )
+    rp.add_argument(
+        "--compact-json",
+        action="store_true",
+        help="Write findings.json and findings.sarif without indentation (smaller, faster)",
+    )
+    rp.add_argument(
+        "--gzip",
+        action="store_true",
+        help=(
+            "Also write gzip-compressed findings.json.gz and findings.sarif.gz, "
+            "and gzip the dashboard's data pages in paged mode"
+        ),
+    )
+    rp.add_argument(
+        "--watch",
+        action="store_true",
+        help=(
+            "After reporting, keep watching tool outputs and update findings.json, "
+            "SUMMARY.md and the dashboard whenever one changes (Ctrl+C to stop)"
+        ),
+    )
+    rp.add_argument(
+        "--watch-interval",
+        type=float,
+        default=None,
+        help="Seconds between checks for changed tool outputs in --watch mode (default: 2)",
+    )
     _add_logging_args(rp)
     # Accept --allow-missing-tools for symmetry with scan (no-op during report)
     rp.add_argument(
@@ -1059,6 +1148,7 @@ Environment Variables:
     MCP_RESULTS_DIR: Path to results directory (overrides --results-dir)
     MCP_REPO_ROOT: Path to repository root (overrides --repo-root)
     MCP_API_KEY: API key for authentication (optional, dev mode if not set)
+    JMO_MCP_ASYNC: Same as --async when set to "true"
 
 See: docs/MCP_SETUP.md for GitHub Copilot and Claude Code integration guides.
         """,
@@ -1077,6 +1167,15 @@ See: docs/MCP_SETUP.md for GitHub Copilot and Claude Code integration guides.
         "--api-key",
         help="API key for authentication (optional, enables production mode)",
     )
+    mcp_parser.add_argument(
+        "--async",
+        dest="async_mode",
+        action="store_true",
+        help=(
+            "Run tools as async handlers on bounded thread pools and refresh "
+            "findings when a new report lands (for several agents sharing one server)"
+        ),
+    )
     _add_logging_args(mcp_parser)
     return mcp_parser
 
@@ -1891,6 +1990,7 @@ Documentation: https://docs.jmotools.com
 
     # Advanced commands
     _add_scan_args(sub)
+    _add_worker_args(sub)
     _add_report_args(sub)
     _add_ci_args(sub)
     _add_diff_args(sub)
@@ -2599,6 +2699,8 @@ class ProgressTracker:
         Returns:
             Base tool name without phase suffix
         """
+        # File-list tools split across invocations run as `<tool>#<n>`
+        tool_name = tool_name.split("#", 1)[0]
         for suffix in self._PHASE_SUFFIXES:
             if tool_name.endswith(suffix):
                 return tool_name[: -len(suffix)]
@@ -2844,8 +2946,12 @@ def cmd_scan(args) -> int:
     """
     import time
 
+    from scripts.cli.report_orchestrator import cmd_report as _cmd_report_impl
+    from scripts.cli.scan_orchestrator import ScanConfig, ScanOrchestrator
+
     # Clear tool warning deduplication tracker at scan start (Fix 1.3 - Issue #3)
     from scripts.cli.scan_utils import clear_tool_warnings
+    from scripts.core.warm_tools import warm_tools_requested
 
     clear_tool_warnings()
 
@@ -2922,6 +3028,11 @@ def cmd_scan(args) -> int:
         include_patterns=eff.get("include", []) or [],
         exclude_patterns=eff.get("exclude", []) or [],
         allow_missing_tools=getattr(args, "allow_missing_tools", False),
+        warm_tools=getattr(args, "warm_tools", False) or warm_tools_requested(),
+        distributed=getattr(args, "distributed", False),
+        local_workers=getattr(args, "local_workers", 1),
+        lease_seconds=getattr(args, "lease_seconds", 120.0),
+        adaptive_concurrency=getattr(args, "adaptive_threads", False),
     )
 
     # Use ScanOrchestrator to discover all targets
@@ -2959,6 +3070,7 @@ def cmd_scan(args) -> int:
     per_tool_config = eff.get("per_tool", {}) or {}
 
     # --- Session checkpointing ---
+    from scripts.cli.scan_queue import WorkersExitedError
     from scripts.cli.scan_session import (
         ScanSession,
         compute_config_hash,
@@ -3131,6 +3243,11 @@ def cmd_scan(args) -> int:
         except KeyboardInterrupt:
             _log(args, "WARN", "Scan interrupted by user")
             return 130
+        except WorkersExitedError as e:
+            # Distributed scan stranded by its local workers; the session is
+            # kept so --resume picks up the unscanned targets.
+            _log(args, "ERROR", f"Scan failed: {e}")
+            return 1
         except (
             Exception
         ) as e:  # Acceptable: top-level scan error handler — re-raises unless allow_missing_tools
@@ -3168,6 +3285,11 @@ def cmd_scan(args) -> int:
         except KeyboardInterrupt:
             _log(args, "WARN", "Scan interrupted by user")
             return 130
+        except WorkersExitedError as e:
+            # Distributed scan stranded by its local workers; the session is
+            # kept so --resume picks up the unscanned targets.
+            _log(args, "ERROR", f"Scan failed: {e}")
+            return 1
         except (
             Exception
         ) as e:  # Acceptable: top-level scan error handler — re-raises unless allow_missing_tools
@@ -3222,16 +3344,84 @@ def cmd_scan(args) -> int:
     return report_code if report_code != 0 else 0
 
 
+def cmd_worker(args) -> int:
+    """Claim and scan targets from a distributed scan's work queue."""
+    from scripts.cli.scan_queue import WorkQueue, run_worker
+
+    queue = WorkQueue(Path(args.queue_dir))
+    try:
+        queue.manifest()
+    except (OSError, ValueError) as e:
+        _log(args, "ERROR", f"Not a usable work queue: {args.queue_dir} ({e})")
+        return 1
+
+    completed = run_worker(
+        queue, threads=max(1, args.threads), worker_id=args.worker_id
+    )
+    _log(args, "INFO", f"Work queue drained; this worker scanned {completed} target(s)")
+    return 0
+
+
 def cmd_report(args) -> int:
     """Wrapper for report orchestrator."""
+    from scripts.cli.report_orchestrator import cmd_report as _cmd_report_impl
+    from scripts.cli.report_orchestrator import watch_report as _watch_report_impl
+
+    if getattr(args, "watch", False):
+        return _watch_report_impl(args, _log)
     return _cmd_report_impl(args, _log)
 
 
 def cmd_ci(args) -> int:
     """Wrapper for CI orchestrator."""
+    from scripts.cli.ci_orchestrator import cmd_ci as _cmd_ci_impl
+    from scripts.cli.report_orchestrator import cmd_report as _cmd_report_impl
+
     return _cmd_ci_impl(args, cmd_scan, _cmd_report_impl)
 
 
+def cmd_diff(args) -> int:
+    """Wrapper for diff commands."""
+    from scripts.cli.diff_commands import cmd_diff as _cmd_diff_impl
+
+    return _cmd_diff_impl(args)
+
+
+def cmd_history(args) -> int:
+    """Wrapper for history commands."""
+    from scripts.cli.history_commands import cmd_history as _cmd_history_impl
+
+    return _cmd_history_impl(args)
+
+
+def cmd_trends(args) -> int:
+    """Wrapper for trend commands."""
+    from scripts.cli.trend_commands import cmd_trends as _cmd_trends_impl
+
+    return _cmd_trends_impl(args)
+
+
+def cmd_policy(args) -> int:
+    """Wrapper for policy commands."""
+    from scripts.cli.policy_commands import cmd_policy as _cmd_policy_impl
+
+    return _cmd_policy_impl(args)
+
+
+def cmd_schedule(args) -> int:
+    """Wrapper for schedule commands."""
+    from scripts.cli.schedule_commands import cmd_schedule as _cmd_schedule_impl
+
+    return _cmd_schedule_impl(args)
+
+
+def cmd_build(args) -> int:
+    """Wrapper for Docker build commands."""
+    from scripts.cli.build_commands import cmd_build as _cmd_build_impl
+
+    return _cmd_build_impl(args)
+
+
 def cmd_adapters(args) -> int:
     """Handle 'jmo adapters' subcommand for plugin management."""
     from scripts.core.plugin_loader import get_available_adapters, get_plugin_registry
@@ -3525,6 +3715,8 @@ def cmd_mcp_server(args):
 
     if args.api_key:
         os.environ["MCP_API_KEY"] = args.api_key
+    if getattr(args, "async_mode", False):
+        os.environ["JMO_MCP_ASYNC"] = "true"
 
     # Configure logging based on args
     if args.human_logs:
@@ -3534,7 +3726,11 @@ def cmd_mcp_server(args):
 
     try:
         # Import MCP server (lazy import to avoid startup cost)
-        from scripts.jmo_mcp.jmo_server import mcp
+        from scripts.jmo_mcp.jmo_server import (
+            mcp,
+            start_background_tasks,
+            stop_background_tasks,
+        )
 
         # Log server start info
         sys.stderr.write("Starting JMo Security MCP Server...\n")
@@ -3545,7 +3741,11 @@ def cmd_mcp_server(args):
         sys.stderr.write("Press Ctrl+C to stop.\n\n")
 
         # Run MCP server (blocking call - uses stdio transport by default)
-        mcp.run()
+        start_background_tasks()
+        try:
+            mcp.run()
+        finally:
+            stop_background_tasks()
 
         return 0
 
@@ -3791,6 +3991,8 @@ def main():
         return cmd_report(args)
     elif args.cmd == "scan":
         return cmd_scan(args)
+    elif args.cmd == "worker":
+        return cmd_worker(args)
     elif args.cmd == "ci":
         return cmd_ci(args)
     elif args.cmd == "adapters":
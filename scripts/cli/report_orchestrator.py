@@ -3,15 +3,22 @@
 
 from __future__ import annotations
 
+import contextlib
 import json
 import logging
 import os
+import threading
 import time
+from functools import partial
 from pathlib import Path
 
 from scripts.core.config import load_config_with_env_overrides
 from scripts.core.exceptions import OPANotFoundException
-from scripts.core.normalize_and_report import gather_results
+from scripts.core.normalize_and_report import (
+    TARGET_DIR_NAMES,
+    IncrementalGatherer,
+    gather_results,
+)
 from scripts.core.reporters.basic_reporter import write_json, write_markdown
 from scripts.core.reporters.compliance_reporter import (
     write_attack_navigator_json,
@@ -20,6 +27,12 @@ from scripts.core.reporters.compliance_reporter import (
 )
 from scripts.core.reporters.csv_reporter import write_csv
 from scripts.core.reporters.html_reporter import write_html
+from scripts.core.reporters.report_engine import (
+    DEFAULT_MAX_WORKERS,
+    ReportJob,
+    compute_aggregates,
+    run_report_jobs,
+)
 from scripts.core.reporters.sarif_reporter import write_sarif
 from scripts.core.reporters.simple_html_reporter import write_simple_html
 from scripts.core.reporters.suppression_reporter import write_suppression_report
@@ -29,6 +42,7 @@ from scripts.core.suppress import (
     filter_suppressed_with_summary,
     load_suppressions,
 )
+from scripts.core.warm_tools import warm_session, warm_tools_requested
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +51,11 @@ __version__ = "1.0.5"
 
 SEV_ORDER = ["CRITICAL", "HIGH", "MEDIUM", "LOW", "INFO"]
 
+# Formats rewritten on each change in watch mode; the rest need a full report
+WATCH_OUTPUTS = ("json", "md", "html")
+DEFAULT_WATCH_INTERVAL = 2.0
+MIN_WATCH_INTERVAL = 0.05
+
 
 def fail_code(threshold: str | None, counts: dict) -> int:
     """Determine exit code based on severity threshold.
@@ -58,73 +77,58 @@ def fail_code(threshold: str | None, counts: dict) -> int:
     return 1 if any(counts.get(s, 0) > 0 for s in severities) else 0
 
 
-def cmd_report(args, _log_fn) -> int:
-    """Run report command: aggregate findings and generate outputs.
-
-    Args:
-        args: Parsed CLI arguments with results_dir, config, fail_on, etc.
-        _log_fn: Logging function (args, level, message) -> None
+def _report_workers() -> int:
+    """Writer threads for report formats; follows JMO_THREADS like gathering."""
+    try:
+        return max(1, int(os.getenv("JMO_THREADS", "")))
+    except ValueError:
+        return DEFAULT_MAX_WORKERS
 
-    Returns:
-        Exit code (0 for success, 1 if threshold exceeded, 2 for errors)
-    """
-    cfg = load_config_with_env_overrides(args.config)
 
-    # Normalize results_dir from positional or optional
-    rd = (
+def _results_dir_arg(args) -> str | None:
+    """results_dir from the positional or optional form."""
+    return (
         getattr(args, "results_dir_opt", None)
         or getattr(args, "results_dir_pos", None)
         or getattr(args, "results_dir", None)
     )
-    if not rd:
-        _log_fn(
-            args,
-            "ERROR",
-            "results_dir not provided. Use positional 'results_dir' or --results-dir <path>.",
-        )
-        return 2
 
-    results_dir = Path(rd)
-    out_dir = Path(args.out) if args.out else results_dir / "summaries"
-    out_dir.mkdir(parents=True, exist_ok=True)
 
-    # Set profiling environment
-    prev_profile = os.getenv("JMO_PROFILE")
-    if args.profile:
-        os.environ["JMO_PROFILE"] = "1"
+def _severity_counts(findings: list[dict]) -> dict[str, int]:
+    counts = dict.fromkeys(SEV_ORDER, 0)
+    for f in findings:
+        s = f.get("severity")
+        if s in counts:
+            counts[s] += 1
+    return counts
 
-    prev_threads = os.getenv("JMO_THREADS")
-    if args.threads is not None:
-        os.environ["JMO_THREADS"] = str(max(1, args.threads))
-    elif prev_threads is None and isinstance(cfg.threads, int):
-        # cfg.threads is `int | str | None` — the str case is the literal
-        # "auto", which means auto-detect. Leaving JMO_THREADS unset is
-        # exactly that, and avoids int("auto") raising ValueError.
-        os.environ["JMO_THREADS"] = str(max(1, cfg.threads))
 
-    # Gather and process findings
-    start = time.perf_counter()
-    findings = gather_results(results_dir)
-    elapsed = time.perf_counter() - start
+def _apply_suppressions(
+    args, _log_fn, results_dir: Path, findings: list[dict]
+) -> tuple[list[dict], dict, SuppressionSummary | None]:
+    """Drop suppressed findings (jmo.suppress.yml in results_dir, else cwd).
 
-    # Apply suppressions
+    Returns:
+        (remaining findings, loaded suppressions, summary if any were loaded)
+    """
     sup_file = (
         (results_dir / "jmo.suppress.yml")
         if (results_dir / "jmo.suppress.yml").exists()
         else (Path.cwd() / "jmo.suppress.yml")
     )
     suppressions = load_suppressions(str(sup_file) if sup_file.exists() else None)
-    suppressed_ids: list[str] = []
     suppression_summary: SuppressionSummary | None = None
     if suppressions:
         findings, suppression_summary = filter_suppressed_with_summary(
             findings, suppressions
         )
-        suppressed_ids = suppression_summary.suppressed_ids
         if suppression_summary.total_suppressed > 0:
             _log_fn(args, "INFO", suppression_summary.debt_label)
+    return findings, suppressions, suppression_summary
+
 
-    # Generate metadata for v1.0.0 output format
+def _report_metadata(results_dir: Path, cfg, findings: list[dict]) -> dict:
+    """Metadata block for the v1.0.0 output format."""
     import uuid
 
     from scripts.core.reporters.basic_reporter import _generate_metadata
@@ -157,19 +161,12 @@ def cmd_report(args, _log_fn) -> int:
 
     # Count targets scanned
     target_count = 0
-    for target_dir_name in [
-        "individual-repos",
-        "individual-images",
-        "individual-iac",
-        "individual-web",
-        "individual-gitlab",
-        "individual-k8s",
-    ]:
+    for target_dir_name in TARGET_DIR_NAMES:
         target_dir = results_dir / target_dir_name
         if target_dir.exists():
             target_count += sum(1 for p in target_dir.iterdir() if p.is_dir())
 
-    metadata = _generate_metadata(
+    return _generate_metadata(
         findings,
         scan_id=scan_id,
         profile=profile,
@@ -177,22 +174,98 @@ def cmd_report(args, _log_fn) -> int:
         target_count=target_count,
     )
 
-    # Write reports (v1.0.0: with metadata wrapper)
+
+def _build_report_jobs(
+    args,
+    cfg,
+    findings: list[dict],
+    out_dir: Path,
+    metadata: dict,
+    suppressions: dict,
+    suppression_summary: SuppressionSummary | None,
+) -> list[ReportJob]:
+    """One writer job per configured output format."""
+    # Write reports (v1.0.0: with metadata wrapper). One pass over findings
+    # builds the groupings every format shares; formats then write concurrently.
+    aggregates = compute_aggregates(findings)
+    compact_json = getattr(args, "compact_json", False)
+    gzip_copy = getattr(args, "gzip", False)
+    jobs: list[ReportJob] = []
     if "json" in cfg.outputs:
-        write_json(findings, out_dir / "findings.json", metadata=metadata)
+        jobs.append(
+            ReportJob(
+                "json",
+                partial(
+                    write_json,
+                    findings,
+                    out_dir / "findings.json",
+                    metadata=metadata,
+                    compact=compact_json,
+                    gzip_copy=gzip_copy,
+                    index_path=out_dir / "findings.idx",
+                ),
+            )
+        )
     if "md" in cfg.outputs:
-        write_markdown(findings, out_dir / "SUMMARY.md")
+        jobs.append(
+            ReportJob(
+                "md",
+                partial(
+                    write_markdown,
+                    findings,
+                    out_dir / "SUMMARY.md",
+                    aggregates=aggregates,
+                ),
+            )
+        )
     if "yaml" in cfg.outputs:
-        try:
-            write_yaml(findings, out_dir / "findings.yaml", metadata=metadata)
-        except RuntimeError as e:
-            _log_fn(args, "DEBUG", f"YAML reporter unavailable: {e}")
+        jobs.append(
+            ReportJob(
+                "yaml",
+                partial(
+                    write_yaml, findings, out_dir / "findings.yaml", metadata=metadata
+                ),
+                tolerate=(RuntimeError,),
+            )
+        )
     if "html" in cfg.outputs:
-        write_html(findings, out_dir / "dashboard.html")
+        jobs.append(
+            ReportJob(
+                "html",
+                partial(
+                    write_html,
+                    findings,
+                    out_dir / "dashboard.html",
+                    aggregates=aggregates,
+                    gzip_pages=gzip_copy,
+                ),
+            )
+        )
     if "simple-html" in cfg.outputs:
-        write_simple_html(findings, out_dir / "simple-report.html")
+        jobs.append(
+            ReportJob(
+                "simple-html",
+                partial(
+                    write_simple_html,
+                    findings,
+                    out_dir / "simple-report.html",
+                    aggregates=aggregates,
+                ),
+            )
+        )
     if "sarif" in cfg.outputs:
-        write_sarif(findings, out_dir / "findings.sarif")
+        jobs.append(
+            ReportJob(
+                "sarif",
+                partial(
+                    write_sarif,
+                    findings,
+                    out_dir / "findings.sarif",
+                    compact=compact_json,
+                    gzip_copy=gzip_copy,
+                ),
+            )
+        )
     if "csv" in cfg.outputs:
         # Get CSV configuration from config
         csv_config = getattr(cfg, "csv", None)
@@ -200,31 +273,119 @@ def cmd_report(args, _log_fn) -> int:
         if csv_config and isinstance(csv_config, dict):
             csv_columns = csv_config.get("columns")
         # Pass suppressions for triage status column (Feature #3)
-        write_csv(
-            findings,
-            out_dir / "findings.csv",
-            columns=csv_columns,
-            suppressions=suppressions,
+        jobs.append(
+            ReportJob(
+                "csv",
+                partial(
+                    write_csv,
+                    findings,
+                    out_dir / "findings.csv",
+                    columns=csv_columns,
+                    suppressions=suppressions,
+                ),
+            )
         )
     if suppressions:
-        write_suppression_report(
-            [str(x) for x in suppressed_ids],
-            suppressions,
-            out_dir / "SUPPRESSIONS.md",
-            summary=suppression_summary,
+        jobs.append(
+            ReportJob(
+                "suppressions",
+                partial(
+                    write_suppression_report,
+                    (
+                        [str(x) for x in suppression_summary.suppressed_ids]
+                        if suppression_summary
+                        else []
+                    ),
+                    suppressions,
+                    out_dir / "SUPPRESSIONS.md",
+                    summary=suppression_summary,
+                ),
+            )
         )
 
-    # Write compliance framework reports (v1.2.0)
-    try:
-        write_compliance_summary(findings, out_dir / "COMPLIANCE_SUMMARY.md")
-        write_pci_dss_report(findings, out_dir / "PCI_DSS_COMPLIANCE.md")
-        write_attack_navigator_json(findings, out_dir / "attack-navigator.json")
-    except (OSError, PermissionError) as e:
-        _log_fn(args, "DEBUG", f"Failed to write compliance reports: {e}")
-        logger.debug(f"Compliance report write failed: {e}")
-    except (KeyError, ValueError, TypeError) as e:
-        _log_fn(args, "DEBUG", f"Failed to write compliance reports: {e}")
-        logger.debug(f"Compliance data formatting error: {e}")
+    # Compliance framework reports (v1.2.0) never fail the report
+    compliance_errors = (OSError, KeyError, ValueError, TypeError)
+    for name, writer, filename in (
+        ("compliance-summary", write_compliance_summary, "COMPLIANCE_SUMMARY.md"),
+        ("pci-dss", write_pci_dss_report, "PCI_DSS_COMPLIANCE.md"),
+        ("attack-navigator", write_attack_navigator_json, "attack-navigator.json"),
+    ):
+        jobs.append(
+            ReportJob(
+                name,
+                partial(writer, findings, out_dir / filename, aggregates=aggregates),
+                tolerate=compliance_errors,
+            )
+        )
+    return jobs
+
+
+def _run_report_jobs(args, _log_fn, jobs: list[ReportJob]) -> None:
+    """Write formats concurrently, logging (not raising) tolerated failures."""
+    for job, error in run_report_jobs(jobs, max_workers=_report_workers()):
+        if job.name == "yaml":
+            _log_fn(args, "DEBUG", f"YAML reporter unavailable: {error}")
+        else:
+            _log_fn(args, "DEBUG", f"Failed to write compliance reports: {error}")
+            logger.debug(f"Compliance report '{job.name}' failed: {error}")
+
+
+def cmd_report(args, _log_fn, gatherer: IncrementalGatherer | None = None) -> int:
+    """Run report command: aggregate findings and generate outputs.
+
+    Args:
+        args: Parsed CLI arguments with results_dir, config, fail_on, etc.
+        _log_fn: Logging function (args, level, message) -> None
+        gatherer: Gather findings through this (watch mode) instead of
+            re-parsing every tool output
+
+    Returns:
+        Exit code (0 for success, 1 if threshold exceeded, 2 for errors)
+    """
+    cfg = load_config_with_env_overrides(args.config)
+
+    rd = _results_dir_arg(args)
+    if not rd:
+        _log_fn(
+            args,
+            "ERROR",
+            "results_dir not provided. Use positional 'results_dir' or --results-dir <path>.",
+        )
+        return 2
+
+    results_dir = Path(rd)
+    out_dir = Path(args.out) if args.out else results_dir / "summaries"
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    # Set profiling environment
+    prev_profile = os.getenv("JMO_PROFILE")
+    if args.profile:
+        os.environ["JMO_PROFILE"] = "1"
+
+    prev_threads = os.getenv("JMO_THREADS")
+    if args.threads is not None:
+        os.environ["JMO_THREADS"] = str(max(1, args.threads))
+    elif prev_threads is None and isinstance(cfg.threads, int):
+        # cfg.threads is `int | str | None` — the str case is the literal
+        # "auto", which means auto-detect. Leaving JMO_THREADS unset is
+        # exactly that, and avoids int("auto") raising ValueError.
+        os.environ["JMO_THREADS"] = str(max(1, cfg.threads))
+
+    # Gather and process findings
+    start = time.perf_counter()
+    findings = (
+        gatherer.findings() if gatherer is not None else gather_results(results_dir)
+    )
+    elapsed = time.perf_counter() - start
+
+    findings, suppressions, suppression_summary = _apply_suppressions(
+        args, _log_fn, results_dir, findings
+    )
+    metadata = _report_metadata(results_dir, cfg, findings)
+    jobs = _build_report_jobs(
+        args, cfg, findings, out_dir, metadata, suppressions, suppression_summary
+    )
+    _run_report_jobs(args, _log_fn, jobs)
 
     # Evaluate and write policy reports (v1.0.0 Feature #5: Policy-as-Code)
     # Determine policies to evaluate using configuration precedence:
@@ -267,9 +428,18 @@ def cmd_report(args, _log_fn) -> int:
                 f"Evaluating {len(policy_names)} policies: {', '.join(policy_names)}",
             )
 
-            policy_results = evaluate_policies(
-                findings, policy_names, builtin_dir, user_dir
+            # With several policies, one warm OPA server compiles each once
+            # instead of `opa eval` cold-starting per policy.
+            warm = (
+                warm_session(tools=["opa"])
+                if len(policy_names) > 1
+                and (getattr(args, "warm_tools", False) or warm_tools_requested())
+                else contextlib.nullcontext()
             )
+            with warm:
+                policy_results = evaluate_policies(
+                    findings, policy_names, builtin_dir, user_dir
+                )
 
             if policy_results:
                 write_policy_report(policy_results, out_dir / "POLICY_REPORT.md")
@@ -362,16 +532,9 @@ def cmd_report(args, _log_fn) -> int:
     elif "JMO_THREADS" in os.environ and args.threads is not None:
         del os.environ["JMO_THREADS"]
 
-    # Calculate severity counts
-    counts = dict.fromkeys(SEV_ORDER, 0)
-    for f in findings:
-        s = f.get("severity")
-        if s in counts:
-            counts[s] += 1
-
     # Determine exit code
     threshold = args.fail_on if args.fail_on is not None else cfg.fail_on
-    code = fail_code(threshold, counts)
+    code = fail_code(threshold, _severity_counts(findings))
 
     _log_fn(
         args,
@@ -427,3 +590,81 @@ def cmd_report(args, _log_fn) -> int:
 
     # Return non-zero if either severity threshold or policy violations occurred
     return max(code, policy_exit_code)
+
+
+def watch_report(args, _log_fn, stop: threading.Event | None = None) -> int:
+    """Run ``jmo report --watch``: report once, then again on each change.
+
+    Polls the tool outputs under ``individual-*/`` every ``--watch-interval``
+    seconds. Only outputs that changed are re-parsed (``IncrementalGatherer``)
+    and only findings.json, SUMMARY.md and the dashboard are rewritten; the
+    other formats, policy evaluation and history storage run with the
+    initial report.
+
+    Args:
+        args: Parsed CLI arguments (as for cmd_report, plus watch_interval)
+        _log_fn: Logging function (args, level, message) -> None
+        stop: Ends watching once set (Ctrl+C also ends it)
+
+    Returns:
+        Exit code of the most recent report
+    """
+    rd = _results_dir_arg(args)
+    if not rd:
+        return cmd_report(args, _log_fn)  # Reports the missing argument
+
+    results_dir = Path(rd)
+    gatherer = IncrementalGatherer(results_dir)
+    gatherer.refresh()
+    code = cmd_report(args, _log_fn, gatherer=gatherer)
+
+    cfg = load_config_with_env_overrides(args.config)
+    out_dir = Path(args.out) if args.out else results_dir / "summaries"
+    formats = [name for name in WATCH_OUTPUTS if name in cfg.outputs]
+    interval = max(
+        MIN_WATCH_INTERVAL,
+        getattr(args, "watch_interval", None) or DEFAULT_WATCH_INTERVAL,
+    )
+    threshold = args.fail_on if args.fail_on is not None else cfg.fail_on
+    stop = stop or threading.Event()
+
+    _log_fn(
+        args,
+        "INFO",
+        f"Watching {results_dir} for tool output changes (Ctrl+C to stop)",
+    )
+    try:
+        while not stop.wait(interval):
+            changed = gatherer.refresh()
+            if not changed:
+                continue
+            _log_fn(
+                args,
+                "INFO",
+                f"{len(changed)} tool output(s) changed: "
+                + ", ".join(str(p.relative_to(results_dir)) for p in changed),
+            )
+            findings, suppressions, suppression_summary = _apply_suppressions(
+                args, _log_fn, results_dir, gatherer.findings()
+            )
+            metadata = _report_metadata(results_dir, cfg, findings)
+            jobs = _build_report_jobs(
+                args,
+                cfg,
+                findings,
+                out_dir,
+                metadata,
+                suppressions,
+                suppression_summary,
+            )
+            _run_report_jobs(args, _log_fn, [j for j in jobs if j.name in formats])
+            code = fail_code(threshold, _severity_counts(findings))
+            _log_fn(
+                args,
+                "INFO",
+                f"Updated {', '.join(formats) or 'no outputs'} "
+                f"({len(findings)} findings, exit={code})",
+            )
+    except KeyboardInterrupt:
+        _log_fn(args, "INFO", "Stopped watching")
+    return code
@@ -144,6 +144,8 @@ class RichScanProgressTracker:
         Returns:
             Base tool name without phase suffix
         """
+        # File-list tools split across invocations run as `<tool>#<n>`
+        tool_name = tool_name.split("#", 1)[0]
         for suffix in self._PHASE_SUFFIXES:
             if tool_name.endswith(suffix):
                 return tool_name[: -len(suffix)]
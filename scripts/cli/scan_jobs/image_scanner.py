@@ -14,7 +14,9 @@ from collections.abc import Callable
 from pathlib import Path
 
 from ...core.config import RetryConfig
+from ...core.sbom_index import build_sbom_index
 from ...core.tool_runner import ToolDefinition, ToolRunner
+from ...core.warm_tools import trivy_client_options
 from ..path_sanitizers import _sanitize_path_component, _validate_output_path
 from ..scan_utils import find_tool, report_tool_failure, write_stub
 
@@ -85,6 +87,7 @@ def scan_image(
         trivy_path = _find_tool("trivy")
         if trivy_path:
             trivy_flags = get_tool_flags("trivy")
+            server_args, server_env = trivy_client_options()
             trivy_cmd = [
                 trivy_path,
                 "image",
@@ -93,6 +96,7 @@ def scan_image(
                 "json",
                 "--scanners",
                 "vuln,secret,misconfig",
+                *server_args,
                 *trivy_flags,
                 image,
                 "-o",
@@ -107,6 +111,7 @@ def scan_image(
                     retries=retries,
                     ok_return_codes=(0, 1),  # 0=clean, 1=findings
                     capture_stdout=False,
+                    env=server_env,
                 )
             )
         elif allow_missing_tools:
@@ -171,6 +176,10 @@ def scan_image(
             if result.attempts > 0:
                 attempts_map[result.tool] = result.attempts
 
+    # Index the SBOM once, so every report, diff and MCP query reuses it
+    if statuses.get("syft"):
+        build_sbom_index(out_dir / "syft.json")
+
     # Include attempts metadata if any retries occurred
     if attempts_map:
         statuses["__attempts__"] = attempts_map  # type: ignore[assignment]  # Store retry metadata alongside bool statuses
@@ -52,13 +52,18 @@ Integrates with ToolRunner for parallel execution and resilient error handling.
 
 from __future__ import annotations
 
+import json
 import logging
 from collections.abc import Callable
 from pathlib import Path
+from typing import Any
 
 from ...core.config import RetryConfig
+from ...core.file_inventory import INVENTORY_FILENAME, FileInventory, build_inventory
 from ...core.paths import get_yara_rules_dir
-from ...core.tool_runner import ToolDefinition, ToolRunner
+from ...core.sbom_index import build_sbom_index
+from ...core.tool_runner import ToolDefinition, ToolResult, ToolRunner
+from ...core.warm_tools import trivy_client_options
 from ..path_sanitizers import _sanitize_path_component, _validate_output_path
 from ..scan_utils import find_tool, report_tool_failure, write_stub
 
@@ -76,15 +81,29 @@ TOOL_TIMEOUT_DEFAULTS: dict[str, int] = {
 }
 
 # Upper bound on file arguments passed to a single per-file tool invocation.
-# Windows caps a command line at 32767 characters; a few hundred absolute paths
-# stays well inside that while covering every repository we have measured
-# (docker-library/postgres, the densest, has 55 shell scripts and 26
-# Dockerfiles). Exceeding it is reported, never silently truncated - a cap that
-# does not announce itself reads as "everything was scanned" when it was not.
+# Lists longer than this are split into several invocations (see
+# `_batch_file_args`) rather than truncated: the cap used to drop every file
+# past the 300th with only a warning, so a large monorepo's shell scripts and
+# Dockerfiles simply went unexamined. A few hundred paths per batch also keeps
+# batches small enough for ToolRunner to spread them across workers.
 MAX_FILE_ARGS = 300
 
+# Windows caps a command line at 32767 characters (CreateProcess); POSIX
+# ARG_MAX is far larger but shared with the environment. One budget for every
+# platform keeps batching - and therefore the number of invocations a scan
+# makes - identical wherever it runs. Per-argument overhead covers the
+# separating space and the quotes Windows adds around paths with spaces.
+MAX_COMMAND_CHARS = 30_000
+_ARG_OVERHEAD_CHARS = 3
 
-def _collect_files(repo: Path, patterns: tuple[str, ...], tool_name: str) -> list[str]:
+# Batches of one tool run as `<tool>#<n>` so results can be grouped back to the
+# tool. `#` appears in no tool name, and progress trackers strip it.
+BATCH_SEPARATOR = "#"
+
+
+def _collect_files(
+    inventory: FileInventory, patterns: tuple[str, ...], tool_name: str
+) -> list[str]:
     """Collect matching files for a tool that takes file arguments.
 
     Both shellcheck and hadolint accept many paths per invocation; scanning one
@@ -92,32 +111,156 @@ def _collect_files(repo: Path, patterns: tuple[str, ...], tool_name: str) -> lis
     take `dockerfiles[0]`, which on docker-library/postgres meant 1 of 26 files
     (and 1 of 14 on kubernetes-goat) - about 90% of Dockerfiles unexamined,
     with nothing in the output to indicate it.
+
+    Matching runs against the target's file inventory rather than globbing the
+    tree per tool. Vendored trees (node_modules, a bundled venv) are pruned by
+    the inventory walk itself - scanning them buries the repo's own findings in
+    third-party noise. Every match is returned; `_batch_file_args` decides how
+    many invocations they need.
     """
-    seen: set[Path] = set()
-    for pattern in patterns:
-        for path in repo.glob(pattern):
-            # Repositories vendor dependencies; scanning node_modules or a
-            # bundled venv buries the repo's own findings in third-party noise.
-            parts = set(path.parts)
-            if parts & {".git", "node_modules", "vendor", ".venv", "venv"}:
-                continue
-            if path.is_file():
-                seen.add(path)
-
-    files = sorted(seen)
-    if len(files) > MAX_FILE_ARGS:
-        logger.warning(
-            "%s: %d matching files in %s, scanning the first %d "
-            "(command-line length limit) - %d file(s) NOT scanned",
-            tool_name,
-            len(files),
-            repo.name,
-            MAX_FILE_ARGS,
-            len(files) - MAX_FILE_ARGS,
+    files = [str(f) for f in inventory.glob(*patterns)]
+    logger.debug(
+        "%s: %d matching file(s) in %s", tool_name, len(files), inventory.root.name
+    )
+    return files
+
+
+def _batch_file_args(
+    base_command: list[str],
+    files: list[str],
+    max_chars: int | None = None,
+    max_files: int | None = None,
+) -> list[list[str]]:
+    """Split `files` into batches whose full command line fits `max_chars`.
+
+    Order is preserved, so batch N always holds the same files for the same
+    repository. A single path longer than the remaining budget still gets a
+    batch of its own: a command the OS may reject is reported as that batch's
+    failure, which is better than a file silently left out.
+    """
+    max_chars = MAX_COMMAND_CHARS if max_chars is None else max_chars
+    max_files = MAX_FILE_ARGS if max_files is None else max_files
+    base_chars = sum(len(arg) + _ARG_OVERHEAD_CHARS for arg in base_command)
+    batches: list[list[str]] = []
+    current: list[str] = []
+    used = base_chars
+    for path in files:
+        cost = len(path) + _ARG_OVERHEAD_CHARS
+        if current and (used + cost > max_chars or len(current) >= max_files):
+            batches.append(current)
+            current, used = [], base_chars
+        current.append(path)
+        used += cost
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _file_list_tool_defs(
+    name: str,
+    base_command: list[str],
+    files: list[str],
+    output_file: Path,
+    **kwargs,
+) -> list[ToolDefinition]:
+    """ToolDefinitions running `base_command` over `files`, batched as needed.
+
+    A list that fits one command line yields exactly the definition this
+    scanner always built. Otherwise each batch becomes `<name>#<n>`, capturing
+    stdout; `_merge_batch_results` folds them back into `<name>.json`.
+    """
+    batches = _batch_file_args(base_command, files)
+    if len(batches) == 1:
+        return [
+            ToolDefinition(
+                name=name,
+                command=[*base_command, *batches[0]],
+                output_file=output_file,
+                capture_stdout=True,
+                **kwargs,
+            )
+        ]
+    logger.info(
+        "%s: %d files split into %d invocations (command-line length limit)",
+        name,
+        len(files),
+        len(batches),
+    )
+    return [
+        ToolDefinition(
+            name=f"{name}{BATCH_SEPARATOR}{i}",
+            command=[*base_command, *batch],
+            output_file=output_file,
+            capture_stdout=True,
+            **kwargs,
         )
-        files = files[:MAX_FILE_ARGS]
+        for i, batch in enumerate(batches, start=1)
+    ]
+
+
+def _merge_json_outputs(outputs: list[str]) -> Any:
+    """Merge several JSON documents from batches of one tool into one.
+
+    hadolint and shellcheck both emit a top-level array, which concatenates.
+    An object merges key by key, extending list values - the shape of
+    shellcheck's `json1` format (`{"comments": [...]}`) if a user selects it
+    through flags. Raises ValueError for anything else rather than guessing.
+    """
+    merged: Any = None
+    for raw in outputs:
+        doc = json.loads(raw) if raw.strip() else []
+        if merged is None:
+            merged = doc
+        elif isinstance(merged, list) and isinstance(doc, list):
+            merged.extend(doc)
+        elif isinstance(merged, dict) and isinstance(doc, dict):
+            for key, value in doc.items():
+                if isinstance(merged.get(key), list) and isinstance(value, list):
+                    merged[key].extend(value)
+                else:
+                    merged.setdefault(key, value)
+        else:
+            raise ValueError(
+                f"cannot merge {type(doc).__name__} into {type(merged).__name__}"
+            )
+    return [] if merged is None else merged
+
+
+def _merge_batch_results(
+    tool: str, results: list[ToolResult], output_file: Path
+) -> tuple[bool, int]:
+    """Write the merged output of a batched tool. Returns (ok, max attempts).
 
-    return [str(f) for f in files]
+    Every successful batch's findings are written, even when another batch
+    failed - discarding them would lose real findings to make the failure
+    look tidier. The tool is still recorded failed in that case, and each
+    failed batch is reported by name, because its files were not examined.
+    """
+    ordered = sorted(results, key=lambda r: int(r.tool.rsplit(BATCH_SEPARATOR, 1)[1]))
+    ok = True
+    outputs: list[str] = []
+    for result in ordered:
+        if result.status == "success":
+            outputs.append(result.stdout or "")
+        else:
+            ok = False
+            report_tool_failure(
+                result,
+                f"this batch of {tool}'s files failed, so they were NOT scanned",
+            )
+    try:
+        merged = _merge_json_outputs(outputs)
+    except ValueError as e:
+        logger.error(
+            "%s: could not merge output from %d batch(es): %s - its findings "
+            "are MISSING from this scan",
+            tool,
+            len(outputs),
+            e,
+        )
+        return False, max(r.attempts for r in results)
+    output_file.write_text(json.dumps(merged), encoding="utf-8")
+    return ok, max(r.attempts for r in results)
 
 
 def scan_repository(
@@ -244,6 +387,26 @@ def scan_repository(
                 return [str(f) for f in flags]
         return []
 
+    # One walk of the repository, shared by every block below that needs to
+    # know what files exist. Built on first use - a trufflehog-only scan never
+    # pays for it - and saved next to the tool outputs so the yara subprocess
+    # and the report phase (snippet extraction) reuse it instead of walking
+    # again. Previously each of those asked the filesystem separately: on a
+    # 500k-file monorepo the repeated walks alone cost minutes.
+    inventory_cache: list[FileInventory] = []
+
+    def get_inventory() -> FileInventory:
+        if not inventory_cache:
+            inventory = build_inventory(repo)
+            try:
+                inventory.save(out_dir / INVENTORY_FILENAME)
+            except OSError as e:
+                # Consumers fall back to walking; a lost inventory costs time,
+                # never coverage.
+                logger.debug(f"Could not save file inventory for {repo.name}: {e}")
+            inventory_cache.append(inventory)
+        return inventory_cache[0]
+
     # TruffleHog: Verified secrets scanning
     # Uses filesystem mode to scan working directory (not just git history)
     # This catches secrets that may not be committed yet or in non-git directories
@@ -327,6 +490,7 @@ def scan_repository(
         trivy_path = _find_tool("trivy")
         if trivy_path:
             trivy_flags = get_tool_flags("trivy")
+            server_args, server_env = trivy_client_options()
             trivy_cmd = [
                 trivy_path,
                 "fs",
@@ -335,6 +499,7 @@ def scan_repository(
                 "json",
                 "--scanners",
                 "vuln,secret,misconfig",
+                *server_args,
                 *trivy_flags,
                 str(repo),
                 "-o",
@@ -349,6 +514,7 @@ def scan_repository(
                     retries=retries,
                     ok_return_codes=(0, 1),
                     capture_stdout=False,
+                    env=server_env,
                 )
             )
         elif allow_missing_tools:
@@ -424,7 +590,7 @@ def scan_repository(
             # docker-library/postgres had 1 of its 26 Dockerfiles scanned and
             # kubernetes-goat 1 of 14 - ~90% unexamined, silently.
             dockerfiles = _collect_files(
-                repo,
+                get_inventory(),
                 ("**/Dockerfile", "**/Dockerfile.*", "**/*.Dockerfile"),
                 "hadolint",
             )
@@ -434,17 +600,16 @@ def scan_repository(
                     "-f",
                     "json",
                     *hadolint_flags,
-                    *dockerfiles,
                 ]
-                tool_defs.append(
-                    ToolDefinition(
-                        name="hadolint",
-                        command=hadolint_cmd,
-                        output_file=hadolint_out,
+                tool_defs.extend(
+                    _file_list_tool_defs(
+                        "hadolint",
+                        hadolint_cmd,
+                        dockerfiles,
+                        hadolint_out,
                         timeout=get_tool_timeout("hadolint", timeout),
                         retries=retries,
                         ok_return_codes=(0, 1),
-                        capture_stdout=True,
                     )
                 )
         elif allow_missing_tools:
@@ -469,26 +634,25 @@ def scan_repository(
         if shellcheck_path:
             shellcheck_flags = get_tool_flags("shellcheck")
             shell_scripts = _collect_files(
-                repo, ("**/*.sh", "**/*.bash", "**/*.ksh"), "shellcheck"
+                get_inventory(), ("**/*.sh", "**/*.bash", "**/*.ksh"), "shellcheck"
             )
             if shell_scripts:
                 shellcheck_cmd = [
                     shellcheck_path,
                     "--format=json",
                     *shellcheck_flags,
-                    *shell_scripts,
                 ]
-                tool_defs.append(
-                    ToolDefinition(
-                        name="shellcheck",
-                        command=shellcheck_cmd,
-                        output_file=shellcheck_out,
+                tool_defs.extend(
+                    _file_list_tool_defs(
+                        "shellcheck",
+                        shellcheck_cmd,
+                        shell_scripts,
+                        shellcheck_out,
                         timeout=get_tool_timeout("shellcheck", timeout),
                         retries=retries,
                         # 0 = clean, 1 = findings. 2+ are fatal parse/usage
                         # errors and must NOT be graded acceptable.
                         ok_return_codes=(0, 1),
-                        capture_stdout=True,
                     )
                 )
         elif allow_missing_tools:
@@ -641,11 +805,7 @@ def scan_repository(
         if zap_baseline_path or zap_docker_path:
             zap_flags = get_tool_flags("zap")
             # Check for web-related files (HTML, JS, PHP, etc.)
-            web_files = (
-                list(repo.glob("**/*.html"))
-                + list(repo.glob("**/*.js"))
-                + list(repo.glob("**/*.php"))
-            )
+            web_files = get_inventory().glob("**/*.html", "**/*.js", "**/*.php")
             if web_files:
                 # Use ZAP baseline scan on first web file found
                 # Note: This is a simplified approach; full ZAP requires live server
@@ -720,9 +880,7 @@ def scan_repository(
         if falco_path:
             falco_flags = get_tool_flags("falco")
             # Look for Falco rule files in repository
-            falco_rules = list(repo.glob("**/*falco*.yaml")) + list(
-                repo.glob("**/*falco*.yml")
-            )
+            falco_rules = get_inventory().glob("**/*falco*.yaml", "**/*falco*.yml")
             if falco_rules:
                 # Validate Falco rules using falco --validate
                 rules_file = falco_rules[0]
@@ -765,9 +923,7 @@ def scan_repository(
             binaries = []
             for pattern in ["**/*-afl", "**/*-fuzzer", "**/bin/*", "**/build/*"]:
                 found = [
-                    f
-                    for f in repo.glob(pattern)
-                    if f.is_file() and f.stat().st_mode & 0o111
+                    f for f in get_inventory().glob(pattern) if f.stat().st_mode & 0o111
                 ]
                 binaries.extend(found)
 
@@ -1008,11 +1164,11 @@ def scan_repository(
     if "prowler" in tools:
         prowler_out = out_dir / "prowler.json"
         # Check for cloud config files (terraform, cloudformation, etc.)
-        cloud_files = (
-            list(repo.glob("**/*.tf"))
-            + list(repo.glob("**/*.tfvars"))
-            + list(repo.glob("**/cloudformation.yaml"))
-            + list(repo.glob("**/cloudformation.json"))
+        cloud_files = get_inventory().glob(
+            "**/*.tf",
+            "**/*.tfvars",
+            "**/cloudformation.yaml",
+            "**/cloudformation.json",
         )
         prowler_path = _find_tool("prowler")
         if cloud_files and prowler_path:
@@ -1093,6 +1249,9 @@ def scan_repository(
             rules_path = per_tool_config.get("yara", {}).get(
                 "rules_path", str(get_yara_rules_dir())
             )
+            # Building the inventory here also saves it, so the runner can read
+            # the file list instead of doing its own os.walk of the repository.
+            get_inventory()
             yara_cmd = [
                 yara_path,
                 "-m",
@@ -1103,6 +1262,8 @@ def scan_repository(
                 str(repo),
                 "--output",
                 str(yara_out),
+                "--inventory",
+                str(out_dir / INVENTORY_FILENAME),
                 *yara_flags,
             ]
             tool_defs.append(
@@ -1157,7 +1318,7 @@ def scan_repository(
     if "mobsf" in tools:
         mobsf_out = out_dir / "mobsf.json"
         # Check for mobile app files
-        mobile_files = list(repo.glob("**/*.apk")) + list(repo.glob("**/*.ipa"))
+        mobile_files = get_inventory().glob("**/*.apk", "**/*.ipa")
         mobsf_path = _find_tool("mobsf")
         if mobile_files and mobsf_path:
             mobsf_flags = get_tool_flags("mobsf")
@@ -1199,10 +1360,8 @@ def scan_repository(
     if "trivy-rbac" in tools:
         trivy_rbac_out = out_dir / "trivy-rbac.json"
         # Check for K8s manifests
-        k8s_manifests = (
-            list(repo.glob("**/*deployment*.yaml"))
-            + list(repo.glob("**/*service*.yaml"))
-            + list(repo.glob("**/k8s/**/*.yaml"))
+        k8s_manifests = get_inventory().glob(
+            "**/*deployment*.yaml", "**/*service*.yaml", "**/k8s/**/*.yaml"
         )
         trivy_rbac_path = _find_tool("trivy", record_as="trivy-rbac")
         if k8s_manifests and trivy_rbac_path:
@@ -1384,7 +1543,8 @@ def scan_repository(
     # Dockerfiles. Benign, and reported at debug so it is available when a user
     # asks "why is there no shellcheck output?" without adding noise to a normal
     # run. Distinct from the two cases above: nothing is wrong here.
-    idle = considered - set(unresolved) - {td.name for td in tool_defs} - set(statuses)
+    defined = {td.name.split(BATCH_SEPARATOR, 1)[0] for td in tool_defs}
+    idle = considered - set(unresolved) - defined - set(statuses)
     if idle:
         logger.debug(
             "No matching files in %s for: %s",
@@ -1404,8 +1564,18 @@ def scan_repository(
     # Process results
     attempts_map: dict[str, int] = {}
     noseyparker_phases = {"init": False, "scan": False, "report": False}
+    batched: dict[str, list[ToolResult]] = {}
+    batch_outputs: dict[str, Path] = {}
 
     for result in results:
+        # Batches of a file-list tool are merged once all have finished
+        if BATCH_SEPARATOR in result.tool:
+            base = result.tool.split(BATCH_SEPARATOR, 1)[0]
+            batched.setdefault(base, []).append(result)
+            if result.output_file is not None:
+                batch_outputs[base] = result.output_file
+            continue
+
         # Handle multi-phase noseyparker execution
         if result.tool.startswith("noseyparker-"):
             phase = result.tool.split("-")[1]  # Extract "init", "scan", or "report"
@@ -1505,6 +1675,14 @@ def scan_repository(
                 ),
             )
 
+    for tool, batch_results in batched.items():
+        ok, attempts = _merge_batch_results(
+            tool, batch_results, batch_outputs.get(tool, out_dir / f"{tool}.json")
+        )
+        statuses[tool] = ok
+        if attempts > 1 or not ok:
+            attempts_map[tool] = attempts
+
     # Aggregate noseyparker multi-phase status
     if any(noseyparker_phases.values()):
         # If any phase succeeded, check if all required phases succeeded
@@ -1522,6 +1700,10 @@ def scan_repository(
         else:
             statuses["noseyparker"] = False
 
+    # Index the SBOM once, so every report, diff and MCP query reuses it
+    if statuses.get("syft"):
+        build_sbom_index(out_dir / "syft.json")
+
     # Include attempts metadata if any retries occurred
     if attempts_map:
         statuses["__attempts__"] = attempts_map  # type: ignore[assignment]  # Store retry metadata alongside bool statuses
@@ -12,6 +12,7 @@ URL and container image validation to prevent injection attacks.
 
 from __future__ import annotations
 
+import contextlib
 import fnmatch
 import logging
 import os
@@ -21,9 +22,15 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from scripts.cli.adaptive_concurrency import (
+    AdaptiveConcurrencyController,
+    ConcurrencyLimiter,
+)
+from scripts.cli.cpu_utils import get_cpu_count
 from scripts.core.config import RetryConfig
 from scripts.core.tool_registry import filter_tools_for_scan_type
 from scripts.core.validation import validate_container_image, validate_url
+from scripts.core.warm_tools import warm_session
 
 logger = logging.getLogger(__name__)
 
@@ -170,6 +177,17 @@ class ScanConfig:
         include_patterns: Repository name patterns to include
         exclude_patterns: Repository name patterns to exclude
         allow_missing_tools: Allow scan to continue if tools missing
+        warm_tools: Run trivy as a session-scoped server instead of cold-starting
+            it for every target (see scripts.core.warm_tools)
+        distributed: Publish targets to a work queue in results_dir and let
+            worker processes scan them (see scripts.cli.scan_queue)
+        local_workers: Worker processes the coordinator starts on this host
+            when distributed (0 = rely on workers started elsewhere)
+        lease_seconds: How long a worker may go without a heartbeat before
+            its target is handed to another worker
+        adaptive_concurrency: Start at max_workers in-flight targets, then
+            grow or shrink with live system load (see
+            scripts.cli.adaptive_concurrency)
     """
 
     tools: list[str]
@@ -180,6 +198,11 @@ class ScanConfig:
     include_patterns: list[str] = field(default_factory=list)
     exclude_patterns: list[str] = field(default_factory=list)
     allow_missing_tools: bool = False
+    warm_tools: bool = False
+    distributed: bool = False
+    local_workers: int = 1
+    lease_seconds: float = 120.0
+    adaptive_concurrency: bool = False
 
     def __post_init__(self):
         """Validate configuration after initialization."""
@@ -191,6 +214,14 @@ class ScanConfig:
             raise ValueError(f"Retries must be non-negative, got {self.retries}")
         if self.max_workers is not None and self.max_workers < 1:
             raise ValueError(f"max_workers must be >= 1, got {self.max_workers}")
+        if self.local_workers < 0:
+            raise ValueError(
+                f"local_workers must be non-negative, got {self.local_workers}"
+            )
+        if self.lease_seconds <= 0:
+            raise ValueError(
+                f"lease_seconds must be positive, got {self.lease_seconds}"
+            )
 
 
 class ScanOrchestrator:
@@ -667,6 +698,15 @@ class ScanOrchestrator:
         Returns:
             List of (target_name, statuses_dict) tuples for all scanned targets
         """
+        if self.config.distributed:
+            return self.scan_distributed(
+                targets,
+                per_tool_config,
+                progress_callback=progress_callback,
+                session=session,
+                session_path=session_path,
+            )
+
         from concurrent.futures import ThreadPoolExecutor
 
         from scripts.cli.scan_jobs import (
@@ -737,13 +777,47 @@ class ScanOrchestrator:
 
         skipped_count = 0
 
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Only trivy has per-target invocations a server can absorb here; OPA
+        # runs at report time, when the report phase opens its own session.
+        warm = (
+            warm_session(tools=["trivy"])
+            if self.config.warm_tools and "trivy" in routed
+            else contextlib.nullcontext()
+        )
+
+        # Adaptive mode sizes the pool to the ceiling and lets a limiter decide
+        # how many of those threads may actually be scanning at a time.
+        limiter = None
+        adaptive: contextlib.AbstractContextManager[Any] = contextlib.nullcontext()
+        pool_size = max_workers
+        if self.config.adaptive_concurrency:
+            pool_size = max(max_workers, get_cpu_count())
+            limiter = ConcurrencyLimiter(max_workers)
+            adaptive = AdaptiveConcurrencyController(
+                limiter, min_workers=1, max_workers=pool_size
+            )
+            logger.info(
+                f"Adaptive concurrency: starting at {max_workers} in-flight "
+                f"targets, bounds 1-{pool_size}"
+            )
+
+        with (
+            warm,
+            adaptive,
+            ThreadPoolExecutor(max_workers=pool_size) as executor,
+        ):
+
+            def _submit(fn, *args, **kwargs):
+                if limiter is None:
+                    return executor.submit(fn, *args, **kwargs)
+                return executor.submit(limiter.run, fn, *args, **kwargs)
+
             # Submit repositories - use repo-filtered tools
             for repo in targets.repos:
                 if _is_completed(repo.name):
                     skipped_count += 1
                     continue
-                future = executor.submit(
+                future = _submit(
                     scan_repository,
                     repo,
                     self.config.results_dir / "individual-repos",
@@ -761,7 +835,7 @@ class ScanOrchestrator:
                 if _is_completed(image):
                     skipped_count += 1
                     continue
-                future = executor.submit(
+                future = _submit(
                     scan_image,
                     image,
                     self.config.results_dir / "individual-images",
@@ -779,7 +853,7 @@ class ScanOrchestrator:
                 if _is_completed(iac_id):
                     skipped_count += 1
                     continue
-                future = executor.submit(
+                future = _submit(
                     scan_iac_file,
                     iac_type,
                     iac_path,
@@ -797,7 +871,7 @@ class ScanOrchestrator:
                 if _is_completed(url):
                     skipped_count += 1
                     continue
-                future = executor.submit(
+                future = _submit(
                     scan_url,
                     url,
                     self.config.results_dir / "individual-web",
@@ -815,7 +889,7 @@ class ScanOrchestrator:
                 if _is_completed(gl_id):
                     skipped_count += 1
                     continue
-                future = executor.submit(
+                future = _submit(
                     scan_gitlab_repo,
                     gitlab_repo_info,
                     self.config.results_dir / "individual-gitlab",
@@ -835,7 +909,7 @@ class ScanOrchestrator:
                 if _is_completed(k8s_id):
                     skipped_count += 1
                     continue
-                future = executor.submit(
+                future = _submit(
                     scan_k8s_resource,
                     k8s_resource_info,
                     self.config.results_dir / "individual-k8s",
@@ -874,3 +948,70 @@ class ScanOrchestrator:
                     all_results.append((target_id, {}))
 
         return all_results
+
+    def scan_distributed(
+        self,
+        targets: ScanTargets,
+        per_tool_config: dict,
+        progress_callback=None,
+        session=None,
+        session_path=None,
+    ) -> list[tuple[str, dict[str, bool]]]:
+        """
+        Scan targets through a work queue served by worker processes.
+
+        Publishes every not-yet-completed target to ``results_dir/.queue``,
+        starts ``local_workers`` worker processes on this host, and waits until
+        every target is done or has exhausted its attempts. Workers on other
+        hosts join with ``jmo worker --queue-dir <results_dir>/.queue``.
+
+        Args:
+            targets: Discovered scan targets
+            per_tool_config: Per-tool configuration overrides
+            progress_callback: Optional callback(target_type, target_id, statuses)
+            session: Optional ScanSession for checkpointing (skip completed targets)
+            session_path: Optional Path to session file for checkpoint writes
+
+        Returns:
+            List of (target_name, statuses_dict) tuples, as scan_all returns
+        """
+        from scripts.cli.scan_queue import (
+            DEFAULT_MAX_ATTEMPTS,
+            build_manifest,
+            coordinate,
+            jobs_from_targets,
+            queue_for_results,
+            spawn_local_worker,
+        )
+
+        queue = queue_for_results(self.config.results_dir)
+        jobs = jobs_from_targets(
+            targets,
+            is_completed=(session.is_target_completed if session is not None else None),
+        )
+        queue.create(
+            build_manifest(
+                self.config,
+                per_tool_config,
+                lease_seconds=self.config.lease_seconds,
+                max_attempts=DEFAULT_MAX_ATTEMPTS,
+            ),
+            jobs,
+        )
+        logger.info(
+            f"Published {len(jobs)} target(s) to work queue {queue.root}; "
+            f"starting {self.config.local_workers} local worker(s)"
+        )
+
+        threads = self.get_effective_max_workers()
+        workers = [
+            spawn_local_worker(queue, threads) for _ in range(self.config.local_workers)
+        ]
+        return coordinate(
+            queue,
+            session=session,
+            session_path=session_path,
+            progress_callback=progress_callback,
+            local_workers=workers,
+            respawn=lambda: spawn_local_worker(queue, threads),
+        )
@@ -0,0 +1,732 @@
+"""
+Distributed scan execution over a shared results volume.
+
+A coordinator publishes every target of a scan to a work queue that lives in
+the results directory; workers on the same or other hosts - anything that
+mounts that directory - claim targets, scan them with the ordinary scan jobs,
+and record the outcome. The coordinator folds completed targets into the
+usual ScanSession checkpoint, so ``--resume`` and the report phase work
+exactly as they do for a single-host scan.
+
+The queue is plain files rather than SQLite because its home is a shared
+volume: SQLite's locking is unreliable over NFS/SMB, whereas ``rename`` of a
+file within one directory tree is atomic there and is the only primitive the
+queue needs.
+
+Layout (``<results_dir>/.queue/``):
+    queue.json          Scan settings every worker runs with
+    pending/NNNNNN-<key>.json   Jobs waiting for a worker
+    leased/NNNNNN-<key>.json    Claimed jobs; rewritten by heartbeats
+    done/NNNNNN-<key>.json      Finished jobs, with the tool statuses
+    failed/NNNNNN-<key>.json    Jobs that used up their attempts
+
+A worker claims a job by renaming it from ``pending/`` to ``leased/`` - of
+several workers racing for one file exactly one rename succeeds. While the
+scan runs, a heartbeat keeps pushing the lease expiry forward; it moves the
+lease file aside to rewrite it, so a heartbeat racing the job's completion
+finds the file gone rather than re-creating it. If the worker
+dies, the lease lapses and whichever process next calls ``reap_expired()``
+puts the job back in ``pending/`` with one more attempt counted.
+
+Repository targets are recorded by absolute path, so every worker must see the
+repositories at the same path as the coordinator. Images, URLs, GitLab and K8s
+targets are location-independent.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from scripts.cli.scan_session import ScanSession, _atomic_write_json, save_session
+from scripts.core.config import RetryConfig
+from scripts.core.tool_registry import filter_tools_for_scan_type
+from scripts.core.warm_tools import warm_session
+
+logger = logging.getLogger(__name__)
+
+QUEUE_DIRNAME = ".queue"
+QUEUE_VERSION = 1
+
+DEFAULT_LEASE_SECONDS = 120.0
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_POLL_INTERVAL = 2.0
+
+# Same mapping ScanOrchestrator.scan_all uses when submitting each target type.
+TARGET_RESULTS_DIRS = {
+    "repo": "individual-repos",
+    "image": "individual-images",
+    "iac": "individual-iac",
+    "url": "individual-web",
+    "gitlab": "individual-gitlab",
+    "k8s": "individual-k8s",
+}
+
+_STATES = ("pending", "leased", "done", "failed")
+
+
+class WorkersExitedError(RuntimeError):
+    """Every local worker exited for good while targets were still queued."""
+
+
+@dataclass
+class QueueJob:
+    """One scan target in the work queue."""
+
+    target_type: str  # repo, image, iac, url, gitlab, k8s
+    target_id: str  # Same identifier ScanSession uses for this target
+    payload: Any  # Argument(s) the scan job needs to locate the target
+    seq: int = 0
+    attempts: int = 0
+    worker: str = ""
+    lease_expires: float = 0.0
+    error: str = ""
+    statuses: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def filename(self) -> str:
+        key = hashlib.sha256(
+            f"{self.target_type}:{self.target_id}".encode()
+        ).hexdigest()[:16]
+        return f"{self.seq:06d}-{key}.json"
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "target_type": self.target_type,
+            "target_id": self.target_id,
+            "payload": self.payload,
+            "seq": self.seq,
+            "attempts": self.attempts,
+            "worker": self.worker,
+            "lease_expires": self.lease_expires,
+            "error": self.error,
+            "statuses": self.statuses,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> QueueJob:
+        return cls(
+            target_type=data["target_type"],
+            target_id=data["target_id"],
+            payload=data.get("payload"),
+            seq=data.get("seq", 0),
+            attempts=data.get("attempts", 0),
+            worker=data.get("worker", ""),
+            lease_expires=data.get("lease_expires", 0.0),
+            error=data.get("error", ""),
+            statuses=data.get("statuses", {}),
+        )
+
+
+def _read_job(path: Path) -> QueueJob | None:
+    try:
+        return QueueJob.from_dict(json.loads(path.read_text(encoding="utf-8")))
+    except (OSError, json.JSONDecodeError, KeyError, TypeError) as e:
+        logger.debug(f"Unreadable queue entry {path}: {e}")
+        return None
+
+
+class WorkQueue:
+    """Filesystem work queue with leases. Safe across processes and hosts."""
+
+    def __init__(self, root: Path):
+        """
+        Args:
+            root: Queue directory (normally ``<results_dir>/.queue``)
+        """
+        self.root = Path(root)
+        # Serialises this process's renewals with its completions and releases
+        self._lease_lock = threading.Lock()
+
+    @property
+    def results_dir(self) -> Path:
+        """Results directory the queue belongs to, as seen from this host."""
+        return self.root.parent
+
+    def _dir(self, state: str) -> Path:
+        return self.root / state
+
+    def _entries(self, state: str) -> list[Path]:
+        try:
+            names = os.listdir(self._dir(state))
+        except FileNotFoundError:
+            return []
+        # Dotfiles are in-flight temp files from _atomic_write_json or a reap.
+        return [
+            self._dir(state) / n
+            for n in sorted(names)
+            if n.endswith(".json") and not n.startswith(".")
+        ]
+
+    # -- coordinator side -------------------------------------------------
+
+    def create(self, manifest: dict[str, Any], jobs: list[QueueJob]) -> None:
+        """Initialise the queue with its jobs and the settings workers use.
+
+        Entries left by a previous run of the coordinator are discarded; a
+        resumed scan republishes only the targets its session has not
+        completed. ``queue.json`` is written last, so a worker that finds it
+        never sees a queue that is still being filled and mistakes it for a
+        drained one.
+        """
+        (self.root / "queue.json").unlink(missing_ok=True)
+        for state in _STATES:
+            self._dir(state).mkdir(parents=True, exist_ok=True, mode=0o700)
+            for path in self._entries(state):
+                path.unlink(missing_ok=True)
+        self.publish(jobs)
+        _atomic_write_json(
+            self.root / "queue.json", {"version": QUEUE_VERSION, **manifest}
+        )
+
+    def manifest(self) -> dict[str, Any]:
+        """Return the scan settings published by the coordinator."""
+        data = json.loads((self.root / "queue.json").read_text(encoding="utf-8"))
+        if data.get("version") != QUEUE_VERSION:
+            raise ValueError(
+                f"Queue version mismatch: expected {QUEUE_VERSION}, "
+                f"got {data.get('version', 'unknown')}"
+            )
+        return dict(data)
+
+    def publish(self, jobs: list[QueueJob]) -> None:
+        """Add jobs to ``pending/``, numbered in publication order."""
+        for seq, job in enumerate(jobs):
+            job.seq = seq
+            _atomic_write_json(self._dir("pending") / job.filename, job.to_dict())
+
+    def counts(self) -> dict[str, int]:
+        """Number of jobs in each state."""
+        return {state: len(self._entries(state)) for state in _STATES}
+
+    def _in_transit(self, state: str, prefix: str) -> bool:
+        try:
+            return any(n.startswith(prefix) for n in os.listdir(self._dir(state)))
+        except FileNotFoundError:
+            return False
+
+    def is_drained(self) -> bool:
+        """True once no job is pending, leased, mid-requeue or mid-renewal."""
+        if self._entries("pending") or self._entries("leased"):
+            return False
+        return not (
+            self._in_transit("pending", ".reap-")
+            or self._in_transit("leased", ".renew-")
+        )
+
+    def abandon_pending(self, error: str) -> int:
+        """Retire every pending job to ``failed/`` without another attempt.
+
+        For a coordinator with no worker left to serve the queue. Returns the
+        number of jobs retired.
+        """
+        abandoned = 0
+        for path in self._entries("pending"):
+            private = self._dir("pending") / f".reap-{uuid.uuid4().hex}"
+            try:
+                os.rename(path, private)
+            except OSError:
+                continue  # Claimed after all
+            job = _read_job(private)
+            if job is not None:
+                job.error = error
+                _atomic_write_json(private, job.to_dict())
+            os.replace(private, self._dir("failed") / path.name)
+            abandoned += 1
+        return abandoned
+
+    def finished(self, state: str = "done") -> Iterator[tuple[Path, QueueJob]]:
+        """Yield finished jobs (``done`` or ``failed``) with their paths."""
+        for path in self._entries(state):
+            job = _read_job(path)
+            if job is not None:
+                yield path, job
+
+    # -- worker side ------------------------------------------------------
+
+    def claim(self, worker: str, lease_seconds: float) -> QueueJob | None:
+        """Lease the oldest pending job, or return None if there is none."""
+        for path in self._entries("pending"):
+            leased = self._dir("leased") / path.name
+            try:
+                os.rename(path, leased)
+            except OSError:
+                continue  # Another worker won this one
+            job = _read_job(leased)
+            if job is None:
+                self._retire_unreadable(leased)
+                continue
+            job.worker = worker
+            job.lease_expires = time.time() + lease_seconds
+            _atomic_write_json(leased, job.to_dict())
+            return job
+        return None
+
+    def renew(self, job: QueueJob, worker: str, lease_seconds: float) -> bool:
+        """Extend a lease. Returns False if the job is no longer ours.
+
+        The lease file is renamed to a private name, rewritten there and
+        renamed back. A lease that complete(), release() or a reap has already
+        removed makes the first rename fail, so renewal can never re-create
+        it and send a finished job round again.
+        """
+        path = self._dir("leased") / job.filename
+        private = self._dir("leased") / f".renew-{uuid.uuid4().hex}"
+        with self._lease_lock:
+            try:
+                os.rename(path, private)
+            except FileNotFoundError:
+                return False
+            except OSError:
+                return True  # Busy (a reader on Windows); retried next heartbeat
+            try:
+                current = _read_job(private)
+                if current is None or current.worker != worker:
+                    return False
+                current.lease_expires = time.time() + lease_seconds
+                _atomic_write_json(private, current.to_dict())
+                return True
+            finally:
+                os.replace(private, path)
+
+    def complete(self, job: QueueJob, worker: str, statuses: dict[str, Any]) -> None:
+        """Record a finished scan and drop the lease."""
+        job.statuses = statuses
+        job.worker = worker
+        _atomic_write_json(self._dir("done") / job.filename, job.to_dict())
+        self._drop_lease(job, worker)
+
+    def release(
+        self, job: QueueJob, worker: str, error: str, max_attempts: int
+    ) -> None:
+        """Give a job back after a failed attempt, or retire it to ``failed/``."""
+        path = self._dir("leased") / job.filename
+        with self._lease_lock:
+            current = _read_job(path)
+            if current is None or current.worker != worker:
+                return
+            self._requeue(path, current, error, max_attempts)
+
+    def _drop_lease(self, job: QueueJob, worker: str) -> None:
+        path = self._dir("leased") / job.filename
+        with self._lease_lock:
+            current = _read_job(path)
+            if current is not None and current.worker == worker:
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+
+    def _requeue(
+        self, path: Path, job: QueueJob, error: str, max_attempts: int
+    ) -> None:
+        # Move under a private dotfile name first: once the lease file is gone
+        # nobody else can reap or renew it, and claimers ignore dotfiles until
+        # the final rename publishes the job again.
+        private = self._dir("pending") / f".reap-{uuid.uuid4().hex}"
+        try:
+            os.rename(path, private)
+        except OSError:
+            return  # Someone else reaped or completed it first
+        job.attempts += 1
+        job.error = error
+        job.worker = ""
+        job.lease_expires = 0.0
+        state = "failed" if job.attempts >= max_attempts else "pending"
+        _atomic_write_json(private, job.to_dict())
+        os.replace(private, self._dir(state) / job.filename)
+        if state == "failed":
+            logger.error(
+                f"Giving up on {job.target_type} {job.target_id} after "
+                f"{job.attempts} attempt(s): {error}"
+            )
+        else:
+            logger.warning(
+                f"Re-queued {job.target_type} {job.target_id} "
+                f"(attempt {job.attempts}/{max_attempts}): {error}"
+            )
+
+    def reap_expired(self, lease_seconds: float, max_attempts: int) -> int:
+        """Return jobs whose lease has lapsed to ``pending/``. Returns the count.
+
+        A lapsed entry that cannot be parsed is retired to ``failed/`` instead.
+        """
+        now = time.time()
+        reaped = 0
+        for path in self._entries("leased"):
+            job = _read_job(path)
+            expires = job.lease_expires if job is not None else 0.0
+            if not expires:
+                # Renamed by claim() but not yet stamped, or unreadable.
+                # rename() updates ctime, so a worker that died in between
+                # still times out.
+                try:
+                    expires = path.stat().st_ctime + lease_seconds
+                except FileNotFoundError:
+                    continue
+            if expires >= now:
+                continue
+            if job is None:
+                # Past its lease and still unparseable: nobody can scan it
+                if self._retire_unreadable(path):
+                    reaped += 1
+            else:
+                self._requeue(
+                    path,
+                    job,
+                    f"lease held by {job.worker or '?'} expired",
+                    max_attempts,
+                )
+                reaped += 1
+        return reaped
+
+    def _retire_unreadable(self, path: Path) -> bool:
+        """Move an entry that cannot be parsed to ``failed/``.
+
+        Left in ``leased/`` it would never be reaped, and the queue would
+        never drain. Returns False if someone else moved it first.
+        """
+        private = self._dir("pending") / f".reap-{uuid.uuid4().hex}"
+        try:
+            os.rename(path, private)
+        except OSError:
+            return False
+        os.replace(private, self._dir("failed") / path.name)
+        logger.error(f"Moved unreadable queue entry {path.name} to failed/")
+        return True
+
+
+def queue_for_results(results_dir: Path) -> WorkQueue:
+    """Return the work queue that belongs to ``results_dir``."""
+    return WorkQueue(Path(results_dir) / QUEUE_DIRNAME)
+
+
+def jobs_from_targets(
+    targets: Any, is_completed: Callable[[str], bool] | None = None
+) -> list[QueueJob]:
+    """Turn ScanTargets into queue jobs, skipping already-completed targets.
+
+    Target IDs match the ones cmd_scan registers in the ScanSession.
+    """
+    jobs = []
+    for repo in targets.repos:
+        jobs.append(QueueJob("repo", repo.name, str(Path(repo).resolve())))
+    for image in targets.images:
+        jobs.append(QueueJob("image", image, image))
+    for iac_type, iac_path in targets.iac_files:
+        jobs.append(
+            QueueJob("iac", str(iac_path), [iac_type, str(Path(iac_path).resolve())])
+        )
+    for url in targets.urls:
+        jobs.append(QueueJob("url", url, url))
+    for info in targets.gitlab_repos:
+        jobs.append(QueueJob("gitlab", info.get("full_path", "unknown"), info))
+    for info in targets.k8s_resources:
+        ctx = info.get("context", "unknown")
+        ns = info.get("namespace", "unknown")
+        jobs.append(QueueJob("k8s", f"{ctx}:{ns}", info))
+    if is_completed is not None:
+        jobs = [j for j in jobs if not is_completed(j.target_id)]
+    return jobs
+
+
+def build_manifest(
+    config: Any, per_tool_config: dict, lease_seconds: float, max_attempts: int
+) -> dict[str, Any]:
+    """Serialise the ScanConfig fields a worker needs to scan like the coordinator."""
+    retries = config.retries
+    return {
+        "tools": list(config.tools),
+        "timeout": config.timeout,
+        "retries": (
+            dataclasses.asdict(retries) if isinstance(retries, RetryConfig) else retries
+        ),
+        "per_tool_config": per_tool_config,
+        "allow_missing_tools": config.allow_missing_tools,
+        "warm_tools": getattr(config, "warm_tools", False),
+        "lease_seconds": lease_seconds,
+        "max_attempts": max_attempts,
+    }
+
+
+def run_job(job: QueueJob, manifest: dict[str, Any], results_dir: Path) -> dict:
+    """Scan one queued target with the ordinary scan job for its type."""
+    from scripts.cli.scan_jobs import (
+        scan_gitlab_repo,
+        scan_iac_file,
+        scan_image,
+        scan_k8s_resource,
+        scan_repository,
+        scan_url,
+    )
+
+    retries = manifest["retries"]
+    if isinstance(retries, dict):
+        retries = RetryConfig(**retries)
+    tools = filter_tools_for_scan_type(manifest["tools"], job.target_type)
+    out = results_dir / TARGET_RESULTS_DIRS[job.target_type]
+    common = (
+        tools,
+        manifest["timeout"],
+        retries,
+        manifest["per_tool_config"],
+        manifest["allow_missing_tools"],
+    )
+
+    if job.target_type == "repo":
+        _, statuses = scan_repository(Path(job.payload), out, *common)
+    elif job.target_type == "image":
+        _, statuses = scan_image(job.payload, out, *common)
+    elif job.target_type == "iac":
+        iac_type, iac_path = job.payload
+        _, statuses = scan_iac_file(iac_type, Path(iac_path), out, *common)
+    elif job.target_type == "url":
+        _, statuses = scan_url(job.payload, out, *common)
+    elif job.target_type == "gitlab":
+        _, statuses = scan_gitlab_repo(job.payload, out, *common)
+    elif job.target_type == "k8s":
+        _, statuses = scan_k8s_resource(job.payload, out, *common)
+    else:
+        raise ValueError(f"Unknown target type: {job.target_type}")
+    return statuses
+
+
+class _LeaseKeeper(threading.Thread):
+    """Renews the leases of every job this process is currently scanning."""
+
+    def __init__(self, queue: WorkQueue, lease_seconds: float):
+        super().__init__(name="jmo-lease-keeper", daemon=True)
+        self.queue = queue
+        self.lease_seconds = lease_seconds
+        self.held: dict[str, tuple[QueueJob, str]] = {}
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+
+    def hold(self, job: QueueJob, worker: str) -> None:
+        with self.lock:
+            self.held[job.filename] = (job, worker)
+
+    def drop(self, job: QueueJob) -> None:
+        with self.lock:
+            self.held.pop(job.filename, None)
+
+    def run(self) -> None:
+        while not self.stopped.wait(self.lease_seconds / 3):
+            # Renew under the lock, so drop() waits out a renewal in progress
+            # and a dropped job's lease is never touched again.
+            with self.lock:
+                lost = [
+                    job
+                    for job, worker in self.held.values()
+                    if not self.queue.renew(job, worker, self.lease_seconds)
+                ]
+            for job in lost:
+                logger.warning(
+                    f"Lost lease on {job.target_type} {job.target_id}; "
+                    "another worker may scan it too"
+                )
+
+
+def run_worker(
+    queue: WorkQueue,
+    threads: int = 1,
+    worker_id: str | None = None,
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+    stop: threading.Event | None = None,
+) -> int:
+    """Claim and scan targets until the queue is drained.
+
+    Args:
+        queue: Work queue to serve
+        threads: Targets to scan concurrently in this process
+        worker_id: Identity recorded on leases (default: host:pid)
+        poll_interval: Seconds to sleep when nothing is claimable
+        stop: Optional event that ends the loop early
+
+    Returns:
+        Number of targets this worker completed
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    manifest = queue.manifest()
+    lease_seconds = float(manifest.get("lease_seconds", DEFAULT_LEASE_SECONDS))
+    max_attempts = int(manifest.get("max_attempts", DEFAULT_MAX_ATTEMPTS))
+    base_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+    stop = stop or threading.Event()
+    keeper = _LeaseKeeper(queue, lease_seconds)
+    keeper.start()
+    completed = [0]
+    count_lock = threading.Lock()
+
+    def _loop(slot: int) -> None:
+        worker = f"{base_id}:{slot}"
+        while not stop.is_set():
+            queue.reap_expired(lease_seconds, max_attempts)
+            job = queue.claim(worker, lease_seconds)
+            if job is None:
+                if queue.is_drained():
+                    return
+                stop.wait(poll_interval)
+                continue
+            keeper.hold(job, worker)
+            error = None
+            try:
+                logger.info(f"[{worker}] scanning {job.target_type} {job.target_id}")
+                statuses = run_job(job, manifest, queue.results_dir)
+            except Exception as e:  # Acceptable: a failed target is retried, not fatal
+                logger.error(
+                    f"[{worker}] {job.target_type} {job.target_id} failed: {e}",
+                    exc_info=True,
+                )
+                error = str(e)
+            finally:
+                # Stop the heartbeat before the lease is dropped below
+                keeper.drop(job)
+            if error is not None:
+                queue.release(job, worker, error, max_attempts)
+            else:
+                queue.complete(job, worker, statuses)
+                with count_lock:
+                    completed[0] += 1
+
+    warm = (
+        warm_session(tools=["trivy"])
+        if manifest.get("warm_tools")
+        else contextlib.nullcontext()
+    )
+    slots = max(1, threads)
+    try:
+        with warm, ThreadPoolExecutor(max_workers=slots) as executor:
+            for future in [executor.submit(_loop, i) for i in range(slots)]:
+                future.result()
+    finally:
+        keeper.stopped.set()
+    return completed[0]
+
+
+def spawn_local_worker(queue: WorkQueue, threads: int) -> subprocess.Popen:
+    """Start a ``jmo worker`` process for ``queue`` on this host."""
+    cmd = [
+        sys.executable,
+        "-m",
+        "scripts.cli.jmo",
+        "worker",
+        "--queue-dir",
+        str(queue.root),
+        "--threads",
+        str(threads),
+    ]
+    return subprocess.Popen(cmd, stdin=subprocess.DEVNULL)  # nosec B603
+
+
+def coordinate(
+    queue: WorkQueue,
+    session: ScanSession | None = None,
+    session_path: Path | None = None,
+    progress_callback: Callable[[str, str, dict], None] | None = None,
+    local_workers: list[subprocess.Popen] | None = None,
+    respawn: Callable[[], subprocess.Popen] | None = None,
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+) -> list[tuple[str, dict[str, Any]]]:
+    """Wait for the queue to drain, checkpointing each target as it finishes.
+
+    Local workers that exit while work remains are restarted (up to three
+    times each); remote workers are not known to the coordinator, so with no
+    local workers it simply waits for them. Once every local worker has exited
+    for good and no lease is held by anyone, nothing will ever claim the
+    remaining jobs (a worker that cannot start, say, in a frozen build): they
+    are retired to ``failed/`` and the coordinator gives up.
+
+    Returns:
+        List of (target_id, statuses) like ScanOrchestrator.scan_all
+
+    Raises:
+        WorkersExitedError: If local workers stopped serving a non-empty queue.
+            Completed targets are already checkpointed in ``session``.
+    """
+    manifest = queue.manifest()
+    lease_seconds = float(manifest.get("lease_seconds", DEFAULT_LEASE_SECONDS))
+    max_attempts = int(manifest.get("max_attempts", DEFAULT_MAX_ATTEMPTS))
+    workers = list(local_workers or [])
+    respawns_left = 3 * len(workers)
+    seen: set[str] = set()
+    results: list[tuple[str, dict[str, Any]]] = []
+
+    def _collect() -> None:
+        for state in ("done", "failed"):
+            for path, job in queue.finished(state):
+                if path.name in seen:
+                    continue
+                seen.add(path.name)
+                statuses = job.statuses if state == "done" else {}
+                results.append((job.target_id, statuses))
+                if state == "done" and session is not None:
+                    session.mark_target_complete(job.target_id, statuses)
+                    if session_path is not None:
+                        save_session(session, session_path)
+                if progress_callback:
+                    progress_callback(job.target_type, job.target_id, statuses)
+
+    try:
+        while True:
+            queue.reap_expired(lease_seconds, max_attempts)
+            _collect()
+            if queue.is_drained():
+                _collect()
+                break
+            for i, proc in enumerate(workers):
+                if (
+                    proc.poll() is not None
+                    and respawn is not None
+                    and respawns_left > 0
+                ):
+                    logger.warning(
+                        f"Local worker exited with code {proc.returncode}; restarting"
+                    )
+                    workers[i] = respawn()
+                    respawns_left -= 1
+            if (
+                workers
+                and all(proc.poll() is not None for proc in workers)
+                and (respawn is None or respawns_left <= 0)
+                and not queue.counts()["leased"]
+            ):
+                codes = ", ".join(str(proc.returncode) for proc in workers)
+                abandoned = queue.abandon_pending(
+                    f"every local worker exited (exit codes: {codes})"
+                )
+                _collect()
+                raise WorkersExitedError(
+                    f"All local workers exited (exit codes: {codes}) with "
+                    f"{abandoned} target(s) left unscanned; check that "
+                    "'jmo worker' runs on this host, then rerun the scan with "
+                    "--resume"
+                )
+            time.sleep(poll_interval)
+    except BaseException:
+        # Interrupted: don't leave local workers scanning behind our back.
+        # Their leases lapse and a resumed coordinator re-publishes the rest.
+        for proc in workers:
+            proc.terminate()
+        raise
+
+    for proc in workers:
+        try:
+            proc.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            proc.terminate()
+    return results
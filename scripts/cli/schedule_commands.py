@@ -43,7 +43,7 @@ from scripts.core.workflow_generators import (
 )
 
 
-def cmd_schedule(args):
+def cmd_schedule(args) -> int:
     """Handle 'jmo schedule' subcommands.
 
     Routes to appropriate subcommand handler based on args.schedule_action.
@@ -8,12 +8,16 @@ across all supported platforms. This is the core logic for the
 
 from __future__ import annotations
 
+import json
 import logging
 import os
 import re
+import stat
 import subprocess
 import sys
-from collections.abc import Callable, Collection
+import threading
+from collections.abc import Callable, Collection, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
@@ -177,6 +181,15 @@ VERSION_TIMEOUTS: dict[str, int] = {
     "mobsf": 30,  # Heavyweight
 }
 
+# Version probes run concurrently by check_profile/check_all_tools. Each probe
+# is mostly a child process starting up, so threads are enough; the cap keeps
+# a deep-profile check from launching 29 JVM/Python interpreters at once.
+PROBE_WORKERS = 8
+
+# Persistent version-probe cache (see ToolStatusCache)
+STATUS_CACHE_FILE = "tool-status.json"
+STATUS_CACHE_VERSION = 1
+
 # Remediation commands for tools with issues
 # Each entry is a dict with:
 #   - "install": command to install the tool
@@ -690,15 +703,152 @@ class ToolStatusSummary:
         return f"{self.execution_ready}/{self.platform_applicable} tools ready ({self.needs_attention_count} need attention)"
 
 
+def default_status_cache_dir() -> Path:
+    """Directory of the persistent tool-status cache (~/.jmo/cache)."""
+    return Path.home() / ".jmo" / "cache"
+
+
+def binary_identity(binary_path: str) -> list | None:
+    """Identity of the file behind ``binary_path``, or None if it is not one.
+
+    Symlinks are resolved first, so re-pointing a shim (``alternatives``,
+    Homebrew, a venv reinstall) changes the identity just as replacing the
+    file in place does.
+
+    Returns:
+        [resolved path, inode, mtime_ns, size]
+    """
+    try:
+        resolved = os.path.realpath(binary_path)
+        st = os.stat(resolved)
+    except (OSError, ValueError):
+        return None
+    if not stat.S_ISREG(st.st_mode):
+        return None
+    return [resolved, st.st_ino, st.st_mtime_ns, st.st_size]
+
+
+def _probe_recipe(tool_name: str) -> str:
+    """How a tool's version is probed and parsed.
+
+    Stored with each cached version so that changing VERSION_COMMANDS or
+    VERSION_PATTERNS for a tool invalidates its entry.
+    """
+    pattern = VERSION_PATTERNS.get(tool_name, VERSION_PATTERNS["default"])
+    return json.dumps([VERSION_COMMANDS.get(tool_name), pattern.pattern])
+
+
+class ToolStatusCache:
+    """Version-probe results persisted across processes.
+
+    A ``--version`` probe is a child process - 4.23s for checkov - and a scan
+    pre-flight runs one per profile tool, every invocation, although the
+    binaries almost never change between runs. Each successful probe is stored
+    in ``<cache_dir>/tool-status.json`` under the binary's identity (resolved
+    path, inode, mtime, size). Installing or upgrading a tool replaces the
+    file and so changes its identity; the stale entry is then simply not
+    used. Crashes, timeouts and unparseable output are not cached, because
+    they are often fixed without touching the binary (a missing JVM).
+
+    The file is a cache, not state: unreadable content is treated as empty,
+    and concurrent writers may drop each other's entries, costing one
+    re-probe.
+
+    Args:
+        cache_dir: Directory holding the cache file (default ~/.jmo/cache)
+    """
+
+    def __init__(self, cache_dir: Path | None = None):
+        self.path = (cache_dir or default_status_cache_dir()) / STATUS_CACHE_FILE
+        self._entries: dict[str, dict] | None = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> dict[str, dict]:
+        if self._entries is None:
+            entries: dict[str, dict] = {}
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+                if data.get("version") == STATUS_CACHE_VERSION:
+                    entries = dict(data.get("tools") or {})
+            except (OSError, ValueError, AttributeError) as e:
+                if not isinstance(e, FileNotFoundError):
+                    logger.debug(f"Ignoring tool status cache {self.path}: {e}")
+            self._entries = entries
+        return self._entries
+
+    def _save(self) -> None:
+        payload = json.dumps(
+            {"version": STATUS_CACHE_VERSION, "tools": self._entries or {}},
+            indent=1,
+            sort_keys=True,
+        )
+        staging = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            staging.write_text(payload, encoding="utf-8")
+            os.replace(staging, self.path)
+        except OSError as e:
+            logger.debug(f"Cannot write tool status cache {self.path}: {e}")
+            staging.unlink(missing_ok=True)
+
+    def get(self, tool_name: str, binary_path: str) -> str | None:
+        """Cached version of ``tool_name`` if ``binary_path`` is unchanged."""
+        identity = binary_identity(binary_path)
+        if identity is None:
+            return None
+        with self._lock:
+            entry = self._load().get(tool_name)
+        if (
+            not isinstance(entry, dict)
+            or entry.get("binary") != identity
+            or entry.get("recipe") != _probe_recipe(tool_name)
+        ):
+            return None
+        return entry.get("version")
+
+    def put(self, tool_name: str, binary_path: str, version: str) -> None:
+        """Record a successful probe of ``binary_path``."""
+        identity = binary_identity(binary_path)
+        if identity is None:
+            return
+        entry = {
+            "binary": identity,
+            "recipe": _probe_recipe(tool_name),
+            "version": version,
+        }
+        with self._lock:
+            entries = self._load()
+            if entries.get(tool_name) == entry:
+                return
+            entries[tool_name] = entry
+            self._save()
+
+    def invalidate(self, tool_name: str | None = None) -> None:
+        """Forget one tool's entry, or every entry when None."""
+        with self._lock:
+            entries = self._load()
+            if tool_name is None:
+                entries.clear()
+            elif entries.pop(tool_name, None) is None:
+                return
+            self._save()
+
+
 class ToolManager:
     """Manage security tool installations."""
 
-    def __init__(self, registry: ToolRegistry | None = None):
+    def __init__(
+        self,
+        registry: ToolRegistry | None = None,
+        cache_dir: Path | None = None,
+    ):
         """
         Initialize tool manager.
 
         Args:
             registry: ToolRegistry instance. If None, creates default.
+            cache_dir: Directory for the persistent version-probe cache.
+                Defaults to ~/.jmo/cache
         """
         self._registry = registry
         self.platform = detect_platform()
@@ -714,7 +864,12 @@ class ToolManager:
         # answer another test's question. Callers that want the saving share an
         # instance; `invalidate_status_cache()` covers the one case where the
         # answer legitimately changes mid-process (a tool was just installed).
+        #
+        # The expensive part - the version probe - is additionally persisted
+        # across processes by ToolStatusCache, keyed on the binary itself, so
+        # a fake registry cannot leak through it.
         self._status_cache: dict[str, ToolStatus] = {}
+        self._probe_cache = ToolStatusCache(cache_dir)
 
     @property
     def registry(self) -> ToolRegistry:
@@ -731,8 +886,10 @@ class ToolManager:
         """
         if tool_name is None:
             self._status_cache.clear()
+            self._probe_cache.invalidate()
         else:
             self._status_cache.pop(tool_name, None)
+            self._probe_cache.invalidate(TOOL_VARIANTS.get(tool_name, tool_name))
 
     def check_tool(self, tool_name: str) -> ToolStatus:
         """
@@ -765,9 +922,13 @@ class ToolManager:
         version_error = None  # Phase 4: Track startup crash errors
         if binary_path:
             base_tool = TOOL_VARIANTS.get(tool_name, tool_name)
-            installed_version, version_error = self._get_tool_version(
-                base_tool, binary_path
-            )
+            installed_version = self._probe_cache.get(base_tool, binary_path)
+            if installed_version is None:
+                installed_version, version_error = self._get_tool_version(
+                    base_tool, binary_path
+                )
+                if installed_version and not version_error:
+                    self._probe_cache.put(base_tool, binary_path, installed_version)
 
         # Determine if outdated
         expected_version = tool_info.version if tool_info else None
@@ -842,32 +1003,60 @@ class ToolManager:
         Returns:
             Dict mapping tool name to ToolStatus
         """
-        tools = PROFILE_TOOLS.get(profile, [])
-        result: dict[str, ToolStatus] = {}
-        for name in tools:
-            try:
-                result[name] = self.check_tool(name)
-            except Exception as e:  # pragma: no cover — defensive
-                logger.warning(
-                    "check_tool(%r) raised %s: %s",
-                    name,
-                    type(e).__name__,
-                    e,
-                )
-                result[name] = ToolStatus(
-                    name=name,
-                    installed=False,
-                    install_hint=f"check failed: {type(e).__name__}: {e}",
-                    manual_install=name in MANUAL_INSTALL_TOOLS,
-                )
-        return result
+        return self._check_tools(
+            PROFILE_TOOLS.get(profile, []), self._check_tool_guarded
+        )
 
     def check_all_tools(self) -> dict[str, ToolStatus]:
-        """Check status of all registered tools."""
-        return {
-            tool.name: self.check_tool(tool.name)
-            for tool in self.registry.get_all_tools()
-        }
+        """Check status of all registered tools.
+
+        Unlike check_profile, an exception from check_tool() propagates.
+        """
+        return self._check_tools(
+            (tool.name for tool in self.registry.get_all_tools()), self.check_tool
+        )
+
+    def _check_tools(
+        self, names: Iterable[str], check: Callable[[str], ToolStatus]
+    ) -> dict[str, ToolStatus]:
+        """Run ``check`` on each name, probing up to PROBE_WORKERS at once.
+
+        Each probe keeps its own subprocess timeout (VERSION_TIMEOUTS), so a
+        hung tool holds one worker rather than the whole check. Results are
+        returned in ``names`` order; an exception from ``check`` propagates.
+        """
+        names = list(dict.fromkeys(names))
+        if len(names) > 1:
+            self.registry  # noqa: B018 - load once, not once per worker
+        workers = min(PROBE_WORKERS, len(names))
+        if workers <= 1:
+            statuses = [check(name) for name in names]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="jmo-tool-probe"
+            ) as pool:
+                statuses = list(pool.map(check, names))
+        return dict(zip(names, statuses, strict=True))
+
+    def _check_tool_guarded(self, name: str) -> ToolStatus:
+        """check_tool(), with an exception turned into an installed=False status."""
+        try:
+            return self.check_tool(name)
+        except (
+            Exception
+        ) as e:  # Acceptable: one tool's failure must not abort the check
+            logger.warning(
+                "check_tool(%r) raised %s: %s",
+                name,
+                type(e).__name__,
+                e,
+            )
+            return ToolStatus(
+                name=name,
+                installed=False,
+                install_hint=f"check failed: {type(e).__name__}: {e}",
+                manual_install=name in MANUAL_INSTALL_TOOLS,
+            )
 
     def get_missing_tools(self, profile: str) -> list[ToolStatus]:
         """
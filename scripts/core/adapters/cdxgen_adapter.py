@@ -26,10 +26,12 @@ Supported Ecosystems:
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
-from scripts.core.adapters.common import safe_load_json_file
+from scripts.core import json_codec
+from scripts.core.adapters.common import iter_json_members
 from scripts.core.common_finding import fingerprint
 from scripts.core.plugin_api import (
     AdapterPlugin,
@@ -114,48 +116,44 @@ class CdxgenAdapter(AdapterPlugin):
 def _load_cdxgen_internal(path: str | Path) -> list[dict[str, Any]]:
     """Internal function to parse cdxgen CycloneDX SBOM JSON output.
 
+    ``components[]`` is streamed one component at a time, so a
+    multi-gigabyte SBOM is never held whole.
+
     Args:
         path: Path to cdxgen.json output file
 
     Returns:
         List of dicts (converted to Finding objects by parse() method)
     """
-    data = safe_load_json_file(path, default=None)
-
     out: list[dict[str, Any]] = []
-
-    # CycloneDX SBOM structure: {"bomFormat": "CycloneDX", "specVersion": "1.5", "components": [...]}
-    if not isinstance(data, dict):
-        return []
-
-    # Validate BOM format
-    bom_format = data.get("bomFormat")
-    if bom_format != "CycloneDX":
-        # Use debug level to avoid noise when cdxgen outputs empty/non-SBOM files
-        logger.debug(f"Invalid BOM format: {bom_format}")
-        return []
-
-    # Extract spec version
-    spec_version = data.get("specVersion", "unknown")
-
-    # Extract cdxgen version from metadata.tools.components (CycloneDX provenance)
+    header: dict[str, Any] = {}
+    malformed = False
+
+    def components() -> Iterator[Any]:
+        # CycloneDX SBOM structure: {"bomFormat": "CycloneDX", "specVersion": "1.5", "components": [...]}
+        nonlocal malformed
+        try:
+            for key, value in iter_json_members(
+                path,
+                stream=("components",),
+                keep=("bomFormat", "specVersion", "metadata"),
+            ):
+                if key != "components":
+                    header[key] = value
+                    if key == "bomFormat" and value != "CycloneDX":
+                        return  # not an SBOM; no point reading further
+                else:
+                    yield value
+        except json_codec.JSONDecodeError as e:
+            logger.debug(f"Failed to parse cdxgen JSON {path}: {e}")
+            malformed = True
+
+    # Document-level fields are applied once the whole document has been
+    # read: nothing requires them to precede components[].
+    spec_version = "unknown"
     cdxgen_version = "unknown"
-    tools_info = data.get("metadata", {}).get("tools", {})
-    # Handle both CycloneDX 1.4 (tools.components) and 1.5+ (tools.components[])
-    if isinstance(tools_info, dict):
-        tool_components = tools_info.get("components", [])
-        if isinstance(tool_components, list):
-            for tool in tool_components:
-                if isinstance(tool, dict) and tool.get("name") == "cdxgen":
-                    cdxgen_version = str(tool.get("version") or "unknown")
-                    break
 
-    # Extract components array
-    components = data.get("components", [])
-    if not isinstance(components, list):
-        return []
-
-    for comp in components:
+    for comp in components():
         if not isinstance(comp, dict):
             continue
 
@@ -245,4 +243,32 @@ def _load_cdxgen_internal(path: str | Path) -> list[dict[str, Any]]:
 
         out.append(finding)
 
+    if malformed:
+        return []
+
+    # Validate BOM format
+    bom_format = header.get("bomFormat")
+    if bom_format != "CycloneDX":
+        # Use debug level to avoid noise when cdxgen outputs empty/non-SBOM files
+        logger.debug(f"Invalid BOM format: {bom_format}")
+        return []
+
+    # Extract spec version
+    spec_version = header.get("specVersion", "unknown")
+
+    # Extract cdxgen version from metadata.tools.components (CycloneDX provenance)
+    metadata = header.get("metadata")
+    tools_info = metadata.get("tools", {}) if isinstance(metadata, dict) else {}
+    # Handle both CycloneDX 1.4 (tools.components) and 1.5+ (tools.components[])
+    if isinstance(tools_info, dict):
+        tool_components = tools_info.get("components", [])
+        if isinstance(tool_components, list):
+            for tool in tool_components:
+                if isinstance(tool, dict) and tool.get("name") == "cdxgen":
+                    cdxgen_version = str(tool.get("version") or "unknown")
+                    break
+
+    for f in out:
+        f["tool"]["version"] = cdxgen_version
+        f["context"]["spec_version"] = spec_version
     return out
@@ -9,18 +9,35 @@ ensures consistent error handling and logging behavior.
 v1.0.0: Initial implementation
 - safe_load_json_file: Load regular JSON files
 - safe_load_ndjson_file: Load newline-delimited JSON files
+- iter_json_members: Stream a large JSON object's arrays element by element
 """
 
 from __future__ import annotations
 
 import json
 import logging
-from collections.abc import Iterator
+import re
+from collections.abc import Callable, Collection, Iterator
 from pathlib import Path
-from typing import Any, cast
+from typing import IO, Any, cast
+
+from scripts.core import json_codec
 
 logger = logging.getLogger(__name__)
 
+# Files at least this large are parsed incrementally by iter_json_members.
+# Smaller ones are parsed whole, which is faster with orjson and costs little
+# memory at this size. ScanCode and SBOM outputs of big repositories run to
+# hundreds of megabytes or several gigabytes.
+STREAM_MIN_BYTES = 32 * 1024 * 1024
+
+# Characters read per refill while streaming. An element that does not fit
+# in the buffer is retried after doubling it, so big elements cost O(size).
+STREAM_CHUNK_CHARS = 1024 * 1024
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DECODER = json.JSONDecoder()
+
 
 def safe_load_json_file(
     path: str | Path,
@@ -74,8 +91,8 @@ def safe_load_json_file(
         return cast(result_type, default)
 
     try:
-        return cast(result_type, json.loads(raw))
-    except json.JSONDecodeError as e:
+        return cast(result_type, json_codec.loads(raw))
+    except json_codec.JSONDecodeError as e:
         if log_errors:
             logger.debug(
                 "Failed to parse JSON file %s: %s at position %d", p, e.msg, e.pos
@@ -83,6 +100,189 @@ def safe_load_json_file(
         return cast(result_type, default)
 
 
+class _JsonReader:
+    """Pull-parser over a text stream, one JSON value at a time.
+
+    Values are decoded with the stdlib's C scanner (``raw_decode``) from a
+    sliding buffer; only the structure around them (the top-level object and
+    the arrays being streamed) is walked here.
+    """
+
+    def __init__(self, fh: IO[str], chunk_chars: int = STREAM_CHUNK_CHARS):
+        self._fh = fh
+        self._chunk = chunk_chars
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self, min_chars: int = 0) -> bool:
+        """Append at least one chunk (or `min_chars`); False at end of file."""
+        if self._eof:
+            return False
+        if self._pos:
+            self._buf = self._buf[self._pos :]
+            self._pos = 0
+        data = self._fh.read(max(self._chunk, min_chars))
+        if not data:
+            self._eof = True
+            return False
+        self._buf += data
+        return True
+
+    def error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self._buf, self._pos)
+
+    def peek(self) -> str:
+        """Next non-whitespace character, without consuming it ("" at EOF)."""
+        while True:
+            match = _WHITESPACE.match(self._buf, self._pos)
+            self._pos = match.end() if match else self._pos
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def take(self, char: str) -> None:
+        """Consume `char`, which must be the next non-whitespace character."""
+        if self.peek() != char:
+            raise self.error(f"Expecting {char!r}")
+        self._pos += 1
+
+    def value(self) -> Any:
+        """Decode the next complete value."""
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                # Usually a value cut off by the buffer end; only at EOF is
+                # it really malformed.
+                if self._fill(len(self._buf) - self._pos):
+                    continue
+                raise
+            # A number at the buffer end may continue in the next chunk
+            if end == len(self._buf) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def items(self) -> Iterator[Any]:
+        """Decode the elements of the array that starts here, one at a time."""
+        self.take("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.peek() == ",":
+                self._pos += 1
+                continue
+            self.take("]")
+            return
+
+
+def iter_json_members(
+    path: str | Path,
+    stream: Collection[str],
+    keep: Collection[str] | None = None,
+    log_errors: bool = True,
+) -> Iterator[tuple[str, Any]]:
+    """Iterate a JSON object's top-level members, streaming the big arrays.
+
+    For each key in `stream` whose value is an array, yields ``(key, element)``
+    once per element, so a scancode ``files`` or CycloneDX ``components`` array
+    is never held whole; a non-array value for such a key is skipped. Every
+    other member is yielded once as ``(key, value)``, or skipped when `keep`
+    is given and does not name it. Members come in document order, so a
+    caller must not assume metadata precedes the arrays.
+
+    Files under STREAM_MIN_BYTES are parsed whole instead, with the same
+    results. Missing, empty, unreadable and non-object documents yield
+    nothing, as ``safe_load_json_file`` returns its default for them.
+
+    Args:
+        path: Path to the JSON file.
+        stream: Keys whose array elements are yielded one at a time.
+        keep: Other keys to yield; None yields every member.
+        log_errors: If True, log problems with the file.
+
+    Raises:
+        json.JSONDecodeError: If a streamed document turns out to be malformed
+            part-way through. Elements yielded before that point were valid,
+            but callers wanting all-or-nothing results (as from
+            ``safe_load_json_file``) should discard them.
+    """
+    p = Path(path)
+
+    def wanted(key: str) -> bool:
+        return keep is None or key in keep
+
+    try:
+        size = p.stat().st_size
+    except OSError:
+        size = -1
+    if size < STREAM_MIN_BYTES:
+        data = safe_load_json_file(p, default=None, log_errors=log_errors)
+        if not isinstance(data, dict):
+            return
+        for key, value in data.items():
+            if key in stream:
+                if isinstance(value, list):
+                    for element in value:
+                        yield key, element
+            elif wanted(key):
+                yield key, value
+        return
+
+    try:
+        with open(p, encoding="utf-8-sig", errors="ignore") as fh:
+            yield from _stream_members(p, _JsonReader(fh), stream, wanted, log_errors)
+    except OSError as e:
+        if log_errors:
+            logger.debug("Failed to read JSON file %s: %s", p, e)
+
+
+def _stream_members(
+    p: Path,
+    reader: _JsonReader,
+    stream: Collection[str],
+    wanted: Callable[[str], bool],
+    log_errors: bool,
+) -> Iterator[tuple[str, Any]]:
+    first = reader.peek()
+    if first != "{":
+        if log_errors:
+            if first:
+                logger.debug("JSON file %s is not an object", p)
+            else:
+                logger.warning("JSON file is empty: %s", p)
+        return
+    reader.take("{")
+    if reader.peek() == "}":
+        return
+    while True:
+        key = reader.value()
+        if not isinstance(key, str):
+            raise reader.error("Expecting property name")
+        reader.take(":")
+        if key in stream or not wanted(key):
+            if reader.peek() == "[":
+                for element in reader.items():
+                    if key in stream:
+                        yield key, element
+            else:
+                reader.value()  # skipped: not wanted or not an array
+        else:
+            yield key, reader.value()
+        if reader.peek() == ",":
+            reader.take(",")
+            continue
+        reader.take("}")
+        break
+    if reader.peek():
+        raise reader.error("Extra data")
+
+
 def safe_load_ndjson_file(
     path: str | Path,
     log_errors: bool = True,
@@ -131,11 +331,11 @@ def safe_load_ndjson_file(
 
     # Try full JSON parse first (handles regular JSON arrays)
     try:
-        data = json.loads(raw)
+        data = json_codec.loads(raw)
         # Yield items from the parsed data
         yield from _flatten_to_dicts(data)
         return
-    except json.JSONDecodeError as e:
+    except json_codec.JSONDecodeError as e:
         if log_errors:
             logger.debug(
                 "Falling back to NDJSON line-by-line parsing for %s: %s at position %d",
@@ -150,9 +350,9 @@ def safe_load_ndjson_file(
         if not line:
             continue
         try:
-            obj = json.loads(line)
+            obj = json_codec.loads(line)
             yield from _flatten_to_dicts(obj)
-        except json.JSONDecodeError as e:
+        except json_codec.JSONDecodeError as e:
             if log_errors:
                 logger.debug(
                     "Skipping malformed JSON at line %d in %s: %s at position %d",
@@ -29,10 +29,12 @@ Supported Package Managers:
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
-from scripts.core.adapters.common import safe_load_json_file
+from scripts.core import json_codec
+from scripts.core.adapters.common import iter_json_members
 from scripts.core.common_finding import fingerprint, normalize_severity
 from scripts.core.plugin_api import (
     AdapterPlugin,
@@ -116,30 +118,39 @@ class DependencyCheckAdapter(AdapterPlugin):
 def _load_dependency_check_internal(path: str | Path) -> list[dict[str, Any]]:
     """Internal function to parse Dependency-Check JSON output.
 
+    ``dependencies[]`` is streamed one dependency at a time; the report
+    lists every scanned file, vulnerable or not.
+
     Args:
         path: Path to dependency-check.json output file
 
     Returns:
         List of dicts (converted to Finding objects by parse() method)
     """
-    data = safe_load_json_file(path, default=None)
-
     out: list[dict[str, Any]] = []
-
-    # Dependency-Check JSON structure: {"reportSchema": "1.1", "scanInfo": {...}, "dependencies": [...]}
-    if not isinstance(data, dict):
-        return []
-
-    # Extract version for tool metadata
-    scan_info = data.get("scanInfo", {})
-    engine_version = str(scan_info.get("engineVersion", "12.1.0"))
-
-    # Process dependencies array
-    dependencies = data.get("dependencies", [])
-    if not isinstance(dependencies, list):
-        return []
-
-    for dep in dependencies:
+    scan_info: dict[str, Any] = {}
+    malformed = False
+
+    def dependencies() -> Iterator[Any]:
+        # Dependency-Check JSON structure: {"reportSchema": "1.1", "scanInfo": {...}, "dependencies": [...]}
+        nonlocal malformed
+        try:
+            for key, value in iter_json_members(
+                path, stream=("dependencies",), keep=("scanInfo",)
+            ):
+                if key == "dependencies":
+                    yield value
+                elif isinstance(value, dict):
+                    scan_info.update(value)
+        except json_codec.JSONDecodeError as e:
+            logger.debug(f"Failed to parse Dependency-Check JSON {path}: {e}")
+            malformed = True
+
+    # Extract version for tool metadata (applied below: scanInfo may follow
+    # dependencies[] in the document)
+    engine_version = "12.1.0"
+
+    for dep in dependencies():
         if not isinstance(dep, dict):
             continue
 
@@ -265,4 +276,9 @@ def _load_dependency_check_internal(path: str | Path) -> list[dict[str, Any]]:
 
             out.append(finding)
 
+    if malformed:
+        return []
+    engine_version = str(scan_info.get("engineVersion", engine_version))
+    for f in out:
+        f["tool"]["version"] = engine_version
     return out
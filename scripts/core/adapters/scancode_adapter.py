@@ -28,10 +28,12 @@ Supported Detections:
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
-from scripts.core.adapters.common import safe_load_json_file
+from scripts.core import json_codec
+from scripts.core.adapters.common import iter_json_members
 from scripts.core.common_finding import fingerprint
 from scripts.core.plugin_api import (
     AdapterPlugin,
@@ -116,35 +118,39 @@ class ScancodeAdapter(AdapterPlugin):
 def _load_scancode_internal(path: str | Path) -> list[dict[str, Any]]:
     """Internal function to parse ScanCode JSON output.
 
+    ``files[]`` is streamed one entry at a time: on large repositories the
+    output runs to gigabytes, most of it files with nothing to report.
+
     Args:
         path: Path to scancode.json output file
 
     Returns:
         List of dicts (converted to Finding objects by parse() method)
     """
-    data = safe_load_json_file(path, default=None)
-
     out: list[dict[str, Any]] = []
-
-    # ScanCode JSON structure: {"headers": [...], "files": [...]}
-    if not isinstance(data, dict):
-        return []
-
-    # Extract tool version from headers
     tool_version = "unknown"
-    headers = data.get("headers", [])
-    if isinstance(headers, list):
-        for header in headers:
-            if isinstance(header, dict) and "tool_version" in header:
-                tool_version = str(header["tool_version"])
-                break
-
-    # Extract files array
-    files = data.get("files", [])
-    if not isinstance(files, list):
-        return []
-
-    for file_entry in files:
+    malformed = False
+
+    def files() -> Iterator[Any]:
+        # ScanCode JSON structure: {"headers": [...], "files": [...]}
+        nonlocal tool_version, malformed
+        try:
+            for key, value in iter_json_members(
+                path, stream=("files",), keep=("headers",)
+            ):
+                if key == "files":
+                    yield value
+                elif isinstance(value, list):
+                    # Extract tool version from headers
+                    for header in value:
+                        if isinstance(header, dict) and "tool_version" in header:
+                            tool_version = str(header["tool_version"])
+                            break
+        except json_codec.JSONDecodeError as e:
+            logger.debug(f"Failed to parse ScanCode JSON {path}: {e}")
+            malformed = True
+
+    for file_entry in files():
         if not isinstance(file_entry, dict):
             continue
 
@@ -287,4 +293,9 @@ def _load_scancode_internal(path: str | Path) -> list[dict[str, Any]]:
 
                 out.append(finding)
 
+    if malformed:
+        return []
+    # headers normally precede files[], but the format does not promise it
+    for f in out:
+        f["tool"]["version"] = tool_version
     return out
@@ -58,9 +58,10 @@ from typing import Any
 
 from scripts.core.adapters.common import safe_load_json_file
 from scripts.core.common_finding import (
-    extract_code_snippet,
+    extract_code_snippets,
     map_tool_severity,
 )
+from scripts.core.file_inventory import inventory_for_results
 from scripts.core.plugin_api import (
     AdapterPlugin,
     Finding,
@@ -106,7 +107,13 @@ class SemgrepAdapter(AdapterPlugin):
         if not isinstance(results, list):
             return []
 
+        # Written by the scan next to this output; lets snippet extraction skip
+        # paths the target is known not to contain.
+        inventory = inventory_for_results(Path(output_path).parent)
         findings: list[Finding] = []
+        # Snippets are extracted in one batch after parsing, so each file is
+        # opened and line-indexed once however many findings point into it
+        snippet_requests: list[tuple[Finding, str, int]] = []
         tool_version = str(
             (data.get("version") if isinstance(data, dict) else None) or "unknown"
         )
@@ -205,11 +212,6 @@ class SemgrepAdapter(AdapterPlugin):
                 if impact in ["HIGH", "MEDIUM", "LOW"]:
                     risk["impact"] = impact
 
-            # Code context
-            context = None
-            if path_str and start_line:
-                context = extract_code_snippet(path_str, start_line, context_lines=2)
-
             # Create Finding object
             finding = Finding(
                 schemaVersion="1.2.0",
@@ -223,7 +225,7 @@ class SemgrepAdapter(AdapterPlugin):
                 location={"path": path_str, "startLine": start_line},
                 remediation=remediation,
                 tags=["sast"],
-                context=context,
+                context=None,  # Filled in by the snippet batch below
                 risk=risk or None,
                 raw=r,
             )
@@ -232,5 +234,16 @@ class SemgrepAdapter(AdapterPlugin):
             finding.id = self.get_fingerprint(finding)
 
             findings.append(finding)
+            if path_str and start_line:
+                snippet_requests.append((finding, path_str, start_line))
+
+        # Code context
+        contexts = extract_code_snippets(
+            ((path, line) for _, path, line in snippet_requests),
+            context_lines=2,
+            inventory=inventory,
+        )
+        for (finding, _, _), context in zip(snippet_requests, contexts, strict=True):
+            finding.context = context
 
         return findings
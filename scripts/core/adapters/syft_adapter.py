@@ -48,10 +48,13 @@ See Also:
 
 from __future__ import annotations
 
+import logging
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
-from scripts.core.adapters.common import safe_load_json_file
+from scripts.core import json_codec
+from scripts.core.adapters.common import iter_json_members
 from scripts.core.common_finding import fingerprint, normalize_severity
 from scripts.core.plugin_api import (
     AdapterPlugin,
@@ -60,6 +63,8 @@ from scripts.core.plugin_api import (
     adapter_plugin,
 )
 
+logger = logging.getLogger(__name__)
+
 
 @adapter_plugin(
     PluginMetadata(
@@ -121,83 +126,101 @@ class SyftAdapter(AdapterPlugin):
 
 
 def _load_syft_internal(path: str | Path) -> list[dict[str, Any]]:
-    data = safe_load_json_file(path, default=None)
-    if not isinstance(data, dict):
+    # artifacts[] is streamed one package at a time and every other member
+    # (files[], artifactRelationships[], ...) is skipped without being kept.
+    # Vulnerabilities refer to artifacts by id, so they are handled once all
+    # artifacts have been read.
+    out: list[dict[str, Any]] = []
+    artifacts: list[Any] = []
+    vulns: list[Any] = []
+    malformed = False
+
+    def packages() -> Iterator[Any]:
+        nonlocal malformed
+        try:
+            for key, value in iter_json_members(
+                path, stream=("artifacts", "vulnerabilities"), keep=()
+            ):
+                if key == "artifacts":
+                    artifacts.append(value)
+                    yield value
+                else:
+                    vulns.append(value)
+        except json_codec.JSONDecodeError as e:
+            logger.debug(f"Failed to parse Syft JSON {path}: {e}")
+            malformed = True
+
+    for a in packages():
+        name = str(a.get("name") or a.get("id") or "package")
+        version = str(a.get("version") or "")
+        location = ""
+        locs = a.get("locations") or []
+        if isinstance(locs, list) and locs:
+            loc0 = locs[0]
+            if isinstance(loc0, dict):
+                location = str(loc0.get("path") or "")
+        title = f"{name} {version}".strip()
+        msg = f"Package discovered: {title}"
+        fid = fingerprint("syft", name, location, 0, msg)
+        finding = {
+            "schemaVersion": "1.2.0",
+            "id": fid,
+            "ruleId": "SBOM.PACKAGE",
+            "title": title,
+            "message": msg,
+            "description": msg,
+            "severity": "INFO",
+            "tool": {
+                "name": "syft",
+                "version": "unknown",  # Syft doesn't embed version in JSON output
+            },
+            "location": {"path": location, "startLine": 0},
+            "remediation": "Track and scan dependencies.",
+            "tags": ["sbom", "package"],
+            "raw": a,
+        }
+        out.append(finding)
+
+    if malformed:
         return []
 
-    out: list[dict[str, Any]] = []
-    artifacts = data.get("artifacts")
-    if isinstance(artifacts, list):
-        for a in artifacts:
-            name = str(a.get("name") or a.get("id") or "package")
-            version = str(a.get("version") or "")
-            location = ""
-            locs = a.get("locations") or []
-            if isinstance(locs, list) and locs:
-                loc0 = locs[0]
-                if isinstance(loc0, dict):
-                    location = str(loc0.get("path") or "")
-            title = f"{name} {version}".strip()
-            msg = f"Package discovered: {title}"
-            fid = fingerprint("syft", name, location, 0, msg)
-            finding = {
-                "schemaVersion": "1.2.0",
-                "id": fid,
-                "ruleId": "SBOM.PACKAGE",
-                "title": title,
-                "message": msg,
-                "description": msg,
-                "severity": "INFO",
-                "tool": {
-                    "name": "syft",
-                    "version": "unknown",  # Syft doesn't embed version in JSON output
-                },
-                "location": {"path": location, "startLine": 0},
-                "remediation": "Track and scan dependencies.",
-                "tags": ["sbom", "package"],
-                "raw": a,
-            }
-            out.append(finding)
-
-    vulns = data.get("vulnerabilities")
-    if isinstance(vulns, list):
-        for v in vulns:
-            vid = str(v.get("id") or v.get("vulnerability") or "VULN")
-            sev = normalize_severity(v.get("severity") or v.get("rating") or "MEDIUM")
-            related = v.get("artifactIds") or []
-            pkg = None
-            if related and isinstance(artifacts, list):
-                # attempt to find package by id
-                for a in artifacts:
-                    if a.get("id") in related:
-                        pkg = a
-                        break
-            name = (pkg or {}).get("name") or "package"
-            location = ""
-            if pkg and isinstance(pkg.get("locations"), list) and pkg["locations"]:
-                loc0 = pkg["locations"][0]
-                if isinstance(loc0, dict):
-                    location = str(loc0.get("path") or "")
-            msg = str(v.get("description") or v.get("summary") or vid)
-            fid = fingerprint("syft", vid, location, 0, msg)
-            finding = {
-                "schemaVersion": "1.2.0",
-                "id": fid,
-                "ruleId": vid,
-                "title": vid,
-                "message": msg,
-                "description": msg,
-                "severity": sev,
-                "tool": {
-                    "name": "syft",
-                    "version": "unknown",  # Syft doesn't embed version in JSON output
-                },
-                "location": {"path": location, "startLine": 0},
-                "remediation": str(v.get("url") or "See advisory"),
-                "tags": ["sbom", "vulnerability"],
-                "risk": {"cwe": ["CWE-1104"]},
-                "raw": v,
-            }
-            out.append(finding)
+    for v in vulns:
+        vid = str(v.get("id") or v.get("vulnerability") or "VULN")
+        sev = normalize_severity(v.get("severity") or v.get("rating") or "MEDIUM")
+        related = v.get("artifactIds") or []
+        pkg = None
+        if related:
+            # attempt to find package by id
+            for a in artifacts:
+                if a.get("id") in related:
+                    pkg = a
+                    break
+        name = (pkg or {}).get("name") or "package"
+        location = ""
+        if pkg and isinstance(pkg.get("locations"), list) and pkg["locations"]:
+            loc0 = pkg["locations"][0]
+            if isinstance(loc0, dict):
+                location = str(loc0.get("path") or "")
+        msg = str(v.get("description") or v.get("summary") or vid)
+        fid = fingerprint("syft", vid, location, 0, msg)
+        finding = {
+            "schemaVersion": "1.2.0",
+            "id": fid,
+            "ruleId": vid,
+            "title": vid,
+            "message": msg,
+            "description": msg,
+            "severity": sev,
+            "tool": {
+                "name": "syft",
+                "version": "unknown",  # Syft doesn't embed version in JSON output
+            },
+            "location": {"path": location, "startLine": 0},
+            "remediation": str(v.get("url") or "See advisory"),
+            "tags": ["sbom", "vulnerability"],
+            "risk": {"cwe": ["CWE-1104"]},
+            "raw": v,
+        }
+        out.append(finding)
 
     return out
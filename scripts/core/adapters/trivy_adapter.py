@@ -64,9 +64,10 @@ from pathlib import Path
 
 from scripts.core.adapters.common import safe_load_json_file
 from scripts.core.common_finding import (
-    extract_code_snippet,
+    extract_code_snippets,
     normalize_severity,
 )
+from scripts.core.file_inventory import inventory_for_results
 from scripts.core.plugin_api import (
     AdapterPlugin,
     Finding,
@@ -112,7 +113,13 @@ class TrivyAdapter(AdapterPlugin):
         if not isinstance(results, list):
             return []
 
+        # Written by the scan next to this output; lets snippet extraction skip
+        # paths the target is known not to contain.
+        inventory = inventory_for_results(Path(output_path).parent)
         findings: list[Finding] = []
+        # Snippets are extracted in one batch after parsing, so each file is
+        # opened and line-indexed once however many findings point into it
+        snippet_requests: list[tuple[Finding, str, int]] = []
         tool_version = str(data.get("Version") or "unknown")
 
         for r in results:
@@ -141,13 +148,6 @@ class TrivyAdapter(AdapterPlugin):
                     path_str = item.get("Target") or target or ""
                     line = item.get("StartLine") or 0
 
-                    # Code context (for misconfigurations)
-                    context = None
-                    if tag == "misconfig" and path_str and line:
-                        context = extract_code_snippet(
-                            str(path_str), int(line), context_lines=2
-                        )
-
                     # Risk metadata for vulnerabilities
                     risk = None
                     if tag == "vulnerability":
@@ -171,7 +171,7 @@ class TrivyAdapter(AdapterPlugin):
                         },
                         remediation=str(item.get("PrimaryURL") or "See advisory"),
                         tags=[tag],
-                        context=context,
+                        context=None,  # Filled in by the snippet batch below
                         risk=risk,
                         raw=item,
                     )
@@ -180,5 +180,16 @@ class TrivyAdapter(AdapterPlugin):
                     finding.id = self.get_fingerprint(finding)
 
                     findings.append(finding)
+                    # Code context (for misconfigurations)
+                    if tag == "misconfig" and path_str and line:
+                        snippet_requests.append((finding, str(path_str), int(line)))
+
+        contexts = extract_code_snippets(
+            ((path, line) for _, path, line in snippet_requests),
+            context_lines=2,
+            inventory=inventory,
+        )
+        for (finding, _, _), context in zip(snippet_requests, contexts, strict=True):
+            finding.context = context
 
         return findings
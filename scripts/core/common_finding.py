@@ -7,8 +7,15 @@ from __future__ import annotations
 
 import hashlib
 import logging
+from collections.abc import Iterable
 from enum import Enum
-from typing import Any
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from scripts.core.source_cache import SourceFile, get_source_cache
+
+if TYPE_CHECKING:
+    from scripts.core.file_inventory import FileInventory
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -217,79 +224,73 @@ def fingerprint(
     return hashlib.sha256(base.encode("utf-8")).hexdigest()[:FINGERPRINT_LENGTH]
 
 
+def _snippet_from_source(
+    source: SourceFile, start_line: int, context_lines: int, language: str | None
+) -> dict[str, Any] | None:
+    line_count = source.line_count
+    if not line_count:
+        return None
+
+    # Calculate snippet bounds (1-indexed, end exclusive-style as before)
+    line_no = max(1, start_line)
+    snippet_start = max(1, line_no - context_lines)
+    snippet_end = min(line_count, line_no + context_lines)
+
+    snippet_lines = source.lines(snippet_start, snippet_end)
+    snippet = "\n".join(
+        f"{i + snippet_start}: {line}" for i, line in enumerate(snippet_lines)
+    )
+    return {
+        "snippet": snippet,
+        "startLine": snippet_start,
+        "endLine": snippet_end,
+        "language": language,
+    }
+
+
+def _open_source(file_path: str, inventory: FileInventory | None) -> SourceFile | None:
+    if inventory is not None:
+        entry = inventory.get(file_path)
+        if entry is None and inventory.covers(file_path):
+            return None
+    return get_source_cache().get(file_path)
+
+
 def extract_code_snippet(
     file_path: str,
     start_line: int,
     context_lines: int = 2,
+    inventory: FileInventory | None = None,
 ) -> dict[str, Any] | None:
     """Extract code snippet around a specific line for context.
 
+    Source files come from the shared ``SourceCache``, so repeated findings in
+    one file reuse a single mapping and line index, and only the snippet's
+    lines are decoded.
+
     Args:
         file_path: Path to source file
         start_line: Line number where finding occurred (1-indexed)
         context_lines: Number of context lines before and after (default: 2)
+        inventory: Optional file inventory of the scanned target. A path it
+            covers but does not list is known not to exist, so the exists/stat
+            round trip is skipped - adapters enriching thousands of findings
+            otherwise stat each one.
 
     Returns:
         Dictionary with snippet, startLine, endLine, language or None if file not readable
     """
-    from pathlib import Path
+    from scripts.core.file_inventory import detect_language
 
     try:
-        p = Path(file_path)
-        if not p.exists() or not p.is_file():
-            return None
-
-        # Read file lines
-        lines = p.read_text(encoding="utf-8", errors="ignore").splitlines()
-        if not lines:
+        source = _open_source(file_path, inventory)
+        if source is None:
             return None
-
-        # Calculate snippet bounds (convert to 0-indexed)
-        line_idx = max(0, start_line - 1)
-        snippet_start = max(0, line_idx - context_lines)
-        snippet_end = min(len(lines), line_idx + context_lines + 1)
-
-        # Extract snippet
-        snippet_lines = lines[snippet_start:snippet_end]
-        snippet = "\n".join(
-            f"{i + snippet_start + 1}: {line}" for i, line in enumerate(snippet_lines)
+        return _snippet_from_source(
+            source, start_line, context_lines, detect_language(Path(file_path))
         )
-
-        # Infer language from extension
-        ext_map = {
-            ".py": "python",
-            ".js": "javascript",
-            ".ts": "typescript",
-            ".go": "go",
-            ".rs": "rust",
-            ".java": "java",
-            ".c": "c",
-            ".cpp": "cpp",
-            ".rb": "ruby",
-            ".php": "php",
-            ".sh": "bash",
-            ".yaml": "yaml",
-            ".yml": "yaml",
-            ".json": "json",
-            ".xml": "xml",
-            ".html": "html",
-            ".css": "css",
-            ".sql": "sql",
-            ".dockerfile": "dockerfile",
-            ".tf": "terraform",
-        }
-        language = ext_map.get(p.suffix.lower(), "text")
-        if p.name.lower() == "dockerfile":
-            language = "dockerfile"
-
-        return {
-            "snippet": snippet,
-            "startLine": snippet_start + 1,  # 1-indexed
-            "endLine": snippet_end,  # 1-indexed (exclusive)
-            "language": language,
-        }
-    except (OSError, UnicodeDecodeError, IndexError) as e:
-        # File read errors, encoding issues, or line indexing errors
+    except (OSError, ValueError) as e:
+        # File read errors or a file truncated while mapped
         logger.debug(f"Failed to read code snippet from {file_path}:{start_line}: {e}")
         return None
     except Exception as e:  # Acceptable: code snippet extraction is best-effort
@@ -297,3 +298,44 @@ def extract_code_snippet(
             f"Unexpected error reading code snippet from {file_path}:{start_line}: {e}"
         )
         return None
+
+
+def extract_code_snippets(
+    locations: Iterable[tuple[str, int]],
+    context_lines: int = 2,
+    inventory: FileInventory | None = None,
+) -> list[dict[str, Any] | None]:
+    """Batch form of ``extract_code_snippet``.
+
+    Locations are grouped by file so each file is opened, indexed and
+    language-detected once however many findings point into it.
+
+    Args:
+        locations: (file_path, start_line) pairs
+        context_lines: Number of context lines before and after (default: 2)
+        inventory: Optional file inventory of the scanned target
+
+    Returns:
+        One snippet dict (or None) per location, in input order
+    """
+    from scripts.core.file_inventory import detect_language
+
+    by_file: dict[str, list[tuple[int, int]]] = {}
+    items = list(locations)
+    for position, (file_path, start_line) in enumerate(items):
+        by_file.setdefault(file_path, []).append((position, start_line))
+
+    results: list[dict[str, Any] | None] = [None] * len(items)
+    for file_path, wanted in by_file.items():
+        try:
+            source = _open_source(file_path, inventory)
+            if source is None:
+                continue
+            language = detect_language(Path(file_path))
+            for position, start_line in wanted:
+                results[position] = _snippet_from_source(
+                    source, start_line, context_lines, language
+                )
+        except Exception as e:  # Acceptable: code snippet extraction is best-effort
+            logger.debug(f"Failed to read code snippets from {file_path}: {e}")
+    return results
@@ -16,10 +16,17 @@ Usage:
     finding = {...}  # CommonFinding dict
     enriched = enrich_finding_with_compliance(finding)
     # enriched["compliance"] now contains all framework mappings
+
+Findings that share a (tool, ruleId, tags, CWEs) tuple - one trivy rule across
+hundreds of images, one semgrep rule across a monorepo - get identical
+mappings, so ``enrich_finding_with_compliance`` computes them once per tuple
+and memoizes the result. The framework lists inside ``compliance`` are shared
+between those findings and must be treated as read-only.
 """
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any
 
 # =============================================================================
@@ -922,6 +929,9 @@ CWE_TO_MITRE_ATTACK = {
 # Enrichment Functions
 # =============================================================================
 
+# Distinct (tool, ruleId, tags, CWEs) tuples whose mappings are memoized
+COMPLIANCE_CACHE_SIZE = 8192
+
 
 def get_tool_category(tool_name: str, tags: list[str]) -> str | None:
     """Determine tool category for framework mapping.
@@ -1152,6 +1162,35 @@ def map_to_mitre_attack(
     return unique_mappings
 
 
+@lru_cache(maxsize=64)
+def _rule_index(
+    tool: str,
+) -> tuple[dict[str, list[str]], tuple[tuple[str, list[str]], ...], list[str]]:
+    """Rule lookup tables for one tool, built from TOOL_RULE_TO_OWASP_TOP10_2021.
+
+    Returns:
+        (exact rule mappings, (prefix, mapping) glob patterns in table order,
+        wildcard mapping)
+    """
+    tool_mappings: dict[str, Any] = TOOL_RULE_TO_OWASP_TOP10_2021.get(tool, {})  # type: ignore[assignment]  # Nested dict structure requires Any
+
+    def as_list(mapping: Any) -> list[str]:
+        return list(mapping) if mapping and isinstance(mapping, (list, tuple)) else []
+
+    exact = {rule: as_list(mapping) for rule, mapping in tool_mappings.items()}
+    patterns = tuple(
+        (pattern.split("*")[0], as_list(mapping))
+        for pattern, mapping in tool_mappings.items()
+        if pattern != "*" and "*" in pattern
+    )
+    wildcard = tool_mappings.get("*")
+    return (
+        exact,
+        patterns,
+        list(wildcard) if isinstance(wildcard, (list, tuple)) else [],
+    )
+
+
 def map_rule_to_owasp_top10_2021(tool_name: str, rule_id: str) -> list[str]:
     """Map tool-specific rule ID to OWASP Top 10 2021.
 
@@ -1167,37 +1206,19 @@ def map_rule_to_owasp_top10_2021(tool_name: str, rule_id: str) -> list[str]:
     if tool not in TOOL_RULE_TO_OWASP_TOP10_2021:
         return []
 
-    tool_mappings: dict[str, Any] = TOOL_RULE_TO_OWASP_TOP10_2021[tool]  # type: ignore[assignment]  # Nested dict structure requires Any
+    exact, patterns, wildcard = _rule_index(tool)
 
     # Check for exact match
-    if rule_id in tool_mappings:
-        mapping = tool_mappings[rule_id]
-        return list(mapping) if mapping and isinstance(mapping, (list, tuple)) else []
+    if rule_id in exact:
+        return list(exact[rule_id])
 
-    # Check for pattern match
-    for pattern, mapping in tool_mappings.items():
-        if pattern == "*":
-            continue
-        if "*" in pattern:
-            # Glob-style pattern matching
-            prefix = pattern.split("*")[0]
-            if rule_id.startswith(prefix):
-                return (
-                    list(mapping)
-                    if mapping and isinstance(mapping, (list, tuple))
-                    else []
-                )
+    # Check for pattern match (glob-style prefix patterns)
+    for prefix, mapping in patterns:
+        if rule_id.startswith(prefix):
+            return list(mapping)
 
     # Check for wildcard match
-    if tool_mappings.get("*"):
-        wildcard_mapping = tool_mappings["*"]
-        return (
-            list(wildcard_mapping)
-            if isinstance(wildcard_mapping, (list, tuple))
-            else []
-        )
-
-    return []
+    return list(wildcard)
 
 
 def enrich_finding_with_compliance(finding: dict[str, Any]) -> dict[str, Any]:
@@ -1222,7 +1243,28 @@ def enrich_finding_with_compliance(finding: dict[str, Any]) -> dict[str, Any]:
     risk = finding.get("risk", {})
     cwes = risk.get("cwe", []) if isinstance(risk, dict) else []
 
-    # Initialize compliance dict
+    try:
+        if not isinstance(tags, (list, tuple)) or not isinstance(cwes, (list, tuple)):
+            raise TypeError("tags and CWEs are not lists")
+        compliance = _cached_compliance(tool_name, rule_id, tuple(tags), tuple(cwes))
+    except TypeError:
+        # Malformed finding (non-list or unhashable tags/CWEs): map without the memo
+        compliance = _compute_compliance(tool_name, rule_id, tags, cwes)
+
+    # Update finding with compliance metadata
+    if compliance:
+        # Own top-level dict per finding; the framework lists are shared
+        finding["compliance"] = dict(compliance)
+        # Update schema version to 1.2.0
+        finding["schemaVersion"] = "1.2.0"
+
+    return finding
+
+
+def _compute_compliance(
+    tool_name: str, rule_id: str, tags: Any, cwes: Any
+) -> dict[str, Any]:
+    """Framework mappings for one (tool, ruleId, tags, CWEs) combination."""
     compliance: dict[str, Any] = {}
 
     # OWASP Top 10 2021
@@ -1266,13 +1308,15 @@ def enrich_finding_with_compliance(finding: dict[str, Any]) -> dict[str, Any]:
     if mitre_attack:
         compliance["mitreAttack"] = mitre_attack
 
-    # Update finding with compliance metadata
-    if compliance:
-        finding["compliance"] = compliance
-        # Update schema version to 1.2.0
-        finding["schemaVersion"] = "1.2.0"
+    return compliance
 
-    return finding
+
+@lru_cache(maxsize=COMPLIANCE_CACHE_SIZE)
+def _cached_compliance(
+    tool_name: str, rule_id: str, tags: tuple[str, ...], cwes: tuple[str, ...]
+) -> dict[str, Any]:
+    """Memoized ``_compute_compliance``; callers must not mutate the result."""
+    return _compute_compliance(tool_name, rule_id, tags, cwes)
 
 
 def enrich_findings_with_compliance(
@@ -10,17 +10,33 @@ to developers and teams. Provides insights into:
 - Focus areas per developer
 
 Phase 6 of Trend Analysis feature (#4).
+
+Blame runs once per file rather than once per finding: the lines of every
+resolved finding in a file are passed to a single ``git blame --porcelain``
+as ``-L`` ranges (or the whole file is blamed when the lines are too many to
+list), files are blamed in parallel, and results are cached per
+(HEAD commit, path) for the life of the ``DeveloperAttribution`` instance.
 """
 
 from __future__ import annotations
 
 import logging
+import re
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_BLAME_WORKERS = 8
+BLAME_TIMEOUT = 60  # seconds per git blame invocation
+# Past this many -L ranges, blaming the whole file is cheaper than listing them
+MAX_BLAME_RANGES = 100
+
+# Porcelain line header: <sha> <orig-line> <final-line> [<group-size>]
+_PORCELAIN_HEADER = re.compile(r"^([0-9a-f]{4,64}) \d+ (\d+)(?: \d+)?$")
+
 
 # ============================================================================
 # Data Classes
@@ -88,14 +104,18 @@ class DeveloperAttribution:
             print(f"{dev.name}: {dev.findings_resolved} resolved")
     """
 
-    def __init__(self, repo_path: Path):
+    def __init__(self, repo_path: Path, max_workers: int = DEFAULT_BLAME_WORKERS):
         """
         Initialize developer attribution analyzer.
 
         Args:
             repo_path: Path to git repository root
+            max_workers: Files blamed concurrently
         """
         self.repo_path = Path(repo_path)
+        self.max_workers = max(1, max_workers)
+        # (HEAD commit, path) -> line number -> author (None if unattributable)
+        self._blame_cache: dict[tuple[str, str], dict[int, dict | None]] = {}
         self._validate_git_repo()
 
     def _validate_git_repo(self) -> None:
@@ -131,6 +151,8 @@ class DeveloperAttribution:
             f"Analyzing {len(resolved_fingerprints)} resolved findings for attribution"
         )
 
+        located = []
+        lines_by_file: dict[str, set[int]] = {}
         for fp in resolved_fingerprints:
             # Get finding details from database
             finding = history_db.get_finding_by_fingerprint(fp)
@@ -144,8 +166,14 @@ class DeveloperAttribution:
                 logger.debug(f"Missing location for finding: {fp}")
                 continue
 
-            # Get git blame for this line
-            author = self._git_blame_line(file_path, line_num)
+            located.append((fp, finding, file_path, line_num))
+            lines_by_file.setdefault(file_path, set()).add(line_num)
+
+        # Get git blame for every line, one git invocation per file
+        authors = self._blame_files(lines_by_file)
+
+        for fp, finding, file_path, line_num in located:
+            author = authors.get(file_path, {}).get(line_num)
             if not author:
                 logger.debug(f"No git blame data for {file_path}:{line_num}")
                 continue
@@ -210,13 +238,79 @@ class DeveloperAttribution:
         logger.info(f"Attributed findings to {len(results)} developers")
         return results
 
+    def _blame_files(
+        self, lines_by_file: dict[str, set[int]]
+    ) -> dict[str, dict[int, dict | None]]:
+        """
+        Blame the given lines of each file, reusing cached results.
+
+        Files are blamed in parallel on up to ``max_workers`` threads. Only
+        lines not already cached for the current HEAD are blamed.
+
+        Args:
+            lines_by_file: File path (relative to repo root) -> line numbers
+
+        Returns:
+            File path -> line number -> author dict (or None)
+        """
+        head = self._head_commit()
+        results: dict[str, dict[int, dict | None]] = {}
+        pending: dict[str, list[int]] = {}
+        for file_path, line_nums in lines_by_file.items():
+            cached = self._blame_cache.get((head, file_path), {}) if head else {}
+            results[file_path] = {n: cached[n] for n in line_nums if n in cached}
+            missing = sorted(n for n in line_nums if n not in cached)
+            if missing:
+                pending[file_path] = missing
+
+        if not pending:
+            return results
+
+        logger.debug(
+            f"Running git blame on {len(pending)} files "
+            f"({sum(len(v) for v in pending.values())} lines)"
+        )
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(pending)),
+            thread_name_prefix="jmo-blame",
+        ) as executor:
+            blamed = executor.map(
+                lambda item: self._git_blame_lines(item[0], item[1]),
+                pending.items(),
+            )
+            for (file_path, missing), authors in zip(
+                pending.items(), blamed, strict=True
+            ):
+                results[file_path].update({n: authors.get(n) for n in missing})
+                if head and authors:
+                    # Only attributed lines: a failed or timed-out blame is
+                    # retried on the next call rather than cached as authorless
+                    self._blame_cache.setdefault((head, file_path), {}).update(authors)
+
+        return results
+
+    def _head_commit(self) -> str | None:
+        """Current HEAD commit of the repository, or None if it has none."""
+        try:
+            result = subprocess.run(
+                ["git", "rev-parse", "HEAD"],
+                cwd=self.repo_path,
+                capture_output=True,
+                encoding="utf-8",
+                errors="replace",
+                timeout=10,
+                check=False,
+            )
+        except (OSError, subprocess.TimeoutExpired) as e:
+            logger.debug(f"git rev-parse failed: {e}")
+            return None
+        head = result.stdout.strip()
+        return head if result.returncode == 0 and head else None
+
     def _git_blame_line(self, file_path: str, line_num: int) -> dict | None:
         """
         Run git blame for a specific line in a file.
 
-        Uses --porcelain format for easier parsing. Returns author info
-        for the line at the given line number.
-
         Args:
             file_path: Path to file relative to repo root
             line_num: Line number (1-indexed)
@@ -228,17 +322,41 @@ class DeveloperAttribution:
             author = self._git_blame_line("src/main.py", 42)
             print(f"{author['name']} <{author['email']}>")
         """
-        try:
-            cmd = [
-                "git",
-                "blame",
-                "-L",
-                f"{line_num},{line_num}",
-                "--porcelain",
-                str(file_path),
-            ]
+        return self._git_blame_lines(file_path, [line_num]).get(line_num)
 
-            result = subprocess.run(
+    def _git_blame_lines(
+        self, file_path: str, line_nums: list[int]
+    ) -> dict[int, dict | None]:
+        """
+        Run one git blame covering several lines of a file.
+
+        Uses --porcelain format for easier parsing. Contiguous lines are
+        merged into one -L range; past MAX_BLAME_RANGES ranges the whole
+        file is blamed instead. Lines past the end of the file are dropped
+        rather than failing the whole blame.
+
+        Args:
+            file_path: Path to file relative to repo root
+            line_nums: Line numbers (1-indexed)
+
+        Returns:
+            Line number -> dictionary with 'name' and 'email' keys. Lines
+            git blame could not attribute are missing.
+        """
+        ranges: list[list[int]] = []
+        for n in sorted(set(line_nums)):
+            if ranges and n == ranges[-1][1] + 1:
+                ranges[-1][1] = n
+            else:
+                ranges.append([n, n])
+
+        def blame(ranges: list[list[int]]) -> subprocess.CompletedProcess[str]:
+            cmd = ["git", "blame"]
+            if len(ranges) <= MAX_BLAME_RANGES:
+                for first, last in ranges:
+                    cmd += ["-L", f"{first},{last}"]
+            cmd += ["--porcelain", str(file_path)]
+            return subprocess.run(
                 cmd,
                 cwd=self.repo_path,
                 capture_output=True,
@@ -247,47 +365,61 @@ class DeveloperAttribution:
                 # locale drops the capture on Windows (see tool_runner.py).
                 encoding="utf-8",
                 errors="replace",
-                timeout=10,
+                timeout=BLAME_TIMEOUT,
                 check=False,
             )
 
+        try:
+            result = blame(ranges)
+            if result.returncode != 0 and len(ranges) <= MAX_BLAME_RANGES:
+                # git rejects every -L range if one is past the end of the
+                # file ("file X has only N lines"). Resolved findings hit this
+                # often, since fixes shrink files, so retry with the lines
+                # that still exist.
+                clamped = self._clamp_ranges(file_path, ranges)
+                if clamped and clamped != ranges:
+                    result = blame(clamped)
+
             if result.returncode != 0:
                 # File might have been deleted or renamed
                 logger.debug(
-                    f"git blame failed for {file_path}:{line_num}: {result.stderr.strip()}"
+                    f"git blame failed for {file_path}: {result.stderr.strip()}"
                 )
-                return None
-
-            # Parse porcelain output
-            # Format:
-            #   <commit-hash> <line-num> <final-line-num> <num-lines>
-            #   author <name>
-            #   author-mail <<email>>
-            #   ...
-            lines = result.stdout.split("\n")
-            author_name = None
-            author_email = None
-
-            for line in lines:
-                if line.startswith("author "):
-                    author_name = line[7:]  # Skip "author "
-                elif line.startswith("author-mail "):
-                    # Remove angle brackets
-                    author_email = line[12:].strip("<>")
-
-            if author_name and author_email:
-                return {"name": author_name, "email": author_email}
-
-            logger.debug(f"Incomplete git blame output for {file_path}:{line_num}")
+                return {}
+
+            wanted = set(line_nums)
+            authors: dict[int, dict | None] = {
+                n: author
+                for n, author in _parse_porcelain(result.stdout).items()
+                if n in wanted
+            }
+            if len(authors) < len(wanted):
+                logger.debug(f"Incomplete git blame output for {file_path}")
+            return authors
 
         except subprocess.TimeoutExpired:
-            logger.warning(f"git blame timeout for {file_path}:{line_num}")
+            logger.warning(f"git blame timeout for {file_path}")
         except (
             Exception
         ) as e:  # Acceptable: git blame may fail for many reasons (deleted files, shallow clones)
-            logger.error(f"git blame error for {file_path}:{line_num}: {e}")
+            logger.error(f"git blame error for {file_path}: {e}")
 
-        return None
+        return {}
+
+    def _clamp_ranges(
+        self, file_path: str, ranges: list[list[int]]
+    ) -> list[list[int]] | None:
+        """Trim -L ranges to the working-tree file's length (None if unreadable)."""
+        try:
+            with open(self.repo_path / file_path, "rb") as fh:
+                line_count = sum(1 for _ in fh)
+        except OSError:
+            return None
+        return [
+            [first, min(last, line_count)]
+            for first, last in ranges
+            if first <= line_count
+        ]
 
     def aggregate_by_team(
         self, developer_stats: list[DeveloperStats], team_mapping: dict[str, str]
@@ -398,6 +530,45 @@ class DeveloperAttribution:
 # ============================================================================
 
 
+def _parse_porcelain(output: str) -> dict[int, dict]:
+    """
+    Map final line numbers to authors in ``git blame --porcelain`` output.
+
+    Format (commit headers appear only the first time a commit is seen):
+        <commit-hash> <orig-line> <final-line> [<num-lines>]
+        author <name>
+        author-mail <<email>>
+        ...
+        \t<line content>
+    """
+    commits: dict[str, dict[str, str]] = {}
+    line_commits: dict[int, str] = {}
+    current: dict[str, str] | None = None
+
+    for line in output.split("\n"):
+        if line.startswith("\t"):
+            continue
+        header = _PORCELAIN_HEADER.match(line)
+        if header:
+            sha, final_line = header.group(1), int(header.group(2))
+            line_commits[final_line] = sha
+            current = commits.setdefault(sha, {})
+        elif current is None:
+            continue
+        elif line.startswith("author "):
+            current["name"] = line[7:]  # Skip "author "
+        elif line.startswith("author-mail "):
+            # Remove angle brackets
+            current["email"] = line[12:].strip("<>")
+
+    authors = {}
+    for final_line, sha in line_commits.items():
+        info = commits[sha]
+        if info.get("name") and info.get("email"):
+            authors[final_line] = {"name": info["name"], "email": info["email"]}
+    return authors
+
+
 def load_team_mapping(team_file_path: Path) -> dict[str, str]:
     """
     Load team mapping from JSON file.
@@ -10,19 +10,34 @@ Key Features:
 - Modification detection (5 change types)
 - Directory and SQLite comparison modes
 - O(n) complexity for fast diffs (<500ms for 1000 findings)
+- Indexed directory diffs: when both directories have a ``findings.idx``
+  sidecar (written by ``jmo report``), fingerprints are merge-joined from the
+  indexes and only findings that are new, resolved or possibly modified are
+  parsed; unchanged findings are parsed lazily, on access
+- Digest-based modification detection: ``modification_digest`` hashes the
+  attributes modification detection looks at. Digests are stored in the
+  sidecar index and in history rows, and findings whose digests match are
+  classified unchanged without a field-by-field comparison
 
 Copyright (c) 2025 JMo Security
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import math
+import sqlite3
 from collections import Counter
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from scripts.core import json_codec
+from scripts.core.findings_index import FindingsIndex, IndexedFindings, merge_join
+
 logger = logging.getLogger(__name__)
 
 
@@ -97,13 +112,92 @@ class DiffResult:
 
     new: list[dict[str, Any]] = field(default_factory=list)
     resolved: list[dict[str, Any]] = field(default_factory=list)
-    unchanged: list[dict[str, Any]] = field(default_factory=list)
+    unchanged: Sequence[dict[str, Any]] = field(default_factory=list)
     modified: list[ModifiedFinding] = field(default_factory=list)
     baseline_source: DiffSource = None  # type: ignore[assignment]  # Dataclass default for optional field
     current_source: DiffSource = None  # type: ignore[assignment]  # Dataclass default for optional field
     statistics: dict[str, Any] = field(default_factory=dict)
 
 
+# ============================================================================
+# Modification Digest
+# ============================================================================
+
+# Fallback priority by severity when a finding has neither EPSS nor CVSS
+SEVERITY_PRIORITY = {
+    "CRITICAL": 90,
+    "HIGH": 70,
+    "MEDIUM": 50,
+    "LOW": 30,
+    "INFO": 10,
+}
+
+# Priority changes above this many points count as a modification
+PRIORITY_THRESHOLD = 5.0
+
+
+def _priority_score(finding: dict[str, Any]) -> float:
+    """Priority score on a 0-100 scale (EPSS, then CVSS, then severity)."""
+    # Try EPSS first (exploit probability)
+    epss = finding.get("risk", {}).get("epss_score")
+    if epss is not None:
+        return float(epss) * 100  # Normalize to 0-100
+
+    # Try CVSS base score
+    cvss = finding.get("cvss", {}).get("baseScore")
+    if cvss is not None:
+        return float(cvss) * 10  # Normalize to 0-100
+
+    # Fallback: severity-based score
+    return SEVERITY_PRIORITY.get(finding.get("severity", "INFO"), 0)
+
+
+def _flattened_compliance(compliance: dict[str, Any]) -> list[str]:
+    """Compliance mappings as "framework:id" strings."""
+    flat = []
+    for framework, mappings in compliance.items():
+        if isinstance(mappings, list):
+            for item in mappings:
+                if isinstance(item, str):
+                    flat.append(f"{framework}:{item}")
+                elif isinstance(item, dict):
+                    # Handle complex objects (CWE, NIST, CIS)
+                    id_key = item.get("id", item.get("category", ""))
+                    if id_key:
+                        flat.append(f"{framework}:{id_key}")
+    return flat
+
+
+def modification_digest(finding: dict[str, Any]) -> str | None:
+    """
+    Hash of the attributes modification detection compares.
+
+    Covers severity, the priority score's ``PRIORITY_THRESHOLD``-wide bucket,
+    the flattened compliance set, CWE and the message. Two versions of a
+    finding with equal digests can never be reported as modified: scores in
+    one bucket differ by less than the threshold, and everything else must
+    match exactly. Unequal digests only mean "compare field by field".
+
+    Returns:
+        16-character hex digest, or None if the finding's attributes cannot
+        be read (such findings are always compared in full)
+    """
+    try:
+        payload = [
+            finding.get("severity", "INFO"),
+            math.floor(_priority_score(finding) / PRIORITY_THRESHOLD),
+            sorted(set(_flattened_compliance(finding.get("compliance", {})))),
+            finding.get("risk", {}).get("cwe"),
+            finding.get("message", ""),
+        ]
+        encoded = json_codec.dumps(
+            payload, separators=json_codec.COMPACT_SEPARATORS
+        ).encode("utf-8")
+    except (AttributeError, TypeError, ValueError, OverflowError):
+        return None
+    return hashlib.blake2b(encoded, digest_size=8).hexdigest()
+
+
 # ============================================================================
 # Core Diff Engine
 # ============================================================================
@@ -174,6 +268,24 @@ class DiffEngine:
         if not current_dir.exists():
             raise FileNotFoundError(f"Current directory not found: {current_dir}")
 
+        baseline_index = FindingsIndex.open(
+            baseline_dir / "summaries" / "findings.json"
+        )
+        current_index = (
+            FindingsIndex.open(current_dir / "summaries" / "findings.json")
+            if baseline_index is not None
+            else None
+        )
+        if baseline_index is not None and current_index is not None:
+            logger.info("Comparing findings through fingerprint indexes")
+            try:
+                return self._compare_indexed(
+                    baseline_index, current_index, baseline_dir, current_dir
+                )
+            except ValueError as e:
+                # A span no longer holds its finding: the index is stale
+                logger.warning(f"{e}; loading findings.json instead")
+
         logger.info(f"Loading baseline findings from {baseline_dir}")
         baseline_findings = self._load_directory_findings(baseline_dir)
 
@@ -270,12 +382,20 @@ class DiffEngine:
                 total_findings=current_scan.get("total_findings", 0),
             )
 
+            digests = None
+            if self.detect_modifications:
+                digests = (
+                    self._load_sqlite_digests(conn, baseline_scan_id),
+                    self._load_sqlite_digests(conn, current_scan_id),
+                )
+
             # Perform diff
             return self._compare_findings(
                 baseline_findings,
                 current_findings,
                 baseline_source,
                 current_source,
+                digests,
             )
 
         finally:
@@ -297,7 +417,7 @@ class DiffEngine:
 
         try:
             with open(findings_path, encoding="utf-8") as f:
-                data = json.load(f)
+                data = json_codec.load(f)
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in {findings_path}: {e}")
 
@@ -328,7 +448,7 @@ class DiffEngine:
             # raw_finding contains the full JSON
             try:
                 raw = (
-                    json.loads(row["raw_finding"])
+                    json_codec.loads(row["raw_finding"])
                     if isinstance(row.get("raw_finding"), str)
                     else {}
                 )
@@ -353,6 +473,19 @@ class DiffEngine:
         logger.debug(f"Loaded {len(findings)} findings for scan {scan_id}")
         return findings
 
+    def _load_sqlite_digests(self, conn, scan_id: str) -> dict[str, str]:
+        """Stored modification digests for a scan ({} for pre-digest databases)."""
+        try:
+            rows = conn.execute(
+                "SELECT fingerprint, mutable_digest FROM findings "
+                "WHERE scan_id = ? AND mutable_digest IS NOT NULL",
+                (scan_id,),
+            ).fetchall()
+        except sqlite3.OperationalError as e:
+            logger.debug(f"No modification digests for scan {scan_id}: {e}")
+            return {}
+        return {row[0]: row[1] for row in rows}
+
     def _extract_source_info(
         self, results_dir: Path, findings: list[dict[str, Any]]
     ) -> DiffSource:
@@ -361,7 +494,7 @@ class DiffEngine:
 
         if findings_json.exists():
             try:
-                data = json.loads(findings_json.read_text(encoding="utf-8"))
+                data = json_codec.loads(findings_json.read_text(encoding="utf-8"))
                 # Handle both formats:
                 # 1. Plain list: [finding1, finding2, ...]
                 # 2. v1.0.0 wrapper: {"meta": {...}, "statistics": {...}, "findings": [...]}
@@ -396,6 +529,7 @@ class DiffEngine:
         current_findings: list[dict[str, Any]],
         baseline_source: DiffSource,
         current_source: DiffSource,
+        digests: tuple[dict[str, str], dict[str, str]] | None = None,
     ) -> DiffResult:
         """
         Core diff algorithm using fingerprint matching.
@@ -408,6 +542,9 @@ class DiffEngine:
         5. Return immutable DiffResult
 
         Complexity: O(n) where n = max(len(baseline), len(current))
+
+        ``digests`` optionally gives precomputed modification digests
+        (baseline, current) by fingerprint, e.g. from history rows.
         """
         logger.info("Building fingerprint indexes")
 
@@ -439,7 +576,7 @@ class DiffEngine:
         if self.detect_modifications:
             logger.info("Detecting modifications")
             modified = self._detect_modifications(
-                baseline_index, current_index, unchanged_fps
+                baseline_index, current_index, unchanged_fps, digests
             )
 
             # Remove modified findings from unchanged list
@@ -461,6 +598,81 @@ class DiffEngine:
             statistics=stats,
         )
 
+    def _compare_indexed(
+        self,
+        baseline: FindingsIndex,
+        current: FindingsIndex,
+        baseline_dir: Path,
+        current_dir: Path,
+    ) -> DiffResult:
+        """
+        Diff two indexed results directories.
+
+        New and resolved findings are parsed from their spans. A finding in
+        both scans whose modification digests (or, for indexes written
+        without digests, serialized bytes) are identical cannot have changed,
+        so it is classified unchanged without being parsed; the rest are
+        parsed pairwise for modification detection. Unchanged findings are
+        returned as an ``IndexedFindings`` sequence that parses on access.
+
+        Raises:
+            ValueError: If either index turns out to be stale
+        """
+        resolved_pos, new_pos, common = merge_join(baseline, current)
+        logger.info(
+            f"Classification: {len(new_pos)} new, "
+            f"{len(resolved_pos)} resolved, "
+            f"{len(common)} unchanged"
+        )
+
+        new = [current.load(i) for i in new_pos]
+        resolved = [baseline.load(i) for i in resolved_pos]
+        modified: list[ModifiedFinding] = []
+        unchanged_pos = []
+
+        if self.detect_modifications:
+            logger.info("Detecting modifications")
+            use_digests = baseline.has_digests and current.has_digests
+            for b, c in common:
+                if use_digests:
+                    digest = baseline.digest(b)
+                    same = digest is not None and digest == current.digest(c)
+                else:
+                    same = baseline.raw(b) == current.raw(c)
+                if not same:
+                    change = self._modification(
+                        current.fingerprints[c], baseline.load(b), current.load(c)
+                    )
+                    if change is not None:
+                        modified.append(change)
+                        continue
+                unchanged_pos.append(c)
+            logger.info(f"Found {len(modified)} modified findings")
+        else:
+            unchanged_pos = [c for _, c in common]
+
+        unchanged = IndexedFindings(current, unchanged_pos)
+        stats = self._calculate_statistics(new, resolved, unchanged, modified)
+
+        def source(index: FindingsIndex, results_dir: Path) -> DiffSource:
+            return DiffSource(
+                source_type="directory",
+                path=str(results_dir),
+                timestamp=index.meta.get("timestamp", ""),
+                profile=index.meta.get("profile", ""),
+                total_findings=index.findings_count,
+            )
+
+        return DiffResult(
+            new=new,
+            resolved=resolved,
+            unchanged=unchanged,
+            modified=modified,
+            baseline_source=source(baseline, baseline_dir),
+            current_source=source(current, current_dir),
+            statistics=stats,
+        )
+
     # ========================================================================
     # Private Methods - Modification Detection
     # ========================================================================
@@ -470,6 +682,7 @@ class DiffEngine:
         baseline_index: dict[str, dict],
         current_index: dict[str, dict],
         unchanged_fps: set[str],
+        digests: tuple[dict[str, str], dict[str, str]] | None = None,
     ) -> list[ModifiedFinding]:
         """
         Detect metadata changes in unchanged findings.
@@ -483,71 +696,82 @@ class DiffEngine:
             baseline_index: {fingerprint: finding}
             current_index: {fingerprint: finding}
             unchanged_fps: Set of fingerprints in both scans
+            digests: Precomputed modification digests (baseline, current)
+                by fingerprint; findings whose digests match are skipped
 
         Returns:
             List of ModifiedFinding objects
         """
         modified = []
+        baseline_digests, current_digests = digests or ({}, {})
 
         for fp in unchanged_fps:
-            baseline = baseline_index[fp]
-            current = current_index[fp]
-
-            changes = {}
-
-            # 1. Severity change (CRITICAL)
-            baseline_sev = baseline.get("severity", "INFO")
-            current_sev = current.get("severity", "INFO")
-            if baseline_sev != current_sev:
-                changes["severity"] = [baseline_sev, current_sev]
-
-            # 2. Priority score change (HIGH) - threshold 5 points
-            baseline_priority = self._extract_priority(baseline)
-            current_priority = self._extract_priority(current)
-            if abs(baseline_priority - current_priority) > 5.0:
-                changes["priority"] = [baseline_priority, current_priority]
-
-            # 3. Compliance framework additions (MEDIUM)
-            baseline_compliance = set(
-                self._flatten_compliance(baseline.get("compliance", {}))
-            )
-            current_compliance = set(
-                self._flatten_compliance(current.get("compliance", {}))
-            )
-            new_mappings = current_compliance - baseline_compliance
-            if new_mappings:
-                changes["compliance_added"] = list(new_mappings)
-
-            # 4. CWE changes (LOW)
-            baseline_cwe = baseline.get("risk", {}).get("cwe")
-            current_cwe = current.get("risk", {}).get("cwe")
-            if baseline_cwe != current_cwe and baseline_cwe and current_cwe:
-                changes["cwe"] = [baseline_cwe, current_cwe]
-
-            # 5. Message changes (INFORMATIONAL) - threshold 10 chars
-            baseline_msg = baseline.get("message", "")
-            current_msg = current.get("message", "")
-            if (
-                baseline_msg != current_msg
-                and abs(len(baseline_msg) - len(current_msg)) > 10
-            ):
-                changes["message"] = [baseline_msg[:100], current_msg[:100]]
-
-            # Only include if changes detected
-            if changes:
-                risk_delta = self._calculate_risk_delta(baseline, current)
-                modified.append(
-                    ModifiedFinding(
-                        fingerprint=fp,
-                        changes=changes,
-                        baseline=baseline,
-                        current=current,
-                        risk_delta=risk_delta,
-                    )
-                )
+            digest = baseline_digests.get(fp)
+            if digest is not None and digest == current_digests.get(fp):
+                continue
+            change = self._modification(fp, baseline_index[fp], current_index[fp])
+            if change is not None:
+                modified.append(change)
 
         return modified
 
+    def _modification(
+        self, fp: str, baseline: dict[str, Any], current: dict[str, Any]
+    ) -> ModifiedFinding | None:
+        """Metadata changes between two versions of one finding, if any."""
+        changes = {}
+
+        # 1. Severity change (CRITICAL)
+        baseline_sev = baseline.get("severity", "INFO")
+        current_sev = current.get("severity", "INFO")
+        if baseline_sev != current_sev:
+            changes["severity"] = [baseline_sev, current_sev]
+
+        # 2. Priority score change (HIGH) - threshold 5 points
+        baseline_priority = self._extract_priority(baseline)
+        current_priority = self._extract_priority(current)
+        if abs(baseline_priority - current_priority) > PRIORITY_THRESHOLD:
+            changes["priority"] = [baseline_priority, current_priority]
+
+        # 3. Compliance framework additions (MEDIUM)
+        baseline_compliance = set(
+            self._flatten_compliance(baseline.get("compliance", {}))
+        )
+        current_compliance = set(
+            self._flatten_compliance(current.get("compliance", {}))
+        )
+        new_mappings = current_compliance - baseline_compliance
+        if new_mappings:
+            changes["compliance_added"] = list(new_mappings)
+
+        # 4. CWE changes (LOW)
+        baseline_cwe = baseline.get("risk", {}).get("cwe")
+        current_cwe = current.get("risk", {}).get("cwe")
+        if baseline_cwe != current_cwe and baseline_cwe and current_cwe:
+            changes["cwe"] = [baseline_cwe, current_cwe]
+
+        # 5. Message changes (INFORMATIONAL) - threshold 10 chars
+        baseline_msg = baseline.get("message", "")
+        current_msg = current.get("message", "")
+        if (
+            baseline_msg != current_msg
+            and abs(len(baseline_msg) - len(current_msg)) > 10
+        ):
+            changes["message"] = [baseline_msg[:100], current_msg[:100]]
+
+        # Only include if changes detected
+        if changes:
+            risk_delta = self._calculate_risk_delta(baseline, current)
+            return ModifiedFinding(
+                fingerprint=fp,
+                changes=changes,
+                baseline=baseline,
+                current=current,
+                risk_delta=risk_delta,
+            )
+
+        return None
+
     def _extract_priority(self, finding: dict[str, Any]) -> float:
         """
         Extract priority score from finding.
@@ -563,25 +787,7 @@ class DiffEngine:
         Returns:
             Priority score (0-100 scale)
         """
-        # Try EPSS first (exploit probability)
-        epss = finding.get("risk", {}).get("epss_score")
-        if epss is not None:
-            return float(epss) * 100  # Normalize to 0-100
-
-        # Try CVSS base score
-        cvss = finding.get("cvss", {}).get("baseScore")
-        if cvss is not None:
-            return float(cvss) * 10  # Normalize to 0-100
-
-        # Fallback: severity-based score
-        severity_scores = {
-            "CRITICAL": 90,
-            "HIGH": 70,
-            "MEDIUM": 50,
-            "LOW": 30,
-            "INFO": 10,
-        }
-        return severity_scores.get(finding.get("severity", "INFO"), 0)
+        return _priority_score(finding)
 
     def _flatten_compliance(self, compliance: dict[str, Any]) -> list[str]:
         """
@@ -593,18 +799,7 @@ class DiffEngine:
         Returns:
             List of "framework:id" strings
         """
-        flat = []
-        for framework, mappings in compliance.items():
-            if isinstance(mappings, list):
-                for item in mappings:
-                    if isinstance(item, str):
-                        flat.append(f"{framework}:{item}")
-                    elif isinstance(item, dict):
-                        # Handle complex objects (CWE, NIST, CIS)
-                        id_key = item.get("id", item.get("category", ""))
-                        if id_key:
-                            flat.append(f"{framework}:{id_key}")
-        return flat
+        return _flattened_compliance(compliance)
 
     def _calculate_risk_delta(
         self, baseline: dict[str, Any], current: dict[str, Any]
@@ -666,7 +861,7 @@ class DiffEngine:
         self,
         new: list[dict],
         resolved: list[dict],
-        unchanged: list[dict],
+        unchanged: Sequence[dict],
         modified: list[ModifiedFinding],
     ) -> dict[str, Any]:
         """
@@ -0,0 +1,397 @@
+"""Per-target file inventory: one tree walk, shared by every consumer.
+
+A repository scan used to walk the target many times over. ``_collect_files``
+globbed it once per file-list tool (hadolint, shellcheck), the zap, falco,
+afl++, prowler, mobsf and trivy-rbac blocks each ran their own ``repo.glob``
+passes, ``yara_runner.iter_target_files`` did a full ``os.walk`` of its own, and
+at report time ``extract_code_snippet`` stat()ed every path a finding named. On
+a 500k-file monorepo the walks alone cost minutes - each one re-listing the
+same directories to answer a slightly different question.
+
+``build_inventory`` walks the target exactly once and records, per file:
+
+- ``path``      relative POSIX path (the stable key; the target root is
+                recorded once, in the header, so consumers can map the
+                absolute paths tools report back onto entries)
+- ``size``      bytes, from the same stat() the walk already pays for
+- ``mtime``     modification time
+- ``language``  inferred from name/extension, the mapping snippets already used
+- ``vendored``  under a third-party directory that is walked but not the
+                repository's own code (``third_party``, ``bower_components``...)
+- ``ignored``   git-ignored, per ``git ls-files --ignored`` (False outside git)
+
+Files the walk sees but cannot stat() are not entries - there is no size to
+record - but they are counted in ``unreadable``, so a consumer that reports
+what it skipped (the yara runner) still reports them.
+
+The inventory is written next to the target's tool outputs as
+``file-inventory.jsonl`` so the yara subprocess and the report phase can reuse
+it instead of walking again. The extension is deliberately not ``.json``:
+``gather_results`` treats every ``*.json`` in a target directory as a tool
+output and would go looking for an adapter named ``file-inventory``.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import json
+import logging
+import os
+import re
+import subprocess
+from collections.abc import Iterable, Iterator
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from pathlib import Path, PurePosixPath
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+INVENTORY_FILENAME = "file-inventory.jsonl"
+INVENTORY_VERSION = 1
+
+# Pruned during traversal and never entered. Repositories vendor dependencies;
+# scanning node_modules or a bundled venv buries the repo's own findings in
+# third-party noise, and descending into pnpm symlink farms raised WinError
+# 1920 on Windows (commit ded93df). The same set yara_runner and _collect_files
+# have always skipped. The zap, falco, afl++, prowler, mobsf and trivy-rbac
+# applicability globs used to search these trees too; answered from the
+# inventory, they no longer find files that exist only under them.
+SKIP_DIRS = frozenset({".git", "node_modules", "vendor", ".venv", "venv"})
+
+# Walked and recorded, but flagged. These hold third-party code that is small
+# enough to walk and occasionally worth scanning, so the choice belongs to the
+# consumer rather than to the walk.
+VENDORED_DIRS = frozenset(
+    {"third_party", "third-party", "bower_components", "Pods", "site-packages"}
+)
+VENDORED_SUFFIXES = (".min.js", ".min.css")
+
+# Extension -> language, as used for snippet context. Lives here so the
+# inventory and extract_code_snippet cannot disagree about a file's language.
+LANGUAGE_BY_EXTENSION: dict[str, str] = {
+    ".py": "python",
+    ".js": "javascript",
+    ".ts": "typescript",
+    ".go": "go",
+    ".rs": "rust",
+    ".java": "java",
+    ".c": "c",
+    ".cpp": "cpp",
+    ".rb": "ruby",
+    ".php": "php",
+    ".sh": "bash",
+    ".yaml": "yaml",
+    ".yml": "yaml",
+    ".json": "json",
+    ".xml": "xml",
+    ".html": "html",
+    ".css": "css",
+    ".sql": "sql",
+    ".dockerfile": "dockerfile",
+    ".tf": "terraform",
+}
+
+# `git ls-files` over a huge tree is still far cheaper than the walk itself,
+# but a wedged git (credential helper, fsmonitor) must not stall the scan.
+GIT_IGNORE_TIMEOUT = 60
+
+
+def detect_language(path: str | PurePosixPath | Path) -> str:
+    """Infer a file's language from its name, defaulting to ``"text"``."""
+    p = PurePosixPath(str(path).replace("\\", "/"))
+    if p.name.lower() == "dockerfile":
+        return "dockerfile"
+    return LANGUAGE_BY_EXTENSION.get(p.suffix.lower(), "text")
+
+
+@dataclass(frozen=True, slots=True)
+class InventoryEntry:
+    """One file in a target, as seen by the single inventory walk."""
+
+    path: str
+    size: int
+    mtime: float
+    language: str
+    vendored: bool = False
+    ignored: bool = False
+
+
+@lru_cache(maxsize=256)
+def _compile_glob(pattern: str) -> re.Pattern[str]:
+    """Translate a pathlib-style glob into a regex over relative POSIX paths.
+
+    ``PurePath.match`` cannot stand in: before 3.13 it has no recursive ``**``,
+    so ``**/Dockerfile`` failed to match a Dockerfile at the repository root -
+    the one ``Path.glob`` (which the inventory replaces) always found.
+    """
+    out: list[str] = []
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+            continue
+        if pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+            continue
+        ch = pattern[i]
+        if ch == "*":
+            out.append("[^/]*")
+        elif ch == "?":
+            out.append("[^/]")
+        elif ch == "[":
+            end = pattern.find("]", i + 1)
+            if end == -1:
+                out.append(re.escape(ch))
+            else:
+                # Reuse fnmatch's character-class handling ([!x], ranges).
+                out.append(fnmatch.translate(pattern[i : end + 1])[4:-3])
+                i = end + 1
+                continue
+        else:
+            out.append(re.escape(ch))
+        i += 1
+    return re.compile("".join(out) + r"\Z")
+
+
+class FileInventory:
+    """Every file in a scan target, indexed by relative path.
+
+    Query methods return absolute ``Path`` objects so call sites that used
+    ``repo.glob`` keep receiving exactly what they got before.
+    """
+
+    def __init__(
+        self, root: Path, entries: Iterable[InventoryEntry], unreadable: int = 0
+    ):
+        self.root = Path(root)
+        self._entries: dict[str, InventoryEntry] = {e.path: e for e in entries}
+        # Files seen by the walk whose stat() failed; not entries
+        self.unreadable = unreadable
+        self._resolved_root: str | None = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[InventoryEntry]:
+        return iter(self._entries.values())
+
+    def _relative(self, path: str | Path) -> str | None:
+        """Return `path` relative to the root as POSIX, or None if outside it."""
+        p = Path(path)
+        if not p.is_absolute():
+            return PurePosixPath(str(path).replace("\\", "/")).as_posix()
+        try:
+            return p.relative_to(self.root).as_posix()
+        except ValueError:
+            pass
+        # Tools report resolved paths (/private/var vs /var on macOS); compare
+        # against the resolved root too, resolving it at most once.
+        if self._resolved_root is None:
+            self._resolved_root = str(self.root.resolve())
+        try:
+            return p.relative_to(self._resolved_root).as_posix()
+        except ValueError:
+            return None
+
+    def get(self, path: str | Path) -> InventoryEntry | None:
+        """Look up a file by relative or absolute path."""
+        rel = self._relative(path)
+        if rel is None:
+            return None
+        return self._entries.get(rel)
+
+    def covers(self, path: str | Path) -> bool:
+        """True if the inventory is authoritative for `path`.
+
+        That is: `path` is absolute, under the root, and not inside a pruned
+        directory. For such a path, absence from the inventory means the file
+        does not exist and callers may skip the stat. A relative path is
+        ambiguous - tools report them relative to their own working directory -
+        so it is never claimed.
+        """
+        if not Path(path).is_absolute():
+            return False
+        rel = self._relative(path)
+        return rel is not None and not SKIP_DIRS.intersection(rel.split("/"))
+
+    def files(
+        self,
+        *,
+        include_vendored: bool = True,
+        include_ignored: bool = True,
+        max_bytes: int | None = None,
+    ) -> list[InventoryEntry]:
+        """Return entries in path order, optionally filtered."""
+        return [
+            e
+            for _, e in sorted(self._entries.items())
+            if (include_vendored or not e.vendored)
+            and (include_ignored or not e.ignored)
+            and (max_bytes is None or e.size <= max_bytes)
+        ]
+
+    def glob(self, *patterns: str, include_vendored: bool = True) -> list[Path]:
+        """Absolute paths matching any pattern, sorted - a one-walk ``repo.glob``."""
+        regexes = [_compile_glob(p) for p in patterns]
+        return [
+            self.root / e.path
+            for e in self.files(include_vendored=include_vendored)
+            if any(r.match(e.path) for r in regexes)
+        ]
+
+    def save(self, path: Path) -> None:
+        """Write the inventory as JSON Lines: a header, then one file per line."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        with tmp.open("w", encoding="utf-8") as fh:
+            header = {
+                "version": INVENTORY_VERSION,
+                "root": str(self.root),
+                "unreadable": self.unreadable,
+            }
+            fh.write(json.dumps(header) + "\n")
+            for entry in self.files():
+                fh.write(json.dumps(asdict(entry), separators=(",", ":")) + "\n")
+        # Atomic replace: the yara subprocess and a concurrent report may read
+        # this file, and a half-written inventory would silently drop files.
+        os.replace(tmp, path)
+
+
+def _git_ignored(root: Path) -> tuple[set[str], tuple[str, ...]]:
+    """Return (ignored files, ignored directory prefixes) relative to `root`.
+
+    ``--directory`` collapses a fully-ignored directory (build/, dist/) into one
+    line instead of listing every file in it.
+    """
+    if not (root / ".git").exists():
+        return set(), ()
+    try:
+        proc = subprocess.run(
+            [
+                "git",
+                "-C",
+                str(root),
+                "ls-files",
+                "-z",
+                "--others",
+                "--ignored",
+                "--exclude-standard",
+                "--directory",
+            ],
+            capture_output=True,
+            timeout=GIT_IGNORE_TIMEOUT,
+            check=False,
+        )
+    except (OSError, subprocess.SubprocessError) as e:
+        logger.debug(f"git ignore detection unavailable for {root}: {e}")
+        return set(), ()
+    if proc.returncode != 0:
+        logger.debug(
+            f"git ls-files failed for {root} (rc={proc.returncode}); "
+            "treating no files as ignored"
+        )
+        return set(), ()
+
+    files: set[str] = set()
+    dirs: list[str] = []
+    for raw in proc.stdout.split(b"\0"):
+        if not raw:
+            continue
+        name = raw.decode("utf-8", errors="surrogateescape")
+        if name.endswith("/"):
+            dirs.append(name)
+        else:
+            files.add(name)
+    return files, tuple(dirs)
+
+
+def build_inventory(root: Path, skip_dirs: Iterable[str] = SKIP_DIRS) -> FileInventory:
+    """Walk `root` once and return its inventory.
+
+    Pruning happens *during* traversal via the in-place ``dirnames[:]``
+    mutation, for the reason given on ``SKIP_DIRS``. Files whose stat() fails
+    (broken symlink, race, permission denied) are not entries, since nothing
+    can scan them, but are counted in ``FileInventory.unreadable`` so they are
+    not mistaken for clean.
+    """
+    root = Path(root)
+    if root.is_file():
+        st = root.stat()
+        return FileInventory(
+            root.parent,
+            [InventoryEntry(root.name, st.st_size, st.st_mtime, detect_language(root))],
+        )
+
+    skip = frozenset(skip_dirs)
+    ignored_files, ignored_dirs = _git_ignored(root)
+    entries: list[InventoryEntry] = []
+    unreadable = 0
+    root_str = str(root)
+    for dirpath, dirnames, filenames in os.walk(root_str):
+        dirnames[:] = [d for d in dirnames if d not in skip]
+        rel_dir = os.path.relpath(dirpath, root_str).replace(os.sep, "/")
+        rel_dir = "" if rel_dir == "." else rel_dir + "/"
+        dir_vendored = bool(VENDORED_DIRS.intersection(rel_dir.split("/")))
+        for name in filenames:
+            rel = rel_dir + name
+            try:
+                st = os.stat(os.path.join(dirpath, name))
+            except OSError:
+                unreadable += 1
+                continue
+            entries.append(
+                InventoryEntry(
+                    path=rel,
+                    size=st.st_size,
+                    mtime=st.st_mtime,
+                    language=detect_language(name),
+                    vendored=dir_vendored or name.endswith(VENDORED_SUFFIXES),
+                    ignored=rel in ignored_files or rel.startswith(ignored_dirs),
+                )
+            )
+    return FileInventory(root, entries, unreadable)
+
+
+def load_inventory(path: Path) -> FileInventory | None:
+    """Read an inventory written by ``FileInventory.save``.
+
+    Returns None for a missing, unreadable or foreign-version file: every
+    consumer can fall back to walking, so a bad inventory costs time rather
+    than coverage.
+    """
+    try:
+        with path.open(encoding="utf-8") as fh:
+            header: dict[str, Any] = json.loads(fh.readline())
+            if header.get("version") != INVENTORY_VERSION:
+                return None
+            unreadable = int(header.get("unreadable", 0))
+            entries = [
+                InventoryEntry(**json.loads(line)) for line in fh if line.strip()
+            ]
+    except (OSError, ValueError, TypeError) as e:
+        logger.debug(f"Could not load file inventory {path}: {e}")
+        return None
+    return FileInventory(Path(header["root"]), entries, unreadable)
+
+
+@lru_cache(maxsize=32)
+def _load_cached(path_str: str, mtime_ns: int) -> FileInventory | None:
+    return load_inventory(Path(path_str))
+
+
+def inventory_for_results(target_results_dir: Path) -> FileInventory | None:
+    """Return the inventory saved in a target's results directory, if any.
+
+    Adapters call this with their output file's parent for every finding they
+    enrich, so loads are memoised on (path, mtime): one parse per target per
+    report, invalidated automatically when a re-scan rewrites the file.
+    """
+    path = target_results_dir / INVENTORY_FILENAME
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        return None
+    return _load_cached(str(path), mtime_ns)
@@ -0,0 +1,335 @@
+"""
+Fingerprint-sorted sidecar index for findings.json.
+
+``jmo report`` writes ``summaries/findings.idx`` next to ``findings.json``.
+It lists every finding's fingerprint (``id``) in sorted order together with
+the byte span of that finding inside findings.json. ``DiffEngine`` uses two
+indexes to classify findings by merge-joining the sorted fingerprint lists,
+then reads (and parses) only the findings it needs instead of loading both
+documents whole.
+
+Layout (all integers little-endian)::
+
+    b"JMOFIDX1"                      magic
+    uint32                           header length
+    header                           JSON: {"version", "count",
+                                     "findingsCount", "findingsSize",
+                                     "fingerprintBytes", "digests", "meta"}
+    uint64[count]                    end offset of each fingerprint in blob
+    uint64[count]                    byte offset of each finding
+    uint64[count]                    byte length of each finding
+    [uint64[count]]                  modification digest of each finding
+    fingerprint blob                 UTF-8 fingerprints, concatenated
+
+``meta`` is the findings.json metadata block and ``findingsCount`` the number
+of findings in the document (``count`` is the number of unique fingerprints),
+so diff source information does not require reading findings.json at all. The optional digest column is
+present when the header has ``"digests": true``; it holds each finding's
+``diff_engine.modification_digest`` (0 if unknown) so the diff can skip
+findings whose tracked attributes did not change. An index whose
+``findingsSize`` no longer matches findings.json, or whose spot-checked spans
+do not hold the fingerprints they claim, is treated as absent.
+"""
+
+from __future__ import annotations
+
+import logging
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from typing import Any, overload
+
+from scripts.core import json_codec
+
+logger = logging.getLogger(__name__)
+
+INDEX_MAGIC = b"JMOFIDX1"
+INDEX_VERSION = 1
+INDEX_SUFFIX = ".idx"
+
+_HEADER_LEN = struct.Struct("<I")
+
+
+def index_path_for(findings_path: str | Path) -> Path:
+    """Sidecar path for a findings.json (``findings.idx`` beside it)."""
+    return Path(findings_path).with_suffix(INDEX_SUFFIX)
+
+
+def _u64(values: list[int]) -> bytes:
+    arr = array("Q", values)
+    if sys.byteorder != "little":
+        arr.byteswap()
+    return arr.tobytes()
+
+
+def write_findings_index(
+    index_path: str | Path,
+    spans: list[tuple[str, int, int]],
+    findings_size: int,
+    meta: dict[str, Any] | None = None,
+    digests: dict[str, str | None] | None = None,
+    findings_count: int | None = None,
+) -> None:
+    """Write a sidecar index atomically.
+
+    Args:
+        index_path: Destination (usually ``index_path_for(findings_path)``)
+        spans: (fingerprint, byte offset, byte length) per finding, in any
+            order. For duplicate fingerprints the last span wins, matching
+            how the diff indexes findings by id.
+        findings_size: Size of findings.json in bytes
+        meta: findings.json metadata block
+        digests: Modification digest (hex) by fingerprint
+        findings_count: Number of findings in findings.json, including
+            duplicates and findings without an id (default: ``len(spans)``)
+    """
+    by_fingerprint = {fp: (start, length) for fp, start, length in spans}
+    ordered = sorted(by_fingerprint)
+    encoded = [fp.encode("utf-8") for fp in ordered]
+
+    ends = []
+    total = 0
+    for fp in encoded:
+        total += len(fp)
+        ends.append(total)
+
+    header = json_codec.dumps(
+        {
+            "version": INDEX_VERSION,
+            "count": len(ordered),
+            "findingsCount": len(spans) if findings_count is None else findings_count,
+            "findingsSize": findings_size,
+            "fingerprintBytes": total,
+            "digests": digests is not None,
+            "meta": meta or {},
+        },
+        separators=json_codec.COMPACT_SEPARATORS,
+    ).encode("utf-8")
+
+    path = Path(index_path)
+    staging = path.with_name(path.name + ".tmp")
+    with open(staging, "wb") as fh:
+        fh.write(INDEX_MAGIC)
+        fh.write(_HEADER_LEN.pack(len(header)))
+        fh.write(header)
+        fh.write(_u64(ends))
+        fh.write(_u64([by_fingerprint[fp][0] for fp in ordered]))
+        fh.write(_u64([by_fingerprint[fp][1] for fp in ordered]))
+        if digests is not None:
+            fh.write(_u64([int(digests.get(fp) or "0", 16) for fp in ordered]))
+        fh.write(b"".join(encoded))
+    os.replace(staging, path)
+
+
+class FindingsIndex:
+    """A findings.json opened through its sidecar index.
+
+    ``fingerprints`` is sorted; ``load(i)`` parses the i-th finding from the
+    memory-mapped findings.json. ``findings_count`` is the number of findings
+    in the document, which duplicate fingerprints make larger than ``len()``.
+    """
+
+    def __init__(
+        self,
+        findings_path: Path,
+        data: mmap.mmap | bytes,
+        fingerprints: list[str],
+        starts: array[int],
+        lengths: array[int],
+        meta: dict[str, Any],
+        digests: array[int] | None = None,
+        findings_count: int | None = None,
+    ):
+        self.findings_path = findings_path
+        self._data = data
+        self.fingerprints = fingerprints
+        self._starts = starts
+        self._lengths = lengths
+        self._digests = digests
+        self.meta = meta
+        self.findings_count = (
+            len(fingerprints) if findings_count is None else findings_count
+        )
+
+    @classmethod
+    def open(cls, findings_path: str | Path) -> FindingsIndex | None:
+        """Open findings.json with its sidecar; None if missing or stale."""
+        findings_path = Path(findings_path)
+        index_path = index_path_for(findings_path)
+        try:
+            raw = index_path.read_bytes()
+            findings_size = findings_path.stat().st_size
+        except OSError:
+            return None
+
+        try:
+            index = cls._parse(findings_path, raw, findings_size)
+        except (ValueError, KeyError, TypeError, struct.error, OSError) as e:
+            logger.debug(f"Ignoring findings index {index_path}: {e}")
+            return None
+        return index
+
+    @classmethod
+    def _parse(
+        cls, findings_path: Path, raw: bytes, findings_size: int
+    ) -> FindingsIndex | None:
+        if not raw.startswith(INDEX_MAGIC):
+            raise ValueError("not a findings index")
+        pos = len(INDEX_MAGIC)
+        (header_len,) = _HEADER_LEN.unpack_from(raw, pos)
+        pos += _HEADER_LEN.size
+        header = json_codec.loads(raw[pos : pos + header_len])
+        pos += header_len
+        if header["version"] != INDEX_VERSION:
+            raise ValueError(f"unsupported index version {header['version']}")
+        if header["findingsSize"] != findings_size:
+            raise ValueError("findings.json changed since the index was written")
+
+        count = header["count"]
+        columns = []
+        for _ in range(4 if header.get("digests") else 3):
+            column = array("Q")
+            column.frombytes(raw[pos : pos + 8 * count])
+            if len(column) != count:
+                raise ValueError("truncated index")
+            if sys.byteorder != "little":
+                column.byteswap()
+            columns.append(column)
+            pos += 8 * count
+        ends, starts, lengths = columns[:3]
+        digests = columns[3] if len(columns) == 4 else None
+        blob = raw[pos : pos + header["fingerprintBytes"]]
+        if len(blob) != header["fingerprintBytes"]:
+            raise ValueError("truncated index")
+
+        fingerprints = []
+        previous = 0
+        for end in ends:
+            fingerprints.append(blob[previous:end].decode("utf-8"))
+            previous = end
+
+        if findings_size == 0:
+            data: mmap.mmap | bytes = b""
+        else:
+            with open(findings_path, "rb") as fh:
+                data = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+        index = cls(
+            findings_path,
+            data,
+            fingerprints,
+            starts,
+            lengths,
+            header["meta"],
+            digests,
+            header["findingsCount"],
+        )
+        # Spot-check that the spans still hold the findings they name
+        for i in {0, count // 2, count - 1} if count else ():
+            index.load(i)
+        return index
+
+    def __len__(self) -> int:
+        return len(self.fingerprints)
+
+    @property
+    def has_digests(self) -> bool:
+        return self._digests is not None
+
+    def digest(self, i: int) -> int | None:
+        """Modification digest of the i-th finding (None if not recorded)."""
+        if self._digests is None or not self._digests[i]:
+            return None
+        return self._digests[i]
+
+    def raw(self, i: int) -> bytes:
+        """Serialized bytes of the i-th finding."""
+        start = self._starts[i]
+        return self._data[start : start + self._lengths[i]]
+
+    def load(self, i: int) -> dict[str, Any]:
+        """Parse the i-th finding.
+
+        Raises:
+            ValueError: If the span does not hold that finding (stale index)
+        """
+        finding = json_codec.loads(self.raw(i))
+        if not isinstance(finding, dict) or finding.get("id") != self.fingerprints[i]:
+            raise ValueError(
+                f"Findings index for {self.findings_path} is stale at entry {i}"
+            )
+        return finding
+
+
+def merge_join(
+    left: FindingsIndex, right: FindingsIndex
+) -> tuple[list[int], list[int], list[tuple[int, int]]]:
+    """Match two indexes by fingerprint in one pass over both sorted lists.
+
+    Returns:
+        (positions only in ``left``, positions only in ``right``,
+        (left position, right position) pairs present in both)
+    """
+    a, b = left.fingerprints, right.fingerprints
+    only_left: list[int] = []
+    only_right: list[int] = []
+    both: list[tuple[int, int]] = []
+    i = j = 0
+    while i < len(a) and j < len(b):
+        if a[i] == b[j]:
+            both.append((i, j))
+            i += 1
+            j += 1
+        elif a[i] < b[j]:
+            only_left.append(i)
+            i += 1
+        else:
+            only_right.append(j)
+            j += 1
+    only_left.extend(range(i, len(a)))
+    only_right.extend(range(j, len(b)))
+    return only_left, only_right, both
+
+
+class IndexedFindings(Sequence[dict[str, Any]]):
+    """Read-only sequence of findings parsed from an index on access.
+
+    Used for the unchanged side of a diff, which is usually by far the
+    largest and which most consumers only count or filter.
+    """
+
+    def __init__(self, index: FindingsIndex, positions: list[int]):
+        self._index = index
+        self._positions = positions
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    @overload
+    def __getitem__(self, item: int) -> dict[str, Any]: ...
+
+    @overload
+    def __getitem__(self, item: slice) -> list[dict[str, Any]]: ...
+
+    def __getitem__(self, item: int | slice) -> Any:
+        if isinstance(item, slice):
+            return [self._index.load(p) for p in self._positions[item]]
+        return self._index.load(self._positions[item])
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        for position in self._positions:
+            yield self._index.load(position)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (list, tuple, IndexedFindings)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]  # mutable-style equality, like list
+
+    def __repr__(self) -> str:
+        return f"IndexedFindings({len(self)} findings from {self._index.findings_path})"
@@ -30,6 +30,9 @@ from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+from scripts.core import json_codec
+from scripts.core.diff_engine import modification_digest
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -47,8 +50,10 @@ class QueryTimeoutError(Exception):
     """Raised when a query exceeds the timeout limit."""
 
 
-# Schema version for migrations
-SCHEMA_VERSION = "1.0.0"
+# Schema version for migrations. The CREATE_* statements below build
+# BASE_SCHEMA_VERSION; init_database applies scripts/migrations from there.
+BASE_SCHEMA_VERSION = "1.0.0"
+SCHEMA_VERSION = "1.2.0"
 
 # Default database location
 DEFAULT_DB_PATH = Path(".jmo/history.db")
@@ -305,6 +310,13 @@ def init_database(db_path: Path = DEFAULT_DB_PATH) -> None:
         - All indices for performance
         - All triggers for auto-updating counts
         - All views for common queries
+
+    A new database is created at BASE_SCHEMA_VERSION; it and any older
+    database are then brought to SCHEMA_VERSION by the migrations in
+    scripts/migrations, so every database at a version has the same shape.
+
+    Raises:
+        sqlite3.Error: If the schema cannot be created or migrated
     """
     conn = get_connection(db_path)
 
@@ -328,20 +340,21 @@ def init_database(db_path: Path = DEFAULT_DB_PATH) -> None:
             for view_sql in CREATE_VIEWS:
                 conn.execute(view_sql)
 
-            # Record schema version
+            # Record the base schema version of a new database
             cursor = conn.cursor()
-            cursor.execute(
-                "SELECT COUNT(*) FROM schema_version WHERE version = ?",
-                (SCHEMA_VERSION,),
-            )
+            cursor.execute("SELECT COUNT(*) FROM schema_version")
             if cursor.fetchone()[0] == 0:
                 now = int(time.time())
                 now_iso = datetime.fromtimestamp(now, tz=UTC).isoformat()
                 cursor.execute(
                     "INSERT INTO schema_version (version, applied_at, applied_at_iso) VALUES (?, ?, ?)",
-                    (SCHEMA_VERSION, now, now_iso),
+                    (BASE_SCHEMA_VERSION, now, now_iso),
                 )
+            current_version = cursor.execute(
+                "SELECT version FROM schema_version ORDER BY applied_at DESC, version DESC LIMIT 1"
+            ).fetchone()[0]
 
+        _migrate_to_schema_version(db_path, current_version)
         logger.info(f"Database initialized: {db_path} (schema v{SCHEMA_VERSION})")
 
     except sqlite3.Error as e:
@@ -351,6 +364,26 @@ def init_database(db_path: Path = DEFAULT_DB_PATH) -> None:
         conn.close()
 
 
+def _migrate_to_schema_version(db_path: Path, current_version: str) -> None:
+    """Apply pending migrations up to SCHEMA_VERSION (no-op once there)."""
+    from scripts.core.history_migrations import (
+        _parse_version,
+        get_current_version,
+        run_migrations,
+    )
+
+    target = _parse_version(SCHEMA_VERSION)
+    if _parse_version(current_version) >= target:
+        return
+    result = run_migrations(db_path, SCHEMA_VERSION)
+    # A concurrent init may have migrated the database first
+    if result["errors"] and _parse_version(get_current_version(db_path)) < target:
+        raise sqlite3.OperationalError(
+            f"Migrating {db_path} to schema v{SCHEMA_VERSION} failed: "
+            f"{result['errors']}"
+        )
+
+
 def get_git_context(repo_path: Path) -> dict[str, Any]:
     """
     Extract Git metadata for scan.
@@ -549,7 +582,9 @@ def redact_secrets(finding: dict, store_raw: bool = True) -> dict:
 
     if tool_name not in SECRET_TOOLS:
         # Non-secret tools: store raw data unchanged
-        result["raw_finding"] = json.dumps(raw_data)
+        result["raw_finding"] = json_codec.dumps(
+            raw_data, separators=json_codec.COMPACT_SEPARATORS
+        )
         return result
 
     # Deep copy raw data for modification
@@ -585,7 +620,9 @@ def redact_secrets(finding: dict, store_raw: bool = True) -> dict:
                         if "secret" in key.lower():
                             metadata[key] = "[REDACTED]"
 
-    result["raw_finding"] = json.dumps(redacted_raw)
+    result["raw_finding"] = json_codec.dumps(
+        redacted_raw, separators=json_codec.COMPACT_SEPARATORS
+    )
     return result
 
 
@@ -851,7 +888,7 @@ def store_scan(
 
     # Load findings
     with open(findings_json, encoding="utf-8") as f:
-        findings_data = json.load(f)
+        findings_data = json_codec.load(f)
 
     # Handle both list format (current) and dict format (legacy)
     if isinstance(findings_data, list):
@@ -1094,6 +1131,7 @@ def store_scan(
                         likelihood,
                         impact,
                         raw_finding,
+                        modification_digest(finding),
                     )
                 )
 
@@ -1108,7 +1146,7 @@ def store_scan(
                         title, message, remediation,
                         owasp_top10, cwe_top25, cis_controls, nist_csf, pci_dss, mitre_attack,
                         cvss_score, confidence, likelihood, impact,
-                        raw_finding
+                        raw_finding, mutable_digest
                     ) VALUES (
                         ?, ?,
                         ?, ?, ?, ?,
@@ -1116,7 +1154,7 @@ def store_scan(
                         ?, ?, ?,
                         ?, ?, ?, ?, ?, ?,
                         ?, ?, ?, ?,
-                        ?
+                        ?, ?
                     )
                     """,
                     finding_rows,
@@ -1639,7 +1677,9 @@ def batch_insert_findings(
             location.get("startLine", 0) if isinstance(location, dict) else 0,
             location.get("endLine", 0) if isinstance(location, dict) else 0,
             f.get("message", ""),
-            json.dumps(f.get("raw", {})),
+            json_codec.dumps(
+                f.get("raw", {}), separators=json_codec.COMPACT_SEPARATORS
+            ),
         )
         rows.append(row)
 
@@ -1799,7 +1839,9 @@ def upsert_findings_batch(
             location.get("startLine", 0) if isinstance(location, dict) else 0,
             location.get("endLine", 0) if isinstance(location, dict) else 0,
             f.get("message", ""),
-            json.dumps(f.get("raw", {})),
+            json_codec.dumps(
+                f.get("raw", {}), separators=json_codec.COMPACT_SEPARATORS
+            ),
         )
         rows.append(row)
 
@@ -1892,7 +1934,9 @@ def batch_insert_findings_optimized(
                 location.get("startLine", 0) if isinstance(location, dict) else 0,
                 location.get("endLine", 0) if isinstance(location, dict) else 0,
                 f.get("message", ""),
-                json.dumps(f.get("raw", {})),
+                json_codec.dumps(
+                    f.get("raw", {}), separators=json_codec.COMPACT_SEPARATORS
+                ),
             )
             rows.append(row)
 
@@ -302,9 +302,13 @@ def recover_database(db_path: Path) -> dict[str, Any]:
             )
             logger.info(f"Imported {len(findings)} findings")
 
-        # Import schema_versions (skip if we just created 1.0.0)
-        # Only import versions > 1.0.0 to avoid duplicates
-        schema_versions_to_import = [sv for sv in schema_versions if sv[0] != "1.0.0"]
+        # Import schema_versions, skipping those init_database just recorded
+        recorded = {
+            row[0] for row in conn_new.execute("SELECT version FROM schema_version")
+        }
+        schema_versions_to_import = [
+            sv for sv in schema_versions if sv[0] not in recorded
+        ]
         if schema_versions_to_import:
             conn_new.executemany(
                 "INSERT INTO schema_version (version, applied_at, applied_at_iso) VALUES (?, ?, ?)",
@@ -208,7 +208,16 @@ def run_migrations(db_path: Path, target_version: str | None = None) -> dict[str
         ...     print(f"Migrated to {result['final_version']}")
     """
     conn = get_connection(db_path)
+    try:
+        return _run_migrations(conn, target_version)
+    finally:
+        # Close promptly: a lingering WAL connection breaks later file operations
+        conn.close()
+
 
+def _run_migrations(
+    conn: sqlite3.Connection, target_version: str | None
+) -> dict[str, Any]:
     # Get current version (order by applied_at DESC, then version DESC for tiebreaking)
     try:
         row = conn.execute(
@@ -328,6 +337,8 @@ def get_current_version(db_path: Path) -> str:
         return row[0] if row else "0.0.0"
     except sqlite3.OperationalError:
         return "0.0.0"
+    finally:
+        conn.close()
 
 
 def _parse_version(version: str) -> tuple[int, int, int]:
@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+JSON codec with an optional fast backend.
+
+JSON encode/decode is the largest CPU cost in ``jmo report``. This module
+routes it through orjson or msgspec when one is installed and falls back to
+the stdlib ``json`` module otherwise. The functions mirror ``json.loads`` /
+``json.dumps`` so call sites change only their import.
+
+Output guarantees, whichever backend is active:
+
+- ``loads`` returns exactly what ``json.loads`` would. Anything the fast
+  parser rejects (NaN literals, lone surrogates, invalid JSON) or might
+  misread (integers beyond 64 bits) is parsed by the stdlib, so errors are
+  the stdlib's ``json.JSONDecodeError``.
+- ``dumps`` keeps insertion key order, ``sort_keys``, and ``ensure_ascii``
+  semantics (non-ASCII and DEL escaped as lowercase ``\\uXXXX``, astral
+  characters as surrogate pairs). The fast path only runs for the layouts a
+  fast backend reproduces byte for byte: compact separators
+  (``separators=(",", ":")``) and ``indent=2``. Anything else, and any object
+  the fast backend cannot encode (non-string keys, huge ints), goes through
+  the stdlib.
+- Known differences: floats that Python prints in exponent form
+  (``1e-05``) are written positionally by orjson (``0.00001``); NaN and
+  infinity become ``null``; enum members encode as their value. All parse
+  back to the same data. HTML escaping for inline dashboards stays with the
+  caller and is applied to the returned text, so it is backend-independent.
+
+Select a backend with ``JMO_JSON_BACKEND`` (``auto``, ``orjson``,
+``msgspec``, ``stdlib``); ``auto`` is the default.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+from collections.abc import Callable
+from typing import IO, Any
+
+logger = logging.getLogger(__name__)
+
+JSONDecodeError = json.JSONDecodeError
+
+BACKEND_ENV = "JMO_JSON_BACKEND"
+COMPACT_SEPARATORS = (",", ":")
+
+# stdlib ensure_ascii escapes everything outside printable ASCII (0x20-0x7e)
+# except the control characters a fast encoder already escapes itself.
+_NOT_ASCII = re.compile(r"[^\x00-\x7e]")
+
+# Fast parsers silently turn integers outside the signed/unsigned 64-bit range
+# into floats. The shortest such literal is 19 digits (-9223372036854775809),
+# so a document with a digit run that long is parsed by the stdlib instead (a
+# long run inside a string only costs the fast path, never correctness). The
+# scan maps every digit to "0" and searches for the run, one chunk at a time
+# so a large document is never copied whole; a regex is several times slower
+# than the fast parse it guards.
+_DIGIT_RUN = 19
+_SCAN_CHUNK = 1 << 20
+_DIGITS_TO_ZERO = str.maketrans("123456789", "000000000")
+_DIGITS_TO_ZERO_BYTES = bytes.maketrans(b"123456789", b"000000000")
+
+
+def _may_hold_big_int(data: str | bytes) -> bool:
+    if isinstance(data, str):
+        table: Any = _DIGITS_TO_ZERO
+        needle: Any = "0" * _DIGIT_RUN
+    else:
+        table = _DIGITS_TO_ZERO_BYTES
+        needle = b"0" * _DIGIT_RUN
+    overlap = _DIGIT_RUN - 1
+    for start in range(0, len(data), _SCAN_CHUNK):
+        if needle in data[start : start + _SCAN_CHUNK + overlap].translate(table):
+            return True
+    return False
+
+
+def _escape_char(match: re.Match[str]) -> str:
+    code = ord(match.group())
+    if code < 0x10000:
+        return f"\\u{code:04x}"
+    code -= 0x10000
+    return f"\\u{0xD800 | (code >> 10):04x}\\u{0xDC00 | (code & 0x3FF):04x}"
+
+
+def _ascii_escape(text: str) -> str:
+    return _NOT_ASCII.sub(_escape_char, text)
+
+
+class _StdlibCodec:
+    name = "stdlib"
+
+    def loads(self, data: str | bytes) -> Any:
+        return json.loads(data)
+
+    def dumps(
+        self,
+        obj: Any,
+        indent: int | None,
+        ensure_ascii: bool,
+        sort_keys: bool,
+        separators: tuple[str, str] | None,
+        default: Callable[[Any], Any] | None,
+    ) -> str:
+        return json.dumps(
+            obj,
+            indent=indent,
+            ensure_ascii=ensure_ascii,
+            sort_keys=sort_keys,
+            separators=separators,
+            default=default,
+        )
+
+
+class _OrjsonCodec(_StdlibCodec):
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+        # Let datetimes and dataclasses reach ``default`` (or fail over to
+        # the stdlib) exactly as they would with json.dumps.
+        self._base_option = (
+            orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+        )
+
+    def loads(self, data: str | bytes) -> Any:
+        if _may_hold_big_int(data):
+            return json.loads(data)
+        try:
+            return self._orjson.loads(data)
+        except self._orjson.JSONDecodeError:
+            return json.loads(data)
+
+    def dumps(self, obj, indent, ensure_ascii, sort_keys, separators, default):
+        if not _fast_layout(indent, separators):
+            return super().dumps(
+                obj, indent, ensure_ascii, sort_keys, separators, default
+            )
+        option = self._base_option
+        if indent == 2:
+            option |= self._orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= self._orjson.OPT_SORT_KEYS
+        try:
+            text = self._orjson.dumps(obj, default=default, option=option).decode(
+                "utf-8"
+            )
+        except TypeError:  # orjson.JSONEncodeError subclasses TypeError
+            return super().dumps(
+                obj, indent, ensure_ascii, sort_keys, separators, default
+            )
+        return _ascii_escape(text) if ensure_ascii else text
+
+
+class _MsgspecCodec(_StdlibCodec):
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self._msgspec = msgspec
+        self._decoder = msgspec.json.Decoder()
+
+    def loads(self, data: str | bytes) -> Any:
+        if _may_hold_big_int(data):
+            return json.loads(data)
+        try:
+            return self._decoder.decode(data)
+        except self._msgspec.DecodeError:
+            return json.loads(data)
+
+    def dumps(self, obj, indent, ensure_ascii, sort_keys, separators, default):
+        # msgspec only writes compact output and has no passthrough switches,
+        # so anything needing ``default`` or sorting stays on the stdlib.
+        if (
+            indent is not None
+            or separators != COMPACT_SEPARATORS
+            or sort_keys
+            or default is not None
+        ):
+            return super().dumps(
+                obj, indent, ensure_ascii, sort_keys, separators, default
+            )
+        try:
+            text = self._msgspec.json.encode(obj).decode("utf-8")
+        except (TypeError, self._msgspec.EncodeError):
+            return super().dumps(
+                obj, indent, ensure_ascii, sort_keys, separators, default
+            )
+        return _ascii_escape(text) if ensure_ascii else text
+
+
+def _fast_layout(indent: int | None, separators: tuple[str, str] | None) -> bool:
+    if indent is None:
+        return separators == COMPACT_SEPARATORS
+    return indent == 2 and separators in (None, (",", ": "))
+
+
+_CODECS: dict[str, type[_StdlibCodec]] = {
+    "orjson": _OrjsonCodec,
+    "msgspec": _MsgspecCodec,
+    "stdlib": _StdlibCodec,
+}
+
+
+def available_backends() -> list[str]:
+    """Backends importable in this environment, fastest first."""
+    names = []
+    for name, cls in _CODECS.items():
+        try:
+            cls()
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def _select(requested: str) -> _StdlibCodec:
+    order = list(_CODECS) if requested == "auto" else [requested, "stdlib"]
+    for name in order:
+        cls = _CODECS.get(name)
+        if cls is None:
+            logger.warning(f"Unknown {BACKEND_ENV}={requested!r}; using stdlib json")
+            continue
+        try:
+            return cls()
+        except ImportError:
+            if requested != "auto":
+                logger.warning(f"JSON backend {name!r} not installed; using stdlib")
+    return _StdlibCodec()
+
+
+_codec = _select(os.getenv(BACKEND_ENV, "auto").strip().lower() or "auto")
+
+
+def backend() -> str:
+    """Name of the active backend."""
+    return _codec.name
+
+
+def use_backend(name: str) -> str:
+    """Switch the active backend; returns the previous one's name.
+
+    Raises:
+        ImportError: If the backend is not installed
+        ValueError: If the name is unknown
+    """
+    global _codec
+    if name not in _CODECS:
+        raise ValueError(f"Unknown JSON backend: {name}")
+    previous = _codec.name
+    _codec = _CODECS[name]()
+    return previous
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse a JSON document (``json.loads`` semantics)."""
+    return _codec.loads(data)
+
+
+def load(fp: IO[Any]) -> Any:
+    """Parse a JSON document from a file object (``json.load`` semantics)."""
+    return _codec.loads(fp.read())
+
+
+def dumps(
+    obj: Any,
+    *,
+    indent: int | None = None,
+    ensure_ascii: bool = True,
+    sort_keys: bool = False,
+    separators: tuple[str, str] | None = None,
+    default: Callable[[Any], Any] | None = None,
+) -> str:
+    """Serialise ``obj`` (``json.dumps`` semantics; see module docstring)."""
+    return _codec.dumps(obj, indent, ensure_ascii, sort_keys, separators, default)
+
+
+def dump(obj: Any, fp: IO[str], **kwargs: Any) -> None:
+    """Serialise ``obj`` into a text file object."""
+    fp.write(dumps(obj, **kwargs))
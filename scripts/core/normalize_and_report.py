@@ -25,6 +25,7 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any
 
+from scripts.core import json_codec
 from scripts.core.compliance_mapper import enrich_findings_with_compliance
 from scripts.core.exceptions import AdapterParseException
 
@@ -34,6 +35,13 @@ from scripts.core.plugin_loader import get_plugin_loader, get_plugin_registry
 # Priority calculation (v0.9.0 Feature #5: EPSS/KEV)
 from scripts.core.priority_calculator import PriorityCalculator
 from scripts.core.reporters.basic_reporter import write_json, write_markdown
+from scripts.core.sbom_index import (
+    PACKAGE_SCANNERS,
+    InMemorySbomIndex,
+    PackageLookup,
+    SbomIndexSet,
+    match_package,
+)
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -44,6 +52,16 @@ PROFILE_TIMINGS: dict[str, Any] = {
     "meta": {},  # miscellaneous metadata like max_workers
 }
 
+# Result subdirectories for every target type: repos, images, IaC, web, gitlab, k8s
+TARGET_DIR_NAMES = [
+    "individual-repos",
+    "individual-images",
+    "individual-iac",
+    "individual-web",
+    "individual-gitlab",
+    "individual-k8s",
+]
+
 
 def deduplicate_findings_memory_efficient(
     findings: list[dict[str, Any]],
@@ -123,14 +141,8 @@ def deduplicate_findings_streaming(
     return list(_gen())
 
 
-def gather_results(results_dir: Path) -> list[dict[str, Any]]:
-    findings: list[dict[str, Any]] = []
-
-    # Get lazy-loading registry and loader for tool name normalization
-    registry = get_plugin_registry()
-    loader = get_plugin_loader()
-
-    jobs = []
+def _gather_workers() -> int:
+    """Parser threads: JMO_THREADS, else min(8, cpu_count) (at least 2)."""
     max_workers = 8
     try:
         # Allow override via env, else default to min(8, cpu_count or 4)
@@ -148,6 +160,58 @@ def gather_results(results_dir: Path) -> list[dict[str, Any]]:
         # Environment or CPU inspection failed (cpu_count() can raise RuntimeError)
         logger.debug(f"Failed to determine CPU count, using default workers: {e}")
         max_workers = 8
+    return max_workers
+
+
+def discover_tool_outputs(
+    results_dir: Path, warn_unknown: bool = True
+) -> list[tuple[Path, type]]:
+    """Tool output files under ``results_dir`` with the adapter plugin for each.
+
+    Args:
+        results_dir: Scan results directory
+        warn_unknown: Log a warning for outputs no adapter handles
+
+    Returns:
+        (tool output path, adapter plugin class) pairs, in target order
+    """
+    # Get lazy-loading registry and loader for tool name normalization
+    registry = get_plugin_registry()
+    loader = get_plugin_loader()
+
+    outputs = []
+    for target_dir in (results_dir / name for name in TARGET_DIR_NAMES):
+        if not target_dir.exists():
+            continue
+
+        for target in sorted(p for p in target_dir.iterdir() if p.is_dir()):
+            # Discover all tool outputs using plugin registry
+            for tool_output in target.glob("*.json"):
+                tool_name = tool_output.stem  # e.g., "trivy", "semgrep", "afl++"
+
+                # Handle special case: afl++.json → tool name is "aflplusplus"
+                if tool_name == "afl++":
+                    tool_name = "aflplusplus"
+
+                # Normalize tool name to adapter name (e.g., "checkov-cicd" → "checkov")
+                # This handles variant filenames from scan profiles
+                adapter_name = loader._tool_to_adapter_name(tool_name)
+
+                # Get plugin for this tool
+                plugin_class = registry.get(adapter_name)
+                if plugin_class is None:
+                    if warn_unknown:
+                        logger.warning(
+                            f"No adapter plugin found for: {tool_name} ({tool_output})"
+                        )
+                    continue
+                outputs.append((tool_output, plugin_class))
+    return outputs
+
+
+def gather_results(results_dir: Path) -> list[dict[str, Any]]:
+    findings: list[dict[str, Any]] = []
+    max_workers = _gather_workers()
 
     profiling = os.getenv("JMO_PROFILE") == "1"
     if profiling:
@@ -157,48 +221,11 @@ def gather_results(results_dir: Path) -> list[dict[str, Any]]:
             # Profiling metadata update is best-effort; PROFILE_TIMINGS may be modified
             logger.debug(f"Failed to update profiling metadata: {e}")
 
-    # Scan all target type directories: repos, images, IaC, web, gitlab, k8s
-    target_dirs = [
-        results_dir / "individual-repos",
-        results_dir / "individual-images",
-        results_dir / "individual-iac",
-        results_dir / "individual-web",
-        results_dir / "individual-gitlab",
-        results_dir / "individual-k8s",
-    ]
-
     with ThreadPoolExecutor(max_workers=max_workers) as ex:
-        for target_dir in target_dirs:
-            if not target_dir.exists():
-                continue
-
-            for target in sorted(p for p in target_dir.iterdir() if p.is_dir()):
-                # Discover all tool outputs using plugin registry
-                for tool_output in target.glob("*.json"):
-                    tool_name = tool_output.stem  # e.g., "trivy", "semgrep", "afl++"
-
-                    # Handle special case: afl++.json → tool name is "aflplusplus"
-                    if tool_name == "afl++":
-                        tool_name = "aflplusplus"
-
-                    # Normalize tool name to adapter name (e.g., "checkov-cicd" → "checkov")
-                    # This handles variant filenames from scan profiles
-                    adapter_name = loader._tool_to_adapter_name(tool_name)
-
-                    # Get plugin for this tool
-                    plugin_class = registry.get(adapter_name)
-                    if plugin_class is None:
-                        logger.warning(
-                            f"No adapter plugin found for: {tool_name} ({tool_output})"
-                        )
-                        continue
-
-                    # Submit job to load findings using plugin
-                    jobs.append(
-                        ex.submit(
-                            _safe_load_plugin, plugin_class, tool_output, profiling
-                        )
-                    )
+        jobs = [
+            ex.submit(_safe_load_plugin, plugin_class, tool_output, profiling)
+            for tool_output, plugin_class in discover_tool_outputs(results_dir)
+        ]
         for fut in as_completed(jobs):
             try:
                 findings.extend(fut.result())
@@ -213,14 +240,33 @@ def gather_results(results_dir: Path) -> list[dict[str, Any]]:
             ) as e:  # Acceptable: adapter parse error — skip tool, continue aggregation
                 # Unexpected error - log with traceback for debugging
                 logger.error(f"Unexpected error loading findings: {e}", exc_info=True)
+    return finalize_findings(findings, results_dir)
+
+
+def finalize_findings(
+    findings: list[dict[str, Any]], results_dir: Path | None = None
+) -> list[dict[str, Any]]:
+    """Dedupe, enrich and cluster parsed findings (modifies them in place).
+
+    Args:
+        findings: Findings from every tool output, as adapters produced them
+        results_dir: Scan results directory, whose persisted SBOM indexes are
+            used for package enrichment (default: index the Syft findings)
+
+    Returns:
+        Deduplicated, enriched findings with cross-tool duplicates clustered
+    """
     # Dedupe by id (fingerprint) - memory-efficient approach
     # Uses set for fingerprints (tiny strings) instead of dict storing full findings
     # This avoids double memory storage (dict + list copy)
     deduped = deduplicate_findings_memory_efficient(findings)
 
-    # Enrich Trivy findings with Syft SBOM context when available
+    # Enrich package-scanner findings with Syft SBOM context when available
+    sbom: SbomIndexSet | None = None
     try:
-        _enrich_trivy_with_syft(deduped)
+        if results_dir is not None:
+            sbom = SbomIndexSet.open(results_dir)
+        _enrich_trivy_with_syft(deduped, sbom)
     except (KeyError, ValueError, TypeError) as e:
         # Best-effort enrichment - missing SBOM data or malformed findings
         logger.debug(f"Trivy-Syft enrichment skipped: {e}")
@@ -228,6 +274,9 @@ def gather_results(results_dir: Path) -> list[dict[str, Any]]:
         Exception
     ) as e:  # Acceptable: enrichment is best-effort — must not block report generation
         logger.debug(f"Unexpected error during Trivy-Syft enrichment: {e}")
+    finally:
+        if sbom is not None:
+            sbom.close()
 
     # Enrich all findings with compliance framework mappings (v1.2.0)
     try:
@@ -341,6 +390,74 @@ def _safe_load_plugin(
         return []
 
 
+class IncrementalGatherer:
+    """Re-gather findings after tool outputs change, re-parsing only those.
+
+    ``refresh()`` stats every tool output and runs the adapter only for files
+    that are new or whose mtime or size changed; deleted outputs drop out.
+    Each file's parsed findings are kept in compact serialized form, so
+    ``findings()`` hands the enrichment and clustering passes (which modify
+    findings in place) fresh dicts without running any adapter again.
+
+    Args:
+        results_dir: Scan results directory
+    """
+
+    def __init__(self, results_dir: Path):
+        self.results_dir = results_dir
+        self._outputs: dict[Path, tuple[tuple[int, int], bytes]] = {}
+        self._refreshed = False
+
+    def refresh(self) -> list[Path]:
+        """Re-parse new and changed tool outputs.
+
+        Returns:
+            Paths that were added, changed or removed since the last refresh
+        """
+        current: dict[Path, tuple[tuple[int, int], type]] = {}
+        for path, plugin_class in discover_tool_outputs(
+            self.results_dir, warn_unknown=not self._refreshed
+        ):
+            try:
+                st = path.stat()
+            except OSError:
+                continue  # Removed between discovery and stat
+            current[path] = ((st.st_mtime_ns, st.st_size), plugin_class)
+        self._refreshed = True
+
+        removed = [p for p in self._outputs if p not in current]
+        for path in removed:
+            del self._outputs[path]
+        changed = [
+            path
+            for path, (key, _) in current.items()
+            if path not in self._outputs or self._outputs[path][0] != key
+        ]
+
+        if changed:
+            with ThreadPoolExecutor(
+                max_workers=min(_gather_workers(), len(changed))
+            ) as ex:
+                parsed = ex.map(
+                    lambda path: _safe_load_plugin(current[path][1], path), changed
+                )
+                for path, findings in zip(changed, parsed):
+                    self._outputs[path] = (
+                        current[path][0],
+                        json_codec.dumps(
+                            findings, separators=json_codec.COMPACT_SEPARATORS
+                        ).encode("utf-8"),
+                    )
+        return sorted(changed + removed)
+
+    def findings(self) -> list[dict[str, Any]]:
+        """Deduplicated, enriched findings across the current tool outputs."""
+        findings: list[dict[str, Any]] = []
+        for path in sorted(self._outputs):
+            findings.extend(json_codec.loads(self._outputs[path][1]))
+        return finalize_findings(findings, self.results_dir)
+
+
 def _build_syft_indexes(
     findings: list[dict[str, Any]],
 ) -> tuple[dict[str, list[dict[str, str]]], dict[str, list[dict[str, str]]]]:
@@ -351,7 +468,8 @@ def _build_syft_indexes(
 
     Returns:
         Tuple of (by_path, by_name) indexes where:
-        - by_path: Dict mapping file paths to list of package dicts
+        - by_path: Dict mapping file paths (every location of a package) to
+          list of package dicts
         - by_name: Dict mapping lowercase package names to list of package dicts
     """
     by_path: dict[str, list[dict[str, str]]] = {}
@@ -372,15 +490,24 @@ def _build_syft_indexes(
             version = str(raw.get("version") or "").strip()
             loc = f.get("location") or {}
             path = str(loc.get("path") if isinstance(loc, dict) else "" or "")
+            record = {
+                "name": name,
+                "version": version,
+                "path": path,
+                "purl": str(raw.get("purl") or ""),
+                "type": str(raw.get("type") or ""),
+            }
 
-            if path:
-                by_path.setdefault(path, []).append(
-                    {"name": name, "version": version, "path": path}
-                )
+            locations = [path] + [
+                str(entry.get("path"))
+                for entry in raw.get("locations") or []
+                if isinstance(entry, dict) and entry.get("path")
+            ]
+            for location in dict.fromkeys(locations):
+                if location:
+                    by_path.setdefault(location, []).append(dict(record))
             if name:
-                by_name.setdefault(name.lower(), []).append(
-                    {"name": name, "version": version, "path": path}
-                )
+                by_name.setdefault(name.lower(), []).append(dict(record))
 
     return by_path, by_name
 
@@ -390,7 +517,7 @@ def _find_sbom_match(
     by_path: dict[str, list[dict[str, str]]],
     by_name: dict[str, list[dict[str, str]]],
 ) -> dict[str, str] | None:
-    """Find matching SBOM package for a Trivy finding.
+    """Find matching SBOM package for a Trivy (or other package scanner) finding.
 
     Args:
         trivy_finding: Trivy finding dict
@@ -400,33 +527,7 @@ def _find_sbom_match(
     Returns:
         Best matching package dict, or None if no match found
     """
-    loc = trivy_finding.get("location") or {}
-    loc_path = str(loc.get("path") if isinstance(loc, dict) else "" or "")
-    raw = trivy_finding.get("raw") or {}
-    if not isinstance(raw, dict):
-        raw = {}
-    pkg_name = str(raw.get("PkgName") or "").strip()
-    pkg_path = str(raw.get("PkgPath") or "").strip()
-
-    # Collect all candidates
-    candidates = []
-    if loc_path and loc_path in by_path:
-        candidates.extend(by_path.get(loc_path, []))
-    if pkg_path and pkg_path in by_path:
-        candidates.extend(by_path.get(pkg_path, []))
-    if pkg_name and pkg_name.lower() in by_name:
-        candidates.extend(by_name.get(pkg_name.lower(), []))
-
-    if not candidates:
-        return None
-
-    # Prefer exact path match, then first by name
-    if loc_path and loc_path in by_path:
-        return by_path[loc_path][0]
-    elif pkg_path and pkg_path in by_path:
-        return by_path[pkg_path][0]
-    else:
-        return candidates[0]
+    return match_package(trivy_finding, InMemorySbomIndex(by_path, by_name))
 
 
 def _attach_sbom_context(finding: dict[str, Any], match: dict[str, str]) -> None:
@@ -451,27 +552,40 @@ def _attach_sbom_context(finding: dict[str, Any], match: dict[str, str]) -> None
         tags.append(tag_val)
 
 
-def _enrich_trivy_with_syft(findings: list[dict[str, Any]]) -> None:
-    """Best-effort enrichment: attach SBOM package context from Syft to Trivy findings.
+def _enrich_trivy_with_syft(
+    findings: list[dict[str, Any]], sbom: PackageLookup | None = None
+) -> None:
+    """Best-effort enrichment: attach SBOM package context from Syft to package findings.
 
     Strategy:
-    - Build indexes of Syft packages by file path and by lowercase package name.
-    - For each Trivy finding, try to match by location.path and/or raw.PkgName/PkgPath.
-    - When matched, attach context.sbom = {name, version, path} and add a tag 'pkg:name@version'.
-    """
-    # Build indexes from Syft package entries
-    by_path, by_name = _build_syft_indexes(findings)
+    - Look packages up in ``sbom`` (the persisted per-target SBOM indexes) or,
+      without one, in indexes built from the Syft package findings.
+    - For each Trivy, Grype, Dependency-Check or OSV finding, match by purl,
+      then location.path / package path, then package name
+      (see ``sbom_index.match_package``).
+    - When matched, attach context.sbom = {name, version, path, purl, type}
+      (non-empty values) and add a tag 'pkg:name@version'.
 
-    # Enrich Trivy findings
+    Args:
+        findings: All findings from all tools (modified in-place)
+        sbom: Persisted SBOM indexes for the results directory, if available
+    """
+    scanned = []
     for f in findings:
         if not isinstance(f, dict):
             continue
         tool_info = f.get("tool") or {}
         tool = tool_info.get("name") if isinstance(tool_info, dict) else None
-        if tool != "trivy":
-            continue
+        if tool in PACKAGE_SCANNERS:
+            scanned.append(f)
+    if not scanned:
+        return
+
+    if sbom is None:
+        sbom = InMemorySbomIndex(*_build_syft_indexes(findings))
 
-        match = _find_sbom_match(f, by_path, by_name)
+    for f in scanned:
+        match = match_package(f, sbom)
         if match:
             _attach_sbom_context(f, match)
 
@@ -601,7 +715,7 @@ def main() -> int:
     out_dir.mkdir(parents=True, exist_ok=True)
 
     findings = gather_results(results_dir)
-    write_json(findings, out_dir / "findings.json")
+    write_json(findings, out_dir / "findings.json", index_path=out_dir / "findings.idx")
     write_markdown(findings, out_dir / "SUMMARY.md")
 
     print(f"Wrote {len(findings)} findings to {out_dir}")
@@ -8,21 +8,44 @@ Provides:
 - Built-in policy marketplace
 - Policy validation and testing
 - Integration with CommonFinding v1.2.0 schema
+- Batch evaluation of many policies in one OPA call
+
+Batch evaluation (``evaluate_batch``) serializes the input once and answers
+every policy with a single query of the data tree the policies share: one
+``POST`` to the session's warm OPA server, or one ``opa eval`` against a
+bundle built once per policy set and cached under ~/.jmo/cache. Policies can
+declare the finding fields they read with a comment directive::
+
+    # jmo:input-fields: id severity tool.name location.path raw.verified
+
+When every policy in a batch declares its fields, findings are trimmed to
+those fields (plus ``id``) before serialization, so large ``raw`` tool
+payloads never reach OPA.
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import re
 import subprocess
+import urllib.error
+import urllib.request
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, cast
 
+from scripts.core import json_codec
 from scripts.core.exceptions import OPANotFoundException
 from scripts.core.secure_temp import secure_temp_file
 from scripts.core.tool_utils import find_tool
+from scripts.core.warm_tools import (
+    WarmServer,
+    WarmToolPool,
+    active_pool,
+    opa_auth_headers,
+)
 
 # Import packaging for version comparison
 try:
@@ -41,6 +64,64 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+INPUT_FIELDS_DIRECTIVE = re.compile(r"^\s*#\s*jmo:input-fields:(.*)$", re.MULTILINE)
+BUNDLE_CACHE_LIMIT = 16
+
+
+def declared_input_fields(policy_text: str) -> list[str] | None:
+    """Finding fields a policy declares with ``# jmo:input-fields:``.
+
+    Returns:
+        Dotted field paths, or None if the policy has no directive (it may
+        read any field)
+    """
+    matches = INPUT_FIELDS_DIRECTIVE.findall(policy_text)
+    if not matches:
+        return None
+    return [field for line in matches for field in line.split()]
+
+
+def project_findings(
+    findings: list[dict[str, Any]], fields: list[str]
+) -> list[dict[str, Any]]:
+    """Copy of ``findings`` keeping only ``fields`` (dotted paths) and ``id``.
+
+    A path keeps the whole value it ends on; ``raw.verified`` keeps only
+    ``verified`` inside ``raw``. ``id`` is always kept so distinct findings
+    stay distinct when a policy collects them into a set.
+    """
+    trie: dict[str, Any] = {"id": True}
+    for field_path in fields:
+        node = trie
+        *parents, leaf = field_path.split(".")
+        for part in parents:
+            child = node.get(part)
+            if child is True:
+                break
+            node = node.setdefault(part, {})
+        else:
+            node[leaf] = True
+
+    def project(value: Any, node: dict[str, Any]) -> Any:
+        if not isinstance(value, dict):
+            return value
+        kept = {}
+        for key, child in node.items():
+            if key in value:
+                kept[key] = value[key] if child is True else project(value[key], child)
+        return kept
+
+    return [project(finding, trie) for finding in findings]
+
+
+def _tree_value(tree: Any, path: list[str]) -> Any:
+    """Value at ``path`` inside a data tree, or None if any step is missing."""
+    for part in path:
+        if not isinstance(tree, dict) or part not in tree:
+            return None
+        tree = tree[part]
+    return tree
+
 
 @dataclass
 class PolicyResult:
@@ -80,13 +161,16 @@ class PolicyMetadata:
 class PolicyEngine:
     """OPA-based policy evaluation engine."""
 
-    def __init__(self, opa_binary: str = "opa"):
+    def __init__(self, opa_binary: str = "opa", cache_dir: Path | None = None):
         """Initialize policy engine.
 
         Args:
             opa_binary: Path to OPA binary (default: "opa" in PATH)
+            cache_dir: Directory for cached policy bundles. Defaults to
+                ~/.jmo/cache
         """
         self.opa_binary = opa_binary
+        self.cache_dir = cache_dir or Path.home() / ".jmo" / "cache"
         self._opa_path: str | None = None  # Resolved path, set by _verify_opa_available
         self._verify_opa_available()
 
@@ -160,14 +244,26 @@ class PolicyEngine:
             "metadata": input_data or {},
         }
 
+        # Extract package name from policy file
+        package_name = self._extract_package_name(policy_path)
+        if not package_name:
+            package_name = "data.jmo.policy"  # Fallback to root namespace
+
+        pool = active_pool()
+        server = pool.server("opa") if pool is not None else None
+        if pool is not None and server is not None:
+            output = self._evaluate_on_server(
+                pool, server, policy_path, package_name, input_doc
+            )
+            if output is not None:
+                return self._parse_opa_output(output, policy_path.stem)
+
         # Write input to secure temporary file (0o600 permissions, auto-cleanup)
         with secure_temp_file(prefix="jmo_policy_", suffix=".json") as input_file:
-            input_file.write_text(json.dumps(input_doc), encoding="utf-8")
-
-            # Extract package name from policy file
-            package_name = self._extract_package_name(policy_path)
-            if not package_name:
-                package_name = "data.jmo.policy"  # Fallback to root namespace
+            input_file.write_text(
+                json_codec.dumps(input_doc, separators=json_codec.COMPACT_SEPARATORS),
+                encoding="utf-8",
+            )
 
             # Evaluate policy using OPA eval
             result = subprocess.run(
@@ -197,12 +293,349 @@ class PolicyEngine:
                 raise RuntimeError(f"Policy evaluation error: {result.stderr}")
 
             # Parse OPA output
-            output = json.loads(result.stdout)
+            output = json_codec.loads(result.stdout)
             policy_result = self._parse_opa_output(output, policy_path.stem)
 
             return policy_result
         # Note: Temp file is automatically cleaned up by secure_temp_file context manager
 
+    def _evaluate_on_server(
+        self,
+        pool: WarmToolPool,
+        server: WarmServer,
+        policy_path: Path,
+        package_name: str,
+        input_doc: dict[str, Any],
+    ) -> dict[str, Any] | None:
+        """Evaluate a policy on the session's warm OPA server.
+
+        The policy is uploaded once per (path, mtime) and stays compiled in the
+        server; each evaluation is then a single ``POST /v1/data/<package>``.
+        The response is reshaped into ``opa eval`` output so both paths share
+        ``_parse_opa_output``.
+
+        Returns None when the server cannot be used for this policy - another
+        loaded policy already owns the package (their rules would merge, which
+        ``opa eval -d <one file>`` never does), the upload is rejected, or the
+        request fails - and the caller falls back to ``opa eval``.
+        """
+        package_path = package_name.removeprefix("data.").replace(".", "/")
+        if not self._load_on_server(pool, server, policy_path, package_name):
+            return None
+
+        try:
+            body = self._opa_request(
+                "POST",
+                f"{server.url}/v1/data/{package_path}",
+                json_codec.dumps(
+                    {"input": input_doc}, separators=json_codec.COMPACT_SEPARATORS
+                ).encode("utf-8"),
+                token=server.token,
+            )
+        except (urllib.error.URLError, OSError, ValueError) as e:
+            logger.debug(f"Warm OPA evaluation of {policy_path} failed: {e}")
+            return None
+
+        # An undefined package yields {} rather than {"result": ...}; map it to
+        # an empty result set, which is what opa eval reports for the same case.
+        if "result" not in body:
+            return {"result": []}
+        return {"result": [{"expressions": [{"value": body["result"]}]}]}
+
+    def _load_on_server(
+        self,
+        pool: WarmToolPool,
+        server: WarmServer,
+        policy_path: Path,
+        package_name: str,
+    ) -> bool:
+        """Upload a policy to the warm server unless it is already loaded.
+
+        Returns False if another file owns the package or the upload fails.
+        """
+        key = (str(policy_path.resolve()), policy_path.stat().st_mtime_ns)
+        package_path = package_name.removeprefix("data.").replace(".", "/")
+
+        with pool.opa_lock:
+            loaded = pool.opa_policies.get(package_name)
+            if loaded is not None and loaded[0] != key[0]:
+                logger.debug(
+                    f"Package {package_name} already loaded from {loaded[0]}; "
+                    f"evaluating {policy_path} with opa eval"
+                )
+                return False
+            if loaded != key:
+                try:
+                    self._opa_request(
+                        "PUT",
+                        f"{server.url}/v1/policies/{package_path}",
+                        policy_path.read_bytes(),
+                        content_type="text/plain",
+                        token=server.token,
+                    )
+                except (urllib.error.URLError, OSError, ValueError) as e:
+                    logger.debug(f"Warm OPA rejected {policy_path}: {e}")
+                    return False
+                pool.opa_policies[package_name] = key
+        return True
+
+    def evaluate_batch(
+        self,
+        findings: list[dict[str, Any]],
+        policy_paths: list[Path],
+        input_data: dict[str, Any] | None = None,
+    ) -> tuple[dict[str, PolicyResult], dict[str, Exception]]:
+        """Evaluate findings against several policies with one OPA call.
+
+        Policies are keyed by file stem, as ``evaluate_policies`` names them.
+        A policy whose package another policy in the batch already uses, or
+        every policy when the batched call fails (e.g. one policy does not
+        compile), is evaluated on its own with ``evaluate`` so one bad policy
+        never takes the others down with it.
+
+        Args:
+            findings: List of CommonFinding dictionaries
+            policy_paths: Paths to .rego policy files
+            input_data: Additional input data for policies (optional)
+
+        Returns:
+            (results by policy name, errors by policy name)
+        """
+        results: dict[str, PolicyResult] = {}
+        errors: dict[str, Exception] = {}
+        batch: dict[str, tuple[Path, str, str]] = {}
+        singles: list[Path] = []
+        packages: set[str] = set()
+
+        for policy_path in policy_paths:
+            try:
+                text = policy_path.read_text(encoding="utf-8")
+            except OSError as e:
+                errors[policy_path.stem] = FileNotFoundError(
+                    f"Policy not found: {policy_path} ({e})"
+                )
+                continue
+            package_name = self._extract_package_name(policy_path)
+            if not package_name or package_name in packages:
+                singles.append(policy_path)
+                continue
+            packages.add(package_name)
+            batch[policy_path.stem] = (policy_path, package_name, text)
+
+        if len(batch) > 1:
+            try:
+                outputs = self._evaluate_batch_outputs(findings, batch, input_data)
+            except (OSError, subprocess.TimeoutExpired) as e:
+                logger.debug(f"Batched policy evaluation failed: {e}")
+                outputs = None
+            if outputs is None:
+                singles.extend(path for path, _, _ in batch.values())
+            else:
+                for name, output in outputs.items():
+                    try:
+                        results[name] = self._parse_opa_output(output, name)
+                    except ValueError as e:
+                        errors[name] = e
+        else:
+            singles.extend(path for path, _, _ in batch.values())
+
+        for policy_path in singles:
+            try:
+                results[policy_path.stem] = self.evaluate(
+                    findings, policy_path, input_data
+                )
+            except (
+                Exception
+            ) as e:  # Acceptable: individual policy failure — report it, keep the rest
+                errors[policy_path.stem] = e
+
+        return results, errors
+
+    def _evaluate_batch_outputs(
+        self,
+        findings: list[dict[str, Any]],
+        batch: dict[str, tuple[Path, str, str]],
+        input_data: dict[str, Any] | None,
+    ) -> dict[str, dict[str, Any]] | None:
+        """Run one OPA query covering every policy in ``batch``.
+
+        Returns ``opa eval``-shaped output per policy name, or None if the
+        batched call failed and the policies must be evaluated one by one.
+        """
+        declared = [declared_input_fields(text) for _, _, text in batch.values()]
+        if all(fields is not None for fields in declared):
+            fields = sorted({f for group in declared for f in group})  # type: ignore[union-attr]
+            findings = project_findings(findings, fields)
+        input_doc = {"findings": findings, "metadata": input_data or {}}
+
+        # Query the deepest package prefix the policies share
+        paths = [package.split(".")[1:] for _, package, _ in batch.values()]
+        prefix: list[str] = []
+        for parts in zip(*paths, strict=False):
+            if len(set(parts)) != 1:
+                break
+            prefix.append(parts[0])
+        prefix = prefix[: min(len(p) for p in paths) - 1] if paths else prefix
+
+        tree = self._batch_tree_on_server(batch, prefix, input_doc)
+        if tree is None:
+            tree = self._batch_tree_with_eval(batch, prefix, input_doc)
+        if tree is None:
+            return None
+
+        outputs = {}
+        for name, (_, package_name, _) in batch.items():
+            value = _tree_value(tree, package_name.split(".")[1 + len(prefix) :])
+            outputs[name] = (
+                {"result": [{"expressions": [{"value": value}]}]}
+                if value is not None
+                else {"result": []}
+            )
+        return outputs
+
+    def _batch_tree_on_server(
+        self,
+        batch: dict[str, tuple[Path, str, str]],
+        prefix: list[str],
+        input_doc: dict[str, Any],
+    ) -> Any:
+        """Data tree under ``prefix`` from the warm server (None if unavailable)."""
+        pool = active_pool()
+        server = pool.server("opa") if pool is not None else None
+        if pool is None or server is None:
+            return None
+        for policy_path, package_name, _ in batch.values():
+            if not self._load_on_server(pool, server, policy_path, package_name):
+                return None
+        try:
+            body = self._opa_request(
+                "POST",
+                f"{server.url}/v1/data/{'/'.join(prefix)}".rstrip("/"),
+                json_codec.dumps(
+                    {"input": input_doc}, separators=json_codec.COMPACT_SEPARATORS
+                ).encode("utf-8"),
+                token=server.token,
+            )
+        except (urllib.error.URLError, OSError, ValueError) as e:
+            logger.debug(f"Warm OPA batch evaluation failed: {e}")
+            return None
+        return body.get("result", {})
+
+    def _batch_tree_with_eval(
+        self,
+        batch: dict[str, tuple[Path, str, str]],
+        prefix: list[str],
+        input_doc: dict[str, Any],
+    ) -> Any:
+        """Data tree under ``prefix`` from one ``opa eval`` (None on failure)."""
+        bundle = self._policy_bundle([path for path, _, _ in batch.values()])
+        if bundle is None:
+            return None
+
+        with secure_temp_file(prefix="jmo_policy_", suffix=".json") as input_file:
+            input_file.write_text(
+                json_codec.dumps(input_doc, separators=json_codec.COMPACT_SEPARATORS),
+                encoding="utf-8",
+            )
+            result = subprocess.run(
+                [
+                    self._opa_path,  # type: ignore[list-item]
+                    "eval",
+                    "-b",
+                    str(bundle),
+                    "-i",
+                    str(input_file),
+                    "--format",
+                    "json",
+                    ".".join(["data", *prefix]),
+                ],
+                capture_output=True,
+                # Same UTF-8 handling as evaluate(): matched finding values
+                # come back in the output and decide PASS/FAIL.
+                encoding="utf-8",
+                errors="replace",
+                timeout=60,
+            )
+
+        if result.returncode != 0:
+            logger.debug(f"Batched opa eval failed: {result.stderr}")
+            return None
+        try:
+            output = json_codec.loads(result.stdout)
+            return output["result"][0]["expressions"][0]["value"]
+        except (ValueError, KeyError, IndexError, TypeError):
+            # Undefined query or unexpected output: evaluate one by one
+            return None
+
+    def _policy_bundle(self, policy_paths: list[Path]) -> Path | None:
+        """Build (or reuse) a bundle of ``policy_paths`` with ``opa build``.
+
+        Bundles are cached under ``cache_dir/policy-bundles`` by a digest of
+        the OPA binary and each policy's path and contents, so an unchanged
+        policy set is built - and compile-checked - once rather than on every
+        run. Returns None if the build fails.
+        """
+        digest = hashlib.sha256(str(self._opa_path).encode("utf-8"))
+        for policy_path in sorted(policy_paths):
+            digest.update(str(policy_path.resolve()).encode("utf-8") + b"\0")
+            digest.update(policy_path.read_bytes() + b"\0")
+        bundle_dir = self.cache_dir / "policy-bundles"
+        bundle = bundle_dir / f"{digest.hexdigest()[:32]}.tar.gz"
+        if bundle.exists():
+            return bundle
+
+        bundle_dir.mkdir(parents=True, exist_ok=True)
+        staging = bundle.with_suffix(".tmp")
+        result = subprocess.run(
+            [
+                self._opa_path,  # type: ignore[list-item]
+                "build",
+                "-o",
+                str(staging),
+                *(str(path) for path in policy_paths),
+            ],
+            capture_output=True,
+            encoding="utf-8",
+            errors="replace",
+            timeout=60,
+        )
+        if result.returncode != 0 or not staging.exists():
+            logger.debug(f"opa build failed: {result.stderr}")
+            staging.unlink(missing_ok=True)
+            return None
+        staging.replace(bundle)
+
+        # Keep the cache small: drop the least recently built bundles
+        bundles = sorted(
+            bundle_dir.glob("*.tar.gz"), key=lambda p: p.stat().st_mtime, reverse=True
+        )
+        for stale in bundles[BUNDLE_CACHE_LIMIT:]:
+            stale.unlink(missing_ok=True)
+        return bundle
+
+    @staticmethod
+    def _opa_request(
+        method: str,
+        url: str,
+        data: bytes,
+        content_type: str = "application/json",
+        token: str | None = None,
+    ) -> dict[str, Any]:
+        """Send one request to the OPA REST API and decode its JSON reply.
+
+        ``token`` is the warm server's bearer token; it rejects requests
+        without it.
+        """
+        request = urllib.request.Request(
+            url,
+            data=data,
+            method=method,
+            headers={"Content-Type": content_type, **opa_auth_headers(token)},
+        )
+        # nosec B310 - loopback URL of a server started by WarmToolPool
+        with urllib.request.urlopen(request, timeout=30) as resp:  # nosec B310
+            return cast(dict[str, Any], json_codec.loads(resp.read()))
+
     def _parse_opa_output(
         self, output: dict[str, Any], policy_name: str
     ) -> PolicyResult:
@@ -380,7 +813,7 @@ class PolicyEngine:
             )
 
             if result.returncode == 0:
-                output = json.loads(result.stdout)
+                output = json_codec.loads(result.stdout)
                 # OPA eval returns: {"result": [{"expressions": [{"value": {...}}]}]}
                 if output.get("result") and len(output["result"]) > 0:
                     expressions = output["result"][0].get("expressions", [])
@@ -3,12 +3,23 @@
 
 from __future__ import annotations
 
-import json
 import platform
 from collections import Counter, defaultdict
+from collections.abc import Mapping
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+from scripts.core.diff_engine import modification_digest
+from scripts.core.findings_index import write_findings_index
+from scripts.core.reporters.json_stream import (
+    CountingWriter,
+    JSONStreamWriter,
+    open_json_output,
+)
+
+if TYPE_CHECKING:
+    from scripts.core.reporters.report_engine import ReportAggregates
 
 SEV_ORDER = ["CRITICAL", "HIGH", "MEDIUM", "LOW", "INFO"]
 SEV_EMOJI = {
@@ -78,28 +89,63 @@ def write_json(
     findings: list[dict[str, Any]],
     out_path: str | Path,
     metadata: dict[str, Any] | None = None,
+    compact: bool = False,
+    gzip_copy: bool = False,
+    index_path: str | Path | None = None,
 ) -> None:
     """Write findings to JSON file with metadata wrapper.
 
+    Findings are streamed to disk one at a time, so memory stays flat no
+    matter how large the document is.
+
     Args:
         findings: List of CommonFinding dictionaries
         out_path: Output file path
         metadata: Optional metadata dict (will be auto-generated if not provided)
+        compact: Omit indentation and whitespace (smaller and faster to write)
+        gzip_copy: Also write a gzip-compressed copy to ``<out_path>.gz``
+        index_path: Also write a fingerprint-sorted sidecar index (see
+            ``scripts.core.findings_index``) for fast directory diffs
 
     """
-    p = Path(out_path)
-    p.parent.mkdir(parents=True, exist_ok=True)
-
     # Generate default metadata if not provided
     if metadata is None:
         metadata = _generate_metadata(findings)
 
-    # Wrap findings in metadata structure (v1.0.0 format)
-    output = {"meta": metadata, "findings": findings}
+    spans: list[tuple[str, int, int]] = []
+    digests: dict[str, str | None] = {}
 
-    p.write_text(
-        json.dumps(output, indent=2, ensure_ascii=False) + "\n", encoding="utf-8"
-    )
+    # Wrap findings in metadata structure (v1.0.0 format)
+    with open_json_output(out_path, gzip_copy=gzip_copy) as fh:
+        out = CountingWriter(fh) if index_path is not None else fh
+        writer = JSONStreamWriter(
+            out, indent=None if compact else 2, ensure_ascii=False
+        )
+        writer.begin_object()
+        writer.field("meta", metadata)
+        writer.key("findings")
+        if index_path is None:
+            writer.array(findings)
+        else:
+            writer.begin_array()
+            for finding in findings:
+                writer.value(finding)
+                if isinstance(finding.get("id"), str):
+                    spans.append((finding["id"], *out.last_span))  # type: ignore[union-attr]
+                    digests[finding["id"]] = modification_digest(finding)
+            writer.end_array()
+        writer.end_object()
+        fh.write("\n")
+
+    if index_path is not None:
+        write_findings_index(
+            index_path,
+            spans,
+            Path(out_path).stat().st_size,
+            meta=metadata,
+            digests=digests,
+            findings_count=len(findings),
+        )
 
 
 def _get_severity_emoji(severity: str) -> str:
@@ -277,10 +323,35 @@ def _get_category_summary(findings: list[dict[str, Any]]) -> dict[str, int]:
     return dict(sorted(categories.items(), key=lambda x: x[1], reverse=True))
 
 
-def to_markdown_summary(findings: list[dict[str, Any]]) -> str:
-    """Generate enhanced markdown summary with actionable insights."""
+def _count_tool_severity(
+    findings: list[dict[str, Any]],
+) -> dict[str, dict[str, int]]:
+    """Count findings per tool and severity, once per tool for consensus findings."""
+    tool_severity: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+    for f in findings:
+        severity = f.get("severity", "INFO")
+        if "detected_by" in f:
+            for tool_info in f.get("detected_by", []):
+                tool_severity[tool_info.get("name", "unknown")][severity] += 1
+        else:
+            tool_severity[f.get("tool", {}).get("name", "unknown")][severity] += 1
+    return tool_severity
+
+
+def to_markdown_summary(
+    findings: list[dict[str, Any]], aggregates: ReportAggregates | None = None
+) -> str:
+    """Generate enhanced markdown summary with actionable insights.
+
+    ``aggregates`` (from ``report_engine.compute_aggregates``) supplies the
+    severity, per-file, per-tool and per-rule groupings when the caller has
+    already computed them for other formats.
+    """
     total = len(findings)
-    sev_counts = Counter(f.get("severity", "INFO") for f in findings)
+    if aggregates is not None:
+        sev_counts = aggregates.severity_counts
+    else:
+        sev_counts = Counter(f.get("severity", "INFO") for f in findings)
 
     lines = ["# Security Summary", ""]
 
@@ -304,10 +375,14 @@ def to_markdown_summary(findings: list[dict[str, Any]]) -> str:
         lines.append("")
 
         # Group by file
-        file_findings: dict[str, list[dict[str, Any]]] = defaultdict(list)
-        for f in findings:
-            path = f.get("location", {}).get("path", "unknown")
-            file_findings[path].append(f)
+        file_findings: dict[str, list[dict[str, Any]]]
+        if aggregates is not None:
+            file_findings = aggregates.by_file
+        else:
+            file_findings = defaultdict(list)
+            for f in findings:
+                path = f.get("location", {}).get("path", "unknown")
+                file_findings[path].append(f)
 
         # Sort files by: 1) highest severity, 2) count
         def file_sort_key(item):
@@ -512,18 +587,11 @@ def to_markdown_summary(findings: list[dict[str, Any]]) -> str:
         lines.append("## By Tool")
         lines.append("")
 
-        tool_severity: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
-        for f in findings:
-            # For consensus findings, count once per detecting tool
-            if "detected_by" in f:
-                for tool_info in f.get("detected_by", []):
-                    tool_name = tool_info.get("name", "unknown")
-                    severity = f.get("severity", "INFO")
-                    tool_severity[tool_name][severity] += 1
-            else:
-                tool_name = f.get("tool", {}).get("name", "unknown")
-                severity = f.get("severity", "INFO")
-                tool_severity[tool_name][severity] += 1
+        tool_severity: Mapping[str, Mapping[str, int]]
+        if aggregates is not None:
+            tool_severity = aggregates.tool_severity
+        else:
+            tool_severity = _count_tool_severity(findings)
 
         # Sort tools by total findings
         sorted_tools = sorted(
@@ -571,7 +639,12 @@ def to_markdown_summary(findings: list[dict[str, Any]]) -> str:
     # Top Rules (traditional - keep for reference)
     lines.append("## Top Rules")
     lines.append("")
-    top_rules = Counter(f.get("ruleId", "unknown") for f in findings).most_common(10)
+    rule_counts = (
+        aggregates.rule_counts
+        if aggregates is not None
+        else Counter(f.get("ruleId", "unknown") for f in findings)
+    )
+    top_rules = rule_counts.most_common(10)
     for rule, count in top_rules:
         # Simplify long rule IDs
         display_rule = rule.split(".")[-1] if len(rule) > 40 and "." in rule else rule
@@ -584,7 +657,11 @@ def to_markdown_summary(findings: list[dict[str, Any]]) -> str:
     return "\n".join(lines)
 
 
-def write_markdown(findings: list[dict[str, Any]], out_path: str | Path) -> None:
+def write_markdown(
+    findings: list[dict[str, Any]],
+    out_path: str | Path,
+    aggregates: ReportAggregates | None = None,
+) -> None:
     """Write findings to Markdown SUMMARY.md file.
 
     Generates human-readable Markdown summary with severity counts,
@@ -593,6 +670,8 @@ def write_markdown(findings: list[dict[str, Any]], out_path: str | Path) -> None
     Args:
         findings (list[dict[str, Any]]): List of CommonFinding dictionaries
         out_path (str | Path): Path to write SUMMARY.md (e.g., results/summaries/SUMMARY.md)
+        aggregates (ReportAggregates | None): Precomputed groupings shared with
+            other formats (optional)
 
     Returns:
         None (writes file to disk)
@@ -615,4 +694,4 @@ def write_markdown(findings: list[dict[str, Any]], out_path: str | Path) -> None
     """
     p = Path(out_path)
     p.parent.mkdir(parents=True, exist_ok=True)
-    p.write_text(to_markdown_summary(findings), encoding="utf-8")
+    p.write_text(to_markdown_summary(findings, aggregates), encoding="utf-8")
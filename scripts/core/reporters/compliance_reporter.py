@@ -55,18 +55,45 @@ from __future__ import annotations
 import json
 from collections import defaultdict
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+if TYPE_CHECKING:
+    from scripts.core.reporters.report_engine import ReportAggregates
 
-def write_pci_dss_report(findings: list[dict[str, Any]], output_path: Path) -> None:
+
+def _mapped(
+    findings: list[dict[str, Any]],
+    framework: str,
+    aggregates: ReportAggregates | None,
+) -> list[dict[str, Any]]:
+    """Findings that may carry ``framework`` mappings.
+
+    With precomputed aggregates this is just the findings that do; without,
+    callers filter the full list themselves.
+    """
+    if aggregates is not None:
+        return aggregates.compliance_findings(framework)
+    return findings
+
+
+def write_pci_dss_report(
+    findings: list[dict[str, Any]],
+    output_path: Path,
+    aggregates: ReportAggregates | None = None,
+) -> None:
     """Generate PCI DSS 4.0 compliance report in Markdown format.
 
     Args:
         findings: List of CommonFindings (v1.2.0 with compliance field)
         output_path: Output file path for the report
+        aggregates: Precomputed compliance rollups (optional)
     """
     # Filter findings with PCI DSS mappings
-    pci_findings = [f for f in findings if f.get("compliance", {}).get("pciDss4_0")]
+    pci_findings = [
+        f
+        for f in _mapped(findings, "pciDss4_0", aggregates)
+        if f.get("compliance", {}).get("pciDss4_0")
+    ]
 
     # Group by requirement
     by_requirement = defaultdict(list)
@@ -229,17 +256,22 @@ def write_pci_dss_report(findings: list[dict[str, Any]], output_path: Path) -> N
 
 
 def write_attack_navigator_json(
-    findings: list[dict[str, Any]], output_path: Path
+    findings: list[dict[str, Any]],
+    output_path: Path,
+    aggregates: ReportAggregates | None = None,
 ) -> None:
     """Generate MITRE ATT&CK Navigator JSON for visualization.
 
     Args:
         findings: List of CommonFindings (v1.2.0 with compliance field)
         output_path: Output file path for the JSON
+        aggregates: Precomputed compliance rollups (optional)
     """
     # Filter findings with ATT&CK mappings
     attack_findings = [
-        f for f in findings if f.get("compliance", {}).get("mitreAttack")
+        f
+        for f in _mapped(findings, "mitreAttack", aggregates)
+        if f.get("compliance", {}).get("mitreAttack")
     ]
 
     # Count techniques
@@ -345,27 +377,35 @@ def write_attack_navigator_json(
     output_path.write_text(json.dumps(navigator_layer, indent=2), encoding="utf-8")
 
 
-def write_compliance_summary(findings: list[dict[str, Any]], output_path: Path) -> None:
+def write_compliance_summary(
+    findings: list[dict[str, Any]],
+    output_path: Path,
+    aggregates: ReportAggregates | None = None,
+) -> None:
     """Generate comprehensive compliance summary covering all frameworks.
 
     Args:
         findings: List of CommonFindings (v1.2.0 with compliance field)
         output_path: Output file path for the report
+        aggregates: Precomputed compliance rollups (optional)
     """
     # Count findings with compliance mappings
     total_findings = len(findings)
-    findings_with_compliance = sum(1 for f in findings if f.get("compliance"))
+    if aggregates is not None:
+        findings_with_compliance = aggregates.with_compliance
+    else:
+        findings_with_compliance = sum(1 for f in findings if f.get("compliance"))
 
     # OWASP Top 10 2021 counts
     owasp_counts: dict[str, int] = defaultdict(int)
-    for f in findings:
+    for f in _mapped(findings, "owaspTop10_2021", aggregates):
         owasp_list = f.get("compliance", {}).get("owaspTop10_2021", [])
         for owasp_cat in owasp_list:
             owasp_counts[owasp_cat] += 1
 
     # CWE Top 25 2024 counts
     cwe_top25_counts: dict[str, int] = defaultdict(int)
-    for f in findings:
+    for f in _mapped(findings, "cweTop25_2024", aggregates):
         cwe_list = f.get("compliance", {}).get("cweTop25_2024", [])
         for cwe_entry in cwe_list:
             if isinstance(cwe_entry, dict):
@@ -374,7 +414,7 @@ def write_compliance_summary(findings: list[dict[str, Any]], output_path: Path)
 
     # CIS Controls counts
     cis_controls: set[str] = set()
-    for f in findings:
+    for f in _mapped(findings, "cisControlsV8_1", aggregates):
         cis_list = f.get("compliance", {}).get("cisControlsV8_1", [])
         for cis_entry in cis_list:
             if isinstance(cis_entry, dict):
@@ -383,7 +423,7 @@ def write_compliance_summary(findings: list[dict[str, Any]], output_path: Path)
 
     # NIST CSF 2.0 counts by function
     nist_csf_functions: dict[str, int] = defaultdict(int)
-    for f in findings:
+    for f in _mapped(findings, "nistCsf2_0", aggregates):
         nist_list = f.get("compliance", {}).get("nistCsf2_0", [])
         for nist_entry in nist_list:
             if isinstance(nist_entry, dict):
@@ -392,7 +432,7 @@ def write_compliance_summary(findings: list[dict[str, Any]], output_path: Path)
 
     # PCI DSS 4.0 counts
     pci_dss_requirements = set()
-    for f in findings:
+    for f in _mapped(findings, "pciDss4_0", aggregates):
         pci_list = f.get("compliance", {}).get("pciDss4_0", [])
         for pci_entry in pci_list:
             if isinstance(pci_entry, dict):
@@ -401,7 +441,7 @@ def write_compliance_summary(findings: list[dict[str, Any]], output_path: Path)
 
     # MITRE ATT&CK counts
     mitre_techniques = set()
-    for f in findings:
+    for f in _mapped(findings, "mitreAttack", aggregates):
         mitre_list = f.get("compliance", {}).get("mitreAttack", [])
         for mitre_entry in mitre_list:
             if isinstance(mitre_entry, dict):
@@ -457,7 +497,7 @@ def write_compliance_summary(findings: list[dict[str, Any]], output_path: Path)
         for cwe_id, count in sorted_cwes:
             # Try to get rank from first finding with this CWE
             rank = "N/A"
-            for f in findings:
+            for f in _mapped(findings, "cweTop25_2024", aggregates):
                 cwe_list = f.get("compliance", {}).get("cweTop25_2024", [])
                 for cwe_entry in cwe_list:
                     if isinstance(cwe_entry, dict) and cwe_entry.get("id") == cwe_id:
@@ -515,7 +555,7 @@ def write_compliance_summary(findings: list[dict[str, Any]], output_path: Path)
         # Count techniques across all findings
         tech_counts: dict[str, int] = defaultdict(int)
         tech_names: dict[str, str] = {}
-        for f in findings:
+        for f in _mapped(findings, "mitreAttack", aggregates):
             mitre_list = f.get("compliance", {}).get("mitreAttack", [])
             for mitre_entry in mitre_list:
                 if isinstance(mitre_entry, dict):
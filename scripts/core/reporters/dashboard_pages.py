@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Paged dashboard data for very large React dashboards.
+
+External mode writes every finding into one ``dashboard-data.json`` that the
+browser must download and parse before the first row renders; at a few
+hundred thousand findings that freezes the tab for tens of seconds. Paged
+mode instead writes a ``dashboard-data/`` directory next to ``dashboard.html``:
+
+- ``manifest.json``: total, page list and precomputed facet counts
+  (severity, tool, path, rule) so filters and charts can render before any
+  findings arrive.
+- ``page-00000.json`` ...: fixed-size compact JSON arrays of findings sorted
+  by priority (KEV first, then priority score, then severity), so the first
+  page the dashboard loads holds the findings that matter most. With
+  ``gzip_pages`` each page is written as ``page-NNNNN.json.gz`` instead and
+  the dashboard inflates it with ``DecompressionStream``.
+
+Manifest layout (``format`` / ``version`` identify it to the dashboard)::
+
+    {
+      "format": "jmo-dashboard-pages",
+      "version": 1,
+      "total": 300000,
+      "pageSize": 5000,
+      "compression": "gzip",
+      "sort": "priority",
+      "facets": {"severity": {...}, "tool": {...}, "path": {...}, "rule": {...}},
+      "facetCardinality": {"severity": 5, "tool": 12, "path": 48210, "rule": 913},
+      "pages": [{"file": "page-00000.json.gz", "count": 5000}, ...]
+    }
+
+Path and rule facets keep the ``FACET_LIMIT`` largest entries;
+``facetCardinality`` gives the full number of distinct values.
+"""
+
+from __future__ import annotations
+
+import gzip
+from collections import Counter
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from scripts.core import json_codec
+from scripts.core.common_finding import SEVERITY_ORDER
+
+if TYPE_CHECKING:
+    from scripts.core.reporters.report_engine import ReportAggregates
+
+MANIFEST_FORMAT = "jmo-dashboard-pages"
+MANIFEST_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+PAGES_DIRNAME = "dashboard-data"
+PAGE_SIZE = 5000
+FACET_LIMIT = 1000
+
+_SEVERITY_RANK = {sev: rank for rank, sev in enumerate(SEVERITY_ORDER)}
+
+
+def priority_key(finding: dict[str, Any]) -> tuple[bool, float, int]:
+    """Sort key putting the most urgent findings first.
+
+    KEV findings lead, then higher priority scores, then higher severities;
+    ``sorted`` keeps input order among equals.
+    """
+    priority = finding.get("priority") or {}
+    return (
+        not priority.get("is_kev", False),
+        -(priority.get("priority") or 0),
+        _SEVERITY_RANK.get(finding.get("severity", "INFO"), len(SEVERITY_ORDER)),
+    )
+
+
+def _top(counts: Counter[str]) -> dict[str, int]:
+    return dict(counts.most_common(FACET_LIMIT))
+
+
+def compute_facets(
+    findings: list[dict[str, Any]], aggregates: ReportAggregates | None = None
+) -> tuple[dict[str, dict[str, int]], dict[str, int]]:
+    """Facet counts and distinct-value counts for the manifest.
+
+    The tool facet counts each finding under its reporting tool, matching the
+    dashboard's tool filter. Severity, path and rule counts come from
+    ``aggregates`` when provided.
+    """
+    tools: Counter[str] = Counter(
+        f.get("tool", {}).get("name", "unknown") for f in findings
+    )
+    if aggregates is not None:
+        severities = aggregates.severity_counts
+        paths = Counter(
+            {path: len(group) for path, group in aggregates.by_file.items()}
+        )
+        rules = aggregates.rule_counts
+    else:
+        severities = Counter(f.get("severity", "INFO") for f in findings)
+        paths = Counter(f.get("location", {}).get("path", "unknown") for f in findings)
+        rules = Counter(f.get("ruleId", "unknown") for f in findings)
+
+    facets = {
+        "severity": {
+            sev: severities[sev]
+            for sev in sorted(severities, key=lambda s: _SEVERITY_RANK.get(s, 99))
+        },
+        "tool": dict(tools.most_common()),
+        "path": _top(paths),
+        "rule": _top(rules),
+    }
+    cardinality = {
+        name: len(counts)
+        for name, counts in (
+            ("severity", severities),
+            ("tool", tools),
+            ("path", paths),
+            ("rule", rules),
+        )
+    }
+    return facets, cardinality
+
+
+def write_dashboard_pages(
+    findings: list[dict[str, Any]],
+    out_dir: str | Path,
+    page_size: int = PAGE_SIZE,
+    gzip_pages: bool = False,
+    aggregates: ReportAggregates | None = None,
+) -> dict[str, Any]:
+    """Write the manifest and finding pages into ``out_dir``.
+
+    Page files left over from an earlier, larger report are removed so the
+    directory only ever holds the pages the manifest lists.
+
+    Args:
+        findings: List of CommonFinding dicts
+        out_dir: Directory to write (created if missing)
+        page_size: Findings per page
+        gzip_pages: Write gzip-compressed ``.json.gz`` pages
+        aggregates: Shared report aggregates (optional)
+
+    Returns:
+        The manifest that was written
+
+    Raises:
+        ValueError: If page_size is not positive
+    """
+    if page_size < 1:
+        raise ValueError(f"page_size must be positive, got {page_size}")
+
+    d = Path(out_dir)
+    d.mkdir(parents=True, exist_ok=True)
+    for stale in d.glob("page-*.json*"):
+        stale.unlink()
+
+    ordered = sorted(findings, key=priority_key)
+    suffix = ".json.gz" if gzip_pages else ".json"
+    pages = []
+    for number, start in enumerate(range(0, len(ordered), page_size)):
+        page = ordered[start : start + page_size]
+        name = f"page-{number:05d}{suffix}"
+        data = json_codec.dumps(page, separators=json_codec.COMPACT_SEPARATORS).encode(
+            "utf-8"
+        )
+        # mtime=0 keeps gzip output identical across runs of the same findings
+        (d / name).write_bytes(gzip.compress(data, mtime=0) if gzip_pages else data)
+        pages.append({"file": name, "count": len(page)})
+
+    facets, cardinality = compute_facets(findings, aggregates)
+    manifest = {
+        "format": MANIFEST_FORMAT,
+        "version": MANIFEST_VERSION,
+        "total": len(findings),
+        "pageSize": page_size,
+        "compression": "gzip" if gzip_pages else "none",
+        "sort": "priority",
+        "facets": facets,
+        "facetCardinality": cardinality,
+        "pages": pages,
+    }
+    (d / MANIFEST_NAME).write_text(
+        json_codec.dumps(manifest, indent=2), encoding="utf-8"
+    )
+    return manifest
@@ -2,27 +2,49 @@
 from __future__ import annotations
 
 import html
-import json
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+from scripts.core import json_codec
+from scripts.core.reporters.dashboard_pages import (
+    MANIFEST_NAME,
+    PAGES_DIRNAME,
+    write_dashboard_pages,
+)
+
+if TYPE_CHECKING:
+    from scripts.core.reporters.report_engine import ReportAggregates
 
 # Threshold for inline vs external JSON mode
 # Below this: embed JSON directly in HTML (fast, self-contained)
 # Above this: load JSON via async fetch() (prevents 50-100 MB HTML files)
 INLINE_THRESHOLD = 1000
 
+# Threshold for external vs paged mode
+# Above this: manifest + priority-sorted pages the dashboard loads lazily
+PAGED_THRESHOLD = 20000
 
-def write_html(findings: list[dict[str, Any]], out_path: str | Path) -> None:
+
+def write_html(
+    findings: list[dict[str, Any]],
+    out_path: str | Path,
+    aggregates: ReportAggregates | None = None,
+    gzip_pages: bool = False,
+) -> None:
     """
-    Write interactive React dashboard with dual-mode support.
+    Write interactive React dashboard with inline, external or paged data.
 
     Mode selection:
     - ≤1000 findings: Inline mode (self-contained HTML, fast loading)
-    - >1000 findings: External mode (async JSON loading, prevents browser freeze)
+    - ≤20000 findings: External mode (async JSON loading, prevents browser freeze)
+    - >20000 findings: Paged mode (dashboard-data/ manifest + lazily loaded
+      pages, see dashboard_pages.py)
 
     Args:
         findings: List of CommonFinding dicts
         out_path: Path to write dashboard.html
+        aggregates: Shared report aggregates for the paged manifest (optional)
+        gzip_pages: Gzip-compress pages in paged mode
     """
     p = Path(out_path)
     p.parent.mkdir(parents=True, exist_ok=True)
@@ -86,7 +108,7 @@ def write_html(findings: list[dict[str, Any]], out_path: str | Path) -> None:
         # 3. <!-- could start HTML comment (breaks in some parsers)
         # 4. Backticks break JavaScript template literals (if used in JS)
         data_json = (
-            json.dumps(findings)
+            json_codec.dumps(findings, separators=json_codec.COMPACT_SEPARATORS)
             .replace("</script>", "<\\/script>")  # Prevent script tag breakout
             .replace("<script", "<\\script")  # Prevent script injection
             .replace("<!--", "<\\!--")  # Prevent HTML comment injection
@@ -97,13 +119,30 @@ def write_html(findings: list[dict[str, Any]], out_path: str | Path) -> None:
         doc = template.replace(
             "window.__FINDINGS__ = []", f"window.__FINDINGS__ = {data_json}"
         )
+    elif total > PAGED_THRESHOLD:
+        # Mode 3: Paged - the dashboard reads the manifest's facet counts, then
+        # fetches pages most-urgent first instead of parsing one huge file
+        write_dashboard_pages(
+            findings,
+            p.parent / PAGES_DIRNAME,
+            gzip_pages=gzip_pages,
+            aggregates=aggregates,
+        )
+        manifest_url = f"{PAGES_DIRNAME}/{MANIFEST_NAME}"
+        doc = template.replace(
+            "window.__FINDINGS__ = []",
+            "window.__FINDINGS__ = []  // Loaded page by page in useFindings.ts\n"
+            f"window.__FINDINGS_MANIFEST__ = {json_codec.dumps(manifest_url)}",
+        )
     else:
         # Mode 2: External - Load JSON via fetch() (prevents 50-100 MB HTML files)
         # Write dashboard data separately for async loading
         # Uses dashboard-data.json to avoid overwriting the metadata-wrapped
         # findings.json produced by basic_reporter.write_json()
         findings_json_path = p.parent / "dashboard-data.json"
-        findings_json_path.write_text(json.dumps(findings, indent=2), encoding="utf-8")
+        findings_json_path.write_text(
+            json_codec.dumps(findings, indent=2), encoding="utf-8"
+        )
 
         # Replace placeholder with fetch() call
         doc = template.replace(
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Incremental JSON writer for large report documents.
+
+``json.dumps`` on a 500 MB findings document builds the whole serialised
+string (plus the encoder's intermediate chunks) before a byte reaches disk,
+so peak memory is two to three times the findings themselves.
+``JSONStreamWriter`` writes the object/array framing itself and serialises
+one value at a time (through ``json_codec``) into a buffered file handle.
+With ``indent=2`` the layout is that of ``json.dumps(doc, indent=2)``; with
+``indent=None`` it is compact (no whitespace at all), which is also much
+faster to encode.
+
+``open_json_output`` opens the destination and can tee the same bytes into a
+gzip-compressed ``<name>.gz`` sibling in the same pass.
+"""
+
+from __future__ import annotations
+
+import gzip
+from collections.abc import Iterable, Iterator
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+from typing import Any, Protocol
+
+from scripts.core import json_codec
+
+# Large enough that a typical finding is one write() to the OS
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+class _Writable(Protocol):
+    def write(self, s: str, /) -> Any: ...
+
+
+class _Tee:
+    """Fan one stream of text out to several handles."""
+
+    def __init__(self, handles: list[_Writable]):
+        self._handles = handles
+
+    def write(self, s: str) -> None:
+        for handle in self._handles:
+            handle.write(s)
+
+
+@contextmanager
+def open_json_output(path: str | Path, gzip_copy: bool = False) -> Iterator[_Writable]:
+    """Open ``path`` for streamed JSON, optionally also writing ``path.gz``.
+
+    Parent directories are created. Both files receive identical content.
+    Newlines are written untranslated (``newline=""``) on every platform, so
+    the bytes on disk are exactly the text written - ``CountingWriter``
+    offsets depend on it, and Windows would otherwise turn each ``\n`` of
+    indented output into ``\r\n``.
+    """
+    p = Path(path)
+    p.parent.mkdir(parents=True, exist_ok=True)
+    with ExitStack() as stack:
+        handles: list[_Writable] = [
+            stack.enter_context(
+                open(
+                    p,
+                    "w",
+                    encoding="utf-8",
+                    newline="",
+                    buffering=WRITE_BUFFER_SIZE,
+                )
+            )
+        ]
+        if gzip_copy:
+            handles.append(
+                stack.enter_context(
+                    gzip.open(
+                        p.with_name(p.name + ".gz"),
+                        "wt",
+                        encoding="utf-8",
+                        newline="",
+                    )
+                )
+            )
+        yield handles[0] if len(handles) == 1 else _Tee(handles)
+
+
+class CountingWriter:
+    """Pass writes through to ``fh`` while tracking the UTF-8 byte position.
+
+    ``last_span`` is the (offset, length) in bytes of the most recent write;
+    ``JSONStreamWriter.value`` writes each value's text in one call, so right
+    after it ``last_span`` locates that value in the output file.
+    """
+
+    def __init__(self, fh: _Writable):
+        self._fh = fh
+        self.position = 0
+        self.last_span = (0, 0)
+
+    def write(self, s: str) -> None:
+        self._fh.write(s)
+        size = len(s) if s.isascii() else len(s.encode("utf-8"))
+        self.last_span = (self.position, size)
+        self.position += size
+
+
+class JSONStreamWriter:
+    """Write one JSON document piece by piece.
+
+    Callers open containers, emit keys and values, and close containers in
+    document order::
+
+        w = JSONStreamWriter(fh)
+        w.begin_object()
+        w.key("findings")
+        w.array(findings)      # each element serialised on its own
+        w.end_object()
+
+    Values passed to ``value``/``array`` are serialised whole with
+    ``json_codec.dumps``, so only the framing around them is streamed.
+    """
+
+    def __init__(
+        self, fh: _Writable, indent: int | None = 2, ensure_ascii: bool = True
+    ):
+        self._fh = fh
+        self._indent = indent
+        self._ensure_ascii = ensure_ascii
+        self._item_sep, self._key_sep = (
+            (",", ": ") if indent is not None else (",", ":")
+        )
+        # One entry per open container: number of members written so far
+        self._counts: list[int] = []
+        self._after_key = False
+
+    def _newline(self, depth: int) -> str:
+        if self._indent is None:
+            return ""
+        return "\n" + " " * (self._indent * depth)
+
+    def _dumps(self, value: Any) -> str:
+        text = json_codec.dumps(
+            value,
+            indent=self._indent,
+            ensure_ascii=self._ensure_ascii,
+            separators=None if self._indent is not None else (",", ":"),
+        )
+        if self._indent is not None and self._counts:
+            # Raw newlines only occur between tokens (strings escape theirs),
+            # so re-indenting the nested document is a plain replace.
+            text = text.replace("\n", self._newline(len(self._counts)))
+        return text
+
+    def _begin_member(self) -> None:
+        if self._after_key:
+            self._after_key = False
+            return
+        if self._counts:
+            self._fh.write(
+                (self._item_sep if self._counts[-1] else "")
+                + self._newline(len(self._counts))
+            )
+            self._counts[-1] += 1
+
+    def _end(self, closer: str) -> None:
+        count = self._counts.pop()
+        self._fh.write((self._newline(len(self._counts)) if count else "") + closer)
+
+    def begin_object(self) -> None:
+        self._begin_member()
+        self._fh.write("{")
+        self._counts.append(0)
+
+    def end_object(self) -> None:
+        self._end("}")
+
+    def begin_array(self) -> None:
+        self._begin_member()
+        self._fh.write("[")
+        self._counts.append(0)
+
+    def end_array(self) -> None:
+        self._end("]")
+
+    def key(self, name: str) -> None:
+        self._begin_member()
+        self._fh.write(self._dumps(name) + self._key_sep)
+        self._after_key = True
+
+    def value(self, value: Any) -> None:
+        self._begin_member()
+        # One write() per value: CountingWriter.last_span relies on it
+        self._fh.write(self._dumps(value))
+
+    def field(self, name: str, value: Any) -> None:
+        self.key(name)
+        self.value(value)
+
+    def array(self, items: Iterable[Any]) -> None:
+        """Write a whole array, serialising ``items`` one at a time."""
+        self.begin_array()
+        for item in items:
+            self.value(item)
+        self.end_array()
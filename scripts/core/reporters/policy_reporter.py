@@ -100,7 +100,7 @@ def evaluate_policies(
         Dict mapping policy name to PolicyResult
     """
     engine = PolicyEngine()
-    results = {}
+    results: dict[str, PolicyResult] = {}
 
     # Discover all available policies
     policies = {}
@@ -111,24 +111,31 @@ def evaluate_policies(
         for policy_file in user_dir.glob("*.rego"):
             policies[policy_file.stem] = policy_file  # User policies override builtin
 
-    # Evaluate each requested policy
+    # Evaluate every requested policy in one batched OPA call
+    selected = []
     for policy_name in policy_names:
         if policy_name not in policies:
             logger.warning(
                 f"Policy '{policy_name}' not found. Available: {', '.join(sorted(policies.keys()))}"
             )
             continue
-
-        policy_path = policies[policy_name]
-        try:
-            logger.info(f"Evaluating policy: {policy_name}")
-            result = engine.evaluate(findings, policy_path)
-            results[policy_name] = result
-        except (
-            Exception
-        ) as e:  # Acceptable: individual policy failure — skip and continue with others
-            logger.error(f"Failed to evaluate policy '{policy_name}': {e}")
-            continue
+        if policies[policy_name] not in selected:
+            selected.append(policies[policy_name])
+
+    if not selected:
+        return results
+
+    for policy_path in selected:
+        logger.info(f"Evaluating policy: {policy_path.stem}")
+    evaluated, errors = engine.evaluate_batch(findings, selected)
+    for policy_path in selected:
+        policy_name = policy_path.stem
+        if policy_name in evaluated:
+            results[policy_name] = evaluated[policy_name]
+        elif policy_name in errors:
+            logger.error(
+                f"Failed to evaluate policy '{policy_name}': {errors[policy_name]}"
+            )
 
     return results
 
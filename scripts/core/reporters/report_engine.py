@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Single-pass report engine shared by all output formats.
+
+``jmo report`` used to call each writer in turn, and every writer walked the
+full findings list again to rebuild the same severity counts, per-file and
+per-tool groupings and compliance subsets. On 100k findings that repeated
+work dominated the command.
+
+``compute_aggregates`` walks the findings once and returns a
+``ReportAggregates`` that writers accept through an optional ``aggregates``
+keyword; without it each writer computes what it needs itself, so direct
+callers are unaffected. ``run_report_jobs`` then runs the enabled writers on
+a thread pool. Writers only read the findings and the aggregates, so sharing
+them across threads is safe.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import Counter, defaultdict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Compliance framework keys on CommonFinding.compliance (schema v1.2.0)
+COMPLIANCE_FRAMEWORKS = (
+    "owaspTop10_2021",
+    "cweTop25_2024",
+    "cisControlsV8_1",
+    "nistCsf2_0",
+    "pciDss4_0",
+    "mitreAttack",
+)
+
+DEFAULT_MAX_WORKERS = 4
+
+
+@dataclass
+class ReportAggregates:
+    """Groupings every report format needs, built in one pass over findings.
+
+    Lists hold references to the original finding dicts in input order, so
+    a writer iterating a group sees findings in the same order it would have
+    seen them while filtering the full list.
+    """
+
+    total: int = 0
+    severity_counts: Counter[str] = field(default_factory=Counter)
+    by_severity: dict[str, list[dict[str, Any]]] = field(default_factory=dict)
+    by_file: dict[str, list[dict[str, Any]]] = field(default_factory=dict)
+    rule_counts: Counter[str] = field(default_factory=Counter)
+    # tool -> severity -> count; consensus findings count once per detecting tool
+    tool_severity: dict[str, Counter[str]] = field(default_factory=dict)
+    # framework key -> findings carrying a non-empty mapping for it
+    compliance: dict[str, list[dict[str, Any]]] = field(default_factory=dict)
+    with_compliance: int = 0
+
+    def compliance_findings(self, framework: str) -> list[dict[str, Any]]:
+        return self.compliance.get(framework, [])
+
+
+def compute_aggregates(findings: list[dict[str, Any]]) -> ReportAggregates:
+    """Walk ``findings`` once and collect the shared report aggregates."""
+    severity_counts: Counter[str] = Counter()
+    by_severity: dict[str, list[dict[str, Any]]] = defaultdict(list)
+    by_file: dict[str, list[dict[str, Any]]] = defaultdict(list)
+    rule_counts: Counter[str] = Counter()
+    tool_severity: dict[str, Counter[str]] = defaultdict(Counter)
+    compliance: dict[str, list[dict[str, Any]]] = defaultdict(list)
+    with_compliance = 0
+
+    for f in findings:
+        severity = f.get("severity", "INFO")
+        severity_counts[severity] += 1
+        by_severity[severity].append(f)
+        by_file[f.get("location", {}).get("path", "unknown")].append(f)
+        rule_counts[f.get("ruleId", "unknown")] += 1
+
+        if "detected_by" in f:
+            for tool_info in f.get("detected_by", []):
+                tool_severity[tool_info.get("name", "unknown")][severity] += 1
+        else:
+            tool_severity[f.get("tool", {}).get("name", "unknown")][severity] += 1
+
+        mappings = f.get("compliance")
+        if mappings:
+            with_compliance += 1
+            for framework in COMPLIANCE_FRAMEWORKS:
+                if mappings.get(framework):
+                    compliance[framework].append(f)
+
+    return ReportAggregates(
+        total=len(findings),
+        severity_counts=severity_counts,
+        by_severity=dict(by_severity),
+        by_file=dict(by_file),
+        rule_counts=rule_counts,
+        tool_severity=dict(tool_severity),
+        compliance=dict(compliance),
+        with_compliance=with_compliance,
+    )
+
+
+@dataclass
+class ReportJob:
+    """One output to write.
+
+    Args:
+        name: Output name used in logs and failure reports (e.g. "sarif")
+        write: Zero-argument callable that writes the output
+        tolerate: Exception types that mean "skip this output" rather than
+            "fail the report"; they are returned to the caller instead of raised
+    """
+
+    name: str
+    write: Callable[[], Any]
+    tolerate: tuple[type[BaseException], ...] = ()
+
+
+def run_report_jobs(
+    jobs: list[ReportJob], max_workers: int = DEFAULT_MAX_WORKERS
+) -> list[tuple[ReportJob, BaseException]]:
+    """Run report writers concurrently and wait for all of them.
+
+    Every job runs to completion even if another fails, so one broken format
+    never leaves the others half-written. Tolerated failures are returned as
+    ``(job, exception)`` pairs in job order; the first failure that is not
+    tolerated is re-raised once all jobs have finished.
+
+    Returns:
+        Tolerated failures, in job order
+    """
+    if not jobs:
+        return []
+
+    if max_workers <= 1 or len(jobs) == 1:
+        outcomes: list[BaseException | None] = []
+        for job in jobs:
+            try:
+                job.write()
+                outcomes.append(None)
+            except Exception as e:
+                outcomes.append(e)
+    else:
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(jobs)), thread_name_prefix="jmo-report"
+        ) as pool:
+            futures = [pool.submit(job.write) for job in jobs]
+            outcomes = [future.exception() for future in futures]
+
+    tolerated: list[tuple[ReportJob, BaseException]] = []
+    fatal: BaseException | None = None
+    for job, error in zip(jobs, outcomes, strict=True):
+        if error is None:
+            continue
+        if isinstance(error, job.tolerate):
+            tolerated.append((job, error))
+        elif fatal is None:
+            logger.debug(f"Report writer '{job.name}' failed: {error}")
+            fatal = error
+    if fatal is not None:
+        raise fatal
+    return tolerated
@@ -7,146 +7,134 @@ with code snippets, fix suggestions, and taxonomy mappings where available.
 
 from __future__ import annotations
 
-import json
 import logging
 from pathlib import Path
 from typing import Any
 
+from scripts.core.reporters.json_stream import JSONStreamWriter, open_json_output
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
 SARIF_VERSION = "2.1.0"
+SARIF_SCHEMA = "https://schemastore.azurewebsites.net/schemas/json/sarif-2.1.0.json"
 
 
-def to_sarif(findings: list[dict[str, Any]]) -> dict[str, Any]:
-    """Convert normalized findings to SARIF 2.1.0 format.
+def _sarif_rule(f: dict[str, Any]) -> dict[str, Any]:
+    """Build the SARIF rule descriptor for the first finding of a rule."""
+    rule_id = f.get("ruleId", "rule")
+    return {
+        "id": rule_id,
+        "name": f.get("title") or rule_id,
+        "shortDescription": {"text": f.get("message", "")},
+        "fullDescription": {"text": f.get("description", "")},
+        "help": {
+            "text": f.get("remediation", "See rule documentation"),
+            "markdown": f.get("remediation", "See rule documentation"),
+        },
+        "properties": {
+            "tags": f.get("tags", []),
+            "precision": "high",
+        },
+    }
 
-    Args:
-        findings: List of CommonFinding dictionaries
 
-    Returns:
-        SARIF document as dict
-    """
-    rules: dict[str, dict[str, Any]] = {}
-    results = []
-
-    for idx, f in enumerate(findings):
-        # Skip None or invalid findings (can happen with filtering)
-        if not f or not isinstance(f, dict):
-            logger.warning("Skipping invalid finding at index %d: %s", idx, type(f))
-            continue
-        rule_id = f.get("ruleId", "rule")
+def _sarif_result(f: dict[str, Any]) -> dict[str, Any]:
+    """Build the SARIF result object for one finding."""
+    rule_id = f.get("ruleId", "rule")
 
-        # Enhanced rule metadata
-        rules.setdefault(
-            rule_id,
-            {
-                "id": rule_id,
-                "name": f.get("title") or rule_id,
-                "shortDescription": {"text": f.get("message", "")},
-                "fullDescription": {"text": f.get("description", "")},
-                "help": {
-                    "text": f.get("remediation", "See rule documentation"),
-                    "markdown": f.get("remediation", "See rule documentation"),
-                },
-                "properties": {
-                    "tags": f.get("tags", []),
-                    "precision": "high",
-                },
+    # Build location with optional snippet
+    location_obj = {
+        "physicalLocation": {
+            "artifactLocation": {"uri": f.get("location", {}).get("path", "")},
+            "region": {
+                "startLine": f.get("location", {}).get("startLine", 0),
             },
-        )
-
-        # Build location with optional snippet
-        location_obj = {
-            "physicalLocation": {
-                "artifactLocation": {"uri": f.get("location", {}).get("path", "")},
-                "region": {
-                    "startLine": f.get("location", {}).get("startLine", 0),
-                },
-            }
         }
+    }
 
-        # Add code snippet if available in context
-        context = f.get("context") if f else None
-        if context and isinstance(context, dict) and context.get("snippet"):
-            location_obj["physicalLocation"]["region"]["snippet"] = {
-                "text": context["snippet"]
-            }
-
-        # End line if available
-        if f.get("location", {}).get("endLine"):
-            location_obj["physicalLocation"]["region"]["endLine"] = f["location"][
-                "endLine"
-            ]
-
-        result = {
-            "ruleId": rule_id,
-            "message": {"text": f.get("message", "")},
-            "level": _severity_to_level(f.get("severity")),
-            "locations": [location_obj],
+    # Add code snippet if available in context
+    context = f.get("context") if f else None
+    if context and isinstance(context, dict) and context.get("snippet"):
+        location_obj["physicalLocation"]["region"]["snippet"] = {
+            "text": context["snippet"]
         }
 
-        # Add fix suggestions if available
-        remediation = f.get("remediation")
-        if remediation and isinstance(remediation, str) and len(remediation) > 0:
-            result["fixes"] = [
+    # End line if available
+    if f.get("location", {}).get("endLine"):
+        location_obj["physicalLocation"]["region"]["endLine"] = f["location"]["endLine"]
+
+    result = {
+        "ruleId": rule_id,
+        "message": {"text": f.get("message", "")},
+        "level": _severity_to_level(f.get("severity")),
+        "locations": [location_obj],
+    }
+
+    # Add fix suggestions if available
+    remediation = f.get("remediation")
+    if remediation and isinstance(remediation, str) and len(remediation) > 0:
+        result["fixes"] = [
+            {
+                "description": {"text": remediation},
+            }
+        ]
+
+    # Add CWE/OWASP/CVE taxonomy if present in tags
+    taxa = []
+    for tag in f.get("tags", []):
+        tag_str = str(tag).upper()
+        if tag_str.startswith("CWE-"):
+            taxa.append(
                 {
-                    "description": {"text": remediation},
+                    "id": tag_str,
+                    "toolComponent": {"name": "CWE"},
                 }
-            ]
-
-        # Add CWE/OWASP/CVE taxonomy if present in tags
-        taxa = []
-        for tag in f.get("tags", []):
-            tag_str = str(tag).upper()
-            if tag_str.startswith("CWE-"):
-                taxa.append(
-                    {
-                        "id": tag_str,
-                        "toolComponent": {"name": "CWE"},
-                    }
-                )
-            elif tag_str.startswith("OWASP-"):
-                taxa.append(
-                    {
-                        "id": tag_str,
-                        "toolComponent": {"name": "OWASP"},
-                    }
-                )
-            elif tag_str.startswith("CVE-"):
-                taxa.append(
-                    {
-                        "id": tag_str,
-                        "toolComponent": {"name": "CVE"},
-                    }
-                )
-        if taxa:
-            result["taxa"] = taxa
-
-        # Add CVSS score if present
-        if f.get("cvss"):
-            if "properties" not in result:
-                result["properties"] = {}
-            result["properties"]["cvss"] = f["cvss"]
-
-        # v1.0.0: Add cross-tool consensus information
-        detected_by = f.get("detected_by", [])
-        if detected_by and len(detected_by) > 1:
-            if "properties" not in result:
-                result["properties"] = {}
-            # Add consensus metadata
-            result["properties"]["consensus"] = {
-                "detectedByCount": len(detected_by),
-                "tools": [
-                    {"name": t.get("name", "unknown"), "version": t.get("version", "")}
-                    for t in detected_by
-                ],
-            }
-            # Add correlation IDs for cross-tool tracking
-            result["correlationGuid"] = f.get("id", "")
+            )
+        elif tag_str.startswith("OWASP-"):
+            taxa.append(
+                {
+                    "id": tag_str,
+                    "toolComponent": {"name": "OWASP"},
+                }
+            )
+        elif tag_str.startswith("CVE-"):
+            taxa.append(
+                {
+                    "id": tag_str,
+                    "toolComponent": {"name": "CVE"},
+                }
+            )
+    if taxa:
+        result["taxa"] = taxa
+
+    # Add CVSS score if present
+    if f.get("cvss"):
+        if "properties" not in result:
+            result["properties"] = {}
+        result["properties"]["cvss"] = f["cvss"]
+
+    # v1.0.0: Add cross-tool consensus information
+    detected_by = f.get("detected_by", [])
+    if detected_by and len(detected_by) > 1:
+        if "properties" not in result:
+            result["properties"] = {}
+        # Add consensus metadata
+        result["properties"]["consensus"] = {
+            "detectedByCount": len(detected_by),
+            "tools": [
+                {"name": t.get("name", "unknown"), "version": t.get("version", "")}
+                for t in detected_by
+            ],
+        }
+        # Add correlation IDs for cross-tool tracking
+        result["correlationGuid"] = f.get("id", "")
 
-        results.append(result)
+    return result
 
+
+def _sarif_tool(rules: dict[str, dict[str, Any]]) -> dict[str, Any]:
+    """Build the SARIF tool component, with the jmo version from pyproject.toml."""
     # Read version from pyproject.toml if possible
     version = "1.0.2"  # Default
     try:
@@ -164,7 +152,7 @@ def to_sarif(findings: list[dict[str, Any]]) -> dict[str, Any]:
         # pyproject.toml invalid/missing version field
         logger.debug(f"Failed to parse version from pyproject.toml: {e}")
 
-    tool = {
+    return {
         "driver": {
             "name": "jmo-security",
             "informationUri": "https://github.com/jimmy058910/jmo-security-repo",
@@ -173,10 +161,43 @@ def to_sarif(findings: list[dict[str, Any]]) -> dict[str, Any]:
         }
     }
 
+
+def _collect_rules(findings: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    """Rule descriptors keyed by ruleId; the first finding of each rule wins."""
+    rules: dict[str, dict[str, Any]] = {}
+    for f in findings:
+        rule_id = f.get("ruleId", "rule")
+        if rule_id not in rules:
+            rules[rule_id] = _sarif_rule(f)
+    return rules
+
+
+def to_sarif(findings: list[dict[str, Any]]) -> dict[str, Any]:
+    """Convert normalized findings to SARIF 2.1.0 format.
+
+    Args:
+        findings: List of CommonFinding dictionaries
+
+    Returns:
+        SARIF document as dict
+    """
+    valid = []
+    for idx, f in enumerate(findings):
+        # Skip None or invalid findings (can happen with filtering)
+        if not f or not isinstance(f, dict):
+            logger.warning("Skipping invalid finding at index %d: %s", idx, type(f))
+            continue
+        valid.append(f)
+
     return {
         "version": SARIF_VERSION,
-        "$schema": "https://schemastore.azurewebsites.net/schemas/json/sarif-2.1.0.json",
-        "runs": [{"tool": tool, "results": results}],
+        "$schema": SARIF_SCHEMA,
+        "runs": [
+            {
+                "tool": _sarif_tool(_collect_rules(valid)),
+                "results": [_sarif_result(f) for f in valid],
+            }
+        ],
     }
 
 
@@ -197,16 +218,37 @@ def _severity_to_level(sev: str | None) -> str:
     return "note"
 
 
-def write_sarif(findings: list[dict[str, Any]], out_path: str | Path) -> None:
+def write_sarif(
+    findings: list[dict[str, Any]],
+    out_path: str | Path,
+    compact: bool = False,
+    gzip_copy: bool = False,
+) -> None:
     """Write findings to SARIF 2.1.0 JSON file.
 
+    Rules are collected in a first pass (they precede results in the
+    document); results are then built and streamed to disk one at a time
+    instead of materialising the whole SARIF document.
+
     Args:
         findings: List of normalized findings
         out_path: Output file path
+        compact: Omit indentation and whitespace
+        gzip_copy: Also write a gzip-compressed copy to ``<out_path>.gz``
     """
-    p = Path(out_path)
-    p.parent.mkdir(parents=True, exist_ok=True)
     # Filter out None or invalid findings before converting to SARIF
     valid_findings = [f for f in findings if f and isinstance(f, dict)]
-    sarif = to_sarif(valid_findings)
-    p.write_text(json.dumps(sarif, indent=2), encoding="utf-8")
+    with open_json_output(out_path, gzip_copy=gzip_copy) as fh:
+        writer = JSONStreamWriter(fh, indent=None if compact else 2)
+        writer.begin_object()
+        writer.field("version", SARIF_VERSION)
+        writer.field("$schema", SARIF_SCHEMA)
+        writer.key("runs")
+        writer.begin_array()
+        writer.begin_object()
+        writer.field("tool", _sarif_tool(_collect_rules(valid_findings)))
+        writer.key("results")
+        writer.array(_sarif_result(f) for f in valid_findings)
+        writer.end_object()
+        writer.end_array()
+        writer.end_object()
@@ -9,7 +9,10 @@ email client compatibility (Gmail, Outlook, Apple Mail, etc.).
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from scripts.core.reporters.report_engine import ReportAggregates
 
 SEV_ORDER = ["CRITICAL", "HIGH", "MEDIUM", "LOW", "INFO"]
 SEV_COLORS = {
@@ -40,7 +43,11 @@ def _truncate_text(text: str, max_len: int = 80) -> str:
     return text[: max_len - 3] + "..."
 
 
-def write_simple_html(findings: list[dict[str, Any]], out_path: str | Path) -> None:
+def write_simple_html(
+    findings: list[dict[str, Any]],
+    out_path: str | Path,
+    aggregates: ReportAggregates | None = None,
+) -> None:
     """
     Write static HTML table for email-compatible findings report.
 
@@ -55,10 +62,24 @@ def write_simple_html(findings: list[dict[str, Any]], out_path: str | Path) -> N
     Args:
         findings: List of CommonFinding dictionaries
         out_path: Output file path
+        aggregates: Precomputed severity buckets and tool counts (optional)
     """
     p = Path(out_path)
     p.parent.mkdir(parents=True, exist_ok=True)
 
+    if aggregates is not None and set(aggregates.by_severity) <= set(SEV_ORDER):
+        # Severity buckets keep input order, so concatenating them is the
+        # same stable sort as below without re-walking the findings.
+        sorted_findings = [
+            f for sev in SEV_ORDER for f in aggregates.by_severity.get(sev, [])
+        ]
+        sev_counts = {sev: aggregates.severity_counts[sev] for sev in SEV_ORDER}
+        html = _generate_html_template(
+            sorted_findings, sev_counts, sorted(aggregates.tool_severity)
+        )
+        p.write_text(html, encoding="utf-8")
+        return
+
     # Sort findings: CRITICAL → HIGH → MEDIUM → LOW → INFO
     sorted_findings = sorted(
         findings, key=lambda f: SEV_ORDER.index(f.get("severity", "INFO"))
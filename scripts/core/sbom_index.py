@@ -0,0 +1,443 @@
+"""
+Per-target SBOM package index.
+
+Reports used to rebuild Syft lookup dicts from the syft findings every time
+(each ``jmo report``, each ``--watch`` refresh), and only Trivy findings were
+matched against them. The scan now writes ``sbom-index.sqlite`` beside each
+target's ``syft.json`` once Syft finishes. Report enrichment and the MCP
+context tools open it read-only and query it per finding, so only the
+packages a lookup touches are ever read.
+
+Schema::
+
+    meta(key, value)             "version" and "source" (syft.json size:mtime)
+    packages(id, name, name_key, version, purl, purl_key, type, path)
+    locations(path, package)     every location of every package
+
+``packages.path`` is a package's first location, as the syft adapter reports
+it; ``locations`` lists all of them. An index whose recorded source no longer
+matches syft.json is rebuilt when opened, so results directories written
+before the index existed get one on first use.
+
+``match_package`` resolves a finding from a package scanner (Trivy, Grype,
+OWASP Dependency-Check, or an OSV-style ``package`` record) to the SBOM
+package it concerns: by purl, then by location, then by name, preferring the
+same name and version among several candidates.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, Protocol
+
+from scripts.core import json_codec
+from scripts.core.adapters.common import iter_json_members
+
+logger = logging.getLogger(__name__)
+
+SBOM_INDEX_FILENAME = "sbom-index.sqlite"
+SBOM_SOURCE_FILENAME = "syft.json"
+INDEX_VERSION = 1
+
+# Tools whose findings name a package that the SBOM can describe
+PACKAGE_SCANNERS = frozenset({"trivy", "grype", "dependency-check", "osv-scanner"})
+
+_SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE packages (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    name_key TEXT NOT NULL,
+    version TEXT NOT NULL,
+    purl TEXT NOT NULL,
+    purl_key TEXT NOT NULL,
+    type TEXT NOT NULL,
+    path TEXT NOT NULL
+);
+CREATE TABLE locations (path TEXT NOT NULL, package INTEGER NOT NULL);
+"""
+
+# Created after the bulk insert, which is much faster than maintaining them
+_INDEXES = """
+CREATE INDEX packages_name ON packages (name_key);
+CREATE INDEX packages_purl ON packages (purl_key);
+CREATE INDEX locations_path ON locations (path);
+"""
+
+_COLUMNS = "p.name, p.version, p.path, p.purl, p.type"
+
+
+def purl_key(purl: str) -> str:
+    """A purl without qualifiers or subpath, so tools' variants of it match."""
+    return purl.split("#", 1)[0].split("?", 1)[0]
+
+
+def _source_key(source: Path) -> str:
+    st = source.stat()
+    return f"{st.st_size}:{st.st_mtime_ns}"
+
+
+def _record(
+    name: str, version: str, path: str, purl: str = "", kind: str = ""
+) -> dict[str, str]:
+    return {"name": name, "version": version, "path": path, "purl": purl, "type": kind}
+
+
+def _syft_packages(source: Path) -> Iterator[tuple[dict[str, str], list[str]]]:
+    """(record, location paths) for each artifact in a syft.json."""
+    for _, artifact in iter_json_members(source, stream=("artifacts",), keep=()):
+        if not isinstance(artifact, dict):
+            continue
+        paths = [
+            str(loc["path"])
+            for loc in artifact.get("locations") or []
+            if isinstance(loc, dict) and loc.get("path")
+        ]
+        record = _record(
+            str(artifact.get("name") or "").strip(),
+            str(artifact.get("version") or "").strip(),
+            paths[0] if paths else "",
+            str(artifact.get("purl") or ""),
+            str(artifact.get("type") or ""),
+        )
+        yield record, paths
+
+
+def build_sbom_index(
+    source: str | Path, index_path: str | Path | None = None
+) -> int | None:
+    """Index the packages of a syft.json, replacing any previous index.
+
+    Args:
+        source: Path to syft.json
+        index_path: Destination (default: ``sbom-index.sqlite`` beside source)
+
+    Returns:
+        Number of packages indexed, or None if syft.json could not be read
+    """
+    source = Path(source)
+    index_path = (
+        Path(index_path) if index_path else source.with_name(SBOM_INDEX_FILENAME)
+    )
+    staging = index_path.with_name(index_path.name + ".tmp")
+    count = 0
+    try:
+        key = _source_key(source)
+        staging.unlink(missing_ok=True)
+        conn = sqlite3.connect(staging)
+        try:
+            # A half-written staging file is discarded, never opened
+            conn.execute("PRAGMA journal_mode = OFF")
+            conn.execute("PRAGMA synchronous = OFF")
+            conn.executescript(_SCHEMA)
+            for record, paths in _syft_packages(source):
+                cursor = conn.execute(
+                    "INSERT INTO packages (name, name_key, version, purl, purl_key,"
+                    " type, path) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        record["name"],
+                        record["name"].lower(),
+                        record["version"],
+                        record["purl"],
+                        purl_key(record["purl"]),
+                        record["type"],
+                        record["path"],
+                    ),
+                )
+                conn.executemany(
+                    "INSERT INTO locations (path, package) VALUES (?, ?)",
+                    [(path, cursor.lastrowid) for path in dict.fromkeys(paths)],
+                )
+                count += 1
+            conn.executescript(_INDEXES)
+            conn.executemany(
+                "INSERT INTO meta (key, value) VALUES (?, ?)",
+                [("version", str(INDEX_VERSION)), ("source", key)],
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        os.replace(staging, index_path)
+    except (OSError, sqlite3.Error, json_codec.JSONDecodeError) as e:
+        logger.debug(f"Could not index SBOM {source}: {e}")
+        try:
+            staging.unlink(missing_ok=True)
+        except OSError:
+            pass
+        return None
+    return count
+
+
+class PackageLookup(Protocol):
+    """Package queries shared by the persisted and in-memory indexes."""
+
+    def packages_at(self, path: str) -> list[dict[str, str]]: ...
+
+    def packages_named(self, name: str) -> list[dict[str, str]]: ...
+
+    def packages_with_purl(self, purl: str) -> list[dict[str, str]]: ...
+
+
+class SbomIndex:
+    """Read-only queries against one target's ``sbom-index.sqlite``.
+
+    Safe to share between threads (the MCP server's async mode queries from
+    a pool).
+    """
+
+    def __init__(self, conn: sqlite3.Connection, path: Path):
+        self.path = path
+        self._conn = conn
+        self._lock = threading.Lock()
+
+    @classmethod
+    def open(cls, target_dir: str | Path, build: bool = True) -> SbomIndex | None:
+        """Open a target's index, building it first if missing or stale.
+
+        Args:
+            target_dir: Target results directory (holds syft.json)
+            build: (Re)build the index from syft.json when needed
+
+        Returns:
+            The index, or None if the target has no usable syft.json
+        """
+        target_dir = Path(target_dir)
+        source = target_dir / SBOM_SOURCE_FILENAME
+        index_path = target_dir / SBOM_INDEX_FILENAME
+        try:
+            key = _source_key(source)
+        except OSError:
+            return None
+
+        index = cls._connect(index_path, key)
+        if index is None and build and build_sbom_index(source, index_path) is not None:
+            index = cls._connect(index_path, key)
+        return index
+
+    @classmethod
+    def _connect(cls, index_path: Path, key: str) -> SbomIndex | None:
+        if not index_path.is_file():
+            return None
+        try:
+            conn = sqlite3.connect(
+                f"{index_path.resolve().as_uri()}?mode=ro",
+                uri=True,
+                check_same_thread=False,
+            )
+        except sqlite3.Error as e:
+            logger.debug(f"Cannot open SBOM index {index_path}: {e}")
+            return None
+        try:
+            meta = dict(conn.execute("SELECT key, value FROM meta").fetchall())
+        except sqlite3.Error as e:
+            logger.debug(f"Ignoring SBOM index {index_path}: {e}")
+            meta = {}
+        if meta.get("version") != str(INDEX_VERSION) or meta.get("source") != key:
+            conn.close()
+            return None
+        return cls(conn, index_path)
+
+    def _query(self, sql: str, *args: Any) -> list[dict[str, str]]:
+        with self._lock:
+            rows = self._conn.execute(sql, args).fetchall()
+        return [_record(*row) for row in rows]
+
+    def packages_at(self, path: str) -> list[dict[str, str]]:
+        """Packages with a location at ``path``, in SBOM order."""
+        return self._query(
+            f"SELECT {_COLUMNS} FROM packages p WHERE p.id IN"
+            " (SELECT package FROM locations WHERE path = ?) ORDER BY p.id",
+            path,
+        )
+
+    def packages_named(self, name: str) -> list[dict[str, str]]:
+        """Packages whose lowercase name is ``name``, in SBOM order."""
+        return self._query(
+            f"SELECT {_COLUMNS} FROM packages p WHERE p.name_key = ? ORDER BY p.id",
+            name.lower(),
+        )
+
+    def packages_with_purl(self, purl: str) -> list[dict[str, str]]:
+        """Packages with ``purl`` (qualifiers ignored), in SBOM order."""
+        return self._query(
+            f"SELECT {_COLUMNS} FROM packages p WHERE p.purl_key = ? ORDER BY p.id",
+            purl_key(purl),
+        )
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM packages").fetchone()
+        return int(count)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class SbomIndexSet:
+    """The SBOM indexes of every target in a results directory, queried together.
+
+    Results are concatenated in target order.
+    """
+
+    def __init__(self, indexes: list[SbomIndex]):
+        self.indexes = indexes
+
+    @classmethod
+    def open(cls, results_dir: str | Path, build: bool = True) -> SbomIndexSet | None:
+        """Open the index of each target that has a syft.json.
+
+        Returns:
+            The set, or None if any target's index could not be opened (for
+            example a malformed syft.json, or a read-only results directory
+            without indexes), so callers can fall back to the syft findings
+        """
+        indexes: list[SbomIndex] = []
+        for source in sorted(
+            Path(results_dir).glob(f"individual-*/*/{SBOM_SOURCE_FILENAME}")
+        ):
+            index = SbomIndex.open(source.parent, build=build)
+            if index is None:
+                for opened in indexes:
+                    opened.close()
+                return None
+            indexes.append(index)
+        return cls(indexes)
+
+    def packages_at(self, path: str) -> list[dict[str, str]]:
+        return [p for index in self.indexes for p in index.packages_at(path)]
+
+    def packages_named(self, name: str) -> list[dict[str, str]]:
+        return [p for index in self.indexes for p in index.packages_named(name)]
+
+    def packages_with_purl(self, purl: str) -> list[dict[str, str]]:
+        return [p for index in self.indexes for p in index.packages_with_purl(purl)]
+
+    def __len__(self) -> int:
+        return sum(len(index) for index in self.indexes)
+
+    def close(self) -> None:
+        for index in self.indexes:
+            index.close()
+
+
+class InMemorySbomIndex:
+    """``PackageLookup`` over dicts of package records.
+
+    Args:
+        by_path: Records by location path
+        by_name: Records by lowercase package name
+    """
+
+    def __init__(
+        self,
+        by_path: dict[str, list[dict[str, str]]],
+        by_name: dict[str, list[dict[str, str]]],
+    ):
+        self.by_path = by_path
+        self.by_name = by_name
+        self.by_purl: dict[str, list[dict[str, str]]] = {}
+        for records in by_name.values():
+            for record in records:
+                if record.get("purl"):
+                    self.by_purl.setdefault(purl_key(record["purl"]), []).append(record)
+
+    def packages_at(self, path: str) -> list[dict[str, str]]:
+        return self.by_path.get(path, [])
+
+    def packages_named(self, name: str) -> list[dict[str, str]]:
+        return self.by_name.get(name.lower(), [])
+
+    def packages_with_purl(self, purl: str) -> list[dict[str, str]]:
+        return self.by_purl.get(purl_key(purl), [])
+
+
+def _dict(value: Any) -> dict[str, Any]:
+    return value if isinstance(value, dict) else {}
+
+
+def _name_from_purl(purl: str) -> tuple[str, str]:
+    """(name, version) from ``pkg:type/namespace/name@version``."""
+    rest = purl_key(purl).rsplit("/", 1)[-1]
+    name, _, version = rest.partition("@")
+    return name, version
+
+
+def package_reference(finding: dict[str, Any]) -> tuple[str, str, str, list[str]]:
+    """The package a scanner finding refers to.
+
+    Recognises Trivy (``raw.PkgName``), Grype (``raw.artifact``), OWASP
+    Dependency-Check (``context.package_id``) and OSV-style
+    (``raw.package``) findings by shape.
+
+    Returns:
+        (purl, name, version, candidate paths); any may be empty
+    """
+    raw = _dict(finding.get("raw"))
+    context = _dict(finding.get("context"))
+    loc = _dict(finding.get("location"))
+    paths = [str(loc.get("path") or "")]
+
+    if "PkgName" in raw or "PkgPath" in raw or "PkgIdentifier" in raw:
+        purl = str(_dict(raw.get("PkgIdentifier")).get("PURL") or "")
+        name = str(raw.get("PkgName") or "")
+        version = str(raw.get("InstalledVersion") or "")
+        paths.append(str(raw.get("PkgPath") or ""))
+    elif isinstance(raw.get("artifact"), dict):
+        artifact = raw["artifact"]
+        purl = str(artifact.get("purl") or "")
+        name = str(artifact.get("name") or "")
+        version = str(artifact.get("version") or "")
+    elif context.get("package_id"):
+        purl = str(context["package_id"])
+        name, version = _name_from_purl(purl) if purl.startswith("pkg:") else ("", "")
+    else:
+        package = _dict(raw.get("package"))
+        purl = str(package.get("purl") or "")
+        name = str(package.get("name") or "")
+        version = str(raw.get("version") or package.get("version") or "")
+
+    return purl.strip(), name.strip(), version.strip(), [p.strip() for p in paths]
+
+
+def _best(candidates: list[dict[str, str]], name: str, version: str) -> dict[str, str]:
+    if name:
+        same_name = [c for c in candidates if c.get("name", "").lower() == name.lower()]
+        candidates = same_name or candidates
+    if version:
+        for candidate in candidates:
+            if candidate.get("version") == version:
+                return candidate
+    return candidates[0]
+
+
+def match_package(
+    finding: dict[str, Any], lookup: PackageLookup
+) -> dict[str, str] | None:
+    """Find the SBOM package a finding concerns.
+
+    Tries the finding's purl, then each of its paths, then its package name.
+
+    Returns:
+        Package record (name, version, path, purl, type), or None
+    """
+    purl, name, version, paths = package_reference(finding)
+    if purl:
+        candidates = lookup.packages_with_purl(purl)
+        if candidates:
+            return _best(candidates, name, version)
+    for path in paths:
+        if path:
+            candidates = lookup.packages_at(path)
+            if candidates:
+                return _best(candidates, name, version)
+    if name:
+        candidates = lookup.packages_named(name)
+        if candidates:
+            return _best(candidates, name, version)
+    return None
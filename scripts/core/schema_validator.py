@@ -8,12 +8,29 @@ validation of files containing findings.
 
 The schema is loaded from docs/schemas/common_finding.v1.json which defines
 the canonical CommonFinding structure.
+
+Validation is built to stay on for 100k-finding results:
+
+- The schema is parsed once per file version and compiled once into a
+  ``CompiledValidator`` (a cached ``Draft202012Validator`` plus a fast-path
+  predicate generated from the schema).
+- The fast path answers "valid" for well-formed findings without running
+  jsonschema. It handles the keywords CommonFinding uses (type, enum,
+  required, properties, items, bounds, oneOf, ...); a finding it cannot vouch
+  for is passed to jsonschema, which produces the exact error messages.
+- Findings that need full validation are split into chunks across worker
+  processes when there are many of them, and ``validate_directory`` validates
+  files in parallel processes.
 """
 
 from __future__ import annotations
 
 import json
 import logging
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any, cast
 
@@ -34,6 +51,48 @@ SCHEMA_PATH = (
     Path(__file__).parent.parent.parent / "docs" / "schemas" / "common_finding.v1.json"
 )
 
+# Full-validation work below these sizes stays in-process: starting worker
+# processes costs more than it saves
+PARALLEL_MIN_FINDINGS = 2000
+PARALLEL_MIN_FILES = 4
+CHUNK_SIZE = 1000
+MAX_CACHED_VALIDATORS = 8
+
+# Keywords that only annotate (format is not asserted by Draft202012Validator
+# unless a format checker is passed, so it is an annotation here too)
+_ANNOTATIONS = frozenset(
+    {
+        "$schema",
+        "$id",
+        "$comment",
+        "title",
+        "description",
+        "format",
+        "default",
+        "examples",
+        "deprecated",
+        "readOnly",
+        "writeOnly",
+    }
+)
+
+_TYPE_CHECKS: dict[str, Callable[[Any], bool]] = {
+    "object": lambda v: isinstance(v, dict),
+    "array": lambda v: isinstance(v, list),
+    "string": lambda v: isinstance(v, str),
+    "boolean": lambda v: isinstance(v, bool),
+    "null": lambda v: v is None,
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    "integer": lambda v: (
+        (isinstance(v, int) and not isinstance(v, bool))
+        or (isinstance(v, float) and v.is_integer())
+    ),
+}
+
+_schema_cache: dict[Path, tuple[tuple[int, int], dict[str, Any]]] = {}
+_validator_cache: dict[int, tuple[dict[str, Any], CompiledValidator]] = {}
+_cache_lock = threading.Lock()
+
 
 def load_schema(schema_path: Path | None = None) -> dict[str, Any]:
     """Load the CommonFinding JSON schema.
@@ -43,7 +102,8 @@ def load_schema(schema_path: Path | None = None) -> dict[str, Any]:
             location at docs/schemas/common_finding.v1.json
 
     Returns:
-        Parsed JSON schema as a dictionary
+        Parsed JSON schema as a dictionary. The parsed schema is cached until
+        the file changes and shared between callers, so treat it as read-only.
 
     Raises:
         FileNotFoundError: If schema file does not exist
@@ -52,7 +112,219 @@ def load_schema(schema_path: Path | None = None) -> dict[str, Any]:
     path = schema_path or SCHEMA_PATH
     if not path.exists():
         raise FileNotFoundError(f"Schema file not found: {path}")
-    return cast(dict[str, Any], json.loads(path.read_text(encoding="utf-8")))
+    st = path.stat()
+    key = (st.st_mtime_ns, st.st_size)
+    with _cache_lock:
+        cached = _schema_cache.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    schema = cast(dict[str, Any], json.loads(path.read_text(encoding="utf-8")))
+    with _cache_lock:
+        _schema_cache[path] = (key, schema)
+    return schema
+
+
+def _never(value: Any) -> bool:
+    return False
+
+
+def _always(value: Any) -> bool:
+    return True
+
+
+def _compile_fast_path(node: Any) -> tuple[Callable[[Any], bool], bool]:
+    """Compile a schema node into a fast validity predicate.
+
+    Returns:
+        (predicate, exact). The predicate returning True means the instance
+        is valid. When ``exact`` is True, False means it is invalid; otherwise
+        the node uses keywords the compiler does not handle and False only
+        means "ask jsonschema".
+    """
+    if node is True or node == {}:
+        return _always, True
+    if node is False:
+        return _never, True
+    if not isinstance(node, dict):
+        return _never, False
+
+    checks: list[Callable[..., bool]] = []
+    exact = True
+    for keyword, value in node.items():
+        if keyword in _ANNOTATIONS or keyword in ("properties", "required"):
+            continue
+        if keyword == "type":
+            names = [value] if isinstance(value, str) else list(value)
+            if not all(name in _TYPE_CHECKS for name in names):
+                return _never, False
+            type_checks = [_TYPE_CHECKS[name] for name in names]
+            if len(type_checks) == 1:
+                checks.append(type_checks[0])
+            else:
+                checks.append(lambda v, tc=type_checks: any(c(v) for c in tc))
+        elif keyword == "enum" and all(isinstance(e, str) for e in value):
+            allowed = frozenset(value)
+            checks.append(lambda v, a=allowed: isinstance(v, str) and v in a)
+        elif keyword in ("minimum", "maximum", "exclusiveMinimum", "exclusiveMaximum"):
+            bound = value
+            compare = {
+                "minimum": lambda v, b=bound: v >= b,
+                "maximum": lambda v, b=bound: v <= b,
+                "exclusiveMinimum": lambda v, b=bound: v > b,
+                "exclusiveMaximum": lambda v, b=bound: v < b,
+            }[keyword]
+            checks.append(
+                lambda v, c=compare: (
+                    not isinstance(v, (int, float)) or isinstance(v, bool) or c(v)
+                )
+            )
+        elif keyword in ("minLength", "maxLength"):
+            limit = value
+            if keyword == "minLength":
+                checks.append(lambda v, n=limit: not isinstance(v, str) or len(v) >= n)
+            else:
+                checks.append(lambda v, n=limit: not isinstance(v, str) or len(v) <= n)
+        elif keyword in ("minItems", "maxItems"):
+            limit = value
+            if keyword == "minItems":
+                checks.append(lambda v, n=limit: not isinstance(v, list) or len(v) >= n)
+            else:
+                checks.append(lambda v, n=limit: not isinstance(v, list) or len(v) <= n)
+        elif keyword == "items" and isinstance(value, (dict, bool)):
+            item_check, item_exact = _compile_fast_path(value)
+            exact = exact and item_exact
+            checks.append(
+                lambda v, c=item_check: (
+                    not isinstance(v, list) or all(c(item) for item in v)
+                )
+            )
+        elif keyword == "additionalProperties" and isinstance(value, (dict, bool)):
+            extra_check, extra_exact = _compile_fast_path(value)
+            exact = exact and extra_exact
+            known = frozenset(node.get("properties", {}))
+            checks.append(
+                lambda v, c=extra_check, k=known: (
+                    not isinstance(v, dict)
+                    or all(c(v[key]) for key in v if key not in k)
+                )
+            )
+        elif keyword in ("allOf", "anyOf", "oneOf"):
+            branches = [_compile_fast_path(sub) for sub in value]
+            branch_checks = [check for check, _ in branches]
+            if keyword == "allOf":
+                exact = exact and all(e for _, e in branches)
+                checks.append(lambda v, bc=branch_checks: all(c(v) for c in bc))
+            elif not all(e for _, e in branches):
+                # A False branch may still be valid; cannot decide any/one-of
+                return _never, False
+            elif keyword == "anyOf":
+                checks.append(lambda v, bc=branch_checks: any(c(v) for c in bc))
+            else:
+                checks.append(
+                    lambda v, bc=branch_checks: sum(1 for c in bc if c(v)) == 1
+                )
+        else:
+            return _never, False
+
+    required = node.get("required", [])
+    properties: list[tuple[str, Callable[[Any], bool]]] = []
+    for name, sub in node.get("properties", {}).items():
+        sub_check, sub_exact = _compile_fast_path(sub)
+        exact = exact and sub_exact
+        if sub_check is not _always:
+            properties.append((name, sub_check))
+
+    if required or properties:
+        required_keys = tuple(required)
+
+        def check_object(v: Any) -> bool:
+            if not isinstance(v, dict):
+                return True
+            for key in required_keys:
+                if key not in v:
+                    return False
+            for key, check in properties:
+                if key in v and not check(v[key]):
+                    return False
+            return True
+
+        checks.append(check_object)
+
+    if not checks:
+        return _always, exact
+    if len(checks) == 1:
+        return checks[0], exact
+    return (lambda v, cs=tuple(checks): all(c(v) for c in cs)), exact
+
+
+class CompiledValidator:
+    """A schema compiled once: fast-path predicate plus jsonschema fallback.
+
+    Args:
+        schema: JSON schema (Draft 2020-12)
+    """
+
+    def __init__(self, schema: dict[str, Any]):
+        self._validator = Draft202012Validator(schema)
+        try:
+            self.fast_check, self.exact = _compile_fast_path(schema)
+        except (TypeError, ValueError, AttributeError):
+            # Malformed schema: let jsonschema report it for every finding
+            self.fast_check, self.exact = _never, False
+
+    def errors(self, finding: Any) -> list[str]:
+        """Error strings for ``finding``; empty when it is valid."""
+        if self.fast_check(finding):
+            return []
+        return self.full_errors(finding)
+
+    def full_errors(self, finding: Any) -> list[str]:
+        """Error strings from a full jsonschema pass (no fast path)."""
+        errors: list[str] = []
+        try:
+            for error in self._validator.iter_errors(finding):
+                # Build a human-readable error message with path context
+                path = (
+                    ".".join(str(p) for p in error.absolute_path)
+                    if error.absolute_path
+                    else "root"
+                )
+                errors.append(f"{path}: {error.message}")
+        except (
+            Exception
+        ) as e:  # Acceptable: schema validation infrastructure error — report as validation error
+            errors.append(f"Validation error: {e}")
+        return errors
+
+
+def get_validator(schema: dict[str, Any]) -> CompiledValidator:
+    """Compiled validator for ``schema``, built once per schema object.
+
+    Validators are cached by schema identity (the cache holds a reference, so
+    the identity stays valid); a schema dict must not be mutated after use.
+    """
+    with _cache_lock:
+        cached = _validator_cache.get(id(schema))
+    if cached is not None and cached[0] is schema:
+        return cached[1]
+    validator = CompiledValidator(schema)
+    with _cache_lock:
+        if len(_validator_cache) >= MAX_CACHED_VALIDATORS:
+            _validator_cache.pop(next(iter(_validator_cache)))
+        _validator_cache[id(schema)] = (schema, validator)
+    return validator
+
+
+def _full_errors_chunk(
+    schema: dict[str, Any], chunk: list[dict[str, Any]]
+) -> list[list[str]]:
+    """Worker-process entry point: full validation of one chunk."""
+    validator = get_validator(schema)
+    return [validator.full_errors(finding) for finding in chunk]
+
+
+def _worker_count(workers: int | None, jobs: int) -> int:
+    return max(1, min(workers or os.cpu_count() or 1, jobs))
 
 
 def validate_finding(
@@ -78,35 +350,31 @@ def validate_finding(
         except (FileNotFoundError, json.JSONDecodeError) as e:
             return [f"Failed to load schema: {e}"]
 
-    errors: list[str] = []
-
     try:
         # Use Draft 2020-12 validator as per schema definition
-        validator = Draft202012Validator(schema)
-        for error in validator.iter_errors(finding):
-            # Build a human-readable error message with path context
-            path = (
-                ".".join(str(p) for p in error.absolute_path)
-                if error.absolute_path
-                else "root"
-            )
-            errors.append(f"{path}: {error.message}")
+        return get_validator(schema).errors(finding)
     except (
         Exception
     ) as e:  # Acceptable: schema validation infrastructure error — report as validation error
-        errors.append(f"Validation error: {e}")
-
-    return errors
+        return [f"Validation error: {e}"]
 
 
 def validate_findings(
-    findings: list[dict[str, Any]], schema: dict[str, Any] | None = None
+    findings: list[dict[str, Any]],
+    schema: dict[str, Any] | None = None,
+    workers: int | None = None,
 ) -> dict[str, list[str]]:
     """Validate multiple findings against the CommonFinding schema.
 
+    Findings the fast path accepts cost a few microseconds each. The rest
+    get full jsonschema validation, spread in chunks over worker processes
+    when there are at least ``PARALLEL_MIN_FINDINGS`` of them.
+
     Args:
         findings: List of finding dictionaries
         schema: Optional pre-loaded schema. If None, loads from default location.
+        workers: Worker processes for full validation (default: CPU count;
+            1 keeps everything in-process)
 
     Returns:
         Dictionary mapping finding index/id to list of errors.
@@ -122,13 +390,38 @@ def validate_findings(
         except (FileNotFoundError, json.JSONDecodeError) as e:
             return {"schema_load_error": [str(e)]}
 
-    errors_by_finding: dict[str, list[str]] = {}
+    validator = get_validator(schema)
+    fast_check = validator.fast_check
+    pending = [i for i, finding in enumerate(findings) if not fast_check(finding)]
+
+    if len(pending) >= PARALLEL_MIN_FINDINGS and _worker_count(workers, 2) > 1:
+        chunks = [
+            [findings[i] for i in pending[start : start + CHUNK_SIZE]]
+            for start in range(0, len(pending), CHUNK_SIZE)
+        ]
+        with ProcessPoolExecutor(
+            max_workers=_worker_count(workers, len(chunks))
+        ) as pool:
+            results = [
+                errors
+                for chunk_errors in pool.map(
+                    _full_errors_chunk, [schema] * len(chunks), chunks
+                )
+                for errors in chunk_errors
+            ]
+    else:
+        results = [validator.full_errors(findings[i]) for i in pending]
 
-    for i, finding in enumerate(findings):
-        finding_errors = validate_finding(finding, schema)
+    errors_by_finding: dict[str, list[str]] = {}
+    for i, finding_errors in zip(pending, results, strict=True):
         if finding_errors:
             # Use finding id if available, otherwise use index
-            finding_id = finding.get("id", f"index_{i}")
+            finding = findings[i]
+            finding_id = (
+                finding.get("id", f"index_{i}")
+                if isinstance(finding, dict)
+                else f"index_{i}"
+            )
             errors_by_finding[finding_id] = finding_errors
 
     return errors_by_finding
@@ -202,13 +495,18 @@ def validate_directory(
     dir_path: Path,
     glob_pattern: str = "**/*.json",
     exclude_patterns: list[str] | None = None,
+    workers: int | None = None,
 ) -> dict[str, list[str]]:
     """Validate all JSON files in a directory against the CommonFinding schema.
 
+    With ``PARALLEL_MIN_FILES`` or more files, files are validated in worker
+    processes (each reads, parses and validates its own files).
+
     Args:
         dir_path: Directory path to search for JSON files
         glob_pattern: Glob pattern for finding JSON files (default: **/*.json)
         exclude_patterns: List of patterns to exclude (substring match)
+        workers: Worker processes (default: CPU count; 1 validates in-process)
 
     Returns:
         Dictionary mapping file paths to lists of errors.
@@ -222,12 +520,27 @@ def validate_directory(
     if not dir_path.exists():
         return {str(dir_path): [f"Directory not found: {dir_path}"]}
 
-    for json_file in dir_path.glob(glob_pattern):
-        # Skip excluded files
-        if any(pattern in str(json_file) for pattern in exclude_patterns):
-            continue
+    # Skip excluded files
+    files = [
+        json_file
+        for json_file in dir_path.glob(glob_pattern)
+        if not any(pattern in str(json_file) for pattern in exclude_patterns)
+    ]
+
+    pool_size = _worker_count(workers, len(files))
+    if len(files) >= PARALLEL_MIN_FILES and pool_size > 1:
+        with ProcessPoolExecutor(max_workers=pool_size) as pool:
+            results = list(
+                pool.map(
+                    validate_findings_file,
+                    files,
+                    chunksize=max(1, len(files) // (pool_size * 4)),
+                )
+            )
+    else:
+        results = [validate_findings_file(json_file) for json_file in files]
 
-        file_errors = validate_findings_file(json_file)
+    for json_file, file_errors in zip(files, results, strict=True):
         if file_errors:
             errors_by_file[str(json_file)] = file_errors
 
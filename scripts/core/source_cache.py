@@ -0,0 +1,229 @@
+"""Shared, bounded access to source files for snippet extraction.
+
+``extract_code_snippet`` and the MCP ``SourceContextExtractor`` used to read
+and split a whole source file for every finding that named it: a file with
+200 findings was read 200 times, and one minified bundle with a few findings
+was decoded and split in full for each.
+
+``SourceCache`` keeps the most recently used files in a bounded LRU. For each
+one a ``SourceFile`` records the byte offset of every line start, built with
+one scan the first time a line is asked for, so each snippet afterwards
+decodes only the lines it returns. A cached entry is reused while the file's
+size and mtime are unchanged, so a long-running process (the MCP server)
+never serves stale lines.
+
+Files under ``MMAP_MIN_BYTES`` are read into memory; only larger ones are
+memory-mapped. A mapping pins its file: on Windows a mapped file cannot be
+truncated, replaced or deleted (editor saves and ``git checkout`` fail), and
+on POSIX reading a mapping whose file was truncated raises SIGBUS. So
+mappings are closed as soon as they are evicted, and any left unused for
+``MAPPED_IDLE_SECONDS`` are released by a background timer.
+
+Lines are split on ``\\n`` with a trailing ``\\r`` dropped, the convention
+scanners use when they report line numbers. ``str.splitlines`` also broke
+lines at form feeds and other Unicode separators, which shifted the snippet
+away from the line a tool reported.
+"""
+
+from __future__ import annotations
+
+import logging
+import mmap
+import os
+import stat
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_FILES = 64
+MMAP_MIN_BYTES = 1 << 20
+MAPPED_IDLE_SECONDS = 30.0
+
+
+class SourceFile:
+    """One source file's contents with a lazily built line-offset index."""
+
+    def __init__(self, data: mmap.mmap | bytes, key: tuple[int, int]):
+        self._data = data
+        self.key = key
+        self._offsets: array[int] | None = None
+        # Reentrant: lines() holds it across _line_offsets() so that close()
+        # never unmaps data mid-read
+        self._lock = threading.RLock()
+        self.last_used = time.monotonic()
+
+    @property
+    def mapped(self) -> bool:
+        return isinstance(self._data, mmap.mmap)
+
+    def close(self) -> None:
+        """Release the mapping. A closed file reads as empty."""
+        with self._lock:
+            if isinstance(self._data, mmap.mmap):
+                self._data.close()
+            self._data = b""
+            self._offsets = array("q", [0])
+
+    def _line_offsets(self) -> array[int]:
+        """Start offset of every line, plus a sentinel at end of data."""
+        if self._offsets is None:
+            with self._lock:
+                if self._offsets is None:
+                    data = self._data
+                    offsets = array("q", [0])
+                    find = data.find
+                    pos = find(b"\n")
+                    while pos != -1:
+                        offsets.append(pos + 1)
+                        pos = find(b"\n", pos + 1)
+                    size = len(data)
+                    if offsets[-1] != size:
+                        offsets.append(size)  # last line has no newline
+                    self._offsets = offsets
+        return self._offsets
+
+    @property
+    def line_count(self) -> int:
+        return len(self._line_offsets()) - 1
+
+    def lines(
+        self, first: int, last: int, errors: str = "ignore", keepends: bool = False
+    ) -> list[str]:
+        """Lines ``first`` through ``last`` (1-indexed, inclusive, clamped).
+
+        Args:
+            first: First line number
+            last: Last line number
+            errors: Decode error handler ("ignore", "replace", ...)
+            keepends: End each line with "\\n" (as text-mode ``readlines``
+                does) except a final line that had none
+        """
+        with self._lock:
+            offsets = self._line_offsets()
+            first = max(1, first)
+            last = min(len(offsets) - 1, last)
+            data = self._data
+            chunks = [
+                data[offsets[number - 1] : offsets[number]]
+                for number in range(first, last + 1)
+            ]
+        result = []
+        for raw in chunks:
+            has_newline = raw.endswith(b"\n")
+            if has_newline:
+                raw = raw[:-1]
+            if raw.endswith(b"\r"):
+                raw = raw[:-1]
+            line = raw.decode("utf-8", errors=errors)
+            result.append(line + "\n" if keepends and has_newline else line)
+        return result
+
+
+class SourceCache:
+    """Bounded LRU of ``SourceFile`` objects keyed by path.
+
+    Evicted files are closed at once. A caller still holding one then reads
+    it as empty rather than touching an unmapped buffer.
+
+    Args:
+        max_files: Files kept at once
+        mmap_min_bytes: Files at least this large are mapped, not read
+        idle_seconds: Close mappings unused for this long (None = never)
+    """
+
+    def __init__(
+        self,
+        max_files: int = DEFAULT_MAX_FILES,
+        mmap_min_bytes: int = MMAP_MIN_BYTES,
+        idle_seconds: float | None = MAPPED_IDLE_SECONDS,
+    ):
+        self.max_files = max(1, max_files)
+        self.mmap_min_bytes = mmap_min_bytes
+        self.idle_seconds = idle_seconds
+        self._files: OrderedDict[str, SourceFile] = OrderedDict()
+        self._lock = threading.Lock()
+        self._timer: threading.Timer | None = None
+
+    def get(self, path: str | Path) -> SourceFile | None:
+        """Open (or reuse) ``path``; None if it is not a readable regular file."""
+        path_str = os.fspath(path)
+        try:
+            st = os.stat(path_str)
+        except (OSError, ValueError):
+            return None
+        if not stat.S_ISREG(st.st_mode):
+            return None
+        key = (st.st_mtime_ns, st.st_size)
+
+        with self._lock:
+            cached = self._files.get(path_str)
+            if cached is not None and cached.key == key:
+                self._files.move_to_end(path_str)
+                cached.last_used = time.monotonic()
+                return cached
+
+        try:
+            if st.st_size < self.mmap_min_bytes:
+                data: mmap.mmap | bytes = Path(path_str).read_bytes()
+            else:
+                with open(path_str, "rb") as fh:
+                    data = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            logger.debug(f"Cannot open source file {path_str}: {e}")
+            return None
+
+        source = SourceFile(data, key)
+        with self._lock:
+            evicted = [self._files.pop(path_str)] if path_str in self._files else []
+            self._files[path_str] = source
+            while len(self._files) > self.max_files:
+                evicted.append(self._files.popitem(last=False)[1])
+            if source.mapped:
+                self._schedule_release()
+        for old in evicted:
+            old.close()
+        return source
+
+    def _schedule_release(self) -> None:
+        """Arm the idle-mapping timer unless it is already armed (lock held)."""
+        if self.idle_seconds is None or self._timer is not None:
+            return
+        self._timer = threading.Timer(self.idle_seconds, self.release_idle)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def release_idle(self) -> int:
+        """Close mappings unused for ``idle_seconds``. Returns how many."""
+        cutoff = time.monotonic() - (self.idle_seconds or 0.0)
+        with self._lock:
+            self._timer = None
+            idle = [
+                path
+                for path, source in self._files.items()
+                if source.mapped and source.last_used <= cutoff
+            ]
+            released = [self._files.pop(path) for path in idle]
+            if any(source.mapped for source in self._files.values()):
+                self._schedule_release()
+        for source in released:
+            source.close()
+        return len(released)
+
+    def clear(self) -> None:
+        with self._lock:
+            files = list(self._files.values())
+            self._files.clear()
+        for source in files:
+            source.close()
+
+
+_default_cache = SourceCache()
+
+
+def get_source_cache() -> SourceCache:
+    """Process-wide cache shared by snippet extraction and the MCP server."""
+    return _default_cache
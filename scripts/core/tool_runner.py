@@ -72,6 +72,9 @@ class ToolDefinition:
         retries: Number of retry attempts on failure (default: 0)
         ok_return_codes: Tuple of acceptable return codes (default: (0, 1))
         capture_stdout: Whether to capture stdout (default: False, writes to file)
+        env: Extra environment variables for the child process (default: None).
+            Used for values that must not appear on the command line, such as
+            the token for a warm trivy server.
     """
 
     name: str
@@ -81,6 +84,7 @@ class ToolDefinition:
     retries: int | RetryConfig = 0
     ok_return_codes: tuple[int, ...] = (0, 1)
     capture_stdout: bool = False
+    env: dict[str, str] | None = None
 
     @property
     def retry_config(self) -> RetryConfig:
@@ -426,6 +430,8 @@ class ToolRunner:
             child_env["PATH"] = os.pathsep.join(
                 [str(jmo_bin), child_env.get("PATH", "")]
             )
+        if tool.env:
+            child_env.update(tool.env)
 
         while True:
             attempt += 1
@@ -0,0 +1,339 @@
+"""
+Warm tool daemons for a scan session.
+
+Trivy and OPA both have a server mode, and both pay a large fixed cost per
+cold invocation: ``trivy image``/``trivy fs`` re-open and re-index the
+vulnerability DB every time, and ``opa eval`` re-parses and re-compiles the
+policy for every evaluation. With hundreds of images in one run, DB load is
+the bulk of trivy's wall time.
+
+A ``WarmToolPool`` starts each server lazily - on the first invocation that
+could use it - bound to loopback on a free port, and tears it down when the
+session ends. Loopback is reachable by every local user, so each server
+requires a per-session token: trivy's client token, and for OPA bearer-token
+authentication with a ``system.authz`` policy that admits only that token
+(otherwise anyone could ``PUT`` a policy and change what ``jmo policy`` and CI
+gates decide). Callers never depend on a server being there: if a binary is
+missing, fails its health check, or dies mid-session, the pool reports no
+server and the caller runs the tool the ordinary way.
+
+Semgrep is deliberately absent. It has no server or daemon mode to route
+invocations to; its per-run rule parsing is not something a wrapper can keep
+warm.
+
+Usage:
+    >>> with warm_session() as pool:
+    ...     args, env = trivy_client_options()
+    ...     # trivy image ... *args, with env merged into the child environment
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import os
+import secrets
+import socket
+import subprocess
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+from scripts.core.tool_utils import find_tool
+
+logger = logging.getLogger(__name__)
+
+WARM_TOOLS_ENV = "JMO_WARM_TOOLS"
+WARM_TOOLS = ("trivy", "opa")
+
+# trivy server downloads its DB before it reports healthy when no cached copy
+# exists, so the first start on a fresh machine can take well over a minute.
+STARTUP_TIMEOUT = 180.0
+SHUTDOWN_TIMEOUT = 10.0
+_HEALTH_POLL_INTERVAL = 0.2
+
+_HEALTH_PATHS = {"trivy": "/healthz", "opa": "/health"}
+
+# Loaded into the warm OPA server at startup. With --authorization=basic every
+# API call, health checks included, is allowed only if this policy says so.
+_OPA_AUTHZ_POLICY = """package system.authz
+
+default allow := false
+
+allow := equal(input.identity, "{token}")
+"""
+
+
+def warm_tools_requested() -> bool:
+    """Return True if ``JMO_WARM_TOOLS`` asks for warm tool daemons."""
+    return os.getenv(WARM_TOOLS_ENV, "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _free_port() -> int:
+    """Ask the kernel for an unused loopback port."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+def opa_auth_headers(token: str | None) -> dict[str, str]:
+    """HTTP headers that authenticate a request to the warm OPA server."""
+    return {"Authorization": f"Bearer {token}"} if token else {}
+
+
+def _wait_healthy(
+    url: str,
+    process: subprocess.Popen,
+    timeout: float,
+    headers: dict[str, str] | None = None,
+) -> bool:
+    """Poll ``url`` until it answers 200, the process exits, or time runs out."""
+    deadline = time.monotonic() + timeout
+    request = urllib.request.Request(url, headers=headers or {})
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            return False
+        try:
+            # nosec B310 - loopback URL built by this module
+            with urllib.request.urlopen(request, timeout=2) as resp:  # nosec B310
+                if resp.status == 200:
+                    return True
+        except (urllib.error.URLError, OSError):
+            pass
+        time.sleep(_HEALTH_POLL_INTERVAL)
+    return False
+
+
+def _terminate(process: subprocess.Popen) -> None:
+    """Stop a server process, escalating to kill if it ignores SIGTERM."""
+    if process.poll() is not None:
+        return
+    process.terminate()
+    try:
+        process.wait(timeout=SHUTDOWN_TIMEOUT)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait(timeout=SHUTDOWN_TIMEOUT)
+
+
+@dataclass
+class WarmServer:
+    """A running tool server.
+
+    Attributes:
+        tool: Tool name ("trivy" or "opa")
+        url: Base URL, e.g. ``http://127.0.0.1:41234``
+        process: The server process
+        token: Shared secret clients must present
+    """
+
+    tool: str
+    url: str
+    process: subprocess.Popen
+    token: str | None = None
+
+    @property
+    def alive(self) -> bool:
+        """Whether the server process is still running."""
+        return self.process.poll() is None
+
+
+class WarmToolPool:
+    """Lazily started, session-scoped tool servers.
+
+    Thread-safe: scan workers call ``server()`` concurrently, and the first
+    caller for a tool starts it while the others wait for the outcome rather
+    than each cold-starting their own run.
+    """
+
+    def __init__(
+        self,
+        tools: Iterable[str] = WARM_TOOLS,
+        startup_timeout: float = STARTUP_TIMEOUT,
+        find_tool_func: Callable[[str], str | None] = find_tool,
+    ):
+        """
+        Initialize the pool. No process is started until first use.
+
+        Args:
+            tools: Tools allowed to run warm (subset of WARM_TOOLS)
+            startup_timeout: Seconds to wait for a server's health check
+            find_tool_func: Binary lookup (injectable for tests)
+        """
+        self.tools = frozenset(t for t in tools if t in WARM_TOOLS)
+        self.startup_timeout = startup_timeout
+        self._find_tool = find_tool_func
+        self._servers: dict[str, WarmServer] = {}
+        self._unavailable: set[str] = set()
+        self._locks = {tool: threading.Lock() for tool in self.tools}
+        # OPA policies uploaded to the warm server: package -> (path, mtime_ns).
+        # Kept here rather than on PolicyEngine so that every engine sharing
+        # this server agrees on what is loaded into it.
+        self.opa_policies: dict[str, tuple[str, int]] = {}
+        self.opa_lock = threading.Lock()
+        self._closed = False
+
+    def __enter__(self) -> WarmToolPool:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def server(self, tool: str) -> WarmServer | None:
+        """Return the running server for ``tool``, starting it if needed.
+
+        Returns None if the tool is not enabled for warm mode, could not be
+        started, or has died - callers then run the tool cold.
+        """
+        if tool not in self.tools or self._closed:
+            return None
+        with self._locks[tool]:
+            srv = self._servers.get(tool)
+            if srv is not None:
+                if srv.alive:
+                    return srv
+                logger.warning(
+                    "Warm %s server exited (code %s); running %s per invocation "
+                    "for the rest of this session",
+                    tool,
+                    srv.process.returncode,
+                    tool,
+                )
+                del self._servers[tool]
+                self._unavailable.add(tool)
+                return None
+            if tool in self._unavailable:
+                return None
+            srv = self._start(tool)
+            if srv is None:
+                self._unavailable.add(tool)
+            else:
+                self._servers[tool] = srv
+            return srv
+
+    def _start(self, tool: str) -> WarmServer | None:
+        binary = self._find_tool(tool)
+        if binary is None:
+            return None
+
+        # The server is reachable by any local user; the token keeps trivy
+        # from being a free scanning service and OPA's policies from being
+        # replaced by them.
+        token = secrets.token_urlsafe(24)
+        addr = f"127.0.0.1:{_free_port()}"
+        url = f"http://{addr}"
+        # OPA reads its authz policy at startup, before it reports healthy, so
+        # the file (which holds the token) only has to outlive the health check.
+        with tempfile.TemporaryDirectory(prefix="jmo_warm_") as tmp:
+            headers: dict[str, str] = {}
+            if tool == "trivy":
+                cmd = [binary, "server", "--quiet", "--listen", addr]
+                env: dict[str, str] | None = {**os.environ, "TRIVY_TOKEN": token}
+            else:
+                authz = Path(tmp) / "authz.rego"
+                authz.write_text(
+                    _OPA_AUTHZ_POLICY.format(token=token), encoding="utf-8"
+                )
+                cmd = [
+                    binary,
+                    "run",
+                    "--server",
+                    "--addr",
+                    addr,
+                    "--authentication=token",
+                    "--authorization=basic",
+                    "--log-level",
+                    "error",
+                    str(authz),
+                ]
+                env = None
+                headers = opa_auth_headers(token)
+
+            try:
+                process = subprocess.Popen(
+                    cmd,
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    env=env,
+                )
+            except OSError as e:
+                logger.warning(f"Could not start warm {tool} server: {e}")
+                return None
+
+            healthy = _wait_healthy(
+                url + _HEALTH_PATHS[tool], process, self.startup_timeout, headers
+            )
+        if not healthy:
+            _terminate(process)
+            logger.warning(
+                f"Warm {tool} server did not become healthy within "
+                f"{self.startup_timeout:.0f}s; running {tool} per invocation"
+            )
+            return None
+
+        logger.info(f"Started warm {tool} server on {url}")
+        return WarmServer(tool=tool, url=url, process=process, token=token)
+
+    def close(self) -> None:
+        """Stop every server this pool started. Safe to call more than once."""
+        self._closed = True
+        for tool, srv in list(self._servers.items()):
+            try:
+                _terminate(srv.process)
+            except (
+                Exception
+            ) as e:  # Acceptable: shutdown is best-effort — keep stopping the rest
+                logger.debug(f"Error stopping warm {tool} server: {e}")
+        self._servers.clear()
+        self.opa_policies.clear()
+
+
+_active_pool: WarmToolPool | None = None
+
+
+def active_pool() -> WarmToolPool | None:
+    """Return the pool for the current session, if one is active."""
+    return _active_pool
+
+
+@contextlib.contextmanager
+def warm_session(tools: Iterable[str] = WARM_TOOLS, **kwargs) -> Iterator[WarmToolPool]:
+    """Make a WarmToolPool the active pool for the duration of a block.
+
+    If a pool is already active (e.g. ``jmo ci`` runs scan and report in one
+    process) it is reused rather than nested, and left for its owner to close.
+    """
+    global _active_pool
+    if _active_pool is not None:
+        yield _active_pool
+        return
+    pool = WarmToolPool(tools, **kwargs)
+    _active_pool = pool
+    try:
+        yield pool
+    finally:
+        _active_pool = None
+        pool.close()
+
+
+def trivy_client_options() -> tuple[list[str], dict[str, str] | None]:
+    """Return extra trivy arguments and environment for the active server.
+
+    Only meaningful for trivy subcommands that support client mode (``image``,
+    ``fs``, ``repo``, ``rootfs``, ``sbom``); ``config`` and ``k8s`` have no
+    vulnerability DB to share. Returns ``([], None)`` when no warm server is
+    available, leaving the command exactly as it would otherwise be. The
+    token travels in the environment so it never appears in ``ps`` output.
+    """
+    pool = active_pool()
+    srv = pool.server("trivy") if pool is not None else None
+    if srv is None:
+        return [], None
+    env = {"TRIVY_TOKEN": srv.token} if srv.token else None
+    return ["--server", srv.url], env
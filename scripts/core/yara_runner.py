@@ -37,28 +37,41 @@ Code 2 matters as much as the other two. A run that examines nothing produces
 byte-for-byte the same empty finding list as a genuinely clean repository, so
 reporting it as 0 is the inert-scanner bug: trufflehog once reported its version
 correctly while scanning nothing at all, and the ``zero-secrets`` gate passed.
+
+**Caching and parallelism.** Compiling the pinned bundle (310 files, with a
+per-file fallback when any of them fails) happened on every run, and files were
+then matched one at a time on one core. The compiled rules are now saved under
+``~/.jmo/cache/yara`` keyed on the libyara version and every rule file's
+content hash, and loaded with ``yara.load()`` while none of those change. Files
+are matched in chunks on a thread pool - libyara releases the GIL for the whole
+scan, so threads run in parallel and share the one compiled ``Rules`` object,
+which cannot be pickled to a process pool. Each file is hashed as it is read,
+and a per-rule-set result cache maps content hashes to their matches, so a file
+whose bytes were already scanned with the same rules is not scanned again.
 """
 
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
+import mmap
 import os
 import sys
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import Any
 
+from scripts.core.file_inventory import SKIP_DIRS, FileInventory, load_inventory
+
 EXIT_CLEAN = 0
 EXIT_MATCHES = 1
 EXIT_ERROR = 2
 
 RULE_SUFFIXES = (".yar", ".yara")
 
-# Repositories vendor dependencies; scanning node_modules or a bundled venv
-# buries the repo's own findings in third-party noise. Mirrors the set in
-# scripts/cli/scan_jobs/repository_scanner.py.
-SKIP_DIRS = {".git", "node_modules", "vendor", ".venv", "venv"}
-
 # yara on a multi-gigabyte artifact costs minutes and finds nothing a rule set
 # aimed at source trees would catch. Skipped files are counted and reported.
 DEFAULT_MAX_FILE_BYTES = 50 * 1024 * 1024
@@ -71,6 +84,34 @@ DEFAULT_MATCH_TIMEOUT = 60
 # A locked or quarantined file is routine; thousands of them is a broken run.
 MAX_REPORTED_FILE_ERRORS = 10
 
+# Files per worker task. Large enough that scheduling is noise next to
+# matching, small enough that one artifact-heavy directory spreads over workers.
+CHUNK_FILES = 64
+
+# Files at least this large are memory-mapped for hashing and matching instead
+# of being read, so several workers on big artifacts do not each hold a copy.
+MMAP_MIN_BYTES = 1024 * 1024
+
+# Content hashes remembered per rule set; the oldest are dropped beyond this.
+MAX_CACHED_RESULTS = 200_000
+
+# Rule sets kept in the cache. Every bundle update or custom rules_path adds
+# one; the least recently compiled are removed with their result caches.
+MAX_CACHED_RULE_SETS = 4
+
+# One scan outcome per file: (path, content hash, matches, error)
+ScanOutcome = tuple[Path, str | None, list[dict[str, Any]], Exception | None]
+
+
+def default_jobs() -> int:
+    """Matching threads (libyara allows at most 32 concurrent scans)."""
+    return max(1, min(16, os.cpu_count() or 1))
+
+
+def default_cache_dir() -> Path:
+    """Compiled rules and per-file results (~/.jmo/cache/yara)."""
+    return Path.home() / ".jmo" / "cache" / "yara"
+
 
 def _import_yara() -> Any | None:
     """Return the yara module, or None if it is not installed.
@@ -170,6 +211,191 @@ def compile_rules(
         return None, 0, rule_files
 
 
+def rules_cache_key(yara: Any, rule_files: list[Path], rules_root: Path) -> str | None:
+    """Key a compiled rule set by libyara version and rule file contents.
+
+    Namespaces are part of the key because they are part of the compiled
+    rules (and of every match). Returns None if a rule file cannot be read;
+    compilation will report it.
+    """
+    digest = hashlib.sha256(
+        json.dumps([yara.YARA_VERSION, getattr(yara, "__version__", "")]).encode()
+    )
+    for path in rule_files:
+        try:
+            content = path.read_bytes()
+        except OSError:
+            return None
+        digest.update(namespace_for(path, rules_root).encode("utf-8") + b"\0")
+        digest.update(hashlib.sha256(content).digest())
+    return digest.hexdigest()[:32]
+
+
+def _replace_atomically(path: Path, write: Any) -> None:
+    staging = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        write(staging)
+        os.replace(staging, path)
+    finally:
+        staging.unlink(missing_ok=True)
+
+
+def load_or_compile_rules(
+    yara: Any, rule_files: list[Path], rules_root: Path, cache_dir: Path | None
+) -> tuple[Any | None, int, list[Path], str | None]:
+    """``compile_rules`` through the compiled-rules cache in `cache_dir`.
+
+    Returns (Rules or None, compiled count, skipped files, cache key). The key
+    is None when caching is off or the rule set could not be keyed. A cache
+    entry that cannot be loaded - written by another libyara, truncated - is
+    recompiled and overwritten.
+    """
+    key = rules_cache_key(yara, rule_files, rules_root) if cache_dir else None
+    if cache_dir is None or key is None:
+        return (*compile_rules(yara, rule_files, rules_root), None)
+
+    compiled_path = cache_dir / f"{key}.yarc"
+    meta_path = cache_dir / f"{key}.json"
+    try:
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        rules = yara.load(filepath=str(compiled_path))
+        skipped_names = set(meta["skipped"])
+        skipped = [
+            p for p in rule_files if namespace_for(p, rules_root) in skipped_names
+        ]
+        return rules, int(meta["compiled"]), skipped, key
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError, KeyError, TypeError, yara.Error) as exc:
+        _log(f"yara: ignoring unusable compiled-rules cache {compiled_path}: {exc}")
+
+    rules, compiled, skipped = compile_rules(yara, rule_files, rules_root)
+    if rules is not None:
+        meta = {
+            "compiled": compiled,
+            "skipped": [namespace_for(p, rules_root) for p in skipped],
+        }
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            _replace_atomically(
+                compiled_path, lambda tmp: rules.save(filepath=str(tmp))
+            )
+            _replace_atomically(
+                meta_path,
+                lambda tmp: tmp.write_text(json.dumps(meta), encoding="utf-8"),
+            )
+        except (OSError, yara.Error) as exc:
+            _log(f"yara: could not cache compiled rules in {cache_dir}: {exc}")
+        else:
+            _prune_rule_sets(cache_dir)
+    return rules, compiled, skipped, key
+
+
+def _prune_rule_sets(cache_dir: Path) -> None:
+    """Keep the MAX_CACHED_RULE_SETS most recently compiled rule sets."""
+    try:
+        compiled = sorted(
+            cache_dir.glob("*.yarc"), key=lambda p: p.stat().st_mtime, reverse=True
+        )
+        for stale in compiled[MAX_CACHED_RULE_SETS:]:
+            for suffix in (".yarc", ".json", ".results.json"):
+                (cache_dir / f"{stale.stem}{suffix}").unlink(missing_ok=True)
+    except OSError as exc:
+        _log(f"yara: could not prune {cache_dir}: {exc}")
+
+
+def load_result_cache(path: Path) -> dict[str, list[dict[str, Any]]]:
+    """Matches by content hash for one rule set; empty if absent or unreadable."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as exc:
+        _log(f"yara: ignoring unreadable result cache {path}: {exc}")
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def save_result_cache(path: Path, results: dict[str, list[dict[str, Any]]]) -> None:
+    """Write `results`, keeping the newest MAX_CACHED_RESULTS entries."""
+    if len(results) > MAX_CACHED_RESULTS:
+        results = dict(list(results.items())[-MAX_CACHED_RESULTS:])
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _replace_atomically(
+            path,
+            lambda tmp: tmp.write_text(
+                json.dumps(results, separators=(",", ":")), encoding="utf-8"
+            ),
+        )
+    except OSError as exc:
+        _log(f"yara: could not write result cache {path}: {exc}")
+
+
+def _scan_chunk(
+    yara: Any,
+    rules: Any,
+    timeout: int,
+    known: dict[str, list[dict[str, Any]]],
+    chunk: list[Path],
+) -> list[ScanOutcome]:
+    """Hash and match each file in `chunk`, answering from `known` when possible.
+
+    The file is read (or mapped, from MMAP_MIN_BYTES) once for both the hash
+    and the match. Matches carry no "file" key; the caller adds it.
+    """
+    outcomes: list[ScanOutcome] = []
+    for path in chunk:
+        data: bytes | mmap.mmap = b""
+        try:
+            with open(path, "rb") as fh:
+                if os.fstat(fh.fileno()).st_size >= MMAP_MIN_BYTES:
+                    data = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+                else:
+                    data = fh.read()
+            content_hash = hashlib.blake2b(data, digest_size=16).hexdigest()
+            found = known.get(content_hash)
+            if found is None:
+                found = []
+                for match in rules.match(data=data, timeout=timeout):
+                    fields = match_to_dict(match, path)
+                    del fields["file"]
+                    found.append(fields)
+            outcomes.append((path, content_hash, found, None))
+        except (yara.Error, OSError, ValueError) as exc:
+            outcomes.append((path, None, [], exc))
+        finally:
+            if isinstance(data, mmap.mmap):
+                data.close()
+    return outcomes
+
+
+def scan_files(
+    yara: Any,
+    rules: Any,
+    files: list[Path],
+    timeout: int,
+    jobs: int,
+    known: dict[str, list[dict[str, Any]]] | None = None,
+) -> Iterator[ScanOutcome]:
+    """Match `files` in CHUNK_FILES chunks on up to `jobs` threads.
+
+    Outcomes are yielded in `files` order whatever order the chunks finish in,
+    so the output JSON does not depend on scheduling.
+    """
+    chunks = [files[i : i + CHUNK_FILES] for i in range(0, len(files), CHUNK_FILES)]
+    scan = partial(_scan_chunk, yara, rules, timeout, known or {})
+    if jobs <= 1 or len(chunks) <= 1:
+        for chunk in chunks:
+            yield from scan(chunk)
+        return
+    with ThreadPoolExecutor(
+        max_workers=min(jobs, len(chunks)), thread_name_prefix="yara"
+    ) as pool:
+        for outcomes in pool.map(scan, chunks):
+            yield from outcomes
+
+
 def iter_target_files(target: Path, max_bytes: int) -> tuple[list[Path], int]:
     """Walk `target`, pruning vendored trees. Returns (files, skipped_too_large).
 
@@ -198,6 +424,32 @@ def iter_target_files(target: Path, max_bytes: int) -> tuple[list[Path], int]:
     return sorted(files), too_large
 
 
+def inventory_target_files(
+    inventory: FileInventory, target: Path, max_bytes: int
+) -> tuple[list[Path], int] | None:
+    """Answer ``iter_target_files`` from a saved file inventory, without a walk.
+
+    Returns None when the inventory does not describe `target` - a stale file
+    from another checkout must not stand in for this one - so the caller falls
+    back to walking. Sizes come from the inventory's own stat(), taken moments
+    earlier in the same scan; files that stat() failed on are counted with the
+    too-large ones, as the walk counts them.
+    """
+    try:
+        if Path(inventory.root).resolve() != target.resolve():
+            return None
+    except OSError:
+        return None
+    files: list[Path] = []
+    too_large = inventory.unreadable
+    for entry in inventory.files():
+        if entry.size > max_bytes:
+            too_large += 1
+            continue
+        files.append(target / entry.path)
+    return files, too_large
+
+
 def match_to_dict(match: Any, path: Path) -> dict[str, Any]:
     """Shape one libyara Match into what yara_adapter._load_yara_internal reads.
 
@@ -232,12 +484,33 @@ def _parse_args(argv: list[str] | None) -> argparse.Namespace:
         default=DEFAULT_MATCH_TIMEOUT,
         help=f"Per-file match timeout in seconds (default: {DEFAULT_MATCH_TIMEOUT})",
     )
+    parser.add_argument(
+        "--inventory",
+        default=None,
+        help="File inventory written by the scan; skips walking the target",
+    )
     parser.add_argument(
         "--max-file-bytes",
         type=int,
         default=DEFAULT_MAX_FILE_BYTES,
         help=f"Skip files larger than this (default: {DEFAULT_MAX_FILE_BYTES})",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=default_jobs(),
+        help="Files matched concurrently (default: CPU count, at most 16)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help="Compiled-rules and result cache (default: ~/.jmo/cache/yara)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Compile the rules and scan every file afresh; write no cache",
+    )
     return parser.parse_args(argv)
 
 
@@ -273,7 +546,12 @@ def main(argv: list[str] | None = None) -> int:
         )
         return EXIT_ERROR
 
-    rules, compiled, skipped = compile_rules(yara, rule_files, rules_root)
+    cache_dir = None
+    if not args.no_cache:
+        cache_dir = Path(args.cache_dir) if args.cache_dir else default_cache_dir()
+    rules, compiled, skipped, rules_key = load_or_compile_rules(
+        yara, rule_files, rules_root, cache_dir
+    )
     if rules is None or compiled == 0:
         _log(
             f"yara: 0 of {len(rule_files)} rule file(s) compiled - nothing was "
@@ -285,15 +563,29 @@ def main(argv: list[str] | None = None) -> int:
             f"yara: compiled {compiled} rule file(s), skipped {len(skipped)} that would not build"
         )
 
-    files, unreadable = iter_target_files(target, args.max_file_bytes)
+    listed = None
+    if args.inventory:
+        inventory = load_inventory(Path(args.inventory))
+        if inventory is not None:
+            listed = inventory_target_files(inventory, target, args.max_file_bytes)
+    if listed is None:
+        listed = iter_target_files(target, args.max_file_bytes)
+    files, unreadable = listed
+
+    results_path = None
+    known: dict[str, list[dict[str, Any]]] = {}
+    if cache_dir is not None and rules_key is not None:
+        results_path = cache_dir / f"{rules_key}.results.json"
+        known = load_result_cache(results_path)
 
     matches: list[dict[str, Any]] = []
+    results: dict[str, list[dict[str, Any]]] = {}
     errored = 0
-    for path in files:
-        try:
-            for match in rules.match(filepath=str(path), timeout=args.timeout):
-                matches.append(match_to_dict(match, path))
-        except (yara.Error, OSError) as exc:
+    cached = 0
+    for path, content_hash, found, exc in scan_files(
+        yara, rules, files, args.timeout, args.jobs, known
+    ):
+        if exc is not None:
             # A single unscannable file must not abort the run, but it must not
             # vanish either. Naming the reason is not decoration: an early
             # version of this loop counted errors without printing them, and
@@ -303,6 +595,16 @@ def main(argv: list[str] | None = None) -> int:
             errored += 1
             if errored <= MAX_REPORTED_FILE_ERRORS:
                 _log(f"yara: could not scan {path}: {exc}")
+            continue
+        if content_hash is not None:
+            cached += content_hash in known
+            results[content_hash] = found
+        matches.extend({**match, "file": str(path)} for match in found)
+
+    if results_path is not None and not results.keys() <= known.keys():
+        for content_hash in results:
+            known.pop(content_hash, None)
+        save_result_cache(results_path, {**known, **results})
 
     scanned = len(files) - errored
     if files and scanned == 0:
@@ -321,7 +623,8 @@ def main(argv: list[str] | None = None) -> int:
     _log(
         f"yara: scanned {scanned} of {len(files)} file(s) with {compiled} rule "
         f"file(s); {len(matches)} match(es), {unreadable} skipped as too large "
-        f"or unreadable, {errored} errored"
+        f"or unreadable, {errored} errored, {cached} unchanged since a "
+        "cached scan"
     )
     return EXIT_MATCHES if matches else EXIT_CLEAN
 
@@ -26,7 +26,9 @@ export default function App() {
   const [selectedScanId, setSelectedScanId] = useState<string | null>(null)
   const [baselineScanId, setBaselineScanId] = useState<string | null>(null)
   const { scans } = useScanHistory()
-  const { findings, loading, error } = useFindings(selectedScanId)
+  const { findings, loading, error, manifest, pagesLoaded } = useFindings(selectedScanId)
+  // Paged mode: pages still arriving in the background
+  const pagesPending = manifest !== null && pagesLoaded < manifest.pages.length
 
   // Load baseline findings for diff mode
   const { findings: baselineFindings } = useFindings(baselineScanId)
@@ -310,7 +312,9 @@ export default function App() {
                           {sev}
                           {isActive && (
                             <span className="ml-2 font-bold">
-                              ({findings.filter((f) => f.severity === sev).length})
+                              ({pagesPending
+                                ? manifest?.facets.severity[sev] ?? 0
+                                : findings.filter((f) => f.severity === sev).length})
                             </span>
                           )}
                         </button>
@@ -353,7 +357,12 @@ export default function App() {
                   {/* Count Badge */}
                   <div className="text-sm text-gray-600 dark:text-gray-400 whitespace-nowrap">
                     Showing <span className="font-bold">{filteredFindings.length}</span> of{' '}
-                    <span className="font-bold">{findings.length}</span>
+                    <span className="font-bold">{pagesPending ? manifest?.total : findings.length}</span>
+                    {pagesPending && (
+                      <span className="ml-2 text-xs" aria-live="polite">
+                        (loading page {pagesLoaded + 1} of {manifest?.pages.length})
+                      </span>
+                    )}
                   </div>
                 </div>
               </div>
@@ -1,18 +1,74 @@
 import { useState, useEffect } from 'react'
-import { CommonFinding } from '../types/findings'
+import { CommonFinding, DashboardManifest } from '../types/findings'
+
+/**
+ * Fetch one page of paged dashboard data.
+ *
+ * Gzip pages are inflated here unless the server already decoded them
+ * (Content-Encoding), which is detected from the gzip magic bytes.
+ */
+async function fetchPage(url: string, compression: string): Promise<CommonFinding[]> {
+  const response = await fetch(url)
+  if (!response.ok) {
+    throw new Error(`Failed to load ${url}: HTTP ${response.status}`)
+  }
+  if (compression !== 'gzip') {
+    return response.json()
+  }
+  const bytes = new Uint8Array(await response.arrayBuffer())
+  if (bytes[0] !== 0x1f || bytes[1] !== 0x8b) {
+    return JSON.parse(new TextDecoder().decode(bytes))
+  }
+  const stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream('gzip'))
+  return JSON.parse(await new Response(stream).text())
+}
 
 /**
  * Hook to load findings from current scan or historical scan
  *
+ * In paged mode (window.__FINDINGS_MANIFEST__ set by html_reporter.py) the
+ * manifest is fetched first and pages are appended one at a time, most
+ * urgent findings first; `loading` clears as soon as the first page arrives.
+ *
  * @param scanId - Optional scan ID to load historical findings
- * @returns {findings, loading, error}
+ * @returns {findings, loading, error, manifest, pagesLoaded}
  */
 export function useFindings(scanId: string | null = null) {
   const [findings, setFindings] = useState<CommonFinding[]>([])
   const [loading, setLoading] = useState(true)
   const [error, setError] = useState<string | null>(null)
+  const [manifest, setManifest] = useState<DashboardManifest | null>(null)
+  const [pagesLoaded, setPagesLoaded] = useState(0)
 
   useEffect(() => {
+    // Stop appending pages once the scan changes or the component unmounts
+    let cancelled = false
+
+    const loadPages = async (manifestUrl: string) => {
+      const response = await fetch(manifestUrl)
+      if (!response.ok) {
+        throw new Error(`HTTP ${response.status}: ${response.statusText}`)
+      }
+      const pageManifest: DashboardManifest = await response.json()
+      if (pageManifest.format !== 'jmo-dashboard-pages') {
+        throw new Error('Invalid dashboard manifest format')
+      }
+      if (cancelled) return
+      setManifest(pageManifest)
+      setFindings([])
+      setPagesLoaded(0)
+
+      const base = manifestUrl.slice(0, manifestUrl.lastIndexOf('/') + 1)
+      for (const [index, page] of pageManifest.pages.entries()) {
+        const pageFindings = await fetchPage(base + page.file, pageManifest.compression)
+        if (cancelled) return
+        setFindings(prev => prev.concat(pageFindings))
+        setPagesLoaded(index + 1)
+        if (index === 0) setLoading(false)
+      }
+      setLoading(false)
+    }
+
     const loadFindings = async () => {
       try {
         // If scanId provided, load historical findings
@@ -45,6 +101,13 @@ export function useFindings(scanId: string | null = null) {
           return
         }
 
+        // Paged mode: manifest + priority-sorted pages
+        const manifestUrl = (window as any).__FINDINGS_MANIFEST__
+        if (typeof manifestUrl === 'string' && manifestUrl) {
+          await loadPages(manifestUrl)
+          return
+        }
+
         // External mode: fetch dashboard-data.json (separate from metadata-wrapped findings.json)
         const response = await fetch('dashboard-data.json')
         if (!response.ok) {
@@ -66,6 +129,7 @@ export function useFindings(scanId: string | null = null) {
 
         setLoading(false)
       } catch (err) {
+        if (cancelled) return
         console.error('Failed to load findings:', err)
         setError(err instanceof Error ? err.message : 'Unknown error')
         setLoading(false)
@@ -73,7 +137,10 @@ export function useFindings(scanId: string | null = null) {
     }
 
     loadFindings()
+    return () => {
+      cancelled = true
+    }
   }, [scanId]) // Re-run when scanId changes
 
-  return { findings, loading, error }
+  return { findings, loading, error, manifest, pagesLoaded }
 }
@@ -103,6 +103,29 @@ export interface FindingsWrapper {
   findings: CommonFinding[]
 }
 
+// Paged dashboard data (scripts/core/reporters/dashboard_pages.py)
+export interface DashboardPage {
+  file: string
+  count: number
+}
+
+export interface DashboardManifest {
+  format: 'jmo-dashboard-pages'
+  version: number
+  total: number
+  pageSize: number
+  compression: 'gzip' | 'none'
+  sort: 'priority'
+  facets: {
+    severity: Record<string, number>
+    tool: Record<string, number>
+    path: Record<string, number>
+    rule: Record<string, number>
+  }
+  facetCardinality: Record<string, number>
+  pages: DashboardPage[]
+}
+
 // SQLite History Types (v1.0.0)
 export interface ScanMetadata {
   scan_id: string
@@ -0,0 +1,280 @@
+import { renderHook, waitFor, act } from '@testing-library/react'
+import { Blob as NodeBlob } from 'buffer'
+import { DecompressionStream as NodeDecompressionStream } from 'stream/web'
+import { TextDecoder as NodeTextDecoder } from 'util'
+import { gzipSync } from 'zlib'
+import { useFindings } from '../../src/hooks/useFindings'
+import { CommonFinding, DashboardManifest } from '../../src/types/findings'
+
+const MANIFEST_URL = 'dashboard-data/manifest.json'
+
+const createFinding = (id: string): CommonFinding => ({
+  schemaVersion: '1.2.0',
+  id,
+  ruleId: 'rule',
+  severity: 'HIGH',
+  tool: { name: 'semgrep', version: '1.0.0' },
+  location: { path: 'app.py', startLine: 1 },
+  message: `finding ${id}`,
+})
+
+const createManifest = (
+  compression: 'gzip' | 'none',
+  files: string[],
+  overrides: Partial<DashboardManifest> = {}
+): DashboardManifest => ({
+  format: 'jmo-dashboard-pages',
+  version: 1,
+  total: files.length,
+  pageSize: 1,
+  compression,
+  sort: 'priority',
+  facets: { severity: {}, tool: {}, path: {}, rule: {} },
+  facetCardinality: {},
+  pages: files.map(file => ({ file, count: 1 })),
+  ...overrides,
+})
+
+const jsonResponse = (body: unknown) => ({
+  ok: true,
+  status: 200,
+  statusText: 'OK',
+  json: async () => body,
+})
+
+const bytesResponse = (bytes: Uint8Array) => ({
+  ok: true,
+  status: 200,
+  statusText: 'OK',
+  arrayBuffer: async () => Uint8Array.from(bytes).buffer,
+})
+
+const notFound = { ok: false, status: 404, statusText: 'Not Found' }
+
+function deferred<T>() {
+  let resolve!: (value: T) => void
+  const promise = new Promise<T>(r => {
+    resolve = r
+  })
+  return { promise, resolve }
+}
+
+// Route fetch() by URL; a route may be a pending promise to hold a page back
+function mockFetch(routes: Record<string, unknown>) {
+  const fetchMock = jest.fn((url: string) =>
+    Promise.resolve(url in routes ? routes[url] : notFound)
+  )
+  globalThis.fetch = fetchMock as unknown as typeof fetch
+  return fetchMock
+}
+
+const ids = (findings: CommonFinding[]) => findings.map(f => f.id)
+
+// jsdom lacks the stream parts of the Fetch API; use Node's implementations
+const inflated: string[] = []
+
+class CountingDecompressionStream extends NodeDecompressionStream {
+  constructor(format: 'gzip' | 'deflate' | 'deflate-raw') {
+    super(format)
+    inflated.push(format)
+  }
+}
+
+class StreamResponse {
+  constructor(private readonly body: ReadableStream<Uint8Array>) {}
+
+  async text(): Promise<string> {
+    const chunks: Buffer[] = []
+    const reader = this.body.getReader()
+    for (let read = await reader.read(); !read.done; read = await reader.read()) {
+      chunks.push(Buffer.from(read.value))
+    }
+    return Buffer.concat(chunks).toString('utf-8')
+  }
+}
+
+describe('useFindings', () => {
+  const originals: Record<string, unknown> = {}
+  const polyfills: Record<string, unknown> = {
+    Blob: NodeBlob,
+    DecompressionStream: CountingDecompressionStream,
+    Response: StreamResponse,
+    TextDecoder: NodeTextDecoder,
+  }
+  const originalFetch = globalThis.fetch
+
+  beforeAll(() => {
+    for (const name of Object.keys(polyfills)) {
+      originals[name] = (globalThis as any)[name]
+      ;(globalThis as any)[name] = polyfills[name]
+    }
+  })
+
+  afterAll(() => {
+    for (const name of Object.keys(originals)) {
+      ;(globalThis as any)[name] = originals[name]
+    }
+    globalThis.fetch = originalFetch
+  })
+
+  beforeEach(() => {
+    inflated.length = 0
+    ;(window as any).__FINDINGS__ = []
+    ;(window as any).__FINDINGS_MANIFEST__ = MANIFEST_URL
+    jest.spyOn(console, 'error').mockImplementation(() => {})
+  })
+
+  afterEach(() => {
+    delete (window as any).__FINDINGS__
+    delete (window as any).__FINDINGS_MANIFEST__
+    jest.restoreAllMocks()
+  })
+
+  describe('Paged mode', () => {
+    it('should fetch the manifest, then append pages in order', async () => {
+      const fetchMock = mockFetch({
+        [MANIFEST_URL]: jsonResponse(
+          createManifest('none', ['page-00000.json', 'page-00001.json'])
+        ),
+        'dashboard-data/page-00000.json': jsonResponse([createFinding('a'), createFinding('b')]),
+        'dashboard-data/page-00001.json': jsonResponse([createFinding('c')]),
+      })
+
+      const { result } = renderHook(() => useFindings())
+
+      await waitFor(() => expect(result.current.pagesLoaded).toBe(2))
+      expect(ids(result.current.findings)).toEqual(['a', 'b', 'c'])
+      expect(result.current.manifest?.pages).toHaveLength(2)
+      expect(result.current.loading).toBe(false)
+      expect(result.current.error).toBeNull()
+      expect(fetchMock.mock.calls.map(call => call[0])).toEqual([
+        MANIFEST_URL,
+        'dashboard-data/page-00000.json',
+        'dashboard-data/page-00001.json',
+      ])
+    })
+
+    it('should stop loading as soon as the first page arrives', async () => {
+      const second = deferred<unknown>()
+      mockFetch({
+        [MANIFEST_URL]: jsonResponse(
+          createManifest('none', ['page-00000.json', 'page-00001.json'])
+        ),
+        'dashboard-data/page-00000.json': jsonResponse([createFinding('a')]),
+        'dashboard-data/page-00001.json': second.promise,
+      })
+
+      const { result } = renderHook(() => useFindings())
+
+      await waitFor(() => expect(result.current.pagesLoaded).toBe(1))
+      expect(result.current.loading).toBe(false)
+      expect(ids(result.current.findings)).toEqual(['a'])
+
+      await act(async () => {
+        second.resolve(jsonResponse([createFinding('b')]))
+      })
+      await waitFor(() => expect(result.current.pagesLoaded).toBe(2))
+      expect(ids(result.current.findings)).toEqual(['a', 'b'])
+    })
+
+    it('should inflate gzip pages', async () => {
+      mockFetch({
+        [MANIFEST_URL]: jsonResponse(createManifest('gzip', ['page-00000.json.gz'])),
+        'dashboard-data/page-00000.json.gz': bytesResponse(
+          gzipSync(JSON.stringify([createFinding('a'), createFinding('b')]))
+        ),
+      })
+
+      const { result } = renderHook(() => useFindings())
+
+      await waitFor(() => expect(result.current.pagesLoaded).toBe(1))
+      expect(ids(result.current.findings)).toEqual(['a', 'b'])
+      expect(inflated).toEqual(['gzip'])
+    })
+
+    it('should not inflate gzip pages the server already decoded', async () => {
+      // Served with Content-Encoding: gzip, so fetch() hands back plain JSON
+      mockFetch({
+        [MANIFEST_URL]: jsonResponse(createManifest('gzip', ['page-00000.json.gz'])),
+        'dashboard-data/page-00000.json.gz': bytesResponse(
+          Buffer.from(JSON.stringify([createFinding('a')]))
+        ),
+      })
+
+      const { result } = renderHook(() => useFindings())
+
+      await waitFor(() => expect(result.current.pagesLoaded).toBe(1))
+      expect(ids(result.current.findings)).toEqual(['a'])
+      expect(inflated).toEqual([])
+    })
+
+    it('should report an invalid manifest', async () => {
+      mockFetch({
+        [MANIFEST_URL]: jsonResponse(
+          createManifest('none', [], { format: 'other' as DashboardManifest['format'] })
+        ),
+      })
+
+      const { result } = renderHook(() => useFindings())
+
+      await waitFor(() => expect(result.current.loading).toBe(false))
+      expect(result.current.error).toBe('Invalid dashboard manifest format')
+      expect(result.current.manifest).toBeNull()
+    })
+
+    it('should report a page that fails to load', async () => {
+      mockFetch({
+        [MANIFEST_URL]: jsonResponse(createManifest('none', ['page-00000.json'])),
+      })
+
+      const { result } = renderHook(() => useFindings())
+
+      await waitFor(() => expect(result.current.error).not.toBeNull())
+      expect(result.current.error).toBe(
+        'Failed to load dashboard-data/page-00000.json: HTTP 404'
+      )
+      expect(result.current.loading).toBe(false)
+    })
+
+    it('should stop fetching pages once unmounted', async () => {
+      const first = deferred<unknown>()
+      const fetchMock = mockFetch({
+        [MANIFEST_URL]: jsonResponse(
+          createManifest('none', ['page-00000.json', 'page-00001.json'])
+        ),
+        'dashboard-data/page-00000.json': first.promise,
+        'dashboard-data/page-00001.json': jsonResponse([createFinding('b')]),
+      })
+
+      const { result, unmount } = renderHook(() => useFindings())
+      await waitFor(() => expect(result.current.manifest).not.toBeNull())
+
+      unmount()
+      await act(async () => {
+        first.resolve(jsonResponse([createFinding('a')]))
+        await new Promise(resolve => setTimeout(resolve, 0))
+      })
+
+      expect(fetchMock.mock.calls.map(call => call[0])).toEqual([
+        MANIFEST_URL,
+        'dashboard-data/page-00000.json',
+      ])
+      expect(result.current.findings).toEqual([])
+      expect(result.current.pagesLoaded).toBe(0)
+    })
+  })
+
+  describe('Inline mode', () => {
+    it('should use embedded findings without fetching', async () => {
+      const fetchMock = mockFetch({})
+      ;(window as any).__FINDINGS__ = [createFinding('a')]
+
+      const { result } = renderHook(() => useFindings())
+
+      await waitFor(() => expect(result.current.loading).toBe(false))
+      expect(ids(result.current.findings)).toEqual(['a'])
+      expect(result.current.manifest).toBeNull()
+      expect(fetchMock).not.toHaveBeenCalled()
+    })
+  })
+})
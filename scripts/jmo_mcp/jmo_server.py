@@ -7,7 +7,7 @@ to query security findings and suggest fixes.
 
 Architecture:
 - Framework: MCPServer (Official Anthropic SDK; named FastMCP before mcp 2.0)
-- Tools: get_security_findings, apply_fix, mark_resolved
+- Tools: get_security_findings, apply_fix, mark_resolved, get_findings_context
 - Resources: finding://{id} for full context
 - Transport: stdio, HTTP, SSE
 
@@ -25,6 +25,12 @@ Environment Variables:
     JMO_MCP_RATE_LIMIT_ENABLED: Enable rate limiting (default: true)
     JMO_MCP_RATE_LIMIT_CAPACITY: Burst capacity in requests (default: 100)
     JMO_MCP_RATE_LIMIT_REFILL_RATE: Tokens per second (default: 1.67 = 100/min)
+    JMO_MCP_RATE_LIMIT_MAX_CLIENTS: Client buckets kept in memory (default: 10000)
+    JMO_MCP_RATE_LIMIT_STATE: JSON file persisting rate limits across restarts (optional)
+    JMO_MCP_ASYNC: Register async tool handlers and watch findings.json (default: false)
+    JMO_MCP_IO_WORKERS: Async mode threads for file I/O (default: 8)
+    JMO_MCP_DB_WORKERS: Async mode threads for SQLite queries (default: 4)
+    JMO_MCP_WATCH_INTERVAL: Async mode findings.json poll interval in seconds (default: 2)
 """
 
 from __future__ import annotations
@@ -52,8 +58,16 @@ except ImportError:
         "  uv add 'mcp[cli]>=1.0.0'"
     )
 
+from scripts.core.sbom_index import PACKAGE_SCANNERS, SbomIndexSet, match_package
+from scripts.jmo_mcp.utils.async_runtime import (
+    DEFAULT_DB_WORKERS,
+    DEFAULT_IO_WORKERS,
+    DEFAULT_WATCH_INTERVAL,
+    AsyncToolRunner,
+    FindingsWatcher,
+)
 from scripts.jmo_mcp.utils.findings_loader import FindingsLoader
-from scripts.jmo_mcp.utils.rate_limiter import RateLimiter
+from scripts.jmo_mcp.utils.rate_limiter import DEFAULT_MAX_CLIENTS, RateLimiter
 from scripts.jmo_mcp.utils.source_context import SourceContextExtractor
 
 # Configure logging
@@ -78,6 +92,16 @@ API_KEYS_HASHED = [
 RATE_LIMIT_ENABLED = os.getenv("JMO_MCP_RATE_LIMIT_ENABLED", "true").lower() == "true"
 RATE_LIMIT_CAPACITY = int(os.getenv("JMO_MCP_RATE_LIMIT_CAPACITY", "100"))
 RATE_LIMIT_REFILL_RATE = float(os.getenv("JMO_MCP_RATE_LIMIT_REFILL_RATE", "1.67"))
+RATE_LIMIT_MAX_CLIENTS = int(
+    os.getenv("JMO_MCP_RATE_LIMIT_MAX_CLIENTS", str(DEFAULT_MAX_CLIENTS))
+)
+RATE_LIMIT_STATE = os.getenv("JMO_MCP_RATE_LIMIT_STATE") or None
+
+# Async mode configuration
+ASYNC_MODE = os.getenv("JMO_MCP_ASYNC", "false").lower() == "true"
+IO_WORKERS = int(os.getenv("JMO_MCP_IO_WORKERS", str(DEFAULT_IO_WORKERS)))
+DB_WORKERS = int(os.getenv("JMO_MCP_DB_WORKERS", str(DEFAULT_DB_WORKERS)))
+WATCH_INTERVAL = float(os.getenv("JMO_MCP_WATCH_INTERVAL", str(DEFAULT_WATCH_INTERVAL)))
 
 logger.info("MCP Server initialized")
 logger.info(f"Results directory: {RESULTS_DIR.resolve()}")
@@ -89,6 +113,10 @@ logger.info(
     f"Rate limiting: {'enabled' if RATE_LIMIT_ENABLED else 'disabled'} "
     f"(capacity={RATE_LIMIT_CAPACITY}, refill_rate={RATE_LIMIT_REFILL_RATE}/s)"
 )
+logger.info(
+    f"Async mode: {'enabled' if ASYNC_MODE else 'disabled'}"
+    + (f" (io_workers={IO_WORKERS}, db_workers={DB_WORKERS})" if ASYNC_MODE else "")
+)
 
 # Initialize MCP server
 mcp = MCPServer("JMo Security")
@@ -96,14 +124,56 @@ mcp = MCPServer("JMo Security")
 # Initialize utilities (lazy-loaded on first use to handle missing files gracefully)
 _findings_loader: FindingsLoader | None = None
 _context_extractor: SourceContextExtractor | None = None
+# (findings.json mtime/size it was opened for, indexes or None if unavailable)
+_sbom_indexes: tuple[tuple[int, int], SbomIndexSet | None] | None = None
+
+# Packages listed per finding file in context responses
+MAX_SBOM_PACKAGES = 50
 
 # Initialize rate limiter (if enabled)
 rate_limiter = (
-    RateLimiter(capacity=RATE_LIMIT_CAPACITY, refill_rate=RATE_LIMIT_REFILL_RATE)
+    RateLimiter(
+        capacity=RATE_LIMIT_CAPACITY,
+        refill_rate=RATE_LIMIT_REFILL_RATE,
+        max_clients=RATE_LIMIT_MAX_CLIENTS,
+        state_file=RATE_LIMIT_STATE,
+    )
     if RATE_LIMIT_ENABLED
     else None
 )
 
+# Async mode: tools run on bounded executors; findings.json is watched
+_async_runner = (
+    AsyncToolRunner(io_workers=IO_WORKERS, db_workers=DB_WORKERS)
+    if ASYNC_MODE
+    else None
+)
+_findings_watcher: FindingsWatcher | None = None
+
+
+def _tool(pool: str = "io"):
+    """Register a tool with MCP, as a coroutine on ``pool`` in async mode.
+
+    The undecorated function is returned either way, so it stays directly
+    callable (and testable) as a plain function.
+    """
+
+    def register(func):
+        mcp.tool()(_async_runner.wrap(func, pool) if _async_runner else func)
+        return func
+
+    return register
+
+
+def _resource(uri: str, pool: str = "io"):
+    """Register a resource template, as a coroutine in async mode."""
+
+    def register(func):
+        mcp.resource(uri)(_async_runner.wrap(func, pool) if _async_runner else func)
+        return func
+
+    return register
+
 
 def require_auth_and_rate_limit(func):
     """
@@ -168,12 +238,66 @@ def get_context_extractor() -> SourceContextExtractor:
     return _context_extractor
 
 
+def get_sbom_indexes() -> SbomIndexSet | None:
+    """Get the per-target SBOM indexes, reopened after each new report (lazy loading)"""
+    global _sbom_indexes
+    stat = (RESULTS_DIR / "summaries" / "findings.json").stat()
+    key = (stat.st_mtime_ns, stat.st_size)
+    if _sbom_indexes is None or _sbom_indexes[0] != key:
+        # Superseded connections are left to the garbage collector: another
+        # thread may still be querying them
+        _sbom_indexes = (key, SbomIndexSet.open(RESULTS_DIR))
+    return _sbom_indexes[1]
+
+
+def _sbom_context(finding: dict) -> dict | None:
+    """SBOM packages for a finding: the one it concerns and those in its file."""
+    try:
+        sbom = get_sbom_indexes()
+    except OSError as e:
+        logger.debug(f"SBOM indexes unavailable: {e}")
+        return None
+    if sbom is None or not sbom.indexes:
+        return None
+
+    tool = finding.get("tool", {}).get("name")
+    path = finding.get("location", {}).get("path", "")
+    return {
+        "package": match_package(finding, sbom) if tool in PACKAGE_SCANNERS else None,
+        "packages_in_file": sbom.packages_at(path)[:MAX_SBOM_PACKAGES] if path else [],
+    }
+
+
+def start_background_tasks() -> None:
+    """Start the findings.json watcher (async mode only)."""
+    global _findings_watcher
+    if not ASYNC_MODE or _findings_watcher is not None:
+        return
+    _findings_watcher = FindingsWatcher(get_findings_loader, interval=WATCH_INTERVAL)
+    _findings_watcher.start()
+
+
+def stop_background_tasks() -> None:
+    """Stop the watcher, release the async executors and save rate limits."""
+    global _findings_watcher
+    if _findings_watcher is not None:
+        _findings_watcher.stop()
+        _findings_watcher = None
+    if _async_runner is not None:
+        _async_runner.shutdown()
+    if rate_limiter is not None and rate_limiter.state_file is not None:
+        try:
+            rate_limiter.save_state()
+        except OSError as e:
+            logger.warning(f"Could not save rate limiter state: {e}")
+
+
 # ============================================================================
 # MCP Tools (Functions callable by AI agents)
 # ============================================================================
 
 
-@mcp.tool()
+@_tool()
 @require_auth_and_rate_limit
 def get_security_findings(
     severity: list[str] | None = None,
@@ -226,11 +350,9 @@ def get_security_findings(
     """
     try:
         loader = get_findings_loader()
-        all_findings = loader.load_findings()
 
-        # Apply filters
-        filtered = loader.filter_findings(
-            all_findings,
+        # Page and total matching (before pagination) from the cached index
+        filtered, total_matching = loader.query(
             severity=severity,
             tool=tool,
             rule_id=rule_id,
@@ -239,19 +361,6 @@ def get_security_findings(
             offset=offset,
         )
 
-        # Get total count matching filters (before pagination)
-        total_matching = len(
-            loader.filter_findings(
-                all_findings,
-                severity=severity,
-                tool=tool,
-                rule_id=rule_id,
-                path=path,
-                limit=999999,  # No limit for count
-                offset=0,
-            )
-        )
-
         logger.info(
             f"get_security_findings: returned {len(filtered)} findings "
             f"(total matching: {total_matching}, filters: severity={severity}, "
@@ -275,7 +384,7 @@ def get_security_findings(
         raise
 
 
-@mcp.tool()
+@_tool()
 @require_auth_and_rate_limit
 def apply_fix(
     finding_id: str,
@@ -369,7 +478,7 @@ def apply_fix(
         raise
 
 
-@mcp.tool()
+@_tool()
 @require_auth_and_rate_limit
 def mark_resolved(
     finding_id: str,
@@ -459,7 +568,7 @@ def mark_resolved(
         raise
 
 
-@mcp.tool()
+@_tool(pool="db")
 @require_auth_and_rate_limit
 def query_findings_db(
     query: str,
@@ -541,7 +650,7 @@ def query_findings_db(
 # ============================================================================
 
 
-@mcp.resource("finding://{finding_id}")
+@_resource("finding://{finding_id}")
 def get_finding_context(finding_id: str) -> dict:
     """
     Get full context for a specific security finding.
@@ -569,6 +678,10 @@ def get_finding_context(finding_id: str) -> dict:
             - cwe: CWE identifier
             - owasp: OWASP Top 10 mappings
         - related_findings: Other findings in same file/CWE (coming in Phase 2)
+        - sbom: From the scan's SBOM index (None without a Syft SBOM)
+            - package: SBOM package a package-scanner finding concerns
+              (name, version, path, purl, type), or None
+            - packages_in_file: SBOM packages declared in the finding's file
 
     Example:
         >>> ctx = get_finding_context("fingerprint-abc123")
@@ -616,6 +729,7 @@ def get_finding_context(finding_id: str) -> dict:
             "source_code": source_context,
             "remediation": remediation,
             "related_findings": related_findings,
+            "sbom": _sbom_context(finding),
         }
 
     except ValueError as e:
@@ -626,12 +740,87 @@ def get_finding_context(finding_id: str) -> dict:
         raise
 
 
+@_tool()
+@require_auth_and_rate_limit
+def get_findings_context(finding_ids: list[str], context_lines: int = 20) -> dict:
+    """
+    Get source code context for several findings in one call.
+
+    Use this instead of reading finding://{id} resources one at a time when
+    reviewing a batch of findings: each source file is read once, however
+    many of the findings point into it.
+
+    Args:
+        finding_ids: Fingerprint IDs (max: 50)
+        context_lines: Lines of context around each finding (default: 20, max: 100)
+
+    Returns:
+        Dictionary with:
+        - contexts: Mapping of finding ID to {"finding", "source_code", "sbom"}
+          (source_code and sbom have the same shape as in finding://{id})
+        - missing: IDs that matched no finding
+
+    Example:
+        >>> ctx = get_findings_context(["fingerprint-abc123", "fingerprint-def456"])
+        >>> print(ctx["contexts"]["fingerprint-abc123"]["source_code"]["lines"])
+    """
+    try:
+        if len(finding_ids) > 50:
+            raise ValueError("At most 50 finding IDs per call")
+        context_lines = max(0, min(context_lines, 100))
+
+        loader = get_findings_loader()
+        found: list[tuple[str, dict]] = []
+        missing: list[str] = []
+        for finding_id in finding_ids:
+            finding = loader.get_finding_by_id(finding_id)
+            if finding:
+                found.append((finding_id, finding))
+            else:
+                missing.append(finding_id)
+
+        requests = []
+        for _, finding in found:
+            location = finding.get("location", {})
+            requests.append(
+                (
+                    location.get("path", ""),
+                    location.get("startLine", 1),
+                    location.get("endLine"),
+                )
+            )
+        sources = get_context_extractor().get_contexts(requests, context_lines)
+
+        logger.info(
+            f"get_findings_context: {len(found)} contexts, {len(missing)} missing"
+        )
+
+        return {
+            "contexts": {
+                finding_id: {
+                    "finding": finding,
+                    "source_code": source,
+                    "sbom": _sbom_context(finding),
+                }
+                for (finding_id, finding), source in zip(found, sources, strict=True)
+            },
+            "missing": missing,
+        }
+
+    except ValueError as e:
+        logger.error(f"get_findings_context validation error: {e}")
+        raise
+    except Exception as e:
+        logger.error(f"Error getting findings context: {e}", exc_info=True)
+        raise
+
+
 # ============================================================================
 # Server Metadata
 # ============================================================================
 
 
-@mcp.tool()
+@_tool()
 @require_auth_and_rate_limit
 def get_server_info() -> dict:
     """
@@ -690,4 +879,8 @@ if __name__ == "__main__":
     logger.info(f"Repository root: {REPO_ROOT.resolve()}")
 
     # Run MCP server (stdio transport by default for Claude Desktop/GitHub Copilot)
-    mcp.run()
+    start_background_tasks()
+    try:
+        mcp.run()
+    finally:
+        stop_background_tasks()
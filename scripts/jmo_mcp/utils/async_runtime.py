@@ -0,0 +1,143 @@
+"""
+Asyncio support for the MCP server.
+
+In async mode (``JMO_MCP_ASYNC=true`` or ``jmo mcp-server --async``) every
+tool is registered as a coroutine that runs the blocking implementation on a
+bounded executor, so one agent's slow SQLite query or large source read never
+holds up another agent's call on the event loop. SQLite work gets its own,
+smaller pool so a burst of history queries cannot starve findings lookups.
+
+``FindingsWatcher`` polls findings.json in the background and rebuilds the
+loader's index as soon as a new ``jmo report`` lands, so the first query after
+a report does not pay for re-parsing the file.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import threading
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from scripts.jmo_mcp.utils.findings_loader import FindingsLoader
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_IO_WORKERS = 8
+DEFAULT_DB_WORKERS = 4
+DEFAULT_WATCH_INTERVAL = 2.0
+
+
+class AsyncToolRunner:
+    """Run blocking tool implementations off the event loop.
+
+    Args:
+        io_workers: Threads for findings, source and other file I/O
+        db_workers: Threads for SQLite history queries
+    """
+
+    def __init__(
+        self, io_workers: int = DEFAULT_IO_WORKERS, db_workers: int = DEFAULT_DB_WORKERS
+    ):
+        self._pools = {
+            "io": ThreadPoolExecutor(
+                max_workers=max(1, io_workers), thread_name_prefix="jmo-mcp-io"
+            ),
+            "db": ThreadPoolExecutor(
+                max_workers=max(1, db_workers), thread_name_prefix="jmo-mcp-db"
+            ),
+        }
+
+    def wrap(
+        self, func: Callable[..., Any], pool: str = "io"
+    ) -> Callable[..., Awaitable[Any]]:
+        """Coroutine version of ``func`` that runs it on the named pool.
+
+        The wrapper keeps ``func``'s name, docstring and signature, so MCP
+        builds the same tool schema for it.
+
+        Raises:
+            ValueError: If the pool name is unknown
+        """
+        if pool not in self._pools:
+            raise ValueError(f"Unknown executor pool: {pool}")
+        executor = self._pools[pool]
+
+        @functools.wraps(func)
+        async def handler(*args: Any, **kwargs: Any) -> Any:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                executor, functools.partial(func, *args, **kwargs)
+            )
+
+        return handler
+
+    def shutdown(self) -> None:
+        for executor in self._pools.values():
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+class FindingsWatcher:
+    """Refresh a FindingsLoader's index whenever findings.json changes.
+
+    Polls the file's mtime and size every ``interval`` seconds on a daemon
+    thread. A missing or half-written file is logged and retried on the next
+    poll; the previous index stays in service meanwhile.
+
+    Args:
+        get_loader: Returns the loader to refresh (raises FileNotFoundError
+            until a scan has produced findings.json)
+        interval: Seconds between polls
+    """
+
+    def __init__(
+        self,
+        get_loader: Callable[[], FindingsLoader],
+        interval: float = DEFAULT_WATCH_INTERVAL,
+    ):
+        self._get_loader = get_loader
+        self._interval = interval
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._last_key: tuple[int, int] | None = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="jmo-mcp-findings-watcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self._interval + 1)
+            self._thread = None
+
+    def poll(self) -> bool:
+        """Check findings.json once; returns True if the index was rebuilt."""
+        try:
+            loader = self._get_loader()
+            stat = loader.findings_file.stat()
+        except FileNotFoundError:
+            return False
+        key = (stat.st_mtime_ns, stat.st_size)
+        if key == self._last_key:
+            return False
+        try:
+            index = loader.index()
+        except Exception as e:  # Acceptable: keep serving the previous index
+            logger.warning(f"Findings refresh failed, will retry: {e}")
+            return False
+        self._last_key = key
+        logger.info(f"Findings index refreshed ({len(index.findings)} findings)")
+        return True
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.poll()
+            self._stop.wait(self._interval)
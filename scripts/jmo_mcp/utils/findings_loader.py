@@ -3,18 +3,106 @@ Load and filter security findings from JMo scan results.
 
 This module provides utilities for reading findings.json and applying
 filters for MCP tool queries.
+
+AI agents call the MCP tools in tight loops, so ``FindingsLoader`` keeps the
+parsed findings in memory as a ``FindingsIndex`` and only re-reads
+findings.json when its mtime or size changes. The index holds posting lists
+(finding positions) per severity, tool, rule and path plus an id map, so
+filtered queries intersect small integer lists and count matches without
+building intermediate lists of findings.
 """
 
 from __future__ import annotations
 
 import json
 import logging
+import threading
+from collections import Counter, defaultdict
 from pathlib import Path
 from typing import Any
 
+from scripts.core import json_codec
+
 logger = logging.getLogger(__name__)
 
 
+class FindingsIndex:
+    """Immutable lookup structures over one findings.json snapshot.
+
+    Posting lists hold positions into ``findings`` in ascending order, so any
+    intersection of them is already in file order and paginates exactly like
+    ``FindingsLoader.filter_findings``.
+    """
+
+    def __init__(self, findings: list[dict[str, Any]]):
+        self.findings = findings
+        self.by_id: dict[str, dict[str, Any]] = {}
+        self.severity_counts: Counter[str] = Counter()
+        severities: dict[str, list[int]] = defaultdict(list)
+        tools: dict[str, list[int]] = defaultdict(list)
+        rules: dict[str, list[int]] = defaultdict(list)
+        paths: dict[str, list[int]] = defaultdict(list)
+
+        for pos, finding in enumerate(findings):
+            # First occurrence wins, as with a linear scan
+            self.by_id.setdefault(finding.get("id"), finding)  # type: ignore[arg-type]
+            self.severity_counts[finding.get("severity", "UNKNOWN")] += 1
+            severities[finding.get("severity", "").upper()].append(pos)
+            tools[finding.get("tool", {}).get("name", "")].append(pos)
+            rules[finding.get("ruleId", "")].append(pos)
+            paths[finding.get("location", {}).get("path", "")].append(pos)
+
+        self.by_severity = dict(severities)
+        self.by_tool = dict(tools)
+        self.by_rule = dict(rules)
+        # Path filters are substring matches, so they scan the distinct paths
+        # (far fewer than findings on real scans) and union their postings
+        self.by_path = dict(paths)
+
+    def match(
+        self,
+        severity: list[str] | None = None,
+        tool: str | None = None,
+        rule_id: str | None = None,
+        path: str | None = None,
+    ) -> list[int] | None:
+        """Positions of findings matching every given filter.
+
+        Returns:
+            Ascending positions, or None when no filter is set (all findings)
+        """
+        postings: list[list[int]] = []
+        if severity:
+            wanted = {s.upper() for s in severity}
+            postings.append(self._union(self.by_severity, wanted))
+        if tool:
+            postings.append(self.by_tool.get(tool, []))
+        if rule_id:
+            postings.append(self.by_rule.get(rule_id, []))
+        if path:
+            postings.append(
+                self._union(self.by_path, {p for p in self.by_path if path in p})
+            )
+        if not postings:
+            return None
+
+        postings.sort(key=len)
+        result = postings[0]
+        for other in postings[1:]:
+            if not result:
+                break
+            members = set(other)
+            result = [pos for pos in result if pos in members]
+        return result
+
+    @staticmethod
+    def _union(index: dict[str, list[int]], keys: set[str]) -> list[int]:
+        lists = [index[key] for key in keys if key in index]
+        if len(lists) == 1:
+            return lists[0]
+        return sorted(pos for positions in lists for pos in positions)
+
+
 class FindingsLoader:
     """Load and filter findings from JMo scan results"""
 
@@ -37,9 +125,37 @@ class FindingsLoader:
                 f"Run a scan first: jmo scan --repo <path>"
             )
 
+        self._index: FindingsIndex | None = None
+        self._index_key: tuple[int, int] | None = None
+        self._index_lock = threading.Lock()
+
+    def index(self) -> FindingsIndex:
+        """
+        Get the in-memory index, rebuilding it if findings.json changed.
+
+        The file is re-read only when its mtime or size differs from the
+        snapshot the index was built from.
+
+        Returns:
+            FindingsIndex for the current findings.json
+
+        Raises:
+            FileNotFoundError: If findings.json was removed
+            json.JSONDecodeError: If findings.json is invalid JSON
+        """
+        stat = self.findings_file.stat()
+        key = (stat.st_mtime_ns, stat.st_size)
+        with self._index_lock:
+            if self._index is None or self._index_key != key:
+                self._index = FindingsIndex(self._read_findings())
+                self._index_key = key
+            return self._index
+
     def load_findings(self) -> list[dict[str, Any]]:
         """
-        Load all findings from findings.json.
+        Load all findings from findings.json (cached until the file changes).
+
+        The returned list is shared with the index; callers must not modify it.
 
         Returns:
             List of finding dictionaries (CommonFinding schema v1.2.0)
@@ -47,9 +163,12 @@ class FindingsLoader:
         Raises:
             json.JSONDecodeError: If findings.json is invalid JSON
         """
+        return self.index().findings
+
+    def _read_findings(self) -> list[dict[str, Any]]:
         try:
             with open(self.findings_file, encoding="utf-8") as f:
-                data = json.load(f)
+                data = json_codec.load(f)
 
             # Handle both v1.0.0 wrapper format and legacy list format
             if isinstance(data, dict) and "findings" in data:
@@ -72,6 +191,47 @@ class FindingsLoader:
             logger.error(f"Error loading findings: {e}")
             raise
 
+    def query(
+        self,
+        severity: list[str] | None = None,
+        tool: str | None = None,
+        rule_id: str | None = None,
+        path: str | None = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> tuple[list[dict[str, Any]], int]:
+        """
+        Filter the current findings through the index.
+
+        Same filters and ordering as ``filter_findings``, but only the
+        requested page is materialised.
+
+        Args:
+            severity: Filter by severity levels (e.g., ["HIGH", "CRITICAL"])
+            tool: Filter by tool name (e.g., "semgrep")
+            rule_id: Filter by rule ID (e.g., "CWE-79")
+            path: Filter by file path (substring match)
+            limit: Maximum number of results (default: 100)
+            offset: Pagination offset (default: 0)
+
+        Returns:
+            Tuple of (page of findings, total matching before pagination)
+        """
+        index = self.index()
+        positions = index.match(severity, tool, rule_id, path)
+        if positions is None:
+            total = len(index.findings)
+            page = index.findings[offset : offset + limit]
+        else:
+            total = len(positions)
+            page = [index.findings[pos] for pos in positions[offset : offset + limit]]
+
+        logger.info(
+            f"Filtered to {len(page)} findings (total matching: {total}, "
+            f"limit: {limit}, offset: {offset})"
+        )
+        return page, total
+
     def filter_findings(
         self,
         findings: list[dict[str, Any]],
@@ -144,11 +304,10 @@ class FindingsLoader:
         Returns:
             Finding dictionary or None if not found
         """
-        findings = self.load_findings()
-        for finding in findings:
-            if finding.get("id") == finding_id:
-                logger.info(f"Found finding: {finding_id}")
-                return finding
+        finding = self.index().by_id.get(finding_id)
+        if finding is not None:
+            logger.info(f"Found finding: {finding_id}")
+            return finding
 
         logger.warning(f"Finding not found: {finding_id}")
         return None
@@ -160,8 +319,7 @@ class FindingsLoader:
         Returns:
             Total number of findings
         """
-        findings = self.load_findings()
-        return len(findings)
+        return len(self.index().findings)
 
     def get_severity_distribution(self) -> dict[str, int]:
         """
@@ -170,11 +328,4 @@ class FindingsLoader:
         Returns:
             Dictionary mapping severity → count
         """
-        findings = self.load_findings()
-        distribution: dict[str, int] = {}
-
-        for finding in findings:
-            severity = finding.get("severity", "UNKNOWN")
-            distribution[severity] = distribution.get(severity, 0) + 1
-
-        return distribution
+        return dict(self.index().severity_counts)
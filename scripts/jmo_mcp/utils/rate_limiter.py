@@ -3,14 +3,34 @@ Rate limiting for MCP server using token bucket algorithm.
 
 Provides per-client rate limiting to prevent abuse while allowing
 burst traffic. Configurable capacity and refill rate.
+
+Client buckets are spread over lock-striped shards, so concurrent checks for
+different clients rarely contend. Each shard keeps its buckets in
+least-recently-used order and drops idle ones: a bucket idle long enough to
+refill completely is indistinguishable from a new one, so evicting it loses
+nothing, and a hard per-limiter cap bounds memory when many ephemeral client
+IDs arrive at once. Bucket state can be saved to a JSON file and reloaded so
+limits survive a server restart.
 """
 
 from __future__ import annotations
 
+import json
+import logging
+import math
+import os
 import time
-from collections import defaultdict
+from collections import OrderedDict
+from collections.abc import Iterator
+from pathlib import Path
 from threading import Lock
 
+logger = logging.getLogger(__name__)
+
+DEFAULT_SHARDS = 16
+DEFAULT_MAX_CLIENTS = 10_000
+STATE_VERSION = 1
+
 
 class TokenBucket:
     """
@@ -73,28 +93,100 @@ class TokenBucket:
             return self.tokens
 
 
+class _Shard:
+    """One lock stripe: buckets in least-recently-used order."""
+
+    __slots__ = ("buckets", "lock")
+
+    def __init__(self) -> None:
+        self.buckets: OrderedDict[str, TokenBucket] = OrderedDict()
+        self.lock = Lock()
+
+
+class _BucketsView:
+    """Read-mostly view over all shards (len, membership, iteration, clear)."""
+
+    def __init__(self, shards: list[_Shard]):
+        self._shards = shards
+
+    def __len__(self) -> int:
+        return sum(len(shard.buckets) for shard in self._shards)
+
+    def __contains__(self, client_id: object) -> bool:
+        return any(client_id in shard.buckets for shard in self._shards)
+
+    def __iter__(self) -> Iterator[str]:
+        for shard in self._shards:
+            with shard.lock:
+                keys = list(shard.buckets)
+            yield from keys
+
+    def clear(self) -> None:
+        for shard in self._shards:
+            with shard.lock:
+                shard.buckets.clear()
+
+
 class RateLimiter:
     """
     Per-client rate limiter using token bucket algorithm.
 
     Tracks separate buckets for each client (identified by API key or IP).
-    Thread-safe for concurrent requests.
+    Thread-safe for concurrent requests; each check locks only the shard its
+    client hashes to and does a constant amount of work.
     """
 
-    def __init__(self, capacity: int = 100, refill_rate: float = 1.67):
+    def __init__(
+        self,
+        capacity: int = 100,
+        refill_rate: float = 1.67,
+        shards: int = DEFAULT_SHARDS,
+        max_clients: int = DEFAULT_MAX_CLIENTS,
+        idle_ttl: float | None = None,
+        state_file: str | Path | None = None,
+    ):
         """
         Initialize rate limiter with default limits.
 
         Args:
             capacity: Burst size (default: 100 requests).
             refill_rate: Sustained rate in tokens/sec (default: 1.67 = 100 req/min).
+            shards: Number of lock stripes (default: 16).
+            max_clients: Buckets kept before the least recently used are
+                dropped (default: 10,000; spread evenly over the shards).
+            idle_ttl: Seconds after which an idle bucket is dropped. Defaults
+                to the time a bucket takes to refill completely, so eviction
+                never hands a client extra tokens. None with a zero refill
+                rate keeps idle buckets until the client cap evicts them.
+            state_file: JSON file to restore bucket state from (if it exists)
+                and to write with ``save_state()``.
         """
         self.capacity = capacity
         self.refill_rate = refill_rate
-        self.buckets: defaultdict[str, TokenBucket] = defaultdict(
-            lambda: TokenBucket(self.capacity, self.refill_rate)
-        )
-        self.lock = Lock()
+        if idle_ttl is None:
+            idle_ttl = capacity / refill_rate if refill_rate > 0 else math.inf
+        self.idle_ttl = idle_ttl
+        self._shards = [_Shard() for _ in range(max(1, shards))]
+        self._per_shard = max(1, math.ceil(max_clients / len(self._shards)))
+        self.buckets = _BucketsView(self._shards)
+        self.state_file = Path(state_file) if state_file else None
+        if self.state_file is not None and self.state_file.exists():
+            self.load_state(self.state_file)
+
+    def _shard(self, client_id: str) -> _Shard:
+        return self._shards[hash(client_id) % len(self._shards)]
+
+    def _evict(self, shard: _Shard, now: float) -> None:
+        """Drop idle and over-cap buckets from the LRU end (caller holds lock)."""
+        buckets = shard.buckets
+        while buckets:
+            oldest = next(iter(buckets.values()))
+            if (
+                len(buckets) <= self._per_shard
+                and now - oldest.last_refill <= self.idle_ttl
+            ):
+                break
+            buckets.popitem(last=False)
 
     def check_rate_limit(self, client_id: str) -> bool:
         """
@@ -106,10 +198,17 @@ class RateLimiter:
         Returns:
             True if request allowed, False if rate limit exceeded.
         """
-        with self.lock:
-            bucket = self.buckets[client_id]
-
-        return bucket.consume(tokens=1)
+        shard = self._shard(client_id)
+        with shard.lock:
+            bucket = shard.buckets.get(client_id)
+            if bucket is None:
+                bucket = TokenBucket(self.capacity, self.refill_rate)
+                shard.buckets[client_id] = bucket
+            else:
+                shard.buckets.move_to_end(client_id)
+            allowed = bucket.consume(tokens=1)
+            self._evict(shard, bucket.last_refill)
+        return allowed
 
     def get_client_status(self, client_id: str) -> dict[str, float]:
         """
@@ -121,13 +220,19 @@ class RateLimiter:
         Returns:
             Dict with 'remaining_tokens', 'capacity', 'refill_rate'.
         """
-        with self.lock:
-            bucket = self.buckets[client_id]
+        shard = self._shard(client_id)
+        with shard.lock:
+            bucket = shard.buckets.get(client_id)
+            remaining = (
+                bucket.get_remaining_tokens()
+                if bucket is not None
+                else float(self.capacity)
+            )
 
         return {
-            "remaining_tokens": bucket.get_remaining_tokens(),
-            "capacity": bucket.capacity,
-            "refill_rate": bucket.refill_rate,
+            "remaining_tokens": remaining,
+            "capacity": self.capacity,
+            "refill_rate": self.refill_rate,
         }
 
     def reset_client(self, client_id: str) -> None:
@@ -137,11 +242,89 @@ class RateLimiter:
         Args:
             client_id: Identifier for client to reset.
         """
-        with self.lock:
-            if client_id in self.buckets:
-                del self.buckets[client_id]
+        shard = self._shard(client_id)
+        with shard.lock:
+            shard.buckets.pop(client_id, None)
 
     def reset_all(self) -> None:
         """Reset rate limits for all clients."""
-        with self.lock:
-            self.buckets.clear()
+        self.buckets.clear()
+
+    def save_state(self, path: str | Path | None = None) -> int:
+        """
+        Write bucket state to JSON (atomically, via a temporary file).
+
+        Full buckets are skipped: a missing client starts full anyway.
+
+        Args:
+            path: Destination (default: the limiter's ``state_file``).
+
+        Returns:
+            Number of buckets written.
+
+        Raises:
+            ValueError: If no path is given and the limiter has no state_file.
+        """
+        target = Path(path) if path else self.state_file
+        if target is None:
+            raise ValueError("No rate limiter state file configured")
+
+        saved: dict[str, list[float]] = {}
+        for shard in self._shards:
+            with shard.lock:
+                for client_id, bucket in shard.buckets.items():
+                    tokens = bucket.get_remaining_tokens()
+                    if tokens < bucket.capacity:
+                        saved[client_id] = [tokens, bucket.last_refill]
+
+        state = {
+            "version": STATE_VERSION,
+            "capacity": self.capacity,
+            "refill_rate": self.refill_rate,
+            "buckets": saved,
+        }
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(target.name + ".tmp")
+        tmp.write_text(json.dumps(state), encoding="utf-8")
+        os.replace(tmp, target)
+        return len(saved)
+
+    def load_state(self, path: str | Path) -> int:
+        """
+        Restore bucket state written by ``save_state()``.
+
+        Tokens refill for the time the server was down, and are capped at the
+        current capacity if the limits changed. An unreadable file is logged
+        and ignored, so a bad state file never stops the server.
+
+        Args:
+            path: State file to read.
+
+        Returns:
+            Number of buckets restored.
+        """
+        try:
+            state = json.loads(Path(path).read_text(encoding="utf-8"))
+            entries = state["buckets"] if state.get("version") == STATE_VERSION else {}
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.warning(f"Ignoring rate limiter state {path}: {e}")
+            return 0
+
+        restored = 0
+        now = time.time()
+        for client_id, entry in entries.items():
+            try:
+                tokens, last_refill = float(entry[0]), float(entry[1])
+            except (TypeError, ValueError, IndexError):
+                continue
+            bucket = TokenBucket(self.capacity, self.refill_rate)
+            bucket.tokens = min(float(self.capacity), tokens)
+            bucket.last_refill = min(last_refill, now)
+            if bucket.get_remaining_tokens() >= bucket.capacity:
+                continue
+            shard = self._shard(client_id)
+            with shard.lock:
+                shard.buckets[client_id] = bucket
+                self._evict(shard, now)
+            restored += 1
+        return restored
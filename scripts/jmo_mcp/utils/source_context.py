@@ -2,6 +2,8 @@
 Extract source code context for security findings.
 
 Provides surrounding code context for AI tools to analyze and suggest fixes.
+Files are read through the shared ``SourceCache`` so repeated lookups in the
+same file only decode the requested window.
 """
 
 from __future__ import annotations
@@ -10,6 +12,8 @@ import logging
 from pathlib import Path
 from typing import Any
 
+from scripts.core.source_cache import SourceFile, get_source_cache
+
 logger = logging.getLogger(__name__)
 
 
@@ -52,6 +56,51 @@ class SourceContextExtractor:
                 "error": Optional[str]  # If file read failed
             }
         """
+        source, error, language = self._open_source(file_path)
+        if source is None:
+            return self._unavailable(file_path, start_line, end_line, error, language)
+        return self._window(file_path, source, start_line, end_line, context_lines)
+
+    def get_contexts(
+        self,
+        requests: list[tuple[str, int, int | None]],
+        context_lines: int = 20,
+    ) -> list[dict[str, Any]]:
+        """
+        Get source context for several locations, opening each file once.
+
+        Args:
+            requests: (file_path, start_line, end_line) tuples
+            context_lines: Number of lines of context to include (default: 20)
+
+        Returns:
+            One context dictionary per request, in request order (same shape
+            as ``get_context``)
+        """
+        files: dict[str, tuple[SourceFile | None, str, str]] = {}
+        results = []
+        for file_path, start_line, end_line in requests:
+            if file_path not in files:
+                files[file_path] = self._open_source(file_path)
+            source, error, language = files[file_path]
+            if source is None:
+                results.append(
+                    self._unavailable(file_path, start_line, end_line, error, language)
+                )
+            else:
+                results.append(
+                    self._window(file_path, source, start_line, end_line, context_lines)
+                )
+        return results
+
+    def _open_source(self, file_path: str) -> tuple[SourceFile | None, str, str]:
+        """
+        Open a repository file through the shared source cache.
+
+        Returns:
+            (source, "", "") on success, or (None, error, language) when the
+            file cannot be read
+        """
         full_path = self.repo_root / file_path
 
         # Security: Prevent path traversal (CWE-22) - resolved path must stay
@@ -61,84 +110,71 @@ class SourceContextExtractor:
             repo_resolved = self.repo_root.resolve()
             if not resolved.is_relative_to(repo_resolved):
                 logger.warning(f"Path traversal attempt blocked: {file_path}")
-                return {
-                    "path": file_path,
-                    "lines": "",
-                    "language": "unknown",
-                    "start_line": start_line,
-                    "end_line": end_line or start_line,
-                    "error": "Path traversal blocked",
-                }
+                return None, "Path traversal blocked", "unknown"
         except (OSError, ValueError):
-            return {
-                "path": file_path,
-                "lines": "",
-                "language": "unknown",
-                "start_line": start_line,
-                "end_line": end_line or start_line,
-                "error": "Invalid path",
-            }
+            return None, "Invalid path", "unknown"
 
         if not full_path.exists():
             logger.error(f"File not found: {full_path}")
-            return {
-                "path": file_path,
-                "lines": "",
-                "language": "unknown",
-                "start_line": start_line,
-                "end_line": end_line or start_line,
-                "error": "File not found",
-            }
+            return None, "File not found", "unknown"
 
-        try:
-            with open(full_path, encoding="utf-8", errors="replace") as f:
-                all_lines = f.readlines()
-
-            # Calculate context window
-            if end_line is None:
-                end_line = start_line
-
-            context_start = max(1, start_line - context_lines)
-            context_end = min(len(all_lines), end_line + context_lines)
-
-            # Extract context lines (convert to 0-indexed)
-            context = all_lines[context_start - 1 : context_end]
+        source = get_source_cache().get(full_path)
+        if source is None:
+            logger.error(f"Error reading file {file_path}")
+            return None, "File not readable", "unknown"
+        return source, "", ""
 
-            # Detect language from file extension
-            language = self._detect_language(file_path)
-
-            logger.info(
-                f"Extracted {len(context)} lines of context for {file_path}:{start_line}"
-            )
-
-            return {
-                "path": file_path,
-                "lines": "".join(context),
-                "language": language,
-                "start_line": context_start,
-                "end_line": context_end,
-            }
+    def _window(
+        self,
+        file_path: str,
+        source: SourceFile,
+        start_line: int,
+        end_line: int | None,
+        context_lines: int,
+    ) -> dict[str, Any]:
+        # Calculate context window
+        if end_line is None:
+            end_line = start_line
+
+        context_start = max(1, start_line - context_lines)
+        context_end = min(source.line_count, end_line + context_lines)
+
+        # Decode only the window; keepends matches text-mode readlines()
+        context = source.lines(
+            context_start, context_end, errors="replace", keepends=True
+        )
+
+        # Detect language from file extension
+        language = self._detect_language(file_path)
+
+        logger.info(
+            f"Extracted {len(context)} lines of context for {file_path}:{start_line}"
+        )
+
+        return {
+            "path": file_path,
+            "lines": "".join(context),
+            "language": language,
+            "start_line": context_start,
+            "end_line": context_end,
+        }
 
-        except UnicodeDecodeError:
-            logger.warning(f"Binary file, cannot extract context: {file_path}")
-            return {
-                "path": file_path,
-                "lines": "",
-                "language": "binary",
-                "start_line": start_line,
-                "end_line": end_line or start_line,
-                "error": "Binary file",
-            }
-        except Exception as e:
-            logger.error(f"Error reading file {file_path}: {e}")
-            return {
-                "path": file_path,
-                "lines": "",
-                "language": "unknown",
-                "start_line": start_line,
-                "end_line": end_line or start_line,
-                "error": str(e),
-            }
+    @staticmethod
+    def _unavailable(
+        file_path: str,
+        start_line: int,
+        end_line: int | None,
+        error: str,
+        language: str,
+    ) -> dict[str, Any]:
+        return {
+            "path": file_path,
+            "lines": "",
+            "language": language,
+            "start_line": start_line,
+            "end_line": end_line or start_line,
+            "error": error,
+        }
 
     def _detect_language(self, file_path: str) -> str:
         """
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Migration: v1.1.0 → v1.2.0
+
+Stores each finding's modification digest so ``jmo diff`` between two stored
+scans can skip findings whose tracked attributes did not change.
+
+Changes:
+- Add mutable_digest TEXT column to findings table
+  (``diff_engine.modification_digest`` of the finding; NULL for findings
+  stored before this migration, which the diff compares in full)
+"""
+
+from __future__ import annotations
+
+import sqlite3
+
+from scripts.core.history_migrations import Migration
+
+
+class Migration_1_1_0_to_1_2_0(Migration):
+    """Migration from schema v1.1.0 to v1.2.0."""
+
+    @property
+    def version(self) -> str:
+        return "1.2.0"
+
+    def migrate_up(self, conn: sqlite3.Connection) -> None:
+        """Apply migration: Add the mutable_digest column."""
+        findings_columns = [
+            row[1] for row in conn.execute("PRAGMA table_info(findings)").fetchall()
+        ]
+        if "mutable_digest" not in findings_columns:
+            conn.execute("""
+                ALTER TABLE findings
+                ADD COLUMN mutable_digest TEXT DEFAULT NULL
+                """)
+
+    def migrate_down(self, conn: sqlite3.Connection) -> None:
+        """
+        Rollback migration (not supported in SQLite).
+
+        The column is nullable and ignored by older versions, so leaving it
+        in place is harmless.
+        """
+        # Rollback not implemented (SQLite limitation)
@@ -241,3 +241,42 @@ def test_cdxgen_adapter_compliance_enrichment(tmp_path: Path):
     assert len(items) == 1
     # Compliance field should exist (enriched by compliance_mapper)
     assert hasattr(items[0], "compliance")
+
+
+def test_cdxgen_adapter_streams_components_before_metadata(tmp_path: Path, monkeypatch):
+    """Large SBOMs are streamed; document fields may follow components[]."""
+    from scripts.core.adapters import common
+
+    monkeypatch.setattr(common, "STREAM_MIN_BYTES", 0)
+    monkeypatch.setattr(common, "STREAM_CHUNK_CHARS", 16)
+    components = [
+        {"type": "library", "name": f"pkg{i}", "version": f"1.{i}"} for i in range(5)
+    ]
+    f = tmp_path / "cdxgen.json"
+    write(
+        f,
+        {
+            "components": components,
+            "bomFormat": "CycloneDX",
+            "specVersion": "1.5",
+            "metadata": {
+                "tools": {"components": [{"name": "cdxgen", "version": "10.9.1"}]}
+            },
+        },
+    )
+
+    items = CdxgenAdapter().parse(f)
+
+    assert [i.title for i in items] == [c["name"] for c in components]
+    assert {i.tool["version"] for i in items} == {"10.9.1"}
+    assert {i.context["spec_version"] for i in items} == {"1.5"}
+
+
+def test_cdxgen_adapter_streamed_non_sbom_is_empty(tmp_path: Path, monkeypatch):
+    from scripts.core.adapters import common
+
+    monkeypatch.setattr(common, "STREAM_MIN_BYTES", 0)
+    f = tmp_path / "cdxgen.json"
+    write(f, {"bomFormat": "SPDX", "components": [{"name": "x", "version": "1"}]})
+
+    assert CdxgenAdapter().parse(f) == []
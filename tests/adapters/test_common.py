@@ -7,8 +7,12 @@ import json
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
+
+from scripts.core.adapters import common
 from scripts.core.adapters.common import (
     _flatten_to_dicts,
+    iter_json_members,
     safe_load_json_file,
     safe_load_ndjson_file,
 )
@@ -227,3 +231,100 @@ class TestFlattenToDicts:
         result = list(_flatten_to_dicts(data))
         assert len(result) == 4
         assert all(isinstance(r, dict) for r in result)
+
+
+DOCUMENT = {
+    "headers": [{"tool_version": "32.1.0"}],
+    "files": [
+        {"path": f"src/{i}.py", "n": i * 10**i, "s": 'q"\\ ' * i, "l": [1, None]}
+        for i in range(40)
+    ],
+    "big": 123456789012345678901234567890,
+    "files_count": 40,
+}
+
+
+@pytest.fixture(params=[1, 7, 4096])
+def streaming(request, monkeypatch) -> int:
+    """Force the incremental parser, with buffers of several sizes."""
+    monkeypatch.setattr(common, "STREAM_MIN_BYTES", 0)
+    monkeypatch.setattr(common, "STREAM_CHUNK_CHARS", request.param)
+    return request.param
+
+
+class TestIterJsonMembers:
+    """Tests for iter_json_members (streaming top-level arrays)."""
+
+    @pytest.mark.parametrize("indent", [None, 2])
+    def test_streamed_matches_whole_parse(
+        self, tmp_path: Path, streaming: int, indent: int | None
+    ) -> None:
+        json_file = tmp_path / "scan.json"
+        json_file.write_text(json.dumps(DOCUMENT, indent=indent), encoding="utf-8")
+
+        members = list(iter_json_members(json_file, stream=("files",)))
+
+        assert [v for k, v in members if k == "files"] == DOCUMENT["files"]
+        assert {k: v for k, v in members if k != "files"} == {
+            "headers": DOCUMENT["headers"],
+            "big": DOCUMENT["big"],
+            "files_count": 40,
+        }
+
+    def test_small_files_give_the_same_members(self, tmp_path: Path) -> None:
+        json_file = tmp_path / "scan.json"
+        json_file.write_text(json.dumps(DOCUMENT), encoding="utf-8")
+        whole = list(iter_json_members(json_file, stream=("files",), keep=()))
+
+        with patch.object(common, "STREAM_MIN_BYTES", 0):
+            streamed = list(iter_json_members(json_file, stream=("files",), keep=()))
+
+        assert streamed == whole == [("files", f) for f in DOCUMENT["files"]]
+
+    def test_keep_skips_other_members(self, tmp_path: Path, streaming: int) -> None:
+        json_file = tmp_path / "scan.json"
+        json_file.write_text(json.dumps(DOCUMENT), encoding="utf-8")
+
+        keys = {k for k, _ in iter_json_members(json_file, ("files",), ("big",))}
+
+        assert keys == {"files", "big"}
+
+    def test_non_array_stream_key_is_skipped(
+        self, tmp_path: Path, streaming: int
+    ) -> None:
+        json_file = tmp_path / "scan.json"
+        json_file.write_text('{"files": {"not": "a list"}, "x": 1}', encoding="utf-8")
+
+        assert list(iter_json_members(json_file, stream=("files",))) == [("x", 1)]
+
+    def test_utf8_bom(self, tmp_path: Path, streaming: int) -> None:
+        json_file = tmp_path / "bom.json"
+        json_file.write_bytes(b"\xef\xbb\xbf" + b'{"files": [1, 2]}')
+
+        assert list(iter_json_members(json_file, stream=("files",))) == [
+            ("files", 1),
+            ("files", 2),
+        ]
+
+    @pytest.mark.parametrize("content", ["", "   ", "[1, 2]", "null"])
+    def test_non_object_documents_yield_nothing(
+        self, tmp_path: Path, streaming: int, content: str
+    ) -> None:
+        json_file = tmp_path / "odd.json"
+        json_file.write_text(content, encoding="utf-8")
+
+        assert list(iter_json_members(json_file, stream=("files",))) == []
+        assert list(iter_json_members(tmp_path / "missing.json", ("files",))) == []
+
+    @pytest.mark.parametrize(
+        "content",
+        ['{"files": [1, 2', '{"files": [1] "x": 2}', '{"files": []} trailing'],
+    )
+    def test_malformed_stream_raises(
+        self, tmp_path: Path, streaming: int, content: str
+    ) -> None:
+        json_file = tmp_path / "bad.json"
+        json_file.write_text(content, encoding="utf-8")
+
+        with pytest.raises(json.JSONDecodeError):
+            list(iter_json_members(json_file, stream=("files",)))
@@ -268,3 +268,41 @@ def test_scancode_adapter_compliance_enrichment(tmp_path: Path):
     assert len(items) == 1
     # Compliance field should exist (enriched by compliance_mapper)
     assert hasattr(items[0], "compliance")
+
+
+def test_scancode_adapter_streams_files_before_headers(tmp_path: Path, monkeypatch):
+    """Large outputs are streamed; headers may come after files[]."""
+    from scripts.core.adapters import common
+
+    monkeypatch.setattr(common, "STREAM_MIN_BYTES", 0)
+    monkeypatch.setattr(common, "STREAM_CHUNK_CHARS", 16)
+    files = [
+        {
+            "path": f"src/{i}.py",
+            "type": "file",
+            "license_detections": [{"license_expression": "mit"}],
+        }
+        for i in range(5)
+    ]
+    f = tmp_path / "scancode.json"
+    write(f, {"files": files, "headers": [{"tool_version": "32.1.0"}]})
+
+    items = ScancodeAdapter().parse(f)
+
+    assert [i.location["path"] for i in items] == [e["path"] for e in files]
+    assert {i.tool["version"] for i in items} == {"32.1.0"}
+
+
+def test_scancode_adapter_truncated_output_is_empty(tmp_path: Path, monkeypatch):
+    """A cut-off stream yields no findings, as a malformed whole file did."""
+    from scripts.core.adapters import common
+
+    monkeypatch.setattr(common, "STREAM_MIN_BYTES", 0)
+    f = tmp_path / "scancode.json"
+    f.write_text(
+        '{"files": [{"path": "a.py", "license_detections": '
+        '[{"license_expression": "mit"}]}, {"path": "b.py", ',
+        encoding="utf-8",
+    )
+
+    assert ScancodeAdapter().parse(f) == []
@@ -1,6 +1,8 @@
 import json
 from pathlib import Path
+from unittest import mock
 
+import scripts.core.common_finding as common_finding
 from scripts.core.adapters.semgrep_adapter import SemgrepAdapter
 
 
@@ -323,6 +325,39 @@ def generate_token():
     assert item.context["language"] == "python"
 
 
+def test_semgrep_code_context_opens_each_file_once(tmp_path: Path):
+    """Test findings in one file share a single open of that file."""
+    source = tmp_path / "app.py"
+    source.write_text("".join(f"line{i}\n" for i in range(1, 21)))
+    sample = {
+        "results": [
+            {"check_id": f"rule{n}", "path": str(source), "start": {"line": n}}
+            for n in (3, 10, 18)
+        ]
+        + [
+            {
+                "check_id": "gone",
+                "path": str(tmp_path / "gone.py"),
+                "start": {"line": 1},
+            }
+        ]
+    }
+    path = write_tmp(tmp_path, "semgrep.json", json.dumps(sample))
+
+    with mock.patch.object(
+        common_finding, "_open_source", wraps=common_finding._open_source
+    ) as opened:
+        findings = SemgrepAdapter().parse(path)
+
+    assert [c.args[0] for c in opened.call_args_list] == [
+        str(source),
+        str(tmp_path / "gone.py"),
+    ]
+    assert [f.context["startLine"] for f in findings[:3]] == [1, 8, 16]
+    assert "10: line10" in findings[1].context["snippet"]
+    assert findings[3].context is None
+
+
 def test_semgrep_v110_no_context_if_file_missing(tmp_path: Path):
     """Test v1.1.0 context is None if file doesn't exist."""
     sample = {
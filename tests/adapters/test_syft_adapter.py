@@ -295,3 +295,27 @@ def test_syft_large_sbom(tmp_path: Path):
 
     assert len(findings) == 100
     assert all(f.severity == "INFO" for f in findings)
+
+
+def test_syft_streamed_vulnerabilities_before_artifacts(tmp_path: Path, monkeypatch):
+    """Large SBOMs are streamed; vulnerabilities still resolve their package."""
+    from scripts.core.adapters import common
+
+    monkeypatch.setattr(common, "STREAM_MIN_BYTES", 0)
+    monkeypatch.setattr(common, "STREAM_CHUNK_CHARS", 16)
+    data = {
+        "vulnerabilities": [{"id": "CVE-2024-0001", "artifactIds": ["pkg-2"]}],
+        "files": [
+            {"id": f"file-{i}", "location": {"path": f"/f{i}"}} for i in range(50)
+        ],
+        "artifacts": [
+            {"id": f"pkg-{i}", "name": f"lib{i}", "locations": [{"path": f"/l{i}"}]}
+            for i in range(3)
+        ],
+    }
+    f = write(tmp_path, "syft.json", json.dumps(data))
+
+    items = SyftAdapter().parse(f)
+
+    assert [i.ruleId for i in items] == ["SBOM.PACKAGE"] * 3 + ["CVE-2024-0001"]
+    assert items[-1].location["path"] == "/l2"
@@ -12,7 +12,9 @@ Tests cover:
 
 import json
 from pathlib import Path
+from unittest import mock
 
+import scripts.core.common_finding as common_finding
 from scripts.core.adapters.trivy_adapter import TrivyAdapter
 
 
@@ -549,6 +551,35 @@ class TestTrivyUnicodeHandling:
 class TestTrivyMisconfigurationDetails:
     """Tests for misconfiguration-specific features."""
 
+    def test_misconfig_code_context_opens_each_file_once(self, tmp_path: Path):
+        """Test misconfigurations in one file share a single open of it."""
+        dockerfile = tmp_path / "Dockerfile"
+        dockerfile.write_text("FROM alpine\nRUN apk add curl\nUSER root\n")
+        sample = {
+            "Results": [
+                {
+                    "Target": str(dockerfile),
+                    "Misconfigurations": [
+                        {"RuleID": "DS002", "StartLine": 3},
+                        {"RuleID": "DS029", "StartLine": 2},
+                    ],
+                    "Vulnerabilities": [{"VulnerabilityID": "CVE-1", "StartLine": 1}],
+                }
+            ]
+        }
+        path = write(tmp_path, "trivy.json", json.dumps(sample))
+
+        with mock.patch.object(
+            common_finding, "_open_source", wraps=common_finding._open_source
+        ) as opened:
+            findings = TrivyAdapter().parse(path)
+
+        assert opened.call_count == 1
+        by_rule = {f.ruleId: f for f in findings}
+        assert "3: USER root" in by_rule["DS002"].context["snippet"]
+        assert by_rule["DS029"].context["startLine"] == 1
+        assert by_rule["CVE-1"].context is None
+
     def test_misconfig_with_rule_id_only(self, tmp_path: Path):
         """Test misconfiguration with only RuleID (no Title)."""
         sample = {
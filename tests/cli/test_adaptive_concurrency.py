@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""Tests for scripts/cli/adaptive_concurrency.py - load-driven scan concurrency."""
+
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from scripts.cli.adaptive_concurrency import (
+    AdaptiveConcurrencyController,
+    ConcurrencyLimiter,
+    LoadSample,
+    decide,
+    read_load_sample,
+)
+from scripts.cli.scan_orchestrator import ScanConfig, ScanOrchestrator, ScanTargets
+
+CALM = LoadSample(load_per_cpu=0.2, memory_available=0.6, psi={"cpu": 0.5})
+BUSY = LoadSample(load_per_cpu=2.5, memory_available=0.6, psi={"cpu": 0.5})
+
+
+class TestReadLoadSample:
+    def test_parses_meminfo_and_pressure(self, tmp_path: Path) -> None:
+        (tmp_path / "meminfo").write_text(
+            "MemTotal:  1000 kB\nMemFree:  100 kB\nMemAvailable:  250 kB\n"
+        )
+        (tmp_path / "pressure").mkdir()
+        (tmp_path / "pressure" / "cpu").write_text(
+            "some avg10=12.50 avg60=3.00 avg300=1.00 total=1\n"
+            "full avg10=0.00 avg60=0.00 avg300=0.00 total=0\n"
+        )
+        sample = read_load_sample(tmp_path)
+        assert sample.memory_available == pytest.approx(0.25)
+        assert sample.psi == {"cpu": 12.5}
+
+    def test_missing_sources_read_as_none(self, tmp_path: Path) -> None:
+        with patch("os.getloadavg", side_effect=OSError):
+            sample = read_load_sample(tmp_path)
+        assert sample == LoadSample()
+        assert sample.describe() == "no load data"
+
+
+class TestDecide:
+    @pytest.mark.parametrize(
+        ("sample", "reason"),
+        [
+            (BUSY, "load"),
+            (LoadSample(load_per_cpu=0.2, memory_available=0.05), "memory"),
+            (LoadSample(load_per_cpu=0.2, psi={"io": 80.0}), "io pressure"),
+        ],
+    )
+    def test_any_overload_signal_shrinks(self, sample: LoadSample, reason: str) -> None:
+        delta, why = decide(sample, limit=4, in_flight=4)
+        assert delta == -1
+        assert reason in why
+
+    def test_grows_only_when_saturated_and_calm(self) -> None:
+        assert decide(CALM, limit=4, in_flight=4)[0] == 1
+        assert decide(CALM, limit=4, in_flight=2) == (0, "limit not saturated")
+
+    def test_does_not_grow_blind(self) -> None:
+        """With no load signal at all there is no evidence of spare capacity."""
+        assert decide(LoadSample(), limit=4, in_flight=4)[0] == 0
+
+
+class TestConcurrencyLimiter:
+    def test_never_exceeds_limit_and_follows_changes(self) -> None:
+        limiter = ConcurrencyLimiter(2)
+        peak = [0]
+        lock = threading.Lock()
+        gate = threading.Event()
+
+        def task() -> None:
+            with lock:
+                peak[0] = max(peak[0], limiter.in_flight)
+            gate.wait(1)
+
+        threads = [threading.Thread(target=limiter.run, args=(task,)) for _ in range(6)]
+        for t in threads:
+            t.start()
+        time.sleep(0.1)
+        assert limiter.in_flight == 2
+
+        limiter.set_limit(4)
+        time.sleep(0.1)
+        assert limiter.in_flight == 4
+        gate.set()
+        for t in threads:
+            t.join()
+        assert peak[0] <= 4
+        assert limiter.in_flight == 0
+
+
+class TestController:
+    def test_steps_stay_within_bounds(self) -> None:
+        limiter = ConcurrencyLimiter(2)
+        samples = iter([BUSY, BUSY, BUSY])
+        controller = AdaptiveConcurrencyController(
+            limiter, min_workers=1, max_workers=3, sampler=lambda: next(samples)
+        )
+        assert [controller.step() for _ in range(3)] == [1, 1, 1]
+
+    def test_grows_to_ceiling(self) -> None:
+        limiter = ConcurrencyLimiter(1)
+        limiter.acquire()  # Saturated: one in flight at limit 1
+        controller = AdaptiveConcurrencyController(
+            limiter, min_workers=1, max_workers=2, sampler=lambda: CALM
+        )
+        assert controller.step() == 2
+        assert controller.step() == 2
+
+    def test_logs_each_adjustment(self, caplog: pytest.LogCaptureFixture) -> None:
+        limiter = ConcurrencyLimiter(3)
+        controller = AdaptiveConcurrencyController(
+            limiter, min_workers=1, max_workers=4, sampler=lambda: BUSY
+        )
+        with caplog.at_level("INFO", logger="scripts.cli.adaptive_concurrency"):
+            controller.step()
+        assert "3 -> 2" in caplog.text
+        assert "load/cpu=2.50" in caplog.text
+
+
+class TestOrchestratorIntegration:
+    def test_scan_all_gates_targets_through_limiter(self, tmp_path: Path) -> None:
+        config = ScanConfig(
+            tools=["trivy"],
+            results_dir=tmp_path,
+            max_workers=2,
+            adaptive_concurrency=True,
+        )
+        orchestrator = ScanOrchestrator(config)
+        running = [0]
+        peak = [0]
+        lock = threading.Lock()
+
+        def fake_scan_image(image, *args, **kwargs):
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.05)
+            with lock:
+                running[0] -= 1
+            return image, {"trivy": True}
+
+        # The controller's first sample is seconds away, so the limit stays 2.
+        with (
+            patch("scripts.cli.scan_jobs.scan_image", fake_scan_image),
+            patch("scripts.cli.scan_orchestrator.get_cpu_count", return_value=8),
+        ):
+            results = orchestrator.scan_all(
+                ScanTargets(images=[f"img{i}" for i in range(8)]), {}
+            )
+
+        assert len(results) == 8
+        assert peak[0] <= 2
@@ -197,6 +197,47 @@ class TestImageScanner:
             assert "trivy" in statuses
             assert "syft" not in statuses
 
+    def test_scan_image_indexes_sbom(self, tmp_path):
+        """A successful syft run leaves an SBOM index beside syft.json"""
+        from scripts.core.sbom_index import SBOM_INDEX_FILENAME, SbomIndex
+        from scripts.core.tool_runner import ToolResult
+
+        syft_out = tmp_path / "nginx_latest" / "syft.json"
+        sbom = '{"artifacts": [{"name": "openssl", "version": "3.0.1"}]}'
+        with (
+            patch("scripts.cli.scan_jobs.image_scanner.ToolRunner") as MockRunner,
+            patch(
+                "scripts.cli.scan_jobs.image_scanner.find_tool",
+                return_value="/usr/bin/syft",
+            ),
+        ):
+            MockRunner.return_value.run_all_parallel.return_value = [
+                ToolResult(
+                    tool="syft",
+                    status="success",
+                    stdout=sbom,
+                    output_file=syft_out,
+                    capture_stdout=True,
+                ),
+            ]
+
+            _, statuses = scan_image(
+                image="nginx:latest",
+                results_dir=tmp_path,
+                tools=["syft"],
+                timeout=600,
+                retries=0,
+                per_tool_config={},
+                allow_missing_tools=False,
+            )
+
+        assert statuses["syft"] is True
+        assert (syft_out.parent / SBOM_INDEX_FILENAME).is_file()
+        index = SbomIndex.open(syft_out.parent, build=False)
+        assert index is not None
+        assert [p["version"] for p in index.packages_named("OpenSSL")] == ["3.0.1"]
+        index.close()
+
     def test_scan_image_creates_output_directory(self, tmp_path):
         """Test that output directories are created"""
         # Create individual-images subdirectory (matches production usage in scan_orchestrator)
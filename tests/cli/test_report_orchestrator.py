@@ -19,11 +19,13 @@ Coverage targets:
 
 import json
 import os
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from scripts.cli.report_orchestrator import cmd_report, fail_code
+from scripts.cli.report_orchestrator import cmd_report, fail_code, watch_report
 
 # =============================================================================
 # fail_code() tests
@@ -731,7 +733,7 @@ def test_cmd_report_reads_profile_from_scan_metadata(
     mock_log = MagicMock()
     captured_metadata = {}
 
-    def capture_metadata(findings, path, metadata=None):
+    def capture_metadata(findings, path, metadata=None, **kwargs):
         """Capture metadata passed to write_json."""
         if metadata:
             captured_metadata.update(metadata)
@@ -783,7 +785,7 @@ def test_cmd_report_reads_tools_from_scan_metadata(tmp_path, mock_config, minima
     mock_log = MagicMock()
     captured_metadata = {}
 
-    def capture_metadata(findings, path, metadata=None):
+    def capture_metadata(findings, path, metadata=None, **kwargs):
         if metadata:
             captured_metadata.update(metadata)
 
@@ -826,7 +828,7 @@ def test_cmd_report_falls_back_to_config_profile(tmp_path, mock_config, minimal_
     mock_log = MagicMock()
     captured_metadata = {}
 
-    def capture_metadata(findings, path, metadata=None):
+    def capture_metadata(findings, path, metadata=None, **kwargs):
         if metadata:
             captured_metadata.update(metadata)
 
@@ -864,7 +866,7 @@ def test_cmd_report_handles_corrupt_scan_metadata(tmp_path, mock_config, minimal
     mock_log = MagicMock()
     captured_metadata = {}
 
-    def capture_metadata(findings, path, metadata=None):
+    def capture_metadata(findings, path, metadata=None, **kwargs):
         if metadata:
             captured_metadata.update(metadata)
 
@@ -904,7 +906,7 @@ def test_cmd_report_infers_tools_from_findings_without_metadata(
     mock_log = MagicMock()
     captured_metadata = {}
 
-    def capture_metadata(findings, path, metadata=None):
+    def capture_metadata(findings, path, metadata=None, **kwargs):
         if metadata:
             captured_metadata.update(metadata)
 
@@ -980,3 +982,71 @@ def test_cmd_report_threads_int_sets_env(
         cmd_report(minimal_args, MagicMock())
 
     assert os.environ.get("JMO_THREADS") == "8"
+
+
+# =============================================================================
+# watch_report() tests
+# =============================================================================
+
+
+def _write_semgrep(path, *lines):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    results = [
+        {
+            "check_id": f"rule.{line}",
+            "path": "app.py",
+            "start": {"line": line},
+            "extra": {"message": f"issue on line {line}", "severity": "ERROR"},
+        }
+        for line in lines
+    ]
+    path.write_text(json.dumps({"results": results}), encoding="utf-8")
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def test_watch_report_rewrites_outputs_on_change(tmp_path, mock_config, minimal_args):
+    """--watch updates findings.json and SUMMARY.md when a tool output changes."""
+    results_dir = tmp_path / "results"
+    tool_output = results_dir / "individual-repos" / "app" / "semgrep.json"
+    _write_semgrep(tool_output, 1)
+    minimal_args.results_dir_pos = str(results_dir)
+    minimal_args.watch_interval = 0.05
+    findings_json = results_dir / "summaries" / "findings.json"
+
+    def finding_count():
+        try:
+            return len(
+                json.loads(findings_json.read_text(encoding="utf-8"))["findings"]
+            )
+        except (OSError, ValueError):
+            return None
+
+    stop = threading.Event()
+    codes = []
+    with patch(
+        "scripts.cli.report_orchestrator.load_config_with_env_overrides",
+        return_value=mock_config,
+    ):
+        watcher = threading.Thread(
+            target=lambda: codes.append(watch_report(minimal_args, MagicMock(), stop))
+        )
+        watcher.start()
+        try:
+            deadline = time.monotonic() + 30
+            while finding_count() != 1 and time.monotonic() < deadline:
+                time.sleep(0.02)
+            assert finding_count() == 1
+
+            _write_semgrep(tool_output, 1, 2)
+            while finding_count() != 2 and time.monotonic() < deadline:
+                time.sleep(0.02)
+        finally:
+            stop.set()
+            watcher.join(timeout=30)
+
+    assert finding_count() == 2
+    assert "rule.2" in (results_dir / "summaries" / "SUMMARY.md").read_text(
+        encoding="utf-8"
+    )
+    assert codes == [0]
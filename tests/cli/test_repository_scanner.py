@@ -1376,5 +1376,193 @@ class TestFailedToolsAreReported:
         assert "trivy" not in caplog.text
 
 
+class TestSharedFileInventory:
+    """File-list tools and yara share one walk of the repository."""
+
+    def _scan(self, tmp_path, tools):
+        repo = tmp_path / "inv-repo"
+        (repo / "svc").mkdir(parents=True)
+        (repo / "Dockerfile").write_text("FROM alpine")
+        (repo / "svc" / "Dockerfile").write_text("FROM alpine")
+        (repo / "run.sh").write_text("echo hi")
+        (repo / "node_modules" / "x").mkdir(parents=True)
+        (repo / "node_modules" / "x" / "Dockerfile").write_text("FROM alpine")
+
+        with patch("scripts.cli.scan_jobs.repository_scanner.ToolRunner") as MockRunner:
+            MockRunner.return_value.run_all_parallel.return_value = []
+            scan_repository(
+                repo=repo,
+                results_dir=tmp_path / "results",
+                tools=tools,
+                timeout=600,
+                retries=0,
+                per_tool_config={"yara": {"rules_path": str(tmp_path)}},
+                allow_missing_tools=False,
+                find_tool_func=lambda t: f"/usr/bin/{t}",
+            )
+        return repo, {td.name: td for td in MockRunner.call_args.kwargs["tools"]}
+
+    def test_inventory_saved_and_passed_to_yara(self, tmp_path):
+        from scripts.core.file_inventory import INVENTORY_FILENAME, load_inventory
+
+        _, defs = self._scan(tmp_path, ["yara"])
+        inv_path = tmp_path / "results" / "inv-repo" / INVENTORY_FILENAME
+        assert inv_path.exists()
+        cmd = defs["yara"].command
+        assert cmd[cmd.index("--inventory") + 1] == str(inv_path)
+        assert load_inventory(inv_path).get("run.sh") is not None
+
+    def test_hadolint_files_come_from_inventory(self, tmp_path):
+        repo, defs = self._scan(tmp_path, ["hadolint"])
+        cmd = defs["hadolint"].command
+        assert str(repo / "Dockerfile") in cmd
+        assert str(repo / "svc" / "Dockerfile") in cmd
+        assert not any("node_modules" in arg for arg in cmd)
+
+    def test_no_inventory_when_no_tool_needs_it(self, tmp_path):
+        from scripts.core.file_inventory import INVENTORY_FILENAME
+
+        self._scan(tmp_path, ["trivy"])
+        assert not (tmp_path / "results" / "inv-repo" / INVENTORY_FILENAME).exists()
+
+
+class TestFileListBatching:
+    """Long file lists are split across invocations, never truncated."""
+
+    def test_batches_respect_char_budget_and_keep_order(self):
+        from scripts.cli.scan_jobs.repository_scanner import _batch_file_args
+
+        files = [f"/repo/dir/{i:04d}.sh" for i in range(50)]
+        batches = _batch_file_args(["shellcheck", "-f", "json"], files, max_chars=200)
+        assert len(batches) > 1
+        assert [f for b in batches for f in b] == files
+        for batch in batches:
+            line = " ".join(["shellcheck", "-f", "json", *batch])
+            assert len(line) <= 200
+
+    def test_batches_respect_file_cap(self):
+        from scripts.cli.scan_jobs.repository_scanner import _batch_file_args
+
+        batches = _batch_file_args(["t"], [f"f{i}" for i in range(7)], max_files=3)
+        assert [len(b) for b in batches] == [3, 3, 1]
+
+    def test_oversized_path_still_gets_a_batch(self):
+        from scripts.cli.scan_jobs.repository_scanner import _batch_file_args
+
+        huge = "/" + "x" * 500
+        assert _batch_file_args(["t"], ["/a", huge, "/b"], max_chars=100) == [
+            ["/a"],
+            [huge],
+            ["/b"],
+        ]
+
+    def _scan(self, tmp_path, n_scripts, results_for):
+        repo = tmp_path / "big-repo"
+        repo.mkdir()
+        for i in range(n_scripts):
+            (repo / f"s{i:03d}.sh").write_text("echo hi")
+
+        with (
+            patch("scripts.cli.scan_jobs.repository_scanner.ToolRunner") as MockRunner,
+            patch("scripts.cli.scan_jobs.repository_scanner.MAX_FILE_ARGS", 10),
+        ):
+
+            def _run(*args, **kwargs):
+                return results_for(kwargs["tools"])
+
+            MockRunner.side_effect = lambda **kw: MagicMock(
+                run_all_parallel=lambda: _run(**kw)
+            )
+            _, statuses = scan_repository(
+                repo=repo,
+                results_dir=tmp_path / "results",
+                tools=["shellcheck"],
+                timeout=600,
+                retries=0,
+                per_tool_config={},
+                allow_missing_tools=False,
+                find_tool_func=lambda t: f"/usr/bin/{t}",
+            )
+        return statuses, tmp_path / "results" / "big-repo" / "shellcheck.json"
+
+    def test_batches_merge_into_single_output(self, tmp_path):
+        import json
+
+        from scripts.core.tool_runner import ToolResult
+
+        seen = {}
+
+        def results_for(defs):
+            seen["names"] = [d.name for d in defs]
+            return [
+                ToolResult(
+                    tool=d.name,
+                    status="success",
+                    stdout=json.dumps([{"file": f} for f in d.command[2:]]),
+                    capture_stdout=True,
+                    output_file=d.output_file,
+                )
+                for d in defs
+            ]
+
+        statuses, out = self._scan(tmp_path, 25, results_for)
+        assert seen["names"] == ["shellcheck#1", "shellcheck#2", "shellcheck#3"]
+        assert statuses["shellcheck"] is True
+        merged = json.loads(out.read_text(encoding="utf-8"))
+        assert len(merged) == 25, "every file must be scanned, none truncated"
+
+    def test_failed_batch_fails_tool_but_keeps_other_findings(self, tmp_path, caplog):
+        import json
+        import logging
+
+        from scripts.core.tool_runner import ToolResult
+
+        def results_for(defs):
+            return [
+                (
+                    ToolResult(
+                        tool=d.name,
+                        status="error",
+                        error_message="Return code 3 not in (0, 1)",
+                    )
+                    if d.name.endswith("#2")
+                    else ToolResult(
+                        tool=d.name,
+                        status="success",
+                        stdout=json.dumps([{"file": f} for f in d.command[2:]]),
+                        capture_stdout=True,
+                        output_file=d.output_file,
+                    )
+                )
+                for d in defs
+            ]
+
+        with caplog.at_level(logging.ERROR):
+            statuses, out = self._scan(tmp_path, 25, results_for)
+        assert statuses["shellcheck"] is False
+        assert "shellcheck#2" in caplog.text
+        assert len(json.loads(out.read_text(encoding="utf-8"))) == 15
+
+    def test_small_list_keeps_single_definition(self, tmp_path):
+        from scripts.core.tool_runner import ToolResult
+
+        seen = {}
+
+        def results_for(defs):
+            seen["names"] = [d.name for d in defs]
+            return [ToolResult(tool="shellcheck", status="success")]
+
+        statuses, _ = self._scan(tmp_path, 5, results_for)
+        assert seen["names"] == ["shellcheck"]
+        assert statuses["shellcheck"] is True
+
+    def test_merge_json_objects_extends_lists(self):
+        from scripts.cli.scan_jobs.repository_scanner import _merge_json_outputs
+
+        merged = _merge_json_outputs(['{"comments": [1]}', '{"comments": [2, 3]}'])
+        assert merged == {"comments": [1, 2, 3]}
+        assert _merge_json_outputs(["", "[1]"]) == [1]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
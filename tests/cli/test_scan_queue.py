@@ -0,0 +1,312 @@
+"""
+Tests for scripts/cli/scan_queue.py - the distributed scan work queue.
+
+The queue's guarantees are what make horizontal scans safe: a target is leased
+to exactly one worker at a time, a crashed worker's target comes back, and a
+target that keeps failing stops coming back. Scan jobs are replaced with a
+stub so the tests exercise the queue, not the scanners.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from scripts.cli import scan_queue
+from scripts.cli.scan_orchestrator import ScanConfig, ScanOrchestrator, ScanTargets
+from scripts.cli.scan_queue import (
+    QueueJob,
+    WorkersExitedError,
+    WorkQueue,
+    build_manifest,
+    coordinate,
+    jobs_from_targets,
+    queue_for_results,
+    run_worker,
+)
+from scripts.cli.scan_session import ScanSession
+
+
+def _queue(tmp_path: Path, n: int = 3, **manifest) -> WorkQueue:
+    queue = queue_for_results(tmp_path / "results")
+    queue.create(
+        {
+            "tools": ["trivy"],
+            "timeout": 60,
+            "retries": 0,
+            "per_tool_config": {},
+            "allow_missing_tools": False,
+            "lease_seconds": manifest.get("lease_seconds", 60.0),
+            "max_attempts": manifest.get("max_attempts", 3),
+        },
+        [QueueJob("image", f"img{i}:latest", f"img{i}:latest") for i in range(n)],
+    )
+    return queue
+
+
+class TestWorkQueue:
+    def test_claims_in_publication_order_and_once(self, tmp_path: Path) -> None:
+        queue = _queue(tmp_path, n=2)
+        first = queue.claim("w1", 60)
+        second = queue.claim("w2", 60)
+        assert (first.target_id, second.target_id) == ("img0:latest", "img1:latest")
+        assert queue.claim("w3", 60) is None
+        assert queue.counts()["leased"] == 2
+
+    def test_concurrent_claims_never_share_a_job(self, tmp_path: Path) -> None:
+        queue = _queue(tmp_path, n=40)
+        claimed: list[str] = []
+        lock = threading.Lock()
+
+        def grab(worker: str) -> None:
+            while (job := queue.claim(worker, 60)) is not None:
+                with lock:
+                    claimed.append(job.target_id)
+
+        threads = [threading.Thread(target=grab, args=(f"w{i}",)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert sorted(claimed) == sorted(f"img{i}:latest" for i in range(40))
+
+    def test_complete_drains(self, tmp_path: Path) -> None:
+        queue = _queue(tmp_path, n=1)
+        job = queue.claim("w1", 60)
+        assert not queue.is_drained()
+        queue.complete(job, "w1", {"trivy": True})
+        assert queue.is_drained()
+        [(_, done)] = list(queue.finished("done"))
+        assert done.statuses == {"trivy": True}
+
+    def test_expired_lease_is_requeued_with_attempt_counted(
+        self, tmp_path: Path
+    ) -> None:
+        queue = _queue(tmp_path, n=1)
+        job = queue.claim("crashed", lease_seconds=0.01)
+        time.sleep(0.05)
+        assert queue.reap_expired(lease_seconds=60, max_attempts=3) == 1
+
+        again = queue.claim("w2", 60)
+        assert again.target_id == job.target_id
+        assert again.attempts == 1
+        assert "crashed" in again.error
+
+    def test_renew_refuses_a_lease_that_moved_on(self, tmp_path: Path) -> None:
+        queue = _queue(tmp_path, n=1)
+        job = queue.claim("slow", lease_seconds=0.01)
+        time.sleep(0.05)
+        queue.reap_expired(lease_seconds=60, max_attempts=3)
+        queue.claim("fast", 60)
+        assert queue.renew(job, "slow", 60) is False
+
+    def test_renewal_racing_completion_never_resurrects_the_lease(
+        self, tmp_path: Path
+    ) -> None:
+        queue = _queue(tmp_path, n=1)
+        job = queue.claim("w", 60)
+        renewing = threading.Event()
+        completed = threading.Event()
+        write = scan_queue._atomic_write_json
+
+        def stalled_write(path: Path, data: dict) -> None:
+            if threading.current_thread().name == "heartbeat":
+                renewing.set()
+                # Let complete() run between the renewal's read and its write
+                completed.wait(timeout=0.5)
+            write(path, data)
+
+        with patch.object(scan_queue, "_atomic_write_json", stalled_write):
+            heartbeat = threading.Thread(
+                target=queue.renew, args=(job, "w", 60), name="heartbeat"
+            )
+            heartbeat.start()
+            assert renewing.wait(timeout=5)
+            queue.complete(job, "w", {"trivy": True})
+            completed.set()
+            heartbeat.join()
+
+        assert queue.counts() == {"pending": 0, "leased": 0, "done": 1, "failed": 0}
+        assert queue.is_drained()
+        assert queue.reap_expired(lease_seconds=0, max_attempts=3) == 0
+
+    def test_unreadable_entries_are_retired_so_the_queue_drains(
+        self, tmp_path: Path
+    ) -> None:
+        queue = _queue(tmp_path, n=1)
+        pending = queue.root / "pending"
+        # Sorts ahead of every published job, so claim() reaches it first
+        (pending / "00000-corrupt.json").write_text("{not json", encoding="utf-8")
+
+        job = queue.claim("w", 60)
+
+        assert job is not None and job.target_id == "img0:latest"
+        assert queue.counts() == {"pending": 0, "leased": 1, "done": 0, "failed": 1}
+        queue.complete(job, "w", {"trivy": True})
+        assert queue.is_drained()
+
+        # A lease corrupted after its claim is retired once the lease lapses
+        (queue.root / "leased" / "000001-corrupt.json").write_text("", encoding="utf-8")
+        assert queue.reap_expired(lease_seconds=60, max_attempts=3) == 0
+        assert queue.reap_expired(lease_seconds=-1, max_attempts=3) == 1
+        assert queue.counts() == {"pending": 0, "leased": 0, "done": 1, "failed": 2}
+        assert queue.is_drained()
+        assert [job.target_id for _, job in queue.finished("failed")] == []
+
+    def test_gives_up_after_max_attempts(self, tmp_path: Path) -> None:
+        queue = _queue(tmp_path, n=1)
+        for _ in range(2):
+            job = queue.claim("w", 60)
+            queue.release(job, "w", "boom", max_attempts=2)
+        assert queue.is_drained()
+        [(_, failed)] = list(queue.finished("failed"))
+        assert failed.attempts == 2 and failed.error == "boom"
+
+    def test_create_discards_previous_run(self, tmp_path: Path) -> None:
+        queue = _queue(tmp_path, n=2)
+        queue.create(queue.manifest(), [])
+        assert queue.counts() == {"pending": 0, "leased": 0, "done": 0, "failed": 0}
+
+
+class TestJobsFromTargets:
+    def test_ids_match_session_registration(self, tmp_path: Path) -> None:
+        targets = ScanTargets(
+            repos=[tmp_path / "app"],
+            images=["nginx:1"],
+            iac_files=[("terraform", tmp_path / "main.tf")],
+            k8s_resources=[{"context": "prod", "namespace": "default"}],
+        )
+        jobs = jobs_from_targets(targets)
+        assert [(j.target_type, j.target_id) for j in jobs] == [
+            ("repo", "app"),
+            ("image", "nginx:1"),
+            ("iac", str(tmp_path / "main.tf")),
+            ("k8s", "prod:default"),
+        ]
+        assert jobs[0].payload == str((tmp_path / "app").resolve())
+
+    def test_skips_completed(self) -> None:
+        targets = ScanTargets(images=["a:1", "b:1"])
+        jobs = jobs_from_targets(targets, is_completed=lambda tid: tid == "a:1")
+        assert [j.target_id for j in jobs] == ["b:1"]
+
+
+class TestWorkerAndCoordinator:
+    def test_worker_scans_everything_and_coordinator_checkpoints(
+        self, tmp_path: Path
+    ) -> None:
+        queue = _queue(tmp_path, n=5)
+        session = ScanSession("s", "fast", "", 0.0, 0)
+        for i in range(5):
+            session.register_target("image", f"img{i}:latest", ["trivy"])
+
+        scanned: list[str] = []
+        lock = threading.Lock()
+
+        def run_job(job: QueueJob, *args) -> dict:
+            # MagicMock's call counting is not thread-safe
+            with lock:
+                scanned.append(job.target_id)
+            return {"trivy": True}
+
+        with patch("scripts.cli.scan_queue.run_job", side_effect=run_job):
+            assert run_worker(queue, threads=3, poll_interval=0.01) == 5
+        assert sorted(scanned) == [f"img{i}:latest" for i in range(5)]
+        assert queue.counts()["done"] == 5
+
+        results = coordinate(queue, session=session, poll_interval=0.01)
+        assert sorted(r[0] for r in results) == [f"img{i}:latest" for i in range(5)]
+        assert session.completed_count == 5
+
+    def test_failing_target_is_retried_then_reported_empty(
+        self, tmp_path: Path
+    ) -> None:
+        queue = _queue(tmp_path, n=1, max_attempts=2)
+        session = ScanSession("s", "fast", "", 0.0, 0)
+        session.register_target("image", "img0:latest", ["trivy"])
+
+        with patch(
+            "scripts.cli.scan_queue.run_job", side_effect=RuntimeError("boom")
+        ) as run:
+            assert run_worker(queue, poll_interval=0.01) == 0
+        assert run.call_count == 2
+
+        assert coordinate(queue, session=session, poll_interval=0.01) == [
+            ("img0:latest", {})
+        ]
+        assert not session.is_target_completed("img0:latest")
+
+    def test_coordinator_gives_up_when_local_workers_cannot_run(
+        self, tmp_path: Path
+    ) -> None:
+        queue = _queue(tmp_path, n=2)
+
+        def broken_worker() -> subprocess.Popen:
+            # A worker that dies at startup, as in a frozen build
+            return subprocess.Popen([sys.executable, "-c", "raise SystemExit(3)"])
+
+        spawned = [0]
+
+        def respawn() -> subprocess.Popen:
+            spawned[0] += 1
+            return broken_worker()
+
+        with pytest.raises(WorkersExitedError, match="2 target"):
+            coordinate(
+                queue,
+                local_workers=[broken_worker()],
+                respawn=respawn,
+                poll_interval=0.01,
+            )
+
+        assert spawned[0] == 3
+        assert queue.is_drained()
+        failed = [job for _, job in queue.finished("failed")]
+        assert [job.attempts for job in failed] == [0, 0]
+        assert "exit codes: 3" in failed[0].error
+
+
+class TestOrchestratorDistributed:
+    def test_scan_all_routes_through_queue(self, tmp_path: Path) -> None:
+        config = ScanConfig(
+            tools=["trivy"],
+            results_dir=tmp_path / "results",
+            distributed=True,
+            local_workers=0,
+        )
+        orchestrator = ScanOrchestrator(config)
+        targets = ScanTargets(images=["a:1", "b:1"])
+        queue = queue_for_results(config.results_dir)
+
+        def remote_worker() -> None:
+            # Stands in for `jmo worker` on another host.
+            while not (queue.root / "queue.json").exists():
+                time.sleep(0.01)
+            run_worker(queue, poll_interval=0.01)
+
+        with patch("scripts.cli.scan_queue.run_job", return_value={"trivy": True}):
+            worker = threading.Thread(target=remote_worker)
+            worker.start()
+            results = orchestrator.scan_all(targets, {})
+            worker.join(timeout=10)
+
+        assert sorted(results) == [("a:1", {"trivy": True}), ("b:1", {"trivy": True})]
+
+    def test_manifest_round_trips_retry_config(self) -> None:
+        from scripts.core.config import RetryConfig
+
+        config = ScanConfig(
+            tools=["trivy"], results_dir=Path("r"), retries=RetryConfig(max_attempts=4)
+        )
+        manifest = build_manifest(config, {}, lease_seconds=30, max_attempts=3)
+        assert RetryConfig(**manifest["retries"]).max_attempts == 4
+
+    def test_rejects_negative_local_workers(self) -> None:
+        with pytest.raises(ValueError, match="local_workers"):
+            ScanConfig(tools=["trivy"], results_dir=Path("r"), local_workers=-1)
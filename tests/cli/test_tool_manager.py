@@ -1817,3 +1817,155 @@ class TestCleanEnvPathSeparator:
         assert (
             sentinel in entries
         ), f"the pre-existing first PATH entry was swallowed. entries[0]={entries[0]!r}"
+
+
+class TestPersistentStatusCache:
+    """Version probes persisted across ToolManager instances (processes)."""
+
+    @staticmethod
+    def _manager(cache_dir, binary):
+        from scripts.cli.tool_manager import ToolManager
+
+        mock_tool = MagicMock()
+        mock_tool.get_binary_name.return_value = "trivy"
+        mock_tool.version = "0.50.0"
+        mock_tool.critical = False
+        mock_registry = MagicMock()
+        mock_registry.get_tool.return_value = mock_tool
+
+        manager = ToolManager(registry=mock_registry, cache_dir=cache_dir)
+        manager._find_binary = MagicMock(return_value=str(binary))
+        manager._verify_execution = MagicMock(return_value=(True, None, []))
+        return manager
+
+    @staticmethod
+    def _replace(binary, content: bytes) -> None:
+        binary.write_bytes(content)
+        st = binary.stat()
+        os.utime(binary, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    def test_probe_reused_by_next_manager(self, tmp_path):
+        binary = tmp_path / "trivy"
+        binary.write_bytes(b"#!/bin/sh\n")
+        first = self._manager(tmp_path / "cache", binary)
+        first._get_tool_version = MagicMock(return_value=("0.50.0", None))
+        first.check_tool("trivy")
+
+        second = self._manager(tmp_path / "cache", binary)
+        second._get_tool_version = MagicMock(side_effect=AssertionError("probed"))
+
+        assert second.check_tool("trivy").installed_version == "0.50.0"
+
+    def test_upgraded_binary_is_probed_again(self, tmp_path):
+        binary = tmp_path / "trivy"
+        binary.write_bytes(b"#!/bin/sh\n")
+        first = self._manager(tmp_path / "cache", binary)
+        first._get_tool_version = MagicMock(return_value=("0.49.0", None))
+        first.check_tool("trivy")
+
+        self._replace(binary, b"#!/bin/sh\n# 0.50.0\n")
+        second = self._manager(tmp_path / "cache", binary)
+        second._get_tool_version = MagicMock(return_value=("0.50.0", None))
+
+        assert second.check_tool("trivy").installed_version == "0.50.0"
+        second._get_tool_version.assert_called_once()
+
+    def test_symlink_retarget_is_probed_again(self, tmp_path):
+        old, new = tmp_path / "trivy-0.49", tmp_path / "trivy-0.50"
+        old.write_bytes(b"old\n")
+        new.write_bytes(b"new\n")
+        link = tmp_path / "trivy"
+        try:
+            link.symlink_to(old)
+        except OSError:
+            import pytest
+
+            pytest.skip("symlinks not available")
+        first = self._manager(tmp_path / "cache", link)
+        first._get_tool_version = MagicMock(return_value=("0.49.0", None))
+        first.check_tool("trivy")
+
+        link.unlink()
+        link.symlink_to(new)
+        second = self._manager(tmp_path / "cache", link)
+        second._get_tool_version = MagicMock(return_value=("0.50.0", None))
+
+        assert second.check_tool("trivy").installed_version == "0.50.0"
+
+    def test_failed_probe_is_not_cached(self, tmp_path):
+        binary = tmp_path / "trivy"
+        binary.write_bytes(b"#!/bin/sh\n")
+        first = self._manager(tmp_path / "cache", binary)
+        first._get_tool_version = MagicMock(return_value=(None, "Startup crash"))
+        assert first.check_tool("trivy").execution_ready is False
+
+        second = self._manager(tmp_path / "cache", binary)
+        second._get_tool_version = MagicMock(return_value=("0.50.0", None))
+
+        assert second.check_tool("trivy").installed_version == "0.50.0"
+
+    def test_invalidate_drops_persisted_entry(self, tmp_path):
+        binary = tmp_path / "trivy"
+        binary.write_bytes(b"#!/bin/sh\n")
+        manager = self._manager(tmp_path / "cache", binary)
+        manager._get_tool_version = MagicMock(return_value=("0.50.0", None))
+        manager.check_tool("trivy")
+
+        manager.invalidate_status_cache("trivy")
+        manager.check_tool("trivy")
+        fresh = self._manager(tmp_path / "cache", binary)
+        fresh._get_tool_version = MagicMock(return_value=("0.50.0", None))
+        fresh.invalidate_status_cache()
+        fresh.check_tool("trivy")
+
+        assert manager._get_tool_version.call_count == 2
+        fresh._get_tool_version.assert_called_once()
+
+    def test_changed_probe_recipe_invalidates(self, tmp_path, monkeypatch):
+        from scripts.cli import tool_manager
+
+        binary = tmp_path / "trivy"
+        binary.write_bytes(b"#!/bin/sh\n")
+        first = self._manager(tmp_path / "cache", binary)
+        first._get_tool_version = MagicMock(return_value=("0.50.0", None))
+        first.check_tool("trivy")
+
+        monkeypatch.setitem(tool_manager.VERSION_COMMANDS, "trivy", ["trivy", "-v"])
+        second = self._manager(tmp_path / "cache", binary)
+        second._get_tool_version = MagicMock(return_value=("0.50.0", None))
+        second.check_tool("trivy")
+
+        second._get_tool_version.assert_called_once()
+
+    def test_corrupt_cache_file_is_ignored(self, tmp_path):
+        from scripts.cli.tool_manager import STATUS_CACHE_FILE
+
+        binary = tmp_path / "trivy"
+        binary.write_bytes(b"#!/bin/sh\n")
+        (tmp_path / "cache").mkdir()
+        (tmp_path / "cache" / STATUS_CACHE_FILE).write_text("{not json")
+        manager = self._manager(tmp_path / "cache", binary)
+        manager._get_tool_version = MagicMock(return_value=("0.50.0", None))
+
+        assert manager.check_tool("trivy").installed_version == "0.50.0"
+
+
+def test_check_profile_probes_tools_concurrently():
+    """Probes overlap, and results keep the profile's tool order."""
+    import threading
+
+    from scripts.cli.tool_manager import PROFILE_TOOLS, ToolManager, ToolStatus
+
+    manager = ToolManager()
+    first_two = PROFILE_TOOLS["fast"][:2]
+    both_running = threading.Barrier(2, timeout=10)
+
+    def probe(name):
+        if name in first_two:
+            both_running.wait()  # BrokenBarrierError if probes run serially
+        return ToolStatus(name=name, installed=True)
+
+    with patch.object(manager, "check_tool", side_effect=probe):
+        statuses = manager.check_profile("fast")
+
+    assert list(statuses) == list(dict.fromkeys(PROFILE_TOOLS["fast"]))
@@ -8,6 +8,7 @@ This module provides:
 - Common test utilities
 """
 
+import itertools
 import subprocess
 import sys
 from pathlib import Path
@@ -252,6 +253,31 @@ def _restore_scan_logging():
     reset_scan_logging()
 
 
+# ---------------------------------------------------------------------------
+# The persistent tool-status cache lives in the real ~/.jmo/cache.
+# ---------------------------------------------------------------------------
+# A test that mocks a version probe for a binary that really exists (python,
+# node) would otherwise store the fake version there, and a later test - or
+# the developer's next real scan - would be answered from it. Point every
+# test at its own empty cache directory instead.
+
+
+_tool_status_cache_ids = itertools.count()
+
+
+@pytest.fixture(autouse=True)
+def _isolate_tool_status_cache(tmp_path_factory, monkeypatch):
+    """Give each test a private, initially empty tool-status cache."""
+    from scripts.cli import tool_manager
+
+    cache_dir = (
+        tmp_path_factory.getbasetemp()
+        / "tool-status-cache"
+        / str(next(_tool_status_cache_ids))
+    )
+    monkeypatch.setattr(tool_manager, "default_status_cache_dir", lambda: cache_dir)
+
+
 # ---------------------------------------------------------------------------
 # Repo walking that prunes during traversal, not after.
 # ---------------------------------------------------------------------------
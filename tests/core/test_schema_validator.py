@@ -6,6 +6,7 @@ Covers:
 - validate_findings(): Batch validation, error aggregation
 - validate_findings_file(): File format handling (array, dict, single)
 - validate_directory(): Directory traversal, exclude patterns
+- Compiled validator: fast path agreement, caching, parallel validation
 - JSONSCHEMA_AVAILABLE fallback when jsonschema is not installed
 """
 
@@ -490,3 +491,88 @@ class TestValidateDirectory:
         result = validate_directory(tmp_path)
         # bad.json should have errors
         assert len(result) >= 1
+
+
+# ========== Category 6: Compiled validator and parallel validation ==========
+
+
+class TestCompiledValidator:
+    """Tests for the cached, fast-path validator and worker-process paths."""
+
+    @pytest.fixture(autouse=True)
+    def _require_jsonschema(self):
+        from scripts.core.schema_validator import JSONSCHEMA_AVAILABLE
+
+        if not JSONSCHEMA_AVAILABLE:
+            pytest.skip("jsonschema not installed")
+
+    def test_fast_path_covers_commonfinding_schema(self):
+        """Test the CommonFinding schema compiles to an exact fast path."""
+        from scripts.core.schema_validator import get_validator, load_schema
+
+        validator = get_validator(load_schema())
+
+        assert validator.exact
+        assert validator.fast_check(make_valid_finding())
+        for invalid in [
+            make_valid_finding(severity="SEVERE"),
+            make_valid_finding(location={"path": "a.py", "startLine": -1}),
+            make_valid_finding(remediation=5),
+            {k: v for k, v in make_valid_finding().items() if k != "tool"},
+        ]:
+            assert not validator.fast_check(invalid)
+            assert validator.errors(invalid)
+
+    def test_unsupported_keywords_fall_back_to_jsonschema(self):
+        """Test keywords the fast path skips still get validated."""
+        from scripts.core.schema_validator import get_validator
+
+        schema = {"type": "object", "properties": {"id": {"pattern": "^f-"}}}
+        validator = get_validator(schema)
+
+        assert not validator.exact
+        assert validator.errors({"id": "f-1"}) == []
+        assert validator.errors({"id": "x"})
+
+    def test_validator_and_schema_are_cached(self):
+        """Test the schema is parsed and compiled once."""
+        from scripts.core.schema_validator import get_validator, load_schema
+
+        schema = load_schema()
+
+        assert load_schema() is schema
+        assert get_validator(schema) is get_validator(schema)
+
+    def test_parallel_findings_match_serial(self, monkeypatch: pytest.MonkeyPatch):
+        """Test chunked worker-process validation reports the same errors."""
+        from scripts.core import schema_validator
+
+        findings = [
+            make_valid_finding(id=f"f-{i}", severity="BAD" if i % 2 else "HIGH")
+            for i in range(10)
+        ]
+        serial = schema_validator.validate_findings(findings, workers=1)
+
+        monkeypatch.setattr(schema_validator, "PARALLEL_MIN_FINDINGS", 2)
+        monkeypatch.setattr(schema_validator, "CHUNK_SIZE", 2)
+        parallel = schema_validator.validate_findings(findings, workers=2)
+
+        assert parallel == serial
+        assert sorted(parallel) == ["f-1", "f-3", "f-5", "f-7", "f-9"]
+
+    def test_parallel_directory_matches_serial(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test worker-process directory validation reports the same files."""
+        from scripts.core import schema_validator
+
+        for i in range(4):
+            write_json(tmp_path, f"ok{i}.json", [make_valid_finding()])
+        write_json(tmp_path, "bad.json", [make_valid_finding(severity="BAD")])
+        serial = schema_validator.validate_directory(tmp_path, workers=1)
+
+        monkeypatch.setattr(schema_validator, "PARALLEL_MIN_FILES", 2)
+        parallel = schema_validator.validate_directory(tmp_path, workers=2)
+
+        assert parallel == serial
+        assert list(parallel) == [str(tmp_path / "bad.json")]
@@ -0,0 +1,98 @@
+"""
+Tests for scripts/jmo_mcp/utils/async_runtime.py (async MCP server mode).
+"""
+
+import asyncio
+import inspect
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+from scripts.jmo_mcp.utils.async_runtime import AsyncToolRunner, FindingsWatcher
+from scripts.jmo_mcp.utils.findings_loader import FindingsLoader
+
+
+@pytest.fixture
+def runner():
+    runner = AsyncToolRunner(io_workers=2, db_workers=1)
+    yield runner
+    runner.shutdown()
+
+
+class TestAsyncToolRunner:
+    """Blocking tools wrapped as coroutines."""
+
+    def test_wrapped_tool_keeps_signature(self, runner):
+        def tool(severity: list[str] | None = None, limit: int = 100) -> dict:
+            """Doc."""
+            return {"severity": severity, "limit": limit}
+
+        handler = runner.wrap(tool)
+
+        assert inspect.iscoroutinefunction(handler)
+        assert handler.__name__ == "tool" and handler.__doc__ == "Doc."
+        assert inspect.signature(handler) == inspect.signature(tool)
+        assert asyncio.run(handler(limit=5)) == {"severity": None, "limit": 5}
+
+    def test_blocking_calls_run_concurrently(self, runner):
+        """Two blocking calls overlap instead of queueing on the event loop."""
+        barrier = threading.Barrier(2, timeout=5)
+        handler = runner.wrap(lambda: barrier.wait())
+
+        async def both():
+            return await asyncio.gather(handler(), handler())
+
+        assert sorted(asyncio.run(both())) == [0, 1]
+
+    def test_errors_propagate_and_unknown_pool_rejected(self, runner):
+        def broken():
+            raise ValueError("Finding not found: x")
+
+        with pytest.raises(ValueError, match="Finding not found"):
+            asyncio.run(runner.wrap(broken, pool="db")())
+        with pytest.raises(ValueError, match="Unknown executor pool"):
+            runner.wrap(broken, pool="gpu")
+
+
+class TestFindingsWatcher:
+    """Background refresh of the findings index."""
+
+    def test_poll_rebuilds_only_on_change(self, tmp_path: Path):
+        summaries = tmp_path / "summaries"
+        summaries.mkdir()
+        findings_file = summaries / "findings.json"
+        findings_file.write_text(json.dumps([{"id": "a"}]), encoding="utf-8")
+        loader = FindingsLoader(tmp_path)
+        watcher = FindingsWatcher(lambda: loader, interval=60)
+
+        assert watcher.poll() is True
+        assert watcher.poll() is False
+
+        findings_file.write_text(json.dumps([{"id": "a"}, {"id": "b"}]))
+        assert watcher.poll() is True
+        assert loader.get_total_count() == 2
+
+    def test_poll_keeps_serving_through_bad_writes(self, tmp_path: Path):
+        summaries = tmp_path / "summaries"
+        summaries.mkdir()
+        findings_file = summaries / "findings.json"
+        findings_file.write_text("[]", encoding="utf-8")
+        loader = FindingsLoader(tmp_path)
+        watcher = FindingsWatcher(lambda: loader, interval=60)
+        watcher.poll()
+
+        findings_file.write_text('[{"id": ', encoding="utf-8")
+        assert watcher.poll() is False
+        findings_file.unlink()
+        assert watcher.poll() is False
+
+    def test_missing_results_do_not_stop_watcher(self):
+        def no_results():
+            raise FileNotFoundError("Findings file not found")
+
+        watcher = FindingsWatcher(no_results, interval=0.01)
+        watcher.start()
+        watcher.stop()
+        assert watcher.poll() is False
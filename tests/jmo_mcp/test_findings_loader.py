@@ -486,3 +486,57 @@ class TestEdgeCases:
         filtered = loader.filter_findings(findings, tool="test")
         # Should return empty since finding has no tool field
         assert len(filtered) == 0
+
+
+class TestFindingsIndex:
+    """Test the cached, mtime-invalidated findings index."""
+
+    @pytest.mark.parametrize(
+        "filters",
+        [
+            {},
+            {"severity": ["high", "CRITICAL"]},
+            {"tool": "semgrep"},
+            {"severity": ["HIGH"], "path": "src"},
+            {"rule_id": "no-such-rule"},
+        ],
+    )
+    def test_query_matches_filter_findings(
+        self, results_dir_with_findings: Path, filters: dict
+    ):
+        """Indexed queries return the same page and total as list filtering."""
+        loader = FindingsLoader(results_dir_with_findings)
+        findings = loader.load_findings()
+
+        page, total = loader.query(**filters, limit=2, offset=1)
+
+        expected_all = loader.filter_findings(findings, **filters, limit=10**6)
+        assert total == len(expected_all)
+        assert page == expected_all[1:3]
+
+    def test_index_reused_until_file_changes(
+        self, results_dir_with_findings: Path, monkeypatch
+    ):
+        """findings.json is parsed once and re-read only after it changes."""
+        loader = FindingsLoader(results_dir_with_findings)
+        reads = []
+        original = loader._read_findings
+
+        def counting_read():
+            reads.append(1)
+            return original()
+
+        monkeypatch.setattr(loader, "_read_findings", counting_read)
+
+        first = loader.index()
+        loader.get_total_count()
+        loader.get_finding_by_id("missing")
+        assert loader.index() is first
+        assert len(reads) == 1
+
+        loader.findings_file.write_text(
+            json.dumps([{"id": "new-1", "severity": "LOW"}]), encoding="utf-8"
+        )
+        assert loader.get_finding_by_id("new-1") == {"id": "new-1", "severity": "LOW"}
+        assert loader.get_total_count() == 1
+        assert len(reads) == 2
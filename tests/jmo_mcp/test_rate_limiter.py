@@ -7,11 +7,15 @@ Tests:
 - TokenBucket refill behavior
 - RateLimiter per-client tracking
 - RateLimiter reset functionality
+- RateLimiter idle/LRU eviction and state persistence
 """
 
+import json
 import threading
 import time
 
+import pytest
+
 from scripts.jmo_mcp.utils.rate_limiter import RateLimiter, TokenBucket
 
 
@@ -308,3 +312,95 @@ class TestRateLimiterEdgeCases:
         for client_id, count in successes_per_client.items():
             assert count > 0  # At least some requests succeeded
             assert count <= 15  # Not more than requested
+
+
+class TestRateLimiterEviction:
+    """Test bounded memory: idle TTL and per-shard LRU cap."""
+
+    def test_idle_buckets_are_dropped(self):
+        """Test buckets idle past the TTL are evicted on later checks."""
+        limiter = RateLimiter(capacity=5, refill_rate=1.0, shards=1, idle_ttl=0.05)
+
+        limiter.check_rate_limit("ephemeral")
+        time.sleep(0.1)
+        limiter.check_rate_limit("active")
+
+        assert "ephemeral" not in limiter.buckets
+        assert "active" in limiter.buckets
+
+    def test_default_ttl_is_full_refill_time(self):
+        """Test eviction waits until an idle bucket would be full again."""
+        limiter = RateLimiter(capacity=100, refill_rate=2.0)
+        assert limiter.idle_ttl == 50.0
+
+    def test_client_cap_evicts_least_recently_used(self):
+        """Test the client cap keeps recently used buckets."""
+        limiter = RateLimiter(capacity=10, refill_rate=0.0, shards=1, max_clients=3)
+
+        for client_id in ["a", "b", "c"]:
+            limiter.check_rate_limit(client_id)
+        limiter.check_rate_limit("a")  # a becomes most recent
+        limiter.check_rate_limit("d")  # evicts b
+
+        assert set(limiter.buckets) == {"a", "c", "d"}
+
+    def test_status_does_not_track_unknown_clients(self):
+        """Test status lookups for unseen clients allocate nothing."""
+        limiter = RateLimiter(capacity=10, refill_rate=1.0)
+
+        assert limiter.get_client_status("nobody")["remaining_tokens"] == 10.0
+        assert len(limiter.buckets) == 0
+
+
+class TestRateLimiterPersistence:
+    """Test saving and restoring bucket state across restarts."""
+
+    def test_round_trip(self, tmp_path):
+        """Test exhausted clients stay limited after a restart."""
+        state = tmp_path / "limits.json"
+        limiter = RateLimiter(capacity=3, refill_rate=0.0, state_file=state)
+        for _ in range(3):
+            limiter.check_rate_limit("busy")
+        limiter.check_rate_limit("light")
+        limiter.get_client_status("idle")
+
+        assert limiter.save_state() == 2
+
+        restarted = RateLimiter(capacity=3, refill_rate=0.0, state_file=state)
+        assert restarted.check_rate_limit("busy") is False
+        assert restarted.get_client_status("light")["remaining_tokens"] == 2.0
+
+    def test_downtime_refills_tokens(self, tmp_path):
+        """Test tokens refill for the time the server was stopped."""
+        state = tmp_path / "limits.json"
+        state.write_text(
+            json.dumps(
+                {
+                    "version": 1,
+                    "buckets": {
+                        "old": [0.0, time.time() - 3600],
+                        "recent": [0.0, time.time()],
+                    },
+                }
+            )
+        )
+
+        limiter = RateLimiter(capacity=10, refill_rate=1.0, state_file=state)
+
+        assert "old" not in limiter.buckets  # fully refilled, not restored
+        assert limiter.get_client_status("recent")["remaining_tokens"] < 1.0
+
+    def test_corrupt_state_is_ignored(self, tmp_path):
+        """Test a bad state file never stops the limiter from starting."""
+        state = tmp_path / "limits.json"
+        state.write_text("{not json")
+
+        limiter = RateLimiter(capacity=10, refill_rate=1.0, state_file=state)
+
+        assert len(limiter.buckets) == 0
+        assert limiter.check_rate_limit("client1") is True
+
+    def test_save_without_path_raises(self):
+        """Test save_state needs a destination."""
+        with pytest.raises(ValueError):
+            RateLimiter().save_state()
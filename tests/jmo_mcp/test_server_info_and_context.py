@@ -1,5 +1,5 @@
 """
-Tests for get_server_info and get_finding_context MCP tools.
+Tests for get_server_info, get_finding_context and get_findings_context MCP tools.
 
 Combined file for efficiency to complete Phase 2B endpoint testing.
 """
@@ -11,6 +11,7 @@ import pytest
 
 from scripts.jmo_mcp.jmo_server import (
     get_finding_context,
+    get_findings_context,
     get_server_info,
     rate_limiter,
 )
@@ -160,3 +161,54 @@ def test_get_finding_context_remediation_structure(mock_env):
     assert "references" in remediation
     assert "cwe" in remediation
     assert "owasp" in remediation
+
+
+def test_get_finding_context_sbom(mock_env):
+    """SBOM packages come from the scan's SBOM index when there is one"""
+    assert get_finding_context("fingerprint-crypto-001")["sbom"] is None
+
+    target = mock_env / "results" / "individual-repos" / "app"
+    target.mkdir(parents=True)
+    artifact = {
+        "name": "golang.org/x/crypto",
+        "version": "0.14.0",
+        "locations": [{"path": "src/auth.go"}],
+    }
+    (target / "syft.json").write_text(json.dumps({"artifacts": [artifact]}))
+    # A new report is what makes the server reopen the indexes
+    findings_json = mock_env / "results" / "summaries" / "findings.json"
+    findings_json.write_text(findings_json.read_text() + "\n")
+
+    trivy = get_finding_context("fingerprint-crypto-001")["sbom"]
+    semgrep = get_finding_context("fingerprint-xss-001")["sbom"]
+
+    assert trivy["package"]["version"] == "0.14.0"
+    assert [p["name"] for p in trivy["packages_in_file"]] == ["golang.org/x/crypto"]
+    assert semgrep == {"package": None, "packages_in_file": []}
+
+
+# ==============================================================================
+# get_findings_context Tests
+# ==============================================================================
+
+
+def test_get_findings_context_matches_single_lookups(mock_env):
+    """Batched contexts equal per-finding resource reads; unknown IDs listed"""
+    ids = ["fingerprint-xss-001", "fingerprint-sqli-001"]
+
+    result = get_findings_context(ids + ["nonexistent-finding"])
+
+    assert result["missing"] == ["nonexistent-finding"]
+    assert list(result["contexts"]) == ids
+    for finding_id in ids:
+        single = get_finding_context(finding_id)
+        batched = result["contexts"][finding_id]
+        assert batched["finding"] == single["finding"]
+        assert batched["source_code"] == single["source_code"]
+        assert batched["sbom"] == single["sbom"]
+
+
+def test_get_findings_context_rejects_large_batches(mock_env):
+    """More than 50 IDs per call is rejected"""
+    with pytest.raises(ValueError, match="At most 50"):
+        get_findings_context([f"id-{i}" for i in range(51)])
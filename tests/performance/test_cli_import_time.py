@@ -0,0 +1,97 @@
+"""Import-time budget for the jmo CLI.
+
+``jmo`` is spawned thousands of times a day from hooks and schedulers, so
+starting it must not import command modules or heavy dependencies that the
+invoked command never uses. Each check runs a fresh interpreter with
+``python -X importtime`` and inspects what was imported; the budget is a
+module count, which unlike wall-clock time is stable under load.
+
+Run with: pytest tests/performance/test_cli_import_time.py -v -s
+"""
+
+from __future__ import annotations
+
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).parent.parent.parent
+
+# Modules `import scripts.cli.jmo` may add to a bare interpreter. About 70
+# today; the old eager imports added ~400 (and took ~500ms instead of ~100ms).
+MODULE_BUDGET = 150
+
+# Imported only by the command that needs them
+DEFERRED_MODULES = [
+    "rich",
+    "scripts.cli.ci_orchestrator",
+    "scripts.cli.diff_commands",
+    "scripts.cli.history_commands",
+    "scripts.cli.policy_commands",
+    "scripts.cli.report_orchestrator",
+    "scripts.cli.scan_orchestrator",
+    "scripts.cli.schedule_commands",
+    "scripts.cli.trend_commands",
+    "scripts.core.compliance_mapper",
+    "scripts.core.history_db",
+    "scripts.core.normalize_and_report",
+    "scripts.core.warm_tools",
+]
+
+_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def _importtime(code: str, *args: str) -> dict[str, int]:
+    """Cumulative import time (us) of every module imported by ``code``."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code, *args],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+    times = {}
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            times[match.group(4)] = int(match.group(2))
+    return times
+
+
+@pytest.mark.benchmark
+class TestCLIImportTime:
+    def test_startup_defers_command_modules(self) -> None:
+        imported = _importtime("import scripts.cli.jmo")
+
+        assert "scripts.cli.jmo" in imported
+        assert [m for m in DEFERRED_MODULES if m in imported] == []
+
+    def test_help_defers_command_modules(self) -> None:
+        imported = _importtime(
+            "import sys; from scripts.cli.jmo import main; "
+            "sys.argv = ['jmo', '--help']; main()",
+        )
+
+        assert [m for m in DEFERRED_MODULES if m in imported] == []
+
+    def test_tools_command_defers_other_commands(self) -> None:
+        imported = _importtime("import scripts.cli.jmo, scripts.cli.tool_commands")
+
+        assert [m for m in DEFERRED_MODULES if m in imported] == []
+
+    def test_startup_within_budget(self) -> None:
+        baseline = _importtime("pass")
+        imported = _importtime("import scripts.cli.jmo")
+        added = sorted(set(imported) - set(baseline))
+        # Wall-clock time is printed for comparison only: it varies too much
+        # with machine load to assert on, while the module count does not.
+        print(
+            f"\nimport scripts.cli.jmo: {imported['scripts.cli.jmo'] / 1000:.1f}ms, "
+            f"{len(added)} modules"
+        )
+
+        assert len(added) <= MODULE_BUDGET, added
@@ -0,0 +1,79 @@
+"""Benchmark JSON codec backends on the sample results.
+
+Compares every installed backend (orjson, msgspec, stdlib) on the layouts
+``jmo report`` writes (indented findings.json, compact dashboard data) and on
+parsing, using tests/fixtures/findings/sample-findings.json scaled up to a
+report-sized document. Each backend must round-trip to the same data as the
+stdlib; timings are printed for comparison, not asserted against targets.
+
+Run with: pytest tests/performance/test_json_codec_benchmark.py -v -s
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from scripts.core import json_codec
+
+SAMPLE = Path(__file__).parent.parent / "fixtures" / "findings" / "sample-findings.json"
+SCALE = 2000
+
+
+@pytest.fixture(scope="module")
+def report_doc() -> dict[str, Any]:
+    sample = json.loads(SAMPLE.read_text(encoding="utf-8"))
+    findings = [
+        {**finding, "id": f"{finding['id']}-{i}"}
+        for i in range(SCALE)
+        for finding in sample
+    ]
+    return {"meta": {"scan_id": "benchmark"}, "findings": findings}
+
+
+@pytest.fixture(params=json_codec.available_backends())
+def backend(request: pytest.FixtureRequest) -> Iterator[str]:
+    previous = json_codec.use_backend(request.param)
+    yield request.param
+    json_codec.use_backend(previous)
+
+
+def _best_of(fn: Any, rounds: int = 3) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@pytest.mark.benchmark
+class TestJSONCodecBackends:
+    @pytest.mark.parametrize(
+        "layout",
+        [
+            {"indent": 2, "ensure_ascii": False},
+            {"separators": json_codec.COMPACT_SEPARATORS},
+        ],
+        ids=["indent", "compact"],
+    )
+    def test_dumps(
+        self, backend: str, report_doc: dict[str, Any], layout: dict[str, Any]
+    ) -> None:
+        text = json_codec.dumps(report_doc, **layout)
+        assert json.loads(text) == report_doc
+
+        seconds = _best_of(lambda: json_codec.dumps(report_doc, **layout))
+        print(f"\n{backend} dumps ({len(text) / 1e6:.1f} MB): {seconds * 1000:.1f}ms")
+
+    def test_loads(self, backend: str, report_doc: dict[str, Any]) -> None:
+        text = json.dumps(report_doc, indent=2)
+        assert json_codec.loads(text) == report_doc
+
+        seconds = _best_of(lambda: json_codec.loads(text))
+        print(f"\n{backend} loads ({len(text) / 1e6:.1f} MB): {seconds * 1000:.1f}ms")
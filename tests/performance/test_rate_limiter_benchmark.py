@@ -0,0 +1,67 @@
+"""Concurrency benchmark for the MCP server's sharded rate limiter.
+
+Hammers one RateLimiter from several threads with a stream of mostly
+ephemeral client IDs (the shared-deployment pattern), comparing a single lock
+stripe against the default sharding. Memory must stay within the client cap
+and no client may exceed its burst; timings are printed, not asserted.
+
+Run with: pytest tests/performance/test_rate_limiter_benchmark.py -v -s
+"""
+
+from __future__ import annotations
+
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from scripts.jmo_mcp.utils.rate_limiter import DEFAULT_SHARDS, RateLimiter
+
+THREADS = 8
+CHECKS_PER_THREAD = 20_000
+MAX_CLIENTS = 1_000
+CAPACITY = 50
+
+
+def _client_ids(worker: int) -> list[str]:
+    # Every 4th check comes from a hot client shared by all threads; the rest
+    # are ephemeral IDs seen once or twice
+    return [
+        f"hot-{(i // 4) % 8}" if i % 4 == 0 else f"w{worker}-{i // 2}"
+        for i in range(CHECKS_PER_THREAD)
+    ]
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("shards", [1, DEFAULT_SHARDS], ids=["1-shard", "sharded"])
+def test_concurrent_checks(shards: int) -> None:
+    limiter = RateLimiter(
+        capacity=CAPACITY, refill_rate=0.0, shards=shards, max_clients=MAX_CLIENTS
+    )
+    workloads = [_client_ids(w) for w in range(THREADS)]
+
+    def run(ids: list[str]) -> Counter[str]:
+        allowed: Counter[str] = Counter()
+        check = limiter.check_rate_limit
+        for client_id in ids:
+            if check(client_id):
+                allowed[client_id] += 1
+        return allowed
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=THREADS) as pool:
+        results = list(pool.map(run, workloads))
+    seconds = time.perf_counter() - start
+
+    total = sum(results, Counter())
+    # Hot clients are never idle long enough to be evicted, so they are
+    # held to their burst across all threads
+    assert all(total[f"hot-{i}"] == CAPACITY for i in range(8))
+    assert len(limiter.buckets) <= MAX_CLIENTS + shards
+
+    checks = THREADS * CHECKS_PER_THREAD
+    print(
+        f"\n{shards} shard(s): {checks} checks in {seconds * 1000:.0f}ms "
+        f"({seconds / checks * 1e6:.2f}us/check, {len(limiter.buckets)} buckets)"
+    )
@@ -0,0 +1,120 @@
+"""Tests for scripts/core/reporters/dashboard_pages.py and paged dashboard mode."""
+
+from __future__ import annotations
+
+import gzip
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from scripts.core.reporters import html_reporter
+from scripts.core.reporters.dashboard_pages import (
+    compute_facets,
+    write_dashboard_pages,
+)
+from scripts.core.reporters.html_reporter import write_html
+from scripts.core.reporters.report_engine import compute_aggregates
+
+SEVERITIES = ["LOW", "CRITICAL", "INFO", "HIGH", "MEDIUM"]
+
+
+def _finding(i: int, **extra: Any) -> dict[str, Any]:
+    return {
+        "id": f"f{i}",
+        "ruleId": f"rule-{i % 3}",
+        "severity": SEVERITIES[i % 5],
+        "message": f"finding {i}",
+        "tool": {"name": ["semgrep", "trivy"][i % 2], "version": "1"},
+        "location": {"path": f"src/file{i % 4}.py", "startLine": i},
+        **extra,
+    }
+
+
+@pytest.fixture
+def findings() -> list[dict[str, Any]]:
+    items = [_finding(i) for i in range(12)]
+    items[7]["priority"] = {"priority": 90, "is_kev": False}
+    items[9]["priority"] = {"priority": 10, "is_kev": True}
+    return items
+
+
+def _read_pages(directory: Path, manifest: dict[str, Any]) -> list[list[str]]:
+    pages = []
+    for page in manifest["pages"]:
+        data = (directory / page["file"]).read_bytes()
+        if manifest["compression"] == "gzip":
+            data = gzip.decompress(data)
+        pages.append([f["id"] for f in json.loads(data)])
+    return pages
+
+
+class TestWriteDashboardPages:
+    def test_pages_are_fixed_size_and_priority_sorted(
+        self, findings: list[dict[str, Any]], tmp_path: Path
+    ) -> None:
+        manifest = write_dashboard_pages(findings, tmp_path, page_size=5)
+
+        assert manifest["total"] == 12
+        assert [p["count"] for p in manifest["pages"]] == [5, 5, 2]
+        ids = [i for page in _read_pages(tmp_path, manifest) for i in page]
+        # KEV first, then priority score, then severity (input order among equals)
+        assert ids[:4] == ["f9", "f7", "f1", "f6"]
+        assert sorted(ids) == sorted(f["id"] for f in findings)
+        on_disk = json.loads((tmp_path / "manifest.json").read_text(encoding="utf-8"))
+        assert on_disk == manifest
+
+    def test_gzip_pages_and_stale_pages_removed(
+        self, findings: list[dict[str, Any]], tmp_path: Path
+    ) -> None:
+        write_dashboard_pages(findings, tmp_path, page_size=1)
+        manifest = write_dashboard_pages(
+            findings, tmp_path, page_size=10, gzip_pages=True
+        )
+
+        assert manifest["compression"] == "gzip"
+        assert sorted(p.name for p in tmp_path.glob("page-*")) == [
+            "page-00000.json.gz",
+            "page-00001.json.gz",
+        ]
+        assert sum(len(page) for page in _read_pages(tmp_path, manifest)) == 12
+
+    def test_facets_match_with_shared_aggregates(
+        self, findings: list[dict[str, Any]]
+    ) -> None:
+        facets, cardinality = compute_facets(findings)
+        assert (facets, cardinality) == compute_facets(
+            findings, compute_aggregates(findings)
+        )
+        assert list(facets["severity"]) == [
+            "CRITICAL",
+            "HIGH",
+            "MEDIUM",
+            "LOW",
+            "INFO",
+        ]
+        assert facets["tool"] == {"semgrep": 6, "trivy": 6}
+        assert cardinality["path"] == 4
+
+    def test_rejects_non_positive_page_size(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError):
+            write_dashboard_pages([], tmp_path, page_size=0)
+
+
+class TestPagedHtmlMode:
+    def test_large_reports_use_pages(
+        self,
+        findings: list[dict[str, Any]],
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(html_reporter, "INLINE_THRESHOLD", 2)
+        monkeypatch.setattr(html_reporter, "PAGED_THRESHOLD", 10)
+
+        write_html(findings, tmp_path / "dashboard.html", gzip_pages=True)
+
+        html = (tmp_path / "dashboard.html").read_text(encoding="utf-8")
+        assert 'window.__FINDINGS_MANIFEST__ = "dashboard-data/manifest.json"' in html
+        assert (tmp_path / "dashboard-data" / "page-00000.json.gz").exists()
+        assert not (tmp_path / "dashboard-data.json").exists()
@@ -0,0 +1,104 @@
+"""Tests for scripts/core/reporters/json_stream.py and the streaming writers."""
+
+from __future__ import annotations
+
+import gzip
+import io
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from scripts.core.reporters.basic_reporter import write_json
+from scripts.core.reporters.json_stream import JSONStreamWriter, open_json_output
+from scripts.core.reporters.sarif_reporter import to_sarif, write_sarif
+
+FINDINGS: list[dict[str, Any]] = [
+    {
+        "id": f"f{i}",
+        "ruleId": f"rule-{i % 2}",
+        "severity": "HIGH",
+        "message": "line one\nline two </script> café",
+        "tags": ["CWE-79"],
+        "location": {"path": "app.py", "startLine": i, "endLine": i + 1},
+        "detected_by": [{"name": "semgrep"}, {"name": "bandit"}],
+        "empty": {"list": [], "dict": {}},
+    }
+    for i in range(3)
+]
+
+
+def _stream(doc: dict[str, Any], indent: int | None) -> str:
+    buf = io.StringIO()
+    writer = JSONStreamWriter(buf, indent=indent, ensure_ascii=False)
+    writer.begin_object()
+    for key, value in doc.items():
+        if isinstance(value, list):
+            writer.key(key)
+            writer.array(iter(value))
+        else:
+            writer.field(key, value)
+    writer.end_object()
+    return buf.getvalue()
+
+
+class TestJSONStreamWriter:
+    @pytest.mark.parametrize("findings", [FINDINGS, []])
+    def test_indented_output_matches_json_dumps(
+        self, findings: list[dict[str, Any]]
+    ) -> None:
+        doc = {"meta": {"tools": [], "count": len(findings)}, "findings": findings}
+        assert _stream(doc, indent=2) == json.dumps(doc, indent=2, ensure_ascii=False)
+
+    def test_compact_output_has_no_whitespace_between_tokens(self) -> None:
+        doc = {"meta": {"a": 1}, "findings": FINDINGS}
+        text = _stream(doc, indent=None)
+        assert text == json.dumps(doc, separators=(",", ":"), ensure_ascii=False)
+
+    def test_nested_containers(self) -> None:
+        buf = io.StringIO()
+        writer = JSONStreamWriter(buf)
+        writer.begin_array()
+        writer.begin_object()
+        writer.field("k", [1, 2])
+        writer.end_object()
+        writer.begin_array()
+        writer.end_array()
+        writer.end_array()
+        assert buf.getvalue() == json.dumps([{"k": [1, 2]}, []], indent=2)
+
+
+class TestStreamingReporters:
+    def test_write_json_unchanged_and_compact(self, tmp_path: Path) -> None:
+        meta = {"scan_id": "s"}
+        write_json(FINDINGS, tmp_path / "findings.json", metadata=meta)
+        expected = {"meta": meta, "findings": FINDINGS}
+        assert (tmp_path / "findings.json").read_text(encoding="utf-8") == (
+            json.dumps(expected, indent=2, ensure_ascii=False) + "\n"
+        )
+
+        write_json(FINDINGS, tmp_path / "compact.json", metadata=meta, compact=True)
+        compact = (tmp_path / "compact.json").read_text(encoding="utf-8")
+        assert json.loads(compact) == expected
+        assert "\n" not in compact.rstrip("\n")
+
+    def test_write_sarif_matches_to_sarif(self, tmp_path: Path) -> None:
+        write_sarif(FINDINGS + [None], tmp_path / "findings.sarif")  # type: ignore[list-item]
+        assert (tmp_path / "findings.sarif").read_text(encoding="utf-8") == (
+            json.dumps(to_sarif(FINDINGS), indent=2)
+        )
+
+    def test_gzip_copy_has_identical_content(self, tmp_path: Path) -> None:
+        write_sarif(FINDINGS, tmp_path / "findings.sarif", gzip_copy=True)
+        with gzip.open(tmp_path / "findings.sarif.gz", "rt", encoding="utf-8") as fh:
+            assert fh.read() == (tmp_path / "findings.sarif").read_text(
+                encoding="utf-8"
+            )
+
+    def test_open_json_output_creates_parents(self, tmp_path: Path) -> None:
+        target = tmp_path / "a" / "b" / "out.json"
+        with open_json_output(target) as fh:
+            fh.write("{}")
+        assert target.read_text(encoding="utf-8") == "{}"
+        assert not target.with_name("out.json.gz").exists()
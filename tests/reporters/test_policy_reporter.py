@@ -112,7 +112,7 @@ def test_evaluate_policies_success(tmp_path, sample_findings):
             "scripts.core.reporters.policy_reporter.PolicyResult", MockPolicyResult
         ):
             mock_engine = MockEngine.return_value
-            mock_engine.evaluate.return_value = mock_result
+            mock_engine.evaluate_batch.return_value = ({"test_policy": mock_result}, {})
 
             results = evaluate_policies(
                 sample_findings, ["test_policy"], builtin_dir, user_dir
@@ -121,7 +121,9 @@ def test_evaluate_policies_success(tmp_path, sample_findings):
             assert "test_policy" in results
             assert results["test_policy"].passed is True
             assert results["test_policy"].message == "Policy passed"
-            mock_engine.evaluate.assert_called_once()
+            mock_engine.evaluate_batch.assert_called_once_with(
+                sample_findings, [builtin_dir / "test_policy.rego"]
+            )
 
 
 def test_evaluate_policies_missing_policy(tmp_path, sample_findings, caplog):
@@ -155,7 +157,10 @@ def test_evaluate_policies_evaluation_exception(tmp_path, sample_findings, caplo
 
     with patch("scripts.core.reporters.policy_reporter.PolicyEngine") as MockEngine:
         mock_engine = MockEngine.return_value
-        mock_engine.evaluate.side_effect = RuntimeError("Policy evaluation failed")
+        mock_engine.evaluate_batch.return_value = (
+            {},
+            {"fails": RuntimeError("Policy evaluation failed")},
+        )
 
         with caplog.at_level(logging.ERROR):
             results = evaluate_policies(
@@ -185,13 +190,13 @@ def test_evaluate_policies_user_override_builtin(tmp_path, sample_findings):
             mock_result = MockPolicyResult(
                 policy_name="policy", passed=True, message="User policy"
             )
-            mock_engine.evaluate.return_value = mock_result
+            mock_engine.evaluate_batch.return_value = ({"policy": mock_result}, {})
 
             evaluate_policies(sample_findings, ["policy"], builtin_dir, user_dir)
 
             # Verify user policy was used (user_dir policy file should be passed to evaluate)
-            call_args = mock_engine.evaluate.call_args
-            assert call_args[0][1] == user_dir / "policy.rego"
+            call_args = mock_engine.evaluate_batch.call_args
+            assert call_args[0][1] == [user_dir / "policy.rego"]
 
 
 def test_evaluate_policies_empty_directories(sample_findings):
@@ -443,7 +448,7 @@ def test_evaluate_policies_logging(tmp_path, sample_findings, caplog):
             mock_result = MockPolicyResult(
                 policy_name="log_test", passed=True, message="Logged"
             )
-            mock_engine.evaluate.return_value = mock_result
+            mock_engine.evaluate_batch.return_value = ({"log_test": mock_result}, {})
 
             with caplog.at_level(logging.INFO):
                 evaluate_policies(sample_findings, ["log_test"], builtin_dir, user_dir)
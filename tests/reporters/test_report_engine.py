@@ -0,0 +1,136 @@
+"""Tests for scripts/core/reporters/report_engine.py.
+
+The shared aggregates are only an optimisation: every writer must produce
+byte-identical output whether it is handed aggregates or computes its own.
+"""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from scripts.core.reporters.basic_reporter import to_markdown_summary
+from scripts.core.reporters.compliance_reporter import (
+    write_attack_navigator_json,
+    write_compliance_summary,
+    write_pci_dss_report,
+)
+from scripts.core.reporters.report_engine import (
+    ReportJob,
+    compute_aggregates,
+    run_report_jobs,
+)
+from scripts.core.reporters.simple_html_reporter import write_simple_html
+
+
+def _finding(i: int, severity: str, tool: str, **extra: Any) -> dict[str, Any]:
+    return {
+        "id": f"f{i}",
+        "ruleId": f"rule-{i % 3}",
+        "severity": severity,
+        "message": f"finding {i}",
+        "tool": {"name": tool, "version": "1"},
+        "location": {"path": f"src/file{i % 4}.py", "startLine": i},
+        "tags": ["security"],
+        **extra,
+    }
+
+
+@pytest.fixture
+def findings() -> list[dict[str, Any]]:
+    compliance = {
+        "owaspTop10_2021": ["A03:2021"],
+        "cweTop25_2024": [{"id": "CWE-79", "rank": 1}],
+        "pciDss4_0": [{"requirement": "6.2.4", "description": "Injection"}],
+        "mitreAttack": [
+            {"technique": "T1190", "tactic": "Initial Access", "techniqueName": "X"}
+        ],
+    }
+    return [
+        _finding(0, "CRITICAL", "semgrep", compliance=compliance),
+        _finding(1, "LOW", "trivy"),
+        _finding(
+            2,
+            "HIGH",
+            "semgrep",
+            detected_by=[{"name": "semgrep"}, {"name": "bandit"}],
+        ),
+        _finding(3, "HIGH", "trivy", compliance={"nistCsf2_0": [{"function": "ID"}]}),
+        _finding(4, "INFO", "gitleaks"),
+    ]
+
+
+class TestComputeAggregates:
+    def test_single_pass_groupings(self, findings: list[dict[str, Any]]) -> None:
+        agg = compute_aggregates(findings)
+        assert agg.total == 5
+        assert agg.severity_counts == {"CRITICAL": 1, "HIGH": 2, "LOW": 1, "INFO": 1}
+        assert [f["id"] for f in agg.by_severity["HIGH"]] == ["f2", "f3"]
+        assert [f["id"] for f in agg.by_file["src/file0.py"]] == ["f0", "f4"]
+        assert agg.rule_counts["rule-0"] == 2
+        # Consensus findings count once for each detecting tool
+        assert agg.tool_severity["bandit"] == {"HIGH": 1}
+        assert agg.tool_severity["semgrep"] == {"CRITICAL": 1, "HIGH": 1}
+        assert agg.with_compliance == 2
+        assert [f["id"] for f in agg.compliance_findings("pciDss4_0")] == ["f0"]
+        assert agg.compliance_findings("cisControlsV8_1") == []
+
+
+class TestWritersMatchWithoutAggregates:
+    def test_markdown(self, findings: list[dict[str, Any]]) -> None:
+        assert to_markdown_summary(
+            findings, compute_aggregates(findings)
+        ) == to_markdown_summary(findings)
+
+    @pytest.mark.parametrize(
+        "writer",
+        [
+            write_simple_html,
+            write_compliance_summary,
+            write_pci_dss_report,
+            write_attack_navigator_json,
+        ],
+    )
+    def test_file_writers(
+        self, writer: Any, findings: list[dict[str, Any]], tmp_path: Path
+    ) -> None:
+        writer(findings, tmp_path / "plain")
+        writer(findings, tmp_path / "shared", aggregates=compute_aggregates(findings))
+        assert (tmp_path / "plain").read_bytes() == (tmp_path / "shared").read_bytes()
+
+
+class TestRunReportJobs:
+    def test_runs_jobs_concurrently(self) -> None:
+        barrier = threading.Barrier(3, timeout=5)
+        jobs = [ReportJob(f"j{i}", barrier.wait) for i in range(3)]
+        assert run_report_jobs(jobs, max_workers=3) == []
+
+    def test_tolerated_failures_are_returned(self) -> None:
+        def unavailable() -> None:
+            raise RuntimeError("PyYAML not installed")
+
+        written = []
+        jobs = [
+            ReportJob("yaml", unavailable, tolerate=(RuntimeError,)),
+            ReportJob("json", lambda: written.append("json")),
+        ]
+        [(job, error)] = run_report_jobs(jobs)
+        assert job.name == "yaml" and "PyYAML" in str(error)
+        assert written == ["json"]
+
+    def test_other_failures_raise_after_all_jobs_finish(self) -> None:
+        written = []
+
+        def broken() -> None:
+            raise PermissionError("read-only")
+
+        jobs = [
+            ReportJob("sarif", broken),
+            ReportJob("csv", lambda: written.append("csv")),
+        ]
+        with pytest.raises(PermissionError):
+            run_report_jobs(jobs)
+        assert written == ["csv"]
@@ -301,10 +301,10 @@ def test_extract_code_snippet_exception_handling(tmp_path):
     test_file = tmp_path / "test.py"
     test_file.write_text("content")
 
-    # Patch to simulate read error
+    # Patch to simulate read error (small files are read by SourceCache)
     from unittest.mock import patch
 
-    with patch("pathlib.Path.read_text", side_effect=Exception("Read error")):
+    with patch("pathlib.Path.read_bytes", side_effect=Exception("Read error")):
         result = extract_code_snippet(str(test_file), start_line=1)
         assert result is None
 
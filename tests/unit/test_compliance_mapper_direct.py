@@ -744,3 +744,62 @@ def test_enrich_container_vulnerability():
     assert "compliance" in result
     # Should have vulnerability-specific mappings
     assert "cisControlsV8_1" in result["compliance"]
+
+
+# ============================================================================
+# Memoized Enrichment Tests
+# ============================================================================
+
+
+def test_enrich_memoizes_identical_mapping_keys():
+    """Test findings sharing (tool, ruleId, tags, CWEs) reuse one computed mapping."""
+    from scripts.core.compliance_mapper import (
+        _cached_compliance,
+        enrich_findings_with_compliance,
+    )
+
+    _cached_compliance.cache_clear()
+    findings = [
+        create_finding(
+            tool_name="trivy",
+            rule_id="CVE-2024-0001",
+            cwes=["CWE-79"],
+            tags=["sca"],
+            id=f"image-{i}",
+        )
+        for i in range(50)
+    ]
+
+    enriched = enrich_findings_with_compliance(findings)
+
+    info = _cached_compliance.cache_info()
+    assert (info.misses, info.hits) == (1, 49)
+    assert enriched[0]["compliance"] == enriched[49]["compliance"]
+    # Each finding owns its top-level dict
+    enriched[0]["compliance"]["custom"] = ["x"]
+    assert "custom" not in enriched[1]["compliance"]
+    assert "custom" not in _cached_compliance(
+        "trivy", "CVE-2024-0001", ("sca",), ("CWE-79",)
+    )
+
+
+def test_enrich_memoized_matches_uncached_mapping():
+    """Test memoized enrichment equals a fresh computation, including string tags."""
+    from scripts.core.compliance_mapper import (
+        _compute_compliance,
+        enrich_finding_with_compliance,
+    )
+
+    cases = [
+        ("semgrep", "python.lang.security.audit.exec-use", ["sast"], ["CWE-95"]),
+        ("semgrep", "generic.secrets.gitleaks.aws", [], []),
+        ("trufflehog", "AWS", ["secrets"], ["CWE-798"]),
+        ("checkov", "CKV_AWS_1", "iac-secrets", []),
+    ]
+    for tool, rule, tags, cwes in cases:
+        finding = create_finding(tool_name=tool, rule_id=rule, cwes=cwes)
+        finding["tags"] = tags
+        result = enrich_finding_with_compliance(finding)
+        assert result.get("compliance", {}) == _compute_compliance(
+            tool, rule, tags, cwes
+        )
@@ -164,7 +164,9 @@ def test_analyze_remediation_by_developer_with_mocked_blame(mock_repo, mock_hist
     def mock_git_blame(file_path, line_num):
         return {"name": "Alice Smith", "email": "alice@example.com"}
 
-    attrib._git_blame_line = mock_git_blame
+    attrib._git_blame_lines = lambda file_path, line_nums: {
+        n: mock_git_blame(file_path, n) for n in line_nums
+    }
 
     resolved = {"fp1", "fp2"}
     result = attrib.analyze_remediation_by_developer(resolved, mock_history_db)
@@ -189,7 +191,9 @@ def test_analyze_remediation_by_developer_multiple_developers(
         else:
             return {"name": "Bob Johnson", "email": "bob@example.com"}
 
-    attrib._git_blame_line = mock_git_blame
+    attrib._git_blame_lines = lambda file_path, line_nums: {
+        n: mock_git_blame(file_path, n) for n in line_nums
+    }
 
     resolved = {"fp1", "fp2"}  # fp1=main.py, fp2=auth.py
     result = attrib.analyze_remediation_by_developer(resolved, mock_history_db)
@@ -206,7 +210,9 @@ def test_analyze_remediation_tracks_tools(mock_repo, mock_history_db):
     def mock_git_blame(file_path, line_num):
         return {"name": "Alice Smith", "email": "alice@example.com"}
 
-    attrib._git_blame_line = mock_git_blame
+    attrib._git_blame_lines = lambda file_path, line_nums: {
+        n: mock_git_blame(file_path, n) for n in line_nums
+    }
 
     resolved = {"fp1", "fp2"}  # fp1=semgrep, fp2=bandit
     result = attrib.analyze_remediation_by_developer(resolved, mock_history_db)
@@ -223,7 +229,9 @@ def test_analyze_remediation_tracks_cwe(mock_repo, mock_history_db):
     def mock_git_blame(file_path, line_num):
         return {"name": "Alice Smith", "email": "alice@example.com"}
 
-    attrib._git_blame_line = mock_git_blame
+    attrib._git_blame_lines = lambda file_path, line_nums: {
+        n: mock_git_blame(file_path, n) for n in line_nums
+    }
 
     resolved = {"fp1", "fp2"}  # CWE-89, CWE-798
     result = attrib.analyze_remediation_by_developer(resolved, mock_history_db)
@@ -240,7 +248,9 @@ def test_analyze_remediation_tracks_severity(mock_repo, mock_history_db):
     def mock_git_blame(file_path, line_num):
         return {"name": "Alice Smith", "email": "alice@example.com"}
 
-    attrib._git_blame_line = mock_git_blame
+    attrib._git_blame_lines = lambda file_path, line_nums: {
+        n: mock_git_blame(file_path, n) for n in line_nums
+    }
 
     resolved = {"fp1", "fp3"}  # HIGH, CRITICAL
     result = attrib.analyze_remediation_by_developer(resolved, mock_history_db)
@@ -559,7 +569,9 @@ def test_analyze_remediation_missing_location(mock_repo):
     def mock_git_blame(file_path, line_num):
         return {"name": "Alice", "email": "alice@example.com"}
 
-    attrib._git_blame_line = mock_git_blame
+    attrib._git_blame_lines = lambda file_path, line_nums: {
+        n: mock_git_blame(file_path, n) for n in line_nums
+    }
 
     resolved = {"fp1"}
     result = attrib.analyze_remediation_by_developer(resolved, MockDB())
@@ -606,7 +618,9 @@ def test_full_attribution_workflow(mock_repo, mock_history_db):
         else:
             return {"name": "Bob", "email": "bob@example.com"}
 
-    attrib._git_blame_line = mock_git_blame
+    attrib._git_blame_lines = lambda file_path, line_nums: {
+        n: mock_git_blame(file_path, n) for n in line_nums
+    }
 
     # Analyze
     resolved = {"fp1", "fp2", "fp3"}
@@ -626,5 +640,117 @@ def test_full_attribution_workflow(mock_repo, mock_history_db):
     assert team_stats[0].total_resolved == 3
 
 
+# ============================================================================
+# Test Batched Blame
+# ============================================================================
+
+
+@pytest.fixture
+def git_repo(tmp_path):
+    """Create a real git repository with lines from two authors."""
+    repo = tmp_path / "git_repo"
+    repo.mkdir()
+
+    def git(*args, author="Alice <alice@example.com>"):
+        name, email = author[:-1].split(" <")
+        env_args = ["-c", f"user.name={name}", "-c", f"user.email={email}"]
+        subprocess.run(
+            ["git", *env_args, *args], cwd=repo, check=True, capture_output=True
+        )
+
+    git("init", "-q")
+    (repo / "a.py").write_text("".join(f"a{i}\n" for i in range(1, 11)))
+    (repo / "b.py").write_text("b1\nb2\n")
+    git("add", ".")
+    git("commit", "-q", "-m", "initial")
+    lines = (repo / "a.py").read_text().splitlines()
+    lines[4] = "changed by bob"
+    (repo / "a.py").write_text("\n".join(lines) + "\n")
+    git("commit", "-q", "-am", "fix", author="Bob <bob@example.com>")
+    return repo
+
+
+def test_blame_files_one_git_blame_per_file(git_repo):
+    """Test each file is blamed once and results match per-line blame."""
+    attrib = DeveloperAttribution(git_repo)
+    wanted = {"a.py": {1, 2, 5, 10}, "b.py": {2}, "gone.py": {1}}
+
+    with mock.patch(
+        "scripts.core.developer_attribution.subprocess.run", wraps=subprocess.run
+    ) as run:
+        result = attrib._blame_files(wanted)
+
+    blame_calls = [c for c in run.call_args_list if c.args[0][1] == "blame"]
+    assert len(blame_calls) == 3
+    assert result["a.py"][5] == {"name": "Bob", "email": "bob@example.com"}
+    assert result["a.py"][10] == {"name": "Alice", "email": "alice@example.com"}
+    assert result["gone.py"] == {1: None}
+    for path, line_nums in wanted.items():
+        for n in line_nums:
+            assert result[path][n] == attrib._git_blame_line(path, n)
+
+
+def test_blame_files_cached_per_head(git_repo):
+    """Test repeated attribution reuses cached blame for unchanged HEAD."""
+    attrib = DeveloperAttribution(git_repo)
+    attrib._blame_files({"a.py": {1, 5}})
+
+    with mock.patch(
+        "scripts.core.developer_attribution.subprocess.run", wraps=subprocess.run
+    ) as run:
+        again = attrib._blame_files({"a.py": {5}})
+        attrib._blame_files({"a.py": {5, 6}})
+
+    blame_calls = [c.args[0] for c in run.call_args_list if c.args[0][1] == "blame"]
+    assert again["a.py"][5]["email"] == "bob@example.com"
+    assert blame_calls == [["git", "blame", "-L", "6,6", "--porcelain", "a.py"]]
+
+
+def test_blame_files_does_not_cache_failed_blame(git_repo):
+    """Test a failed or timed-out blame is retried instead of cached as authorless."""
+    attrib = DeveloperAttribution(git_repo)
+
+    with mock.patch.object(attrib, "_git_blame_lines", return_value={}):
+        failed = attrib._blame_files({"a.py": {1, 5}})
+    again = attrib._blame_files({"a.py": {1, 5}})
+
+    assert failed["a.py"] == {1: None, 5: None}
+    assert again["a.py"][5] == {"name": "Bob", "email": "bob@example.com"}
+    assert again["a.py"][1] == {"name": "Alice", "email": "alice@example.com"}
+
+
+def test_git_blame_lines_merges_ranges_and_falls_back_to_whole_file(git_repo):
+    """Test contiguous lines share one -L range and many ranges blame the file."""
+    attrib = DeveloperAttribution(git_repo)
+
+    with (
+        mock.patch(
+            "scripts.core.developer_attribution.subprocess.run", wraps=subprocess.run
+        ) as run,
+        mock.patch("scripts.core.developer_attribution.MAX_BLAME_RANGES", 2),
+    ):
+        merged = attrib._git_blame_lines("a.py", [3, 1, 2, 7])
+        whole = attrib._git_blame_lines("a.py", [1, 3, 5, 7])
+
+    assert run.call_args_list[0].args[0][2:6] == ["-L", "1,3", "-L", "7,7"]
+    assert "-L" not in run.call_args_list[1].args[0]
+    assert sorted(merged) == [1, 2, 3, 7]
+    assert sorted(whole) == [1, 3, 5, 7]
+    assert whole[5]["name"] == "Bob"
+
+
+def test_git_blame_lines_drops_lines_past_end_of_file(git_repo):
+    """Test a line beyond the file's end does not lose the file's other lines."""
+    attrib = DeveloperAttribution(git_repo)
+
+    result = attrib._git_blame_lines("a.py", [1, 99999])
+    straddling = attrib._git_blame_lines("a.py", [10, 11])
+
+    assert sorted(result) == [1]
+    assert result[1] == {"name": "Alice", "email": "alice@example.com"}
+    assert sorted(straddling) == [10]
+    assert attrib._git_blame_lines("a.py", [50]) == {}
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
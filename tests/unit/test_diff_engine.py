@@ -13,12 +13,13 @@ Target coverage: ≥95%
 """
 
 import json
+import random
 import sqlite3
 from pathlib import Path
 
 import pytest
 
-from scripts.core.diff_engine import DiffEngine, DiffSource
+from scripts.core.diff_engine import DiffEngine, DiffSource, modification_digest
 
 # ============================================================================
 # Fixtures
@@ -541,6 +542,45 @@ def test_risk_delta_improved():
     assert delta == "improved"
 
 
+def test_equal_modification_digests_mean_no_modification():
+    """Findings with equal digests are never reported as modified."""
+    rng = random.Random(44)
+    engine = DiffEngine()
+
+    def variant():
+        finding = {
+            "severity": rng.choice(["HIGH", "MEDIUM"]),
+            "risk": {"cwe": rng.choice(["CWE-79", "CWE-89"])},
+            "compliance": {"owaspTop10_2021": rng.sample(["A01", "A02"], k=1)},
+            "message": rng.choice(["short", "a much longer message text"]),
+        }
+        if rng.random() < 0.5:
+            finding["risk"]["epss_score"] = rng.choice([0.10, 0.12, 0.149, 0.151])
+        return finding
+
+    matched = 0
+    for _ in range(500):
+        baseline, current = variant(), variant()
+        if modification_digest(baseline) == modification_digest(current):
+            matched += 1
+            assert engine._modification("fp", baseline, current) is None
+    assert matched > 0
+
+
+def test_detect_modifications_skips_matching_digests():
+    """Precomputed digests (e.g. from history rows) short-circuit comparison."""
+    engine = DiffEngine()
+    baseline = {"fp1": {"severity": "HIGH"}, "fp2": {"severity": "HIGH"}}
+    current = {"fp1": {"severity": "LOW"}, "fp2": {"severity": "LOW"}}
+
+    modified = engine._detect_modifications(
+        baseline, current, {"fp1", "fp2"}, ({"fp1": "d", "fp2": "x"}, {"fp1": "d"})
+    )
+
+    # fp1 is trusted unchanged by digest; fp2 has no current digest
+    assert [m.fingerprint for m in modified] == ["fp2"]
+
+
 # ============================================================================
 # Error Handling Tests
 # ============================================================================
@@ -0,0 +1,211 @@
+"""Contracts for the per-target file inventory.
+
+The inventory replaces several independent tree walks (``_collect_files`` per
+tool, the yara runner's ``os.walk``, per-finding stat()s in snippet
+extraction), so the tests pin that it answers those questions the way the
+walks it replaced did - root-level matches for ``**/`` patterns, vendored-tree
+pruning - and that a saved inventory round-trips intact.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from scripts.core.common_finding import extract_code_snippet
+from scripts.core.file_inventory import (
+    INVENTORY_FILENAME,
+    build_inventory,
+    detect_language,
+    inventory_for_results,
+    load_inventory,
+)
+from scripts.core.yara_runner import inventory_target_files, iter_target_files
+
+
+def _tree(root: Path) -> Path:
+    files = {
+        "Dockerfile": "FROM alpine\n",
+        "svc/Dockerfile.prod": "FROM alpine\n",
+        "run.sh": "echo hi\n",
+        "lib/tool.bash": "echo hi\n",
+        "app/main.py": "print('x')\n",
+        "node_modules/pkg/install.sh": "echo vendored\n",
+        ".venv/bin/activate.sh": "echo venv\n",
+        "third_party/lib.sh": "echo tp\n",
+        "web/app.min.js": "x\n",
+        "k8s/base/deploy.yaml": "kind: Deployment\n",
+    }
+    for rel, body in files.items():
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(body, encoding="utf-8")
+    return root
+
+
+class TestBuildInventory:
+    def test_prunes_vendored_trees(self, tmp_path: Path) -> None:
+        inv = build_inventory(_tree(tmp_path))
+        paths = {e.path for e in inv}
+        assert "node_modules/pkg/install.sh" not in paths
+        assert ".venv/bin/activate.sh" not in paths
+        assert "app/main.py" in paths
+
+    def test_records_size_language_and_vendored_flag(self, tmp_path: Path) -> None:
+        inv = build_inventory(_tree(tmp_path))
+        main = inv.get("app/main.py")
+        assert main is not None
+        assert main.size == len("print('x')\n")
+        assert main.language == "python"
+        assert not main.vendored
+        assert inv.get("third_party/lib.sh").vendored
+        assert inv.get("web/app.min.js").vendored
+
+    def test_glob_matches_root_level_for_double_star(self, tmp_path: Path) -> None:
+        """``**/Dockerfile`` must find the root Dockerfile, as Path.glob did."""
+        inv = build_inventory(_tree(tmp_path))
+        found = inv.glob("**/Dockerfile", "**/Dockerfile.*")
+        assert found == sorted(
+            [tmp_path / "Dockerfile", tmp_path / "svc" / "Dockerfile.prod"]
+        )
+
+    def test_glob_nested_double_star(self, tmp_path: Path) -> None:
+        inv = build_inventory(_tree(tmp_path))
+        assert inv.glob("**/k8s/**/*.yaml") == [tmp_path / "k8s/base/deploy.yaml"]
+
+    def test_glob_can_exclude_vendored(self, tmp_path: Path) -> None:
+        inv = build_inventory(_tree(tmp_path))
+        shells = inv.glob("**/*.sh", include_vendored=False)
+        assert tmp_path / "third_party/lib.sh" not in shells
+        assert tmp_path / "run.sh" in shells
+
+    def test_git_ignored_files_are_flagged(self, tmp_path: Path) -> None:
+        try:
+            subprocess.run(
+                ["git", "init", "-q", str(tmp_path)], check=True, capture_output=True
+            )
+        except (OSError, subprocess.CalledProcessError):
+            pytest.skip("git not available")
+        _tree(tmp_path)
+        (tmp_path / ".gitignore").write_text("build/\n*.log\n", encoding="utf-8")
+        (tmp_path / "build").mkdir()
+        (tmp_path / "build" / "out.sh").write_text("x\n", encoding="utf-8")
+        (tmp_path / "debug.log").write_text("x\n", encoding="utf-8")
+
+        inv = build_inventory(tmp_path)
+        assert inv.get("build/out.sh").ignored
+        assert inv.get("debug.log").ignored
+        assert not inv.get("run.sh").ignored
+
+    def test_single_file_target(self, tmp_path: Path) -> None:
+        f = tmp_path / "one.py"
+        f.write_text("x = 1\n", encoding="utf-8")
+        inv = build_inventory(f)
+        assert [e.path for e in inv] == ["one.py"]
+
+
+class TestPersistence:
+    def test_round_trip(self, tmp_path: Path) -> None:
+        repo = _tree(tmp_path / "repo")
+        inv = build_inventory(repo)
+        out = tmp_path / "results" / INVENTORY_FILENAME
+        inv.save(out)
+
+        loaded = load_inventory(out)
+        assert loaded is not None
+        assert loaded.root == repo
+        assert loaded.files() == inv.files()
+
+    def test_not_picked_up_as_tool_output(self) -> None:
+        """gather_results globs ``*.json``; the inventory must not match it."""
+        assert not INVENTORY_FILENAME.endswith(".json")
+
+    def test_corrupt_file_returns_none(self, tmp_path: Path) -> None:
+        bad = tmp_path / INVENTORY_FILENAME
+        bad.write_text("not json\n", encoding="utf-8")
+        assert load_inventory(bad) is None
+
+    def test_inventory_for_results_reloads_after_rewrite(self, tmp_path: Path) -> None:
+        repo = _tree(tmp_path / "repo")
+        results = tmp_path / "results"
+        build_inventory(repo).save(results / INVENTORY_FILENAME)
+        first = inventory_for_results(results)
+        assert first is inventory_for_results(results)
+
+        (repo / "new.py").write_text("y = 2\n", encoding="utf-8")
+        inv = build_inventory(repo)
+        inv.save(results / INVENTORY_FILENAME)
+        # Force a distinct mtime on coarse-grained filesystems.
+        stat = (results / INVENTORY_FILENAME).stat()
+        os.utime(
+            results / INVENTORY_FILENAME,
+            ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000),
+        )
+        reloaded = inventory_for_results(results)
+        assert reloaded is not first
+        assert reloaded.get("new.py") is not None
+
+    def test_missing_returns_none(self, tmp_path: Path) -> None:
+        assert inventory_for_results(tmp_path) is None
+
+
+class TestConsumers:
+    def test_yara_file_list_matches_walk(self, tmp_path: Path) -> None:
+        repo = _tree(tmp_path)
+        walked = iter_target_files(repo, 1024)
+        listed = inventory_target_files(build_inventory(repo), repo, 1024)
+        assert listed == walked
+
+    def test_yara_counts_unstattable_files_like_walk(self, tmp_path: Path) -> None:
+        repo = _tree(tmp_path / "repo")
+        try:
+            (repo / "dangling.sh").symlink_to(repo / "missing")
+        except OSError:
+            pytest.skip("Symlinks not supported on this platform")
+        inv = build_inventory(repo)
+        inv.save(tmp_path / INVENTORY_FILENAME)
+
+        assert inv.get("dangling.sh") is None
+        assert inv.unreadable == 1
+        loaded = load_inventory(tmp_path / INVENTORY_FILENAME)
+        assert loaded is not None and loaded.unreadable == 1
+        assert inventory_target_files(loaded, repo, 1024) == iter_target_files(
+            repo, 1024
+        )
+
+    def test_yara_rejects_inventory_for_other_target(self, tmp_path: Path) -> None:
+        repo = _tree(tmp_path / "a")
+        other = tmp_path / "b"
+        other.mkdir()
+        assert inventory_target_files(build_inventory(repo), other, 1024) is None
+
+    def test_snippet_skips_path_known_absent(self, tmp_path: Path) -> None:
+        repo = _tree(tmp_path)
+        inv = build_inventory(repo)
+        assert extract_code_snippet(str(repo / "gone.py"), 1, inventory=inv) is None
+        ctx = extract_code_snippet(str(repo / "app/main.py"), 1, inventory=inv)
+        assert ctx is not None
+        assert ctx["language"] == "python"
+
+    def test_snippet_still_reads_pruned_tree_paths(self, tmp_path: Path) -> None:
+        """A finding inside node_modules is not 'absent' - it was never walked."""
+        repo = _tree(tmp_path)
+        inv = build_inventory(repo)
+        path = repo / "node_modules/pkg/install.sh"
+        assert extract_code_snippet(str(path), 1, inventory=inv) is not None
+
+
+@pytest.mark.parametrize(
+    ("name", "language"),
+    [
+        ("Dockerfile", "dockerfile"),
+        ("x.tf", "terraform"),
+        ("a/b.YML", "yaml"),
+        ("README", "text"),
+    ],
+)
+def test_detect_language(name: str, language: str) -> None:
+    assert detect_language(name) == language
@@ -0,0 +1,228 @@
+"""Tests for scripts/core/findings_index.py and indexed directory diffs."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from scripts.core.diff_engine import DiffEngine, modification_digest
+from scripts.core.findings_index import (
+    FindingsIndex,
+    IndexedFindings,
+    index_path_for,
+    merge_join,
+    write_findings_index,
+)
+from scripts.core.reporters import json_stream
+from scripts.core.reporters.basic_reporter import write_json
+
+
+def _finding(fp: str, **extra: Any) -> dict[str, Any]:
+    return {
+        "id": fp,
+        "ruleId": "rule",
+        "severity": "HIGH",
+        "message": f"finding {fp} — café",
+        "tool": {"name": "semgrep"},
+        "location": {"path": "app.py", "startLine": 1},
+        **extra,
+    }
+
+
+def _results(root: Path, findings: list[dict[str, Any]], **kwargs: Any) -> Path:
+    summaries = root / "summaries"
+    summaries.mkdir(parents=True)
+    write_json(
+        findings,
+        summaries / "findings.json",
+        metadata={"timestamp": "2026-01-01T00:00:00Z", "profile": "fast"},
+        index_path=summaries / "findings.idx",
+        **kwargs,
+    )
+    return root
+
+
+class TestFindingsIndex:
+    @pytest.mark.parametrize("compact", [False, True])
+    def test_spans_locate_every_finding(self, tmp_path: Path, compact: bool) -> None:
+        findings = [_finding(f"fp{i}", tags=["a\nb"]) for i in (3, 1, 2)]
+        findings.append({"ruleId": "no-id"})
+        _results(tmp_path, findings, compact=compact)
+
+        path = tmp_path / "summaries" / "findings.json"
+        index = FindingsIndex.open(path)
+
+        assert index is not None
+        assert index.fingerprints == ["fp1", "fp2", "fp3"]
+        assert index.has_digests
+        assert index.digest(0) == int(modification_digest(findings[1]), 16)
+        assert [index.load(i) for i in range(3)] == sorted(
+            findings[:3], key=lambda f: f["id"]
+        )
+        assert index.meta["profile"] == "fast"
+        assert json.loads(path.read_text(encoding="utf-8"))["findings"] == findings
+
+    def test_spans_are_byte_offsets_where_text_mode_writes_crlf(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        real_open = open
+
+        def windows_open(file: Any, mode: str = "r", **kwargs: Any) -> Any:
+            # Text mode on Windows translates "\n" to "\r\n" unless told not to
+            if "b" not in mode:
+                kwargs.setdefault("newline", "\r\n")
+            return real_open(file, mode, **kwargs)
+
+        monkeypatch.setattr(json_stream, "open", windows_open, raising=False)
+        findings = [_finding(f"fp{i}", tags=["x\r\ny"]) for i in range(3)]
+        _results(tmp_path, findings)
+
+        path = tmp_path / "summaries" / "findings.json"
+        data = path.read_bytes()
+        index = FindingsIndex.open(path)
+
+        assert index is not None
+        for i, finding in enumerate(findings):
+            assert json.loads(index.raw(i)) == finding
+            assert index.raw(i) in data
+
+    def test_missing_or_stale_index_is_ignored(self, tmp_path: Path) -> None:
+        _results(tmp_path, [_finding("fp1"), _finding("fp2")])
+        path = tmp_path / "summaries" / "findings.json"
+
+        # Same size, different layout: the spot check catches it
+        text = path.read_text(encoding="utf-8")
+        path.write_text(text.replace('"fp1"', '"fpX"'), encoding="utf-8")
+        assert FindingsIndex.open(path) is None
+
+        path.write_text(text + " ", encoding="utf-8")
+        assert FindingsIndex.open(path) is None
+
+        index_path_for(path).unlink()
+        assert FindingsIndex.open(path) is None
+
+    def test_merge_join(self, tmp_path: Path) -> None:
+        _results(tmp_path / "a", [_finding(fp) for fp in ("a", "c", "d", "f")])
+        _results(tmp_path / "b", [_finding(fp) for fp in ("b", "c", "f", "g")])
+        left = FindingsIndex.open(tmp_path / "a" / "summaries" / "findings.json")
+        right = FindingsIndex.open(tmp_path / "b" / "summaries" / "findings.json")
+
+        only_left, only_right, both = merge_join(left, right)
+
+        assert [left.fingerprints[i] for i in only_left] == ["a", "d"]
+        assert [right.fingerprints[i] for i in only_right] == ["b", "g"]
+        assert [(left.fingerprints[i], right.fingerprints[j]) for i, j in both] == [
+            ("c", "c"),
+            ("f", "f"),
+        ]
+
+
+class TestIndexedDiff:
+    @pytest.fixture
+    def dirs(self, tmp_path: Path) -> tuple[Path, Path]:
+        baseline = [_finding(f"fp{i}") for i in range(6)]
+        current = [_finding(f"fp{i}") for i in range(2, 8)]
+        current[0]["severity"] = "CRITICAL"  # fp2 modified
+        current[1]["location"]["startLine"] = 9  # fp3 differs, but not a tracked change
+        return (
+            _results(tmp_path / "baseline", baseline),
+            _results(tmp_path / "current", current, compact=True),
+        )
+
+    def test_matches_full_load_diff(
+        self, dirs: tuple[Path, Path], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        indexed = DiffEngine().compare_directories(*dirs)
+
+        monkeypatch.setattr(FindingsIndex, "open", classmethod(lambda cls, p: None))
+        full = DiffEngine().compare_directories(*dirs)
+
+        assert isinstance(indexed.unchanged, IndexedFindings)
+        assert indexed.statistics == full.statistics
+        for attr in ("new", "resolved", "unchanged"):
+            assert sorted(f["id"] for f in getattr(indexed, attr)) == sorted(
+                f["id"] for f in getattr(full, attr)
+            )
+        assert [m.fingerprint for m in indexed.modified] == ["fp2"]
+        assert indexed.modified[0].changes == full.modified[0].changes
+        assert indexed.baseline_source.profile == "fast"
+        assert indexed.current_source.total_findings == 6
+
+    def test_total_counts_every_finding_like_full_load(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        findings = [_finding("fp0"), _finding("fp0"), _finding("fp1")]
+        findings.append({"ruleId": "no-id", "severity": "LOW"})
+        dirs = (_results(tmp_path / "a", findings), _results(tmp_path / "b", []))
+        assert len(FindingsIndex.open(dirs[0] / "summaries" / "findings.json")) == 2
+
+        indexed = DiffEngine().compare_directories(*dirs)
+        monkeypatch.setattr(FindingsIndex, "open", classmethod(lambda cls, p: None))
+        full = DiffEngine().compare_directories(*dirs)
+
+        assert indexed.baseline_source.total_findings == 4
+        assert indexed.baseline_source == full.baseline_source
+
+    def test_unchanged_findings_are_parsed_on_access(
+        self, dirs: tuple[Path, Path], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        loads = []
+        original = FindingsIndex.load
+        monkeypatch.setattr(
+            FindingsIndex,
+            "load",
+            lambda self, i: loads.append(i) or original(self, i),
+        )
+
+        diff = DiffEngine(detect_modifications=False).compare_directories(*dirs)
+
+        # Only new + resolved (and the open-time spot checks) were parsed
+        parsed = len(loads)
+        assert len(diff.unchanged) == 4
+        assert len(loads) == parsed
+        assert [f["id"] for f in diff.unchanged] == ["fp2", "fp3", "fp4", "fp5"]
+        assert diff.unchanged[1:2] == [diff.unchanged[1]]
+
+    def test_matching_digests_skip_comparison(
+        self, dirs: tuple[Path, Path], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        compared = []
+        original = DiffEngine._modification
+        monkeypatch.setattr(
+            DiffEngine,
+            "_modification",
+            lambda self, fp, b, c: compared.append(fp) or original(self, fp, b, c),
+        )
+
+        diff = DiffEngine().compare_directories(*dirs)
+
+        # fp3's bytes differ, but not in any attribute modification detection tracks
+        assert compared == ["fp2"]
+        assert [m.fingerprint for m in diff.modified] == ["fp2"]
+
+    def test_index_without_digests_compares_bytes(self, tmp_path: Path) -> None:
+        path = tmp_path / "findings.json"
+        path.write_bytes(b'[{"id":"a"}]')
+        write_findings_index(index_path_for(path), [("a", 1, 10)], 12)
+        index = FindingsIndex.open(path)
+
+        assert index is not None
+        assert not index.has_digests
+        assert index.digest(0) is None
+
+    def test_stale_index_falls_back_to_full_load(self, dirs: tuple[Path, Path]) -> None:
+        baseline, current = dirs
+        path = current / "summaries" / "findings.json"
+        # Rewrite findings.json (same size) without refreshing the index
+        data = json.loads(path.read_text(encoding="utf-8"))
+        data["findings"].reverse()
+        text = json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+        path.write_text(text, encoding="utf-8")
+
+        diff = DiffEngine().compare_directories(baseline, current)
+
+        assert sorted(f["id"] for f in diff.new) == ["fp6", "fp7"]
+        assert diff.statistics["total_modified"] == 1
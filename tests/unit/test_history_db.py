@@ -25,7 +25,10 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+import scripts.core.history_db as history_db
+from scripts.core.diff_engine import modification_digest
 from scripts.core.history_db import (
+    BASE_SCHEMA_VERSION,
     SCHEMA_VERSION,
     QuerySecurityError,
     QueryTimeoutError,
@@ -137,10 +140,14 @@ class TestDatabaseInitialization:
         conn = get_connection(db_path)
         cursor = conn.cursor()
 
-        cursor.execute("SELECT version FROM schema_version")
-        version = cursor.fetchone()[0]
+        cursor.execute(
+            "SELECT version FROM schema_version ORDER BY applied_at DESC, version DESC"
+        )
+        versions = [row[0] for row in cursor.fetchall()]
 
-        assert version == SCHEMA_VERSION
+        # Created at the base schema, then migrated to the current one
+        assert versions[0] == SCHEMA_VERSION
+        assert versions[-1] == BASE_SCHEMA_VERSION
 
         conn.close()
 
@@ -159,6 +166,38 @@ class TestDatabaseInitialization:
         assert cursor.fetchone()[0] == 0
         conn.close()
 
+    def test_init_database_migrates_older_database(self, tmp_path, monkeypatch):
+        """Databases created before mutable_digest existed gain it by migration."""
+        db_path = tmp_path / "test.db"
+        with monkeypatch.context() as m:
+            m.setattr(history_db, "SCHEMA_VERSION", BASE_SCHEMA_VERSION)
+            init_database(db_path)
+
+        def shape():
+            conn = get_connection(db_path)
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(findings)")}
+            version = conn.execute(
+                "SELECT version FROM schema_version "
+                "ORDER BY applied_at DESC, version DESC LIMIT 1"
+            ).fetchone()[0]
+            conn.close()
+            return version, columns
+
+        version, columns = shape()
+        assert version == BASE_SCHEMA_VERSION
+        assert "mutable_digest" not in columns
+
+        init_database(db_path)
+
+        version, migrated = shape()
+        assert version == SCHEMA_VERSION
+        assert "mutable_digest" in migrated
+
+        fresh_path = db_path.with_name("fresh.db")
+        init_database(fresh_path)
+        db_path = fresh_path
+        assert shape() == (SCHEMA_VERSION, migrated)
+
 
 class TestGetConnection:
     """Test database connection management."""
@@ -251,6 +290,9 @@ class TestStoreScan:
         assert finding_rows[0]["fingerprint"] == "test123"
         assert finding_rows[0]["severity"] == "HIGH"
         assert finding_rows[0]["tool"] == "trivy"
+        assert finding_rows[0]["mutable_digest"] == modification_digest(
+            findings_data["findings"][0]
+        )
 
         conn.close()
 
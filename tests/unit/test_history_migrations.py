@@ -8,6 +8,7 @@ Tests cover:
 - Version tracking in schema_version table
 - Rollback on error
 - Example migration v1.0.0 → v1.1.0
+- init_database migrating to the current schema version
 
 Run with: pytest tests/unit/test_history_migrations.py -v
 """
@@ -16,7 +17,14 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from scripts.core.history_db import get_connection, init_database
+import pytest
+
+import scripts.core.history_db as history_db
+from scripts.core.history_db import (
+    BASE_SCHEMA_VERSION,
+    SCHEMA_VERSION,
+    get_connection,
+)
 from scripts.core.history_migrations import (
     Migration,
     discover_migrations,
@@ -25,6 +33,13 @@ from scripts.core.history_migrations import (
 )
 
 
+def init_base_database(db_path: Path) -> None:
+    """Create a database at the base schema, before any migration."""
+    with pytest.MonkeyPatch.context() as m:
+        m.setattr(history_db, "SCHEMA_VERSION", BASE_SCHEMA_VERSION)
+        history_db.init_database(db_path)
+
+
 def test_discover_migrations_finds_all(tmp_path: Path):
     """
     Migration Test 1: Discovery finds all migration files.
@@ -72,9 +87,9 @@ def test_run_migrations_applies_all(tmp_path: Path):
     when no errors occur.
     """
     db_path = tmp_path / "test.db"
-    init_database(db_path)
+    init_base_database(db_path)
 
-    # Current version should be 1.0.0 (from init_database)
+    # Current version should be 1.0.0 (the base schema)
     current = get_current_version(db_path)
     assert current == "1.0.0", f"Expected 1.0.0, got {current}"
 
@@ -98,7 +113,7 @@ def test_run_migrations_updates_version(tmp_path: Path):
     after applying migrations.
     """
     db_path = tmp_path / "test.db"
-    init_database(db_path)
+    init_base_database(db_path)
 
     # Run migration
     run_migrations(db_path, "1.1.0")
@@ -130,7 +145,7 @@ def test_migration_adds_columns(tmp_path: Path):
     as expected (adds scan_notes and finding_status columns).
     """
     db_path = tmp_path / "test.db"
-    init_database(db_path)
+    init_base_database(db_path)
 
     # Run migration
     run_migrations(db_path, "1.1.0")
@@ -168,7 +183,7 @@ def test_migration_idempotent(tmp_path: Path):
     doesn't fail or re-apply migrations.
     """
     db_path = tmp_path / "test.db"
-    init_database(db_path)
+    init_base_database(db_path)
 
     # Run migration once
     result1 = run_migrations(db_path, "1.1.0")
@@ -191,3 +206,25 @@ def test_migration_idempotent(tmp_path: Path):
     assert (
         scan_notes_count == 1
     ), f"scan_notes should appear exactly once, found {scan_notes_count} times"
+
+
+def test_init_database_migrates_to_schema_version(tmp_path: Path):
+    """
+    Migration Test 7: init_database applies pending migrations.
+
+    Verifies that a base-schema database is brought to SCHEMA_VERSION
+    (gaining the v1.2.0 mutable_digest column) the next time it is opened
+    through init_database, instead of being stamped with the new version.
+    """
+    db_path = tmp_path / "test.db"
+    init_base_database(db_path)
+
+    history_db.init_database(db_path)
+
+    assert get_current_version(db_path) == SCHEMA_VERSION
+    conn = get_connection(db_path)
+    findings_columns = [
+        row[1] for row in conn.execute("PRAGMA table_info(findings)").fetchall()
+    ]
+    conn.close()
+    assert findings_columns.count("mutable_digest") == 1
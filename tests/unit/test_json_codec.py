@@ -0,0 +1,118 @@
+"""Contracts for scripts/core/json_codec.py.
+
+Every backend must be a drop-in for stdlib json: same parse results, same
+errors, same bytes for the layouts it accelerates, and a clean fallback for
+everything it cannot reproduce.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+from collections.abc import Iterator
+from datetime import UTC, datetime
+
+import pytest
+
+from scripts.core import json_codec
+
+DOC = {
+    "ascii": "plain",
+    "unicode": "café ☕ 𝄞",
+    "control": "tab\there\nnew \x00 \x1f del\x7f",
+    "html": "</script><!-- `x`",
+    "nested": {"b": [1, 2, {"c": []}], "a": {}, "t": True, "n": None},
+    "ints": [0, -1, 2**63 - 1],
+    "floats": [0.5, 7.5, 9.8],
+}
+
+
+@pytest.fixture(params=json_codec.available_backends())
+def backend(request: pytest.FixtureRequest) -> Iterator[str]:
+    previous = json_codec.use_backend(request.param)
+    yield request.param
+    json_codec.use_backend(previous)
+
+
+class TestDumps:
+    @pytest.mark.parametrize("ensure_ascii", [True, False])
+    @pytest.mark.parametrize("sort_keys", [True, False])
+    @pytest.mark.parametrize(
+        ("indent", "separators"),
+        [(2, None), (None, (",", ":")), (None, None), (4, None)],
+    )
+    def test_matches_stdlib(
+        self,
+        backend: str,
+        ensure_ascii: bool,
+        sort_keys: bool,
+        indent: int | None,
+        separators: tuple[str, str] | None,
+    ) -> None:
+        kwargs = {
+            "indent": indent,
+            "ensure_ascii": ensure_ascii,
+            "sort_keys": sort_keys,
+            "separators": separators,
+        }
+        assert json_codec.dumps(DOC, **kwargs) == json.dumps(DOC, **kwargs)
+
+    def test_unencodable_falls_back_to_stdlib(self, backend: str) -> None:
+        compact = json_codec.COMPACT_SEPARATORS
+        # Non-string keys and ints past 64 bits are stdlib-only territory
+        value = {1: "one", "big": 2**70}
+        assert json_codec.dumps(value, separators=compact) == json.dumps(
+            value, separators=compact
+        )
+        with pytest.raises(TypeError):
+            json_codec.dumps({"s": {1, 2}}, separators=compact)
+
+    def test_default_hook_sees_datetimes_and_dataclasses(self, backend: str) -> None:
+        @dataclasses.dataclass
+        class Point:
+            x: int
+
+        value = {"when": datetime(2024, 1, 2, 3, 4, 5, tzinfo=UTC), "p": Point(1)}
+        compact = json_codec.COMPACT_SEPARATORS
+        assert json_codec.dumps(value, separators=compact, default=str) == (
+            json.dumps(value, separators=compact, default=str)
+        )
+
+
+class TestLoads:
+    def test_round_trip(self, backend: str) -> None:
+        text = json.dumps(DOC)
+        assert json_codec.loads(text) == json.loads(text)
+        assert json_codec.loads(text.encode("utf-8")) == json.loads(text)
+
+    @pytest.mark.parametrize(
+        "text",
+        ['{"x": NaN}', "[18446744073709551616]", "[-9223372036854775809]"],
+    )
+    def test_stdlib_only_inputs_still_parse(self, backend: str, text: str) -> None:
+        assert repr(json_codec.loads(text)) == repr(json.loads(text))
+
+    def test_big_int_across_scan_chunks(
+        self, backend: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(json_codec, "_SCAN_CHUNK", 8)
+        text = '{"pad": 1, "n": 18446744073709551616}'
+        assert json_codec.loads(text) == json.loads(text)
+        assert json_codec.loads(text.encode("utf-8")) == json.loads(text)
+
+    def test_errors_are_stdlib_decode_errors(self, backend: str) -> None:
+        with pytest.raises(json.JSONDecodeError) as info:
+            json_codec.loads('{"a": }')
+        assert info.value.pos == 6
+
+
+class TestBackendSelection:
+    def test_stdlib_always_available(self) -> None:
+        assert "stdlib" in json_codec.available_backends()
+
+    def test_unknown_backend_rejected(self) -> None:
+        with pytest.raises(ValueError, match="Unknown JSON backend"):
+            json_codec.use_backend("simdjson")
+
+    def test_env_request_for_missing_backend_uses_stdlib(self) -> None:
+        assert json_codec._select("no-such-backend").name == "stdlib"
@@ -0,0 +1,101 @@
+"""Tests for IncrementalGatherer in scripts/core/normalize_and_report.py."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import scripts.core.normalize_and_report as nr
+
+
+def _semgrep(path: Path, *lines: int) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    results = [
+        {
+            "check_id": f"rule.{line}",
+            "path": "app.py",
+            "start": {"line": line},
+            "extra": {"message": f"issue on line {line}", "severity": "ERROR"},
+        }
+        for line in lines
+    ]
+    path.write_text(json.dumps({"results": results}), encoding="utf-8")
+    # Make every rewrite visible even on coarse-mtime filesystems
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    return path
+
+
+@pytest.fixture
+def results(tmp_path: Path) -> Path:
+    root = tmp_path / "results"
+    _semgrep(root / "individual-repos" / "a" / "semgrep.json", 1, 2)
+    _semgrep(root / "individual-repos" / "b" / "semgrep.json", 3)
+    return root
+
+
+@pytest.fixture
+def parsed(monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+    calls: list[Path] = []
+    original = nr._safe_load_plugin
+
+    def counting(plugin_class: Any, path: Path, profiling: bool = False) -> Any:
+        calls.append(path)
+        return original(plugin_class, path, profiling)
+
+    monkeypatch.setattr(nr, "_safe_load_plugin", counting)
+    return calls
+
+
+def _rules(findings: list[dict[str, Any]]) -> list[str]:
+    return sorted(f["ruleId"] for f in findings)
+
+
+class TestIncrementalGatherer:
+    def test_matches_gather_results(self, results: Path, parsed: list[Path]) -> None:
+        gatherer = nr.IncrementalGatherer(results)
+
+        assert len(gatherer.refresh()) == 2
+        assert _rules(gatherer.findings()) == _rules(nr.gather_results(results))
+
+    def test_only_changed_outputs_are_reparsed(
+        self, results: Path, parsed: list[Path]
+    ) -> None:
+        gatherer = nr.IncrementalGatherer(results)
+        gatherer.refresh()
+        parsed.clear()
+
+        assert gatherer.refresh() == []
+        changed = _semgrep(results / "individual-repos" / "b" / "semgrep.json", 3, 4)
+
+        assert gatherer.refresh() == [changed]
+        assert parsed == [changed]
+        assert _rules(gatherer.findings()) == [
+            "rule.1",
+            "rule.2",
+            "rule.3",
+            "rule.4",
+        ]
+
+    def test_removed_outputs_drop_out(self, results: Path) -> None:
+        gatherer = nr.IncrementalGatherer(results)
+        gatherer.refresh()
+        removed = results / "individual-repos" / "a" / "semgrep.json"
+        removed.unlink()
+
+        assert gatherer.refresh() == [removed]
+        assert _rules(gatherer.findings()) == ["rule.3"]
+
+    def test_findings_are_fresh_copies(self, results: Path) -> None:
+        gatherer = nr.IncrementalGatherer(results)
+        gatherer.refresh()
+
+        first = gatherer.findings()
+        first[0]["severity"] = "INFO"
+        first[0].setdefault("context", {})["marker"] = True
+
+        assert gatherer.findings() != first
@@ -3,6 +3,8 @@
 
 from __future__ import annotations
 
+import json
+import re
 import subprocess
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -10,7 +12,16 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from scripts.core.exceptions import OPANotFoundException
-from scripts.core.policy_engine import PolicyEngine, PolicyMetadata, PolicyResult
+from scripts.core.policy_engine import (
+    PolicyEngine,
+    PolicyMetadata,
+    PolicyResult,
+    declared_input_fields,
+    project_findings,
+)
+from scripts.core.warm_tools import WarmToolPool
+
+BUILTIN_POLICIES = Path(__file__).resolve().parents[2] / "policies" / "builtin"
 
 
 class TestPolicyResult:
@@ -320,3 +331,185 @@ class TestPolicyEngine:
 
         with pytest.raises(FileNotFoundError, match="Policy file not found"):
             engine.get_metadata(tmp_path / "nonexistent.rego")
+
+
+class TestInputFields:
+    """Tests for the # jmo:input-fields: directive and input trimming."""
+
+    def test_declared_input_fields(self) -> None:
+        text = "package p\n# jmo:input-fields: id severity\n#jmo:input-fields: raw.verified\n"
+        assert declared_input_fields(text) == ["id", "severity", "raw.verified"]
+        assert declared_input_fields("package p\nallow := true\n") is None
+
+    def test_project_findings_keeps_declared_paths_and_id(self) -> None:
+        finding = {
+            "id": "f1",
+            "severity": "HIGH",
+            "location": {"path": "a.py", "startLine": 3},
+            "raw": {"verified": True, "blob": "x" * 1000},
+            "tool": {"name": "trufflehog", "version": "3"},
+        }
+
+        projected = project_findings(
+            [finding], ["severity", "location", "raw.verified", "tool.name", "cwe"]
+        )
+
+        assert projected == [
+            {
+                "id": "f1",
+                "severity": "HIGH",
+                "location": {"path": "a.py", "startLine": 3},
+                "raw": {"verified": True},
+                "tool": {"name": "trufflehog"},
+            }
+        ]
+        assert finding["raw"]["blob"]  # input is not modified
+
+    def test_project_findings_whole_value_wins_over_subpath(self) -> None:
+        finding = {"id": "f", "raw": {"a": 1, "b": 2}}
+        assert project_findings([finding], ["raw", "raw.a"]) == [finding]
+        assert project_findings([finding], ["raw.a", "raw"]) == [finding]
+
+    @pytest.mark.parametrize(
+        "policy", sorted(BUILTIN_POLICIES.glob("*.rego")), ids=lambda p: p.stem
+    )
+    def test_builtin_policies_declare_every_field_they_read(self, policy: Path) -> None:
+        text = policy.read_text(encoding="utf-8")
+        declared = declared_input_fields(text)
+        assert declared is not None
+
+        code = "\n".join(
+            line for line in text.splitlines() if not line.lstrip().startswith("#")
+        )
+        for chain in re.findall(r"\bfinding((?:\.\w+)+)", code):
+            parts = chain[1:].split(".")
+            assert any(
+                parts[: len(d.split("."))] == d.split(".") for d in declared
+            ), f"{policy.name} reads finding.{chain[1:]} but does not declare it"
+
+
+class TestEvaluateBatch:
+    """Tests for PolicyEngine.evaluate_batch."""
+
+    @pytest.fixture
+    def engine(self, tmp_path: Path) -> PolicyEngine:
+        engine = PolicyEngine.__new__(PolicyEngine)
+        engine.opa_binary = "opa"
+        engine._opa_path = "/usr/bin/opa"
+        engine.cache_dir = tmp_path / "cache"
+        return engine
+
+    @pytest.fixture
+    def policies(self, tmp_path: Path) -> list[Path]:
+        paths = []
+        for name, fields in (("secrets", "severity raw.verified"), ("pci", "severity")):
+            path = tmp_path / f"{name}.rego"
+            path.write_text(
+                f"package jmo.policy.{name}\n# jmo:input-fields: {fields}\n"
+                "allow := true\n"
+            )
+            paths.append(path)
+        return paths
+
+    @staticmethod
+    def _tree() -> dict:
+        return {
+            "secrets": {"allow": False, "violations": [{"id": "f1"}]},
+            "pci": {"allow": True, "violations": []},
+        }
+
+    def test_warm_server_answers_every_policy_with_one_query(
+        self, engine: PolicyEngine, policies: list[Path]
+    ) -> None:
+        pool = WarmToolPool(tools=["opa"])
+        pool.server = MagicMock(
+            return_value=MagicMock(url="http://127.0.0.1:9", token="tok")
+        )
+        calls = []
+
+        def fake_request(
+            method, url, data, content_type="application/json", token=None
+        ):
+            assert token == "tok"
+            calls.append((method, url))
+            if method == "PUT":
+                return {}
+            findings = json.loads(data)["input"]["findings"]
+            assert findings == [
+                {"id": "f1", "severity": "HIGH", "raw": {"verified": True}}
+            ]
+            return {"result": self._tree()}
+
+        findings = [
+            {
+                "id": "f1",
+                "severity": "HIGH",
+                "message": "m",
+                "raw": {"verified": True, "x": 1},
+            }
+        ]
+        with (
+            patch("scripts.core.policy_engine.active_pool", return_value=pool),
+            patch.object(PolicyEngine, "_opa_request", side_effect=fake_request),
+            patch("scripts.core.policy_engine.subprocess.run") as run,
+        ):
+            results, errors = engine.evaluate_batch(findings, policies)
+
+        run.assert_not_called()
+        assert errors == {}
+        assert results["secrets"].passed is False
+        assert results["secrets"].violation_count == 1
+        assert results["pci"].passed is True
+        assert [c for c in calls if c[0] == "POST"] == [
+            ("POST", "http://127.0.0.1:9/v1/data/jmo/policy")
+        ]
+
+    def test_cold_eval_builds_bundle_once(
+        self, engine: PolicyEngine, policies: list[Path]
+    ) -> None:
+        eval_out = {"result": [{"expressions": [{"value": self._tree()}]}]}
+
+        def fake_run(cmd, **kwargs):
+            if cmd[1] == "build":
+                Path(cmd[cmd.index("-o") + 1]).write_bytes(b"bundle")
+                return MagicMock(returncode=0, stdout="", stderr="")
+            assert cmd[-1] == "data.jmo.policy"
+            return MagicMock(returncode=0, stdout=json.dumps(eval_out), stderr="")
+
+        with (
+            patch("scripts.core.policy_engine.active_pool", return_value=None),
+            patch(
+                "scripts.core.policy_engine.subprocess.run", side_effect=fake_run
+            ) as run,
+        ):
+            first, _ = engine.evaluate_batch([], policies)
+            second, _ = engine.evaluate_batch([], policies)
+
+        commands = [call.args[0][1] for call in run.call_args_list]
+        assert commands == ["build", "eval", "eval"]
+        assert len(list((engine.cache_dir / "policy-bundles").glob("*.tar.gz"))) == 1
+        assert first["pci"].passed is True and second["secrets"].passed is False
+
+    def test_failed_batch_falls_back_to_single_policies(
+        self, engine: PolicyEngine, policies: list[Path]
+    ) -> None:
+        def fake_run(cmd, **kwargs):
+            if cmd[1] == "build":
+                return MagicMock(returncode=1, stdout="", stderr="rego_parse_error")
+            raise AssertionError("opa eval should not run")
+
+        single = PolicyResult(policy_name="x", passed=True)
+        with (
+            patch("scripts.core.policy_engine.active_pool", return_value=None),
+            patch("scripts.core.policy_engine.subprocess.run", side_effect=fake_run),
+            patch.object(
+                PolicyEngine,
+                "evaluate",
+                side_effect=[single, RuntimeError("compile error")],
+            ) as evaluate,
+        ):
+            results, errors = engine.evaluate_batch([], policies)
+
+        assert evaluate.call_count == 2
+        assert results == {"secrets": single}
+        assert str(errors["pci"]) == "compile error"
@@ -0,0 +1,265 @@
+"""Tests for scripts/core/sbom_index.py and SBOM enrichment from it."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import scripts.core.normalize_and_report as nr
+import scripts.core.sbom_index as si
+from scripts.core.sbom_index import (
+    SBOM_INDEX_FILENAME,
+    InMemorySbomIndex,
+    SbomIndex,
+    SbomIndexSet,
+    build_sbom_index,
+    match_package,
+)
+
+ARTIFACTS = [
+    {
+        "name": "Flask",
+        "version": "2.0.1",
+        "type": "python",
+        "purl": "pkg:pypi/flask@2.0.1",
+        "locations": [{"path": "/app/requirements.txt"}, {"path": "/app/setup.py"}],
+    },
+    {
+        "name": "requests",
+        "version": "2.28.0",
+        "type": "python",
+        "purl": "pkg:pypi/requests@2.28.0",
+        "locations": [{"path": "/app/requirements.txt"}],
+    },
+    {
+        "name": "openssl",
+        "version": "1.1.1",
+        "type": "apk",
+        "purl": "pkg:apk/alpine/openssl@1.1.1?arch=x86_64",
+        "locations": [{"path": "/lib/apk/db/installed"}],
+    },
+    {
+        "name": "openssl",
+        "version": "3.0.1",
+        "type": "apk",
+        "purl": "pkg:apk/alpine/openssl@3.0.1?arch=x86_64",
+        "locations": [{"path": "/lib/apk/db/installed"}],
+    },
+]
+
+
+def _syft(target: Path, artifacts: list[dict[str, Any]] = ARTIFACTS) -> Path:
+    target.mkdir(parents=True, exist_ok=True)
+    path = target / "syft.json"
+    path.write_text(json.dumps({"artifacts": artifacts}), encoding="utf-8")
+    # Make every rewrite visible even on coarse-mtime filesystems
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    return path
+
+
+@pytest.fixture
+def target(tmp_path: Path) -> Path:
+    directory = tmp_path / "results" / "individual-repos" / "app"
+    _syft(directory)
+    return directory
+
+
+@pytest.fixture
+def index(target: Path):
+    opened = SbomIndex.open(target)
+    assert opened is not None
+    yield opened
+    opened.close()
+
+
+class TestSbomIndex:
+    def test_build_writes_index_beside_syft_json(self, target: Path) -> None:
+        assert build_sbom_index(target / "syft.json") == len(ARTIFACTS)
+        assert (target / SBOM_INDEX_FILENAME).is_file()
+        assert not (target / (SBOM_INDEX_FILENAME + ".tmp")).exists()
+
+    def test_lookups(self, index: SbomIndex) -> None:
+        assert len(index) == 4
+        assert [p["name"] for p in index.packages_at("/app/requirements.txt")] == [
+            "Flask",
+            "requests",
+        ]
+        # Every location is indexed; the record keeps the first one
+        assert index.packages_at("/app/setup.py") == [
+            {
+                "name": "Flask",
+                "version": "2.0.1",
+                "path": "/app/requirements.txt",
+                "purl": "pkg:pypi/flask@2.0.1",
+                "type": "python",
+            }
+        ]
+        assert [p["version"] for p in index.packages_named("OPENSSL")] == [
+            "1.1.1",
+            "3.0.1",
+        ]
+        # Qualifiers are ignored on both sides
+        found = index.packages_with_purl("pkg:apk/alpine/openssl@3.0.1?distro=3.18")
+        assert [p["version"] for p in found] == ["3.0.1"]
+        assert index.packages_at("/nowhere") == []
+
+    def test_existing_index_is_reused(
+        self, target: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        build_sbom_index(target / "syft.json")
+        calls: list[Path] = []
+        monkeypatch.setattr(si, "build_sbom_index", lambda *a: calls.append(a[0]))
+
+        index = SbomIndex.open(target)
+
+        assert index is not None and len(index) == 4
+        assert calls == []
+        index.close()
+
+    def test_stale_index_is_rebuilt(self, target: Path) -> None:
+        build_sbom_index(target / "syft.json")
+        _syft(target, ARTIFACTS[:1])
+
+        assert SbomIndex.open(target, build=False) is None
+        index = SbomIndex.open(target)
+        assert index is not None and len(index) == 1
+        index.close()
+
+    def test_missing_and_malformed_sources(self, tmp_path: Path) -> None:
+        assert SbomIndex.open(tmp_path) is None
+
+        (tmp_path / "syft.json").write_text('{"artifacts": [', encoding="utf-8")
+        index = SbomIndex.open(tmp_path)
+        # Unparseable small files yield nothing, as for the syft adapter
+        assert index is not None and len(index) == 0
+        index.close()
+
+    def test_index_set_spans_targets(self, target: Path) -> None:
+        results = target.parent.parent
+        _syft(
+            results / "individual-images" / "nginx",
+            [{"name": "openssl", "version": "3.0.9"}],
+        )
+
+        sbom = SbomIndexSet.open(results)
+
+        assert sbom is not None and len(sbom.indexes) == 2
+        assert [p["version"] for p in sbom.packages_named("openssl")] == [
+            "3.0.9",
+            "1.1.1",
+            "3.0.1",
+        ]
+        sbom.close()
+
+    def test_index_set_unavailable_when_a_target_fails(
+        self, target: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(si, "build_sbom_index", lambda *a: None)
+
+        assert SbomIndexSet.open(target.parent.parent) is None
+
+
+class TestMatchPackage:
+    def test_trivy_matches_by_path_then_name(self, index: SbomIndex) -> None:
+        trivy = {
+            "location": {"path": "/app/requirements.txt"},
+            "raw": {"PkgName": "requests", "InstalledVersion": "2.28.0"},
+        }
+        assert match_package(trivy, index)["name"] == "requests"
+
+        trivy["location"]["path"] = "/elsewhere"
+        trivy["raw"] = {"PkgName": "openssl", "InstalledVersion": "3.0.1"}
+        assert match_package(trivy, index)["version"] == "3.0.1"
+
+    def test_grype_matches_by_purl(self, index: SbomIndex) -> None:
+        grype = {
+            "location": {"path": "openssl@1.1.1"},
+            "raw": {
+                "artifact": {
+                    "name": "openssl",
+                    "version": "1.1.1",
+                    "purl": "pkg:apk/alpine/openssl@1.1.1?arch=x86_64&distro=3.18",
+                }
+            },
+        }
+        assert match_package(grype, index)["version"] == "1.1.1"
+
+    def test_dependency_check_and_osv(self, index: SbomIndex) -> None:
+        dependency_check = {
+            "location": {"path": "/build/flask.whl"},
+            "context": {"package_id": "pkg:pypi/flask@9.9"},
+        }
+        assert match_package(dependency_check, index)["version"] == "2.0.1"
+
+        osv = {
+            "location": {"path": ""},
+            "raw": {"package": {"name": "Requests", "ecosystem": "PyPI"}},
+        }
+        assert match_package(osv, index)["name"] == "requests"
+
+    def test_in_memory_index_matches_like_persisted(self, index: SbomIndex) -> None:
+        record = dict(index.packages_named("flask")[0])
+        memory = InMemorySbomIndex(
+            {"/app/requirements.txt": [record]}, {"flask": [record]}
+        )
+        grype = {"raw": {"artifact": {"purl": "pkg:pypi/flask@2.0.1"}}}
+
+        assert match_package(grype, memory) == match_package(grype, index)
+        assert match_package({"raw": {"PkgName": "django"}}, memory) is None
+
+
+class TestReportEnrichment:
+    def test_gather_results_enriches_grype_from_index(self, target: Path) -> None:
+        (target / "grype.json").write_text(
+            json.dumps(
+                {
+                    "matches": [
+                        {
+                            "vulnerability": {
+                                "id": "CVE-2023-0001",
+                                "severity": "High",
+                            },
+                            "artifact": {
+                                "name": "flask",
+                                "version": "2.0.1",
+                                "purl": "pkg:pypi/flask@2.0.1",
+                            },
+                        }
+                    ]
+                }
+            ),
+            encoding="utf-8",
+        )
+
+        findings = nr.gather_results(target.parent.parent)
+
+        grype = [f for f in findings if f["tool"]["name"] == "grype"]
+        assert grype[0]["context"]["sbom"]["path"] == "/app/requirements.txt"
+        assert "pkg:Flask@2.0.1" in grype[0]["tags"]
+        assert (target / SBOM_INDEX_FILENAME).is_file()
+
+    def test_falls_back_to_syft_findings_without_index(self) -> None:
+        syft = {
+            "tool": {"name": "syft"},
+            "tags": ["sbom", "package"],
+            "raw": {
+                "name": "lodash",
+                "version": "4.17.20",
+                "purl": "pkg:npm/lodash@4.17.20",
+            },
+            "location": {"path": "/app/package-lock.json"},
+        }
+        grype = {
+            "tool": {"name": "grype"},
+            "location": {"path": "lodash@4.17.20"},
+            "raw": {"artifact": {"name": "lodash", "purl": "pkg:npm/lodash@4.17.20"}},
+        }
+
+        nr._enrich_trivy_with_syft([syft, grype])
+
+        assert grype["context"]["sbom"]["purl"] == "pkg:npm/lodash@4.17.20"
@@ -0,0 +1,144 @@
+"""Tests for scripts/core/source_cache.py and batch snippet extraction."""
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from scripts.core.common_finding import extract_code_snippet, extract_code_snippets
+from scripts.core.source_cache import SourceCache
+
+
+@pytest.fixture
+def cache() -> SourceCache:
+    return SourceCache(max_files=2)
+
+
+def _write(path: Path, data: bytes) -> Path:
+    path.write_bytes(data)
+    return path
+
+
+class TestSourceFile:
+    def test_lines_match_splitlines(self, cache: SourceCache, tmp_path: Path) -> None:
+        text = "".join(f"line {i}\n" for i in range(1, 101)) + "tail"
+        source = cache.get(_write(tmp_path / "a.py", text.encode()))
+
+        assert source is not None
+        assert source.line_count == 101
+        assert source.lines(1, 101) == text.splitlines()
+        assert source.lines(40, 42) == ["line 40", "line 41", "line 42"]
+        assert source.lines(0, 1) == ["line 1"]
+        assert source.lines(100, 500) == ["line 100", "tail"]
+
+    def test_crlf_and_keepends(self, cache: SourceCache, tmp_path: Path) -> None:
+        source = cache.get(_write(tmp_path / "win.txt", b"a\r\nb\r\nc"))
+
+        assert source is not None
+        assert source.lines(1, 3) == ["a", "b", "c"]
+        assert source.lines(1, 3, keepends=True) == ["a\n", "b\n", "c"]
+
+    def test_decode_errors(self, cache: SourceCache, tmp_path: Path) -> None:
+        source = cache.get(_write(tmp_path / "bin.txt", b"ok\xff\n"))
+
+        assert source is not None
+        assert source.lines(1, 1) == ["ok"]
+        assert source.lines(1, 1, errors="replace") == ["ok�"]
+
+    def test_empty_file(self, cache: SourceCache, tmp_path: Path) -> None:
+        source = cache.get(_write(tmp_path / "empty.py", b""))
+
+        assert source is not None
+        assert source.line_count == 0
+        assert source.lines(1, 5) == []
+
+
+class TestSourceCache:
+    def test_reuses_and_evicts_least_recent(
+        self, cache: SourceCache, tmp_path: Path
+    ) -> None:
+        a, b, c = (_write(tmp_path / f"{n}.py", b"x\n") for n in "abc")
+        first = cache.get(a)
+        assert cache.get(a) is first
+
+        cache.get(b)
+        cache.get(a)  # a is now most recent
+        cache.get(c)  # evicts b
+
+        assert cache.get(a) is first
+        assert len(cache._files) == 2
+        assert str(b) not in cache._files
+
+    def test_changed_file_is_reloaded(self, cache: SourceCache, tmp_path: Path) -> None:
+        path = _write(tmp_path / "a.py", b"old\n")
+        assert cache.get(path).lines(1, 1) == ["old"]
+
+        path.write_bytes(b"new line\nsecond\n")
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        assert cache.get(path).lines(1, 2) == ["new line", "second"]
+
+    def test_only_large_files_are_mapped(self, tmp_path: Path) -> None:
+        cache = SourceCache(mmap_min_bytes=8, idle_seconds=None)
+        small = cache.get(_write(tmp_path / "small.py", b"x = 1\n"))
+        large = cache.get(_write(tmp_path / "large.py", b"x = 1\ny = 2\n"))
+
+        assert small is not None and not small.mapped
+        assert large is not None and large.mapped
+        assert large.lines(2, 2) == ["y = 2"]
+        cache.clear()
+        assert not large.mapped
+
+    def test_evicted_mapping_is_closed(self, tmp_path: Path) -> None:
+        cache = SourceCache(max_files=1, mmap_min_bytes=1, idle_seconds=None)
+        first = cache.get(_write(tmp_path / "a.py", b"a\n"))
+        cache.get(_write(tmp_path / "b.py", b"b\n"))
+
+        assert first is not None and not first.mapped
+        # A holder of an evicted file reads nothing rather than a dead mapping
+        assert first.lines(1, 1) == []
+
+    def test_idle_mappings_are_released(self, tmp_path: Path) -> None:
+        cache = SourceCache(mmap_min_bytes=1, idle_seconds=0.05)
+        path = _write(tmp_path / "a.py", b"old\n")
+        source = cache.get(path)
+        assert source is not None and source.mapped
+
+        deadline = time.monotonic() + 5
+        while source.mapped and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert not source.mapped
+        assert str(path) not in cache._files
+        # Nothing pins the file any more
+        path.unlink()
+
+    def test_missing_and_non_regular_files(
+        self, cache: SourceCache, tmp_path: Path
+    ) -> None:
+        assert cache.get(tmp_path / "missing.py") is None
+        assert cache.get(tmp_path) is None
+
+
+class TestExtractCodeSnippets:
+    def test_batch_matches_single_extraction(self, tmp_path: Path) -> None:
+        one = _write(tmp_path / "one.py", b"".join(b"l%d\n" % i for i in range(30)))
+        two = _write(tmp_path / "two.js", b"a\nb\nc\n")
+        locations = [
+            (str(one), 10),
+            (str(two), 2),
+            (str(tmp_path / "gone.py"), 1),
+            (str(one), 1),
+            (str(one), 99),
+        ]
+
+        results = extract_code_snippets(locations, context_lines=2)
+
+        assert results == [extract_code_snippet(p, n) for p, n in locations]
+        assert results[0]["snippet"].splitlines()[0] == "8: l7"
+        assert results[1]["language"] == "javascript"
+        assert results[2] is None
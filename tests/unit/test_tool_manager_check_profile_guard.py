@@ -92,3 +92,19 @@ def test_check_profile_multiple_tools_can_crash_independently(manager) -> None:
     assert "ImportError" in result["semgrep"].install_hint
     # Other tools unaffected
     assert result["trufflehog"].installed is True
+
+
+def test_check_all_tools_propagates_check_tool_exceptions(manager) -> None:
+    """check_all_tools is not guarded: a crashing check_tool still raises."""
+    from scripts.cli.tool_manager import ToolStatus
+
+    def fake_check(name: str) -> ToolStatus:
+        if name == "trivy":
+            raise RuntimeError("simulated segfault probe")
+        return ToolStatus(name=name, installed=True)
+
+    with (
+        patch.object(manager, "check_tool", side_effect=fake_check),
+        pytest.raises(RuntimeError, match="simulated segfault probe"),
+    ):
+        manager.check_all_tools()
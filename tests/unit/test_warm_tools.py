@@ -0,0 +1,285 @@
+"""Contracts for session-scoped warm tool servers.
+
+The pool must be invisible when it cannot help: a missing binary, a server
+that never turns healthy or one that dies mid-session all leave commands
+exactly as they were. The real trivy/OPA binaries are not needed - a tiny
+HTTP server stands in for them and answers their health endpoints.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import stat
+import sys
+import urllib.error
+import urllib.request
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from scripts.core.policy_engine import PolicyEngine
+from scripts.core.warm_tools import (
+    WarmToolPool,
+    active_pool,
+    opa_auth_headers,
+    trivy_client_options,
+    warm_session,
+    warm_tools_requested,
+)
+
+pytestmark = pytest.mark.skipif(
+    sys.platform == "win32", reason="fake server uses a shebang script"
+)
+
+_FAKE_SERVER = """#!{python}
+import re
+import sys
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+args = sys.argv[1:]
+flag = "--listen" if "--listen" in args else "--addr"
+host, port = args[args.index(flag) + 1].rsplit(":", 1)
+required = None
+if "--authentication=token" in args:
+    with open(args[-1], encoding="utf-8") as fh:
+        required = "Bearer " + re.search(r'identity, "([^"]+)"', fh.read())[1]
+
+
+class Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if required and self.headers.get("Authorization") != required:
+            self.send_response(401)
+        else:
+            self.send_response(200 if self.path in ("/healthz", "/health") else 404)
+        self.end_headers()
+
+    def log_message(self, *a):
+        pass
+
+
+HTTPServer((host, int(port)), Handler).serve_forever()
+"""
+
+
+def _executable(path: Path, body: str) -> str:
+    path.write_text(body, encoding="utf-8")
+    path.chmod(path.stat().st_mode | stat.S_IXUSR)
+    return str(path)
+
+
+@pytest.fixture
+def fake_server(tmp_path: Path) -> str:
+    return _executable(
+        tmp_path / "fake-server", _FAKE_SERVER.format(python=sys.executable)
+    )
+
+
+class TestWarmToolPool:
+    def test_missing_binary_is_looked_up_once(self) -> None:
+        finder = MagicMock(return_value=None)
+        pool = WarmToolPool(tools=["trivy"], find_tool_func=finder)
+        assert pool.server("trivy") is None
+        assert pool.server("trivy") is None
+        finder.assert_called_once_with("trivy")
+
+    def test_tool_not_enabled_is_never_started(self) -> None:
+        finder = MagicMock()
+        pool = WarmToolPool(tools=["opa"], find_tool_func=finder)
+        assert pool.server("trivy") is None
+        finder.assert_not_called()
+
+    def test_starts_once_and_stops_on_close(self, fake_server: str) -> None:
+        pool = WarmToolPool(
+            tools=["trivy"], startup_timeout=15, find_tool_func=lambda _: fake_server
+        )
+        srv = pool.server("trivy")
+        assert srv is not None
+        assert srv.url.startswith("http://127.0.0.1:")
+        assert srv.token
+        assert pool.server("trivy") is srv
+
+        pool.close()
+        assert not srv.alive
+        assert pool.server("trivy") is None
+
+    def test_unhealthy_server_falls_back(self, tmp_path: Path) -> None:
+        dead = _executable(tmp_path / "dead", "#!/bin/sh\nexit 3\n")
+        pool = WarmToolPool(
+            tools=["opa"], startup_timeout=5, find_tool_func=lambda _: dead
+        )
+        assert pool.server("opa") is None
+
+    def test_opa_server_requires_session_token(self, fake_server: str) -> None:
+        with WarmToolPool(
+            tools=["opa"], startup_timeout=15, find_tool_func=lambda _: fake_server
+        ) as pool:
+            srv = pool.server("opa")
+            assert srv is not None and srv.token
+            assert "--authorization=basic" in srv.process.args
+            # The token is in the authz policy file, not on the command line
+            assert not any(srv.token in arg for arg in srv.process.args)
+
+            with pytest.raises(urllib.error.HTTPError) as denied:
+                urllib.request.urlopen(srv.url + "/health", timeout=5)
+            assert denied.value.code == 401
+            request = urllib.request.Request(
+                srv.url + "/health", headers=opa_auth_headers(srv.token)
+            )
+            with urllib.request.urlopen(request, timeout=5) as resp:
+                assert resp.status == 200
+
+    def test_dead_server_is_not_reused(self, fake_server: str) -> None:
+        with WarmToolPool(
+            tools=["opa"], startup_timeout=15, find_tool_func=lambda _: fake_server
+        ) as pool:
+            srv = pool.server("opa")
+            assert srv is not None
+            srv.process.kill()
+            srv.process.wait()
+            assert pool.server("opa") is None
+
+
+class TestSession:
+    def test_session_is_active_only_inside_block(self) -> None:
+        assert active_pool() is None
+        with warm_session(tools=["trivy"]) as pool:
+            assert active_pool() is pool
+        assert active_pool() is None
+
+    def test_nested_session_reuses_outer_pool(self) -> None:
+        with warm_session(tools=["trivy"]) as outer:
+            with warm_session(tools=["opa"]) as inner:
+                assert inner is outer
+            assert active_pool() is outer
+
+    def test_trivy_options_empty_without_session(self) -> None:
+        assert trivy_client_options() == ([], None)
+
+    def test_trivy_options_point_at_server(self, fake_server: str) -> None:
+        with warm_session(
+            tools=["trivy"], startup_timeout=15, find_tool_func=lambda _: fake_server
+        ) as pool:
+            args, env = trivy_client_options()
+            srv = pool.server("trivy")
+            assert args == ["--server", srv.url]
+            # The token rides in the environment, never on the command line.
+            assert env == {"TRIVY_TOKEN": srv.token}
+            assert srv.token not in args
+
+    @pytest.mark.parametrize(
+        ("value", "expected"), [("1", True), ("true", True), ("0", False), ("", False)]
+    )
+    def test_env_toggle(self, value: str, expected: bool) -> None:
+        with patch.dict(os.environ, {"JMO_WARM_TOOLS": value}):
+            assert warm_tools_requested() is expected
+
+
+class TestScannerRouting:
+    def test_image_scan_uses_warm_trivy(self, tmp_path: Path) -> None:
+        from scripts.cli.scan_jobs import image_scanner
+
+        captured = {}
+
+        def fake_run_all(self):
+            captured["defs"] = self.tools
+            return []
+
+        with (
+            patch.object(
+                image_scanner,
+                "trivy_client_options",
+                return_value=(["--server", "http://127.0.0.1:1"], {"TRIVY_TOKEN": "t"}),
+            ),
+            patch.object(image_scanner.ToolRunner, "run_all_parallel", fake_run_all),
+        ):
+            image_scanner.scan_image(
+                "alpine:3",
+                tmp_path,
+                ["trivy"],
+                60,
+                0,
+                {},
+                False,
+                find_tool_func=lambda _: "/usr/bin/trivy",
+            )
+
+        (trivy,) = captured["defs"]
+        assert trivy.command[trivy.command.index("--server") + 1] == (
+            "http://127.0.0.1:1"
+        )
+        assert trivy.env == {"TRIVY_TOKEN": "t"}
+
+
+class TestPolicyEngineOnServer:
+    @pytest.fixture
+    def engine(self) -> PolicyEngine:
+        engine = PolicyEngine.__new__(PolicyEngine)
+        engine.opa_binary = "opa"
+        engine._opa_path = "/usr/bin/opa"
+        return engine
+
+    @pytest.fixture
+    def policy(self, tmp_path: Path) -> Path:
+        path = tmp_path / "secrets.rego"
+        path.write_text("package jmo.policy.secrets\nallow := true\n")
+        return path
+
+    def _pool(self) -> WarmToolPool:
+        pool = WarmToolPool(tools=["opa"])
+        pool.server = MagicMock(
+            return_value=MagicMock(url="http://127.0.0.1:9", token="tok")
+        )
+        return pool
+
+    def test_policy_uploaded_once_then_queried(
+        self, engine: PolicyEngine, policy: Path
+    ) -> None:
+        pool = self._pool()
+        calls = []
+
+        def fake_request(
+            method, url, data, content_type="application/json", token=None
+        ):
+            assert token == "tok"
+            calls.append((method, url))
+            if method == "PUT":
+                return {}
+            assert json.loads(data)["input"]["findings"] == [{"id": "x"}]
+            return {"result": {"allow": False, "violations": [{"id": "x"}]}}
+
+        with (
+            patch("scripts.core.policy_engine.active_pool", return_value=pool),
+            patch.object(PolicyEngine, "_opa_request", side_effect=fake_request),
+            patch("scripts.core.policy_engine.subprocess.run") as run,
+        ):
+            first = engine.evaluate([{"id": "x"}], policy)
+            second = engine.evaluate([{"id": "x"}], policy)
+
+        run.assert_not_called()
+        assert first.passed is False and second.violation_count == 1
+        assert calls == [
+            ("PUT", "http://127.0.0.1:9/v1/policies/jmo/policy/secrets"),
+            ("POST", "http://127.0.0.1:9/v1/data/jmo/policy/secrets"),
+            ("POST", "http://127.0.0.1:9/v1/data/jmo/policy/secrets"),
+        ]
+
+    def test_package_owned_by_other_file_uses_opa_eval(
+        self, engine: PolicyEngine, policy: Path, tmp_path: Path
+    ) -> None:
+        pool = self._pool()
+        pool.opa_policies["data.jmo.policy.secrets"] = (str(tmp_path / "other"), 1)
+        eval_out = {"result": [{"expressions": [{"value": {"allow": True}}]}]}
+
+        with (
+            patch("scripts.core.policy_engine.active_pool", return_value=pool),
+            patch.object(PolicyEngine, "_opa_request") as request,
+            patch("scripts.core.policy_engine.subprocess.run") as run,
+        ):
+            run.return_value = MagicMock(returncode=0, stdout=json.dumps(eval_out))
+            result = engine.evaluate([], policy)
+
+        request.assert_not_called()
+        run.assert_called_once()
+        assert result.passed is True
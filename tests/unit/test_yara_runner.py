@@ -70,6 +70,14 @@ rule JMo_Test_Broken
 """
 
 
+@pytest.fixture(autouse=True)
+def _private_cache(tmp_path, monkeypatch):
+    """Keep compiled rules and result caches out of the real ~/.jmo/cache."""
+    cache = tmp_path / "yara-cache"
+    monkeypatch.setattr(yara_runner, "default_cache_dir", lambda: cache)
+    return cache
+
+
 def _rules_dir(tmp_path: Path, **files: bytes) -> Path:
     d = tmp_path / "rules"
     d.mkdir()
@@ -320,3 +328,136 @@ class TestAdapterContract:
         assert findings[0].ruleId == "JMo_Test_Webshell"
         assert findings[0].severity == "HIGH"
         assert "app.php" in findings[0].location["path"]
+
+
+class TestCaching:
+    """Compiled rules and per-file results are reused while nothing changed."""
+
+    @staticmethod
+    def _run(rules: Path, target: Path, out: Path, *extra: str) -> int:
+        return yara_runner.main(
+            ["--rules", str(rules), "--target", str(target), "--output", str(out)]
+            + list(extra)
+        )
+
+    def test_second_run_loads_compiled_rules(self, tmp_path, monkeypatch, capsys):
+        yara = pytest.importorskip("yara")
+        rules = _rules_dir(tmp_path, hit=RULE_HIT, broken=RULE_BROKEN)
+        target = _target_dir(tmp_path, **{"app.php": MARKER})
+        out = tmp_path / "yara.json"
+        assert self._run(rules, target, out) == 1
+        capsys.readouterr()
+
+        def no_compile(**kwargs):
+            raise AssertionError("rules were recompiled")
+
+        monkeypatch.setattr(yara, "compile", no_compile)
+
+        assert self._run(rules, target, out) == 1
+        assert len(json.loads(out.read_text(encoding="utf-8"))) == 1
+        assert "skipped 1" in capsys.readouterr().err
+
+    def test_edited_rule_file_is_recompiled(self, tmp_path):
+        pytest.importorskip("yara")
+        rules = _rules_dir(tmp_path, probe=RULE_MISS)
+        target = _target_dir(tmp_path, **{"app.php": MARKER})
+        out = tmp_path / "yara.json"
+        assert self._run(rules, target, out) == 0
+
+        (rules / "probe.yar").write_bytes(RULE_HIT)
+
+        assert self._run(rules, target, out) == 1
+
+    def test_unchanged_files_are_answered_from_the_result_cache(self, tmp_path, capsys):
+        pytest.importorskip("yara")
+        rules = _rules_dir(tmp_path, hit=RULE_HIT)
+        target = _target_dir(
+            tmp_path, **{"app.php": MARKER, "copy.php": MARKER, "b.txt": b"clean"}
+        )
+        out = tmp_path / "yara.json"
+        assert self._run(rules, target, out) == 1
+        first = json.loads(out.read_text(encoding="utf-8"))
+        capsys.readouterr()
+
+        assert self._run(rules, target, out) == 1
+        assert json.loads(out.read_text(encoding="utf-8")) == first
+        assert "3 unchanged since a cached scan" in capsys.readouterr().err
+
+        (target / "app.php").write_bytes(b"cleaned up")
+
+        assert self._run(rules, target, out) == 1
+        matched = [m["file"] for m in json.loads(out.read_text(encoding="utf-8"))]
+        assert [Path(f).name for f in matched] == ["copy.php"]
+        assert "2 unchanged since a cached scan" in capsys.readouterr().err
+
+    def test_no_cache_writes_nothing(self, tmp_path, _private_cache):
+        pytest.importorskip("yara")
+        rules = _rules_dir(tmp_path, hit=RULE_HIT)
+        target = _target_dir(tmp_path, **{"app.php": MARKER})
+
+        assert self._run(rules, target, tmp_path / "yara.json", "--no-cache") == 1
+        assert not _private_cache.exists()
+
+    def test_old_rule_sets_are_pruned(self, tmp_path, monkeypatch, _private_cache):
+        pytest.importorskip("yara")
+        monkeypatch.setattr(yara_runner, "MAX_CACHED_RULE_SETS", 1)
+        rules = _rules_dir(tmp_path, probe=RULE_MISS)
+        target = _target_dir(tmp_path, **{"app.php": MARKER})
+        self._run(rules, target, tmp_path / "yara.json")
+        (rules / "probe.yar").write_bytes(RULE_HIT)
+        self._run(rules, target, tmp_path / "yara.json")
+
+        assert len(list(_private_cache.glob("*.yarc"))) == 1
+        assert len(list(_private_cache.glob("*.results.json"))) == 1
+
+
+class TestParallelMatching:
+    def test_parallel_output_matches_serial_order(self, tmp_path, monkeypatch):
+        pytest.importorskip("yara")
+        monkeypatch.setattr(yara_runner, "CHUNK_FILES", 3)
+        rules = _rules_dir(tmp_path, hit=RULE_HIT)
+        target = _target_dir(
+            tmp_path,
+            **{f"f{i:02d}.txt": MARKER if i % 3 else b"clean" for i in range(20)},
+        )
+        outputs = []
+        for jobs in ("1", "4"):
+            out = tmp_path / f"yara-{jobs}.json"
+            rc = yara_runner.main(
+                [
+                    "--rules",
+                    str(rules),
+                    "--target",
+                    str(target),
+                    "--output",
+                    str(out),
+                    "--jobs",
+                    jobs,
+                    "--no-cache",
+                ]
+            )
+            assert rc == 1
+            outputs.append(json.loads(out.read_text(encoding="utf-8")))
+
+        assert outputs[0] == outputs[1]
+        files = [Path(m["file"]).name for m in outputs[1]]
+        assert files == sorted(files)
+        assert len(files) == 13
+
+    def test_large_files_are_matched_through_mmap(self, tmp_path, monkeypatch):
+        pytest.importorskip("yara")
+        monkeypatch.setattr(yara_runner, "MMAP_MIN_BYTES", 1)
+        rules = _rules_dir(tmp_path, hit=RULE_HIT)
+        target = _target_dir(
+            tmp_path, **{"big.bin": b"x" * 4096 + MARKER, "empty.txt": b""}
+        )
+        out = tmp_path / "yara.json"
+
+        assert (
+            yara_runner.main(
+                ["--rules", str(rules), "--target", str(target), "--output", str(out)]
+            )
+            == 1
+        )
+        matched = [m["file"] for m in json.loads(out.read_text(encoding="utf-8"))]
+        assert [Path(f).name for f in matched] == ["big.bin"]